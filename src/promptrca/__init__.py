@@ -21,15 +21,24 @@ Contact: info@promptrca.com
 PromptRCA - AI Root-Cause Investigator for AWS Serverless
 """
 
-from .models import Fact, Hypothesis, Advice, InvestigationReport, InvestigationTarget
-from .clients.aws_client import AWSClient
-from .agents.hypothesis_agent import HypothesisAgent
-from .agents.advice_agent import AdviceAgent
-from .core.investigator import PromptRCAInvestigator
+from .utils.lazy_exports import lazy_exports
 
 __version__ = "1.0.0"
 __author__ = "PromptRCA Team"
 
+# Public names and the module defining each, imported on first access
+_LAZY_EXPORTS = {
+    "Fact": ".models",
+    "Hypothesis": ".models",
+    "Advice": ".models",
+    "InvestigationReport": ".models",
+    "InvestigationTarget": ".models",
+    "AWSClient": ".clients.aws_client",
+    "HypothesisAgent": ".agents.hypothesis_agent",
+    "AdviceAgent": ".agents.advice_agent",
+    "PromptRCAInvestigator": ".core.investigator",
+}
+
 __all__ = [
     "Fact",
     "Hypothesis", 
@@ -41,3 +50,5 @@ __all__ = [
     "AdviceAgent",
     "PromptRCAInvestigator"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -20,11 +20,16 @@ Contact: info@promptrca.com
 
 """
 
-from .hypothesis_agent import HypothesisAgent
-from .advice_agent import AdviceAgent
-from .severity_agent import SeverityAgent
-from .root_cause_agent import RootCauseAgent
-from .specialized import ExecutionFlowAgent
+from ..utils.lazy_exports import lazy_exports
+
+# Imported on first access; the agents and orchestrators pull in strands
+_LAZY_EXPORTS = {
+    "HypothesisAgent": ".hypothesis_agent",
+    "AdviceAgent": ".advice_agent",
+    "SeverityAgent": ".severity_agent",
+    "RootCauseAgent": ".root_cause_agent",
+    "ExecutionFlowAgent": ".specialized",
+}
 
 __all__ = [
     "HypothesisAgent",
@@ -33,3 +38,5 @@ __all__ = [
     "RootCauseAgent",
     "ExecutionFlowAgent"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -23,6 +23,7 @@ Contact: info@promptrca.com
 import json
 from typing import List, Optional
 from ..models import Fact, Hypothesis
+from ..context import invoke_agent
 from ..utils import get_logger
 
 logger = get_logger(__name__)
@@ -135,7 +136,7 @@ JSON: [{{"type": "...", "description": "...", "confidence": 0.0-1.0, "evidence":
 
         try:
             # Use Strands agent to generate hypotheses (call agent directly)
-            response = self.strands_agent(prompt)
+            response = invoke_agent(self.strands_agent, prompt)
 
 
             # Parse response
@@ -27,6 +27,7 @@ import json
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
 from ..models import Fact
+from ..context import invoke_agent
 from ..utils import get_logger
 from strands import Agent
 from ..utils.config import create_bedrock_model, create_parser_model
@@ -77,14 +78,14 @@ class InputParserAgent:
 
         Deterministic-first parsing; fallback uses a constrained, low-temp model.
         """
-        # Dedicated constrained model for fallback parsing only
-        self.parser_model = create_parser_model()
+        # Dedicated constrained model for fallback parsing only; created on first use
+        self._parser_model = None
         
         # X-Ray trace ID pattern (reliable regex) - handles optional Root= prefix
         self.trace_id_pattern = r'(?:Root=)?(1-[a-f0-9]{8}-[a-f0-9]{24})'
         
         # ARN pattern (reliable regex)
-        self.arn_pattern = r'arn:aws:[a-z0-9-]+:[a-z0-9-]*:[0-9]*:[a-zA-Z0-9/_-]+'
+        self.arn_pattern = r'arn:aws:[a-z0-9-]+:[a-z0-9-]*:[0-9]*:[a-zA-Z0-9/_-]+(?::[a-zA-Z0-9/_-]+)*'
         
         # Region patterns
         self.region_pattern = r'(us|eu|ap|ca|sa|af|me)-(east|west|central|north|south)-[0-9]+'
@@ -97,6 +98,13 @@ class InputParserAgent:
             'dynamodb': [r'table[:\s]+([a-zA-Z0-9_-]+)', r'dynamodb[:\s]+([a-zA-Z0-9_-]+)'],
         }
     
+    @property
+    def parser_model(self):
+        """Constrained fallback parser model, so regex-only parsing never builds a model."""
+        if self._parser_model is None:
+            self._parser_model = create_parser_model()
+        return self._parser_model
+
     def parse_inputs(self, inputs: Union[str, Dict[str, Any]], region: str = "eu-west-1") -> ParsedInputs:
         """Parse various input formats to extract investigation targets."""
         if isinstance(inputs, str):
@@ -140,6 +148,17 @@ class InputParserAgent:
             confidence=0.85
         )
 
+    def _extract_resource_names(self, text: str) -> List[str]:
+        """Extract bare resource names (no ARN) with the regex resource patterns; no AI usage."""
+        names: List[str] = []
+        for patterns in self.resource_patterns.values():
+            for pattern in patterns:
+                for match in re.finditer(pattern, text, flags=re.IGNORECASE):
+                    name = match.group(1)
+                    if name and name not in names:
+                        names.append(name)
+        return names
+
     def _parse_free_text_with_fallback_agent(self, text: str, region: str) -> ParsedInputs:
         """Use constrained parser agent only if deterministic parsing found nothing."""
         logger.info("🔍 Deterministic parsing found nothing; using constrained parser agent...")
@@ -204,7 +223,7 @@ Return [] if no explicit resources found."""
 
         try:
             agent = Agent(model=self.parser_model if use_parser_model else create_bedrock_model(temperature_override=0.2))
-            response = agent(prompt)
+            response = invoke_agent(agent, prompt)
             
             # Parse the AI response - extract content from AgentResult
             response_text = str(response.content) if hasattr(response, 'content') else str(response)
@@ -250,9 +269,9 @@ Return [] if no explicit resources found."""
         """Validate resource exists via lightweight AWS check."""
         try:
             if resource.type == "lambda_function":
-                from ..tools import get_lambda_config
-                config = get_lambda_config(resource.name, region)
-                return "error" not in config.lower()
+                from ..tools import fetch_lambda_config
+                config = fetch_lambda_config(resource.name)
+                return "error" not in config
             elif resource.type == "apigateway":
                 if resource.arn and "restapis/" in resource.arn:
                     api_id = resource.arn.split("restapis/")[1].split("/")[0]
@@ -276,7 +295,7 @@ Example: ["500 errors", "Permission denied"]"""
 
         try:
             agent = Agent(model=self.parser_model if use_parser_model else create_bedrock_model(temperature_override=0.2))
-            response = agent(prompt)
+            response = invoke_agent(agent, prompt)
             
             # Extract content from AgentResult
             response_text = str(response.content) if hasattr(response, 'content') else str(response)
@@ -24,6 +24,7 @@ from typing import List, Dict, Any, Optional
 import json
 
 from ..models.base import Fact, Hypothesis, RootCauseAnalysis
+from ..context import invoke_agent
 from ..utils import get_logger
 
 logger = get_logger(__name__)
@@ -168,7 +169,7 @@ JSON: {{"primary_root_cause_index": 0, "contributing_factor_indices": [1,2], "an
 
         try:
             # Use Strands agent
-            response = self.strands_agent(prompt)
+            response = invoke_agent(self.strands_agent, prompt)
 
 
             # Parse response
@@ -26,6 +26,7 @@ import json
 
 from ..models.base import Fact, Hypothesis, AffectedResource, SeverityAssessment
 from ..clients.aws_client import AWSClient
+from ..context import invoke_agent
 from ..utils import get_logger
 
 logger = get_logger(__name__)
@@ -241,7 +242,7 @@ Respond with ONLY a JSON object:
 
         try:
             # Use Strands agent
-            response = self.strands_agent(prompt)
+            response = invoke_agent(self.strands_agent, prompt)
 
             # Cost tracking removed
 
@@ -22,6 +22,8 @@ Contact: info@promptrca.com
 
 from typing import List, Dict, Any
 from strands import Agent
+from ...context import invoke_agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...models import Fact
 from ...tools.aws_tools import (
     get_api_gateway_stage_config,
@@ -131,6 +133,7 @@ CRITICAL REQUIREMENTS:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[
             get_api_gateway_stage_config,
             get_api_gateway_deployment_history,
@@ -185,7 +188,7 @@ Investigation steps:
 Focus on temporal correlation - if there was a recent deployment, compare timing with issue start."""
 
             # Run the agent
-            agent_result = apigateway_agent(prompt)
+            agent_result = invoke_agent(apigateway_agent, prompt)
             
             # Extract the response content from AgentResult
             response = str(agent_result.content) if hasattr(agent_result, 'content') else str(agent_result)
@@ -22,6 +22,7 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.dynamodb_tools import (
     get_dynamodb_table_config,
     get_dynamodb_table_metrics,
@@ -38,6 +39,7 @@ def create_dynamodb_agent(model) -> Agent:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_dynamodb_table_config, get_dynamodb_table_metrics, describe_dynamodb_streams, list_dynamodb_tables],
         trace_attributes={
             "service.name": "promptrca-dynamodb-agent",
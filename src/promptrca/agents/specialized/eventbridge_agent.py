@@ -22,6 +22,7 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.eventbridge_tools import (
     get_eventbridge_rule_config,
     get_eventbridge_targets,
@@ -39,6 +40,7 @@ def create_eventbridge_agent(model) -> Agent:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_eventbridge_rule_config, get_eventbridge_targets, get_eventbridge_metrics, list_eventbridge_rules, get_eventbridge_bus_config],
         trace_attributes={
             "service.name": "promptrca-eventbridge-agent",
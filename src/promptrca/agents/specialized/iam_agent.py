@@ -21,6 +21,8 @@ Contact: info@promptrca.com
 """
 
 from strands import Agent
+from ...context import invoke_agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.aws_tools import (
     get_iam_role_config,
     get_cloudwatch_logs
@@ -193,6 +195,7 @@ CRITICAL REQUIREMENTS:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_iam_role_config, get_cloudwatch_logs],
         trace_attributes={
             "service.name": "promptrca-iam-agent",
@@ -217,7 +220,7 @@ Context: {investigation_context}
 
 Please analyze this IAM role for any permission issues, policy problems, or security concerns. Start by getting the role configuration, then check logs for IAM-related errors."""
 
-            agent_result = iam_agent(prompt)
+            agent_result = invoke_agent(iam_agent, prompt)
             response = str(agent_result.content) if hasattr(agent_result, 'content') else str(agent_result)
 
             def _extract_json(s: str):
@@ -22,6 +22,8 @@ Contact: info@promptrca.com
 
 from typing import List, Dict, Any
 from strands import Agent
+from ...context import invoke_agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...models import Fact
 from ...tools.aws_tools import (
     get_lambda_config,
@@ -190,6 +192,7 @@ CRITICAL REQUIREMENTS:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[
             get_lambda_config,
             get_lambda_logs,
@@ -243,7 +246,7 @@ Investigation steps:
 Focus on temporal correlation - if there was a recent deployment, compare timing with issue start."""
 
             # Run the agent
-            agent_result = lambda_agent(prompt)
+            agent_result = invoke_agent(lambda_agent, prompt)
             
             
             # Extract the response content from AgentResult
@@ -22,6 +22,7 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.s3_tools import (
     get_s3_bucket_config,
     get_s3_bucket_metrics,
@@ -185,6 +186,7 @@ CRITICAL REQUIREMENTS:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_s3_bucket_config, get_s3_bucket_metrics, list_s3_bucket_objects, get_s3_bucket_policy],
         trace_attributes={
             "service.name": "promptrca-s3-agent",
@@ -22,6 +22,7 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.sns_tools import (
     get_sns_topic_config,
     get_sns_topic_metrics,
@@ -172,6 +173,7 @@ Begin investigation immediately upon receiving issue description."""
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_sns_topic_config, get_sns_topic_metrics, get_sns_subscriptions, list_sns_topics],
         trace_attributes={
             "service.name": "promptrca-sns-agent",
@@ -22,6 +22,7 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.sqs_tools import (
     get_sqs_queue_config,
     get_sqs_queue_metrics,
@@ -167,6 +168,7 @@ Begin investigation immediately upon receiving issue description."""
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_sqs_queue_config, get_sqs_queue_metrics, get_sqs_dead_letter_queue, list_sqs_queues],
         trace_attributes={
             "service.name": "promptrca-sqs-agent",
@@ -22,6 +22,8 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...context import invoke_agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.aws_tools import (
     get_stepfunctions_definition,
     get_iam_role_config,
@@ -125,6 +127,7 @@ CRITICAL REQUIREMENTS:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[
             get_stepfunctions_definition,
             get_stepfunctions_execution_details,
@@ -184,7 +187,7 @@ Investigation steps:
 4. Check IAM permissions if execution issues suspected
 5. Examine logs for errors"""
 
-            agent_result = stepfunctions_agent(prompt)
+            agent_result = invoke_agent(stepfunctions_agent, prompt)
             response = str(agent_result.content) if hasattr(agent_result, 'content') else str(agent_result)
 
             def _extract_json(s: str):
@@ -22,6 +22,7 @@ Contact: info@promptrca.com
 
 from typing import Any
 from strands import Agent
+from ...core.tool_output_encoder import tool_output_hooks
 from ...tools.vpc_tools import (
     get_vpc_config,
     get_subnet_config,
@@ -40,6 +41,7 @@ def create_vpc_agent(model) -> Agent:
     return Agent(
         model=model,
         system_prompt=system_prompt,
+        hooks=tool_output_hooks(),
         tools=[get_vpc_config, get_subnet_config, get_security_group_config, get_network_interface_config, get_nat_gateway_config, get_internet_gateway_config],
         trace_attributes={
             "service.name": "promptrca-vpc-agent",
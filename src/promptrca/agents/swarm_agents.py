@@ -39,6 +39,7 @@ from ..utils.config import (
     create_root_cause_agent_model,
     create_parser_model
 )
+from ..core.tool_output_encoder import tool_output_hooks
 from ..core.swarm_tools import (
     lambda_specialist_tool,
     apigateway_specialist_tool,
@@ -52,6 +53,7 @@ from ..core.swarm_tools import (
 )
 from ..tools.apigateway_tools import get_api_gateway_stage_config
 from ..tools.aws_knowledge_tools import search_aws_documentation, read_aws_documentation
+from ..tools.service_graph_tools import get_xray_service_graph_diff
 from ..utils.prompt_loader import load_prompt
 
 
@@ -96,7 +98,8 @@ def create_trace_agent() -> Agent:
         description="Analyzes X-Ray traces to identify service interactions, errors, and performance issues. Entry point for investigations.",
         model=create_orchestrator_model(),
         system_prompt=load_prompt("trace_specialist"),
-        tools=[trace_specialist_tool]
+        hooks=tool_output_hooks(),
+        tools=[trace_specialist_tool, get_xray_service_graph_diff]
     )
 
 
@@ -115,6 +118,7 @@ def create_lambda_agent() -> Agent:
         description="Analyzes Lambda functions for errors, timeouts, memory issues, and IAM permission problems.",
         model=create_lambda_agent_model(),
         system_prompt=load_prompt("lambda_specialist"),
+        hooks=tool_output_hooks(),
         tools=[lambda_specialist_tool, search_aws_documentation, read_aws_documentation]
     )
 
@@ -134,6 +138,7 @@ def create_apigateway_agent() -> Agent:
         description="Analyzes API Gateway configurations, integration errors, authentication issues, and throttling problems.",
         model=create_apigateway_agent_model(),
         system_prompt=load_prompt("apigateway_specialist"),
+        hooks=tool_output_hooks(),
         tools=[apigateway_specialist_tool, search_aws_documentation, read_aws_documentation]
     )
 
@@ -153,6 +158,7 @@ def create_stepfunctions_agent() -> Agent:
         description="Analyzes Step Functions executions for state failures, timeouts, and IAM permission issues.",
         model=create_stepfunctions_agent_model(),
         system_prompt=load_prompt("stepfunctions_specialist"),
+        hooks=tool_output_hooks(),
         tools=[stepfunctions_specialist_tool, search_aws_documentation, read_aws_documentation]
     )
 
@@ -172,6 +178,7 @@ def create_iam_agent() -> Agent:
         description="Analyzes IAM roles, policies, and permissions. Essential for API Gateway → Lambda/Step Functions integration errors and AccessDenied issues.",
         model=create_iam_agent_model(),
         system_prompt=load_prompt("iam_specialist"),
+        hooks=tool_output_hooks(),
         tools=[iam_specialist_tool, get_api_gateway_stage_config, search_aws_documentation, read_aws_documentation]
     )
 
@@ -191,6 +198,7 @@ def create_s3_agent() -> Agent:
         description="Analyzes S3 buckets, policies, and access patterns to identify storage and access issues.",
         model=create_s3_agent_model(),
         system_prompt=load_prompt("s3_specialist"),
+        hooks=tool_output_hooks(),
         tools=[s3_specialist_tool, search_aws_documentation, read_aws_documentation]
     )
 
@@ -210,6 +218,7 @@ def create_sqs_agent() -> Agent:
         description="Analyzes SQS queues, message processing, and integration patterns to identify message delivery issues.",
         model=create_sqs_agent_model(),
         system_prompt=load_prompt("sqs_specialist"),
+        hooks=tool_output_hooks(),
         tools=[sqs_specialist_tool, search_aws_documentation, read_aws_documentation]
     )
 
@@ -229,6 +238,7 @@ def create_sns_agent() -> Agent:
         description="Analyzes SNS topics, subscriptions, and message delivery patterns to identify notification delivery issues.",
         model=create_sns_agent_model(),
         system_prompt=load_prompt("sns_specialist"),
+        hooks=tool_output_hooks(),
         tools=[sns_specialist_tool, search_aws_documentation, read_aws_documentation]
     )
 
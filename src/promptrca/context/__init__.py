@@ -20,7 +20,19 @@ Contact: info@promptrca.com
 
 """
 
-from .aws_context import set_aws_client, get_aws_client, clear_aws_client
-
-__all__ = ['set_aws_client', 'get_aws_client', 'clear_aws_client']
+from .aws_context import set_aws_client, get_aws_client, clear_aws_client, aws_client_scope
+from .trace_store import TraceStore, set_trace_store, get_trace_store, clear_trace_store
+from .propagation import submit_with_context, isolated_context, invoke_agent
+from .investigation_executor import (
+    InvestigationExecutor, set_investigation_executor, get_investigation_executor,
+    clear_investigation_executor, run_blocking
+)
+
+__all__ = [
+    'set_aws_client', 'get_aws_client', 'clear_aws_client', 'aws_client_scope',
+    'TraceStore', 'set_trace_store', 'get_trace_store', 'clear_trace_store',
+    'submit_with_context', 'isolated_context', 'invoke_agent',
+    'InvestigationExecutor', 'set_investigation_executor', 'get_investigation_executor',
+    'clear_investigation_executor', 'run_blocking'
+]
 
@@ -20,8 +20,9 @@ Contact: info@promptrca.com
 
 """
 
+from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Optional
+from typing import Iterator, Optional
 
 # Use TYPE_CHECKING to avoid circular imports
 from typing import TYPE_CHECKING
@@ -29,12 +30,12 @@ if TYPE_CHECKING:
     from ..clients import AWSClient
 
 # Per-request context variable for AWS client
-# This is async-safe and thread-safe, ensuring proper isolation between concurrent investigations
+# This is async-safe and thread-safe, ensuring proper isolation between concurrent investigations.
+# There is deliberately no process-wide fallback: code that hands work to another
+# thread must carry the context along (see context/propagation.py), so one
+# investigation can never see another tenant's client.
 _aws_client_context: ContextVar[Optional['AWSClient']] = ContextVar('aws_client', default=None)
 
-# Fallback module-level storage for Swarm contexts where contextvars don't propagate
-_aws_client_fallback: Optional['AWSClient'] = None
-
 
 def set_aws_client(client: 'AWSClient') -> None:
     """
@@ -101,3 +102,21 @@ def clear_aws_client() -> None:
     """
     _aws_client_context.set(None)
 
+
+@contextmanager
+def aws_client_scope(client: 'AWSClient') -> Iterator['AWSClient']:
+    """
+    Use the AWS client for the duration of the block, then restore the previous one.
+
+    Prefer this over set_aws_client() in code running on a reused worker
+    thread (e.g. inside a tool), where a bare set would outlive the call.
+
+    Example:
+        with aws_client_scope(aws_client):
+            facts = run_analysis()
+    """
+    token = _aws_client_context.set(client)
+    try:
+        yield client
+    finally:
+        _aws_client_context.reset(token)
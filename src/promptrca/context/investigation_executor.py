@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Context - Investigation-scoped executor for blocking AWS calls
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Specialists are async, but the AWS tools they call are synchronous boto3.
+Awaited inline, those calls run one after another even when specialists
+are gathered. Each investigation gets a bounded thread pool instead;
+specialists hand their blocking calls to it through run_blocking(), with
+the investigation's context (AWS client, trace store) carried into the
+worker threads. The executor also records how long each specialist ran,
+so the overlap actually achieved can be reported.
+
+Environment Variables:
+- PROMPTRCA_INVESTIGATION_MAX_WORKERS: Threads per investigation for blocking AWS calls (default: 8)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from .propagation import submit_with_context
+
+T = TypeVar("T")
+
+DEFAULT_INVESTIGATION_MAX_WORKERS = 8
+
+
+class InvestigationExecutor:
+    """
+    Bounded thread pool for one investigation's blocking calls.
+
+    run() executes a function on the pool in a copy of the caller's context
+    and can be awaited from any event loop, including the private loops
+    specialists run on inside tool threads. timed() records the wall time of
+    a labelled unit of work (typically one specialist run) for timing_report().
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or int(
+            os.getenv("PROMPTRCA_INVESTIGATION_MAX_WORKERS", str(DEFAULT_INVESTIGATION_MAX_WORKERS))
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="promptrca-investigation")
+        self._spans: List[Tuple[str, float, float]] = []
+        self._lock = threading.Lock()
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn on the pool and wait for its result."""
+        return await asyncio.wrap_future(submit_with_context(self._executor, fn, *args, **kwargs))
+
+    @contextmanager
+    def timed(self, label: str) -> Iterator[None]:
+        """Record the wall time of the enclosed block under label."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._spans.append((label, started, time.monotonic()))
+
+    def timing_report(self) -> Dict[str, Any]:
+        """
+        Wall time per recorded unit of work and the overlap between them.
+
+        Returns:
+            Dictionary with per-label seconds, the summed ("busy") seconds,
+            the wall seconds from first start to last finish, and their
+            ratio: 1.0 means the work ran back to back, N means N ran at once
+        """
+        with self._lock:
+            spans = list(self._spans)
+        if not spans:
+            return {"specialists": {}, "busy_seconds": 0.0, "wall_seconds": 0.0, "overlap": 0.0}
+
+        specialists: Dict[str, float] = {}
+        for label, started, finished in spans:
+            specialists[label] = round(specialists.get(label, 0.0) + finished - started, 3)
+        busy = sum(finished - started for _, started, finished in spans)
+        wall = max(finished for _, _, finished in spans) - min(started for _, started, _ in spans)
+        return {
+            "specialists": specialists,
+            "busy_seconds": round(busy, 3),
+            "wall_seconds": round(wall, 3),
+            "overlap": round(busy / wall, 2) if wall > 0 else 1.0
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop queued calls; running calls finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Per-request executor; None means blocking calls go to asyncio's default executor
+_investigation_executor_context: ContextVar[Optional[InvestigationExecutor]] = ContextVar(
+    'investigation_executor', default=None
+)
+
+
+def set_investigation_executor(executor: Optional[InvestigationExecutor]) -> None:
+    """Set the executor for the current request context."""
+    _investigation_executor_context.set(executor)
+
+
+def get_investigation_executor() -> Optional[InvestigationExecutor]:
+    """Get the executor for the current request context, or None."""
+    return _investigation_executor_context.get()
+
+
+def clear_investigation_executor() -> None:
+    """Clear the executor from the current request context."""
+    _investigation_executor_context.set(None)
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking call off the event loop in the current context.
+
+    Uses the investigation's executor when one is set, so one investigation
+    cannot take more than its share of threads; otherwise asyncio.to_thread().
+    """
+    executor = get_investigation_executor()
+    if executor is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return await executor.run(fn, *args, **kwargs)
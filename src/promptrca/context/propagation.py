@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Context - Propagation of per-investigation context into threads
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Per-investigation state (the AWS client, the trace store) lives in
+contextvars. asyncio tasks and asyncio.to_thread() carry the current
+context along; bare executors and strands' synchronous Agent.__call__,
+which runs the agent on a fresh thread of its own, do not. Work handed to
+another thread goes through these helpers so it sees the investigation
+that started it, and only that one.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def submit_with_context(executor: Executor, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+    """Submit fn to the executor, running it in a copy of the caller's context."""
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
+
+
+def isolated_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Run every call of fn in a fresh copy of the caller's context.
+
+    For tools that set per-investigation state from their arguments: the
+    values they set are discarded when the call returns instead of staying
+    on the worker thread for whatever it runs next.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return contextvars.copy_context().run(fn, *args, **kwargs)
+    return wrapper
+
+
+def invoke_agent(agent: Any, prompt: Any, **kwargs: Any) -> Any:
+    """
+    Call a strands Agent synchronously without losing the caller's context.
+
+    Equivalent to agent(prompt, **kwargs), whose worker thread would start
+    from an empty context and leave the agent's tools without an AWS client.
+    Objects without an async invoke_async are simply called.
+    """
+    if not inspect.iscoroutinefunction(getattr(agent, "invoke_async", None)):
+        return agent(prompt, **kwargs)
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="promptrca-agent") as executor:
+        return executor.submit(context.run, asyncio.run, agent.invoke_async(prompt, **kwargs)).result()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - AI-powered root cause analysis for AWS infrastructure
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+"""
+
+
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Optional
+
+
+class TraceStore:
+    """
+    Per-investigation store of raw X-Ray traces.
+
+    Traces fetched once (for example by exemplar prefetching) are served from
+    memory to every later tool call in the same investigation instead of
+    being downloaded again with BatchGetTraces.
+    """
+
+    def __init__(self):
+        self._traces: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Return the raw trace for trace_id, or None if it has not been fetched."""
+        with self._lock:
+            return self._traces.get(trace_id)
+
+    def put(self, trace_id: str, trace: Dict[str, Any]) -> None:
+        """Store a raw trace (as returned by BatchGetTraces) under trace_id."""
+        with self._lock:
+            self._traces[trace_id] = trace
+
+    def missing(self, trace_ids: Iterable[str]) -> list:
+        """Return the trace ids that are not yet in the store, preserving order."""
+        with self._lock:
+            return [trace_id for trace_id in trace_ids if trace_id not in self._traces]
+
+    def trace_ids(self) -> list:
+        """Return the ids of all stored traces."""
+        with self._lock:
+            return list(self._traces.keys())
+
+    def __contains__(self, trace_id: str) -> bool:
+        with self._lock:
+            return trace_id in self._traces
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._traces)
+
+
+# Per-request trace store; None means traces are always fetched from X-Ray
+_trace_store_context: ContextVar[Optional[TraceStore]] = ContextVar('trace_store', default=None)
+
+
+def set_trace_store(store: Optional[TraceStore]) -> None:
+    """
+    Set the trace store for the current request context.
+
+    Args:
+        store: The TraceStore for the current investigation, or None to disable
+    """
+    _trace_store_context.set(store)
+
+
+def get_trace_store() -> Optional[TraceStore]:
+    """
+    Get the trace store for the current request context.
+
+    Unlike get_aws_client(), a missing store is not an error: callers simply
+    fall back to fetching traces from X-Ray.
+
+    Returns:
+        The TraceStore for the current investigation, or None
+    """
+    return _trace_store_context.get()
+
+
+def clear_trace_store() -> None:
+    """Clear the trace store from the current request context."""
+    _trace_store_context.set(None)
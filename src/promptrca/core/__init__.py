@@ -20,7 +20,14 @@ Contact: info@promptrca.com
 
 """
 
-from .investigator import PromptRCAInvestigator
-from .swarm_orchestrator import SwarmOrchestrator
+from ..utils.lazy_exports import lazy_exports
+
+# Imported on first access; the agents and orchestrators pull in strands
+_LAZY_EXPORTS = {
+    "PromptRCAInvestigator": ".investigator",
+    "SwarmOrchestrator": ".swarm_orchestrator",
+}
 
 __all__ = ["PromptRCAInvestigator", "SwarmOrchestrator"]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -265,12 +265,11 @@ class DirectInvocationOrchestrator:
 
         # Discover from X-Ray traces
         if parsed_inputs.trace_ids:
-            from ..tools import get_all_resources_from_trace
+            from ..tools import fetch_all_resources_from_trace
 
             for trace_id in parsed_inputs.trace_ids:
                 try:
-                    resources_json = get_all_resources_from_trace(trace_id)
-                    trace_resources = json.loads(resources_json)
+                    trace_resources = fetch_all_resources_from_trace(trace_id)
 
                     if "error" not in trace_resources:
                         for resource in trace_resources.get("resources", []):
@@ -322,9 +321,8 @@ class DirectInvocationOrchestrator:
             service_name = service_name_map.get(service_type)
             if service_name:
                 try:
-                    from ..tools import check_aws_service_health
-                    health_check = check_aws_service_health(service_name, self.region)
-                    health_data = json.loads(health_check)
+                    from ..tools import fetch_aws_service_health
+                    health_data = fetch_aws_service_health(service_name, self.region)
                     
                     if "error" in health_data:
                         logger.debug(f"AWS Health check failed for {service_name}: {health_data.get('error')}")
@@ -354,9 +352,8 @@ class DirectInvocationOrchestrator:
             resource_name = resource.get('name')
             if resource_name:
                 try:
-                    from ..tools import get_recent_cloudtrail_events
-                    trail_events = get_recent_cloudtrail_events(resource_name, hours_back=24)
-                    trail_data = json.loads(trail_events)
+                    from ..tools import fetch_recent_cloudtrail_events
+                    trail_data = fetch_recent_cloudtrail_events(resource_name, hours_back=24)
                     
                     if "error" in trail_data:
                         logger.debug(f"CloudTrail check failed for {resource_name}: {trail_data.get('error')}")
@@ -399,12 +396,10 @@ class DirectInvocationOrchestrator:
         facts = []
         
         try:
-            from ..tools import get_xray_trace
+            from ..tools import fetch_xray_trace
             logger.info(f"     → Getting trace data for {trace_id}...")
             
-            trace_json = get_xray_trace(trace_id)
-            logger.info(f"     → Trace JSON length: {len(trace_json) if trace_json else 0}")
-            trace_data = json.loads(trace_json)
+            trace_data = fetch_xray_trace(trace_id)
             logger.info(f"     → Parsed trace data keys: {list(trace_data.keys())}")
 
             if "error" in trace_data:
@@ -585,9 +580,8 @@ class DirectInvocationOrchestrator:
                     invocation.context
                 )
 
-                # Run specialist (in thread pool since Strands is sync)
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, specialist, prompt)
+                # Run specialist on this task so it keeps the investigation's context
+                result = await specialist.invoke_async(prompt)
 
                 invocation.result = result
                 logger.info(f"   ✓ {invocation.specialist_type} specialist completed")
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Deterministic evidence pre-collection node
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Graph node that runs before the specialist swarm. It takes the resources
+found by the deterministic input parse and the investigation's traces, runs
+every matching specialist in parallel in code, and hands the resulting fact
+bundle to the swarm so agents start from evidence instead of tool calls.
+
+Environment Variables:
+- PROMPTRCA_EVIDENCE_MAX_WORKERS: Specialists run concurrently (default: 8)
+- PROMPTRCA_EVIDENCE_SPECIALIST_TIMEOUT: Seconds allowed per specialist (default: 60)
+"""
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from strands.agent.agent_result import AgentResult
+from strands.multiagent.base import MultiAgentBase, MultiAgentResult, NodeResult, Status
+from strands.telemetry.metrics import EventLoopMetrics
+
+from ..context import (
+    InvestigationExecutor, get_investigation_executor,
+    set_investigation_executor, clear_investigation_executor
+)
+from ..models import Fact
+from ..specialists import (
+    LambdaSpecialist, APIGatewaySpecialist,
+    StepFunctionsSpecialist, TraceSpecialist,
+    IAMSpecialist, S3Specialist, SQSSpecialist, SNSSpecialist,
+    InvestigationContext
+)
+from ..utils import get_logger
+from .investigation_events import publish_facts
+from .swarm_tools import _run_specialist_analysis, _format_specialist_results
+
+logger = get_logger(__name__)
+
+DEFAULT_EVIDENCE_MAX_WORKERS = 8
+DEFAULT_EVIDENCE_SPECIALIST_TIMEOUT = 60.0
+
+RESOURCE_SPECIALISTS = (
+    LambdaSpecialist, APIGatewaySpecialist, StepFunctionsSpecialist,
+    IAMSpecialist, S3Specialist, SQSSpecialist, SNSSpecialist
+)
+
+PRECOLLECTED_EVIDENCE_HEADER = "PRE-COLLECTED EVIDENCE"
+
+
+class EvidenceCollectionNode(MultiAgentBase):
+    """
+    Custom Strands node that gathers specialist facts before the swarm runs.
+
+    Reads the deterministic ParsedInputs and exemplar traces from
+    invocation_state, discovers resources from explicit targets and traces
+    (served from the investigation's trace store), and runs each matching
+    specialist in its own thread. Threads inherit the current context, so
+    the AWS client and trace store set by the orchestrator are visible.
+    Within each specialist, independent sub-analyses share the
+    investigation's executor for their AWS calls.
+    The node's output forwards its dependencies' text and appends the fact
+    bundle, which is also stored in invocation_state["precollected_facts"];
+    the discovered resources are kept in invocation_state["discovered_resources"]
+    and the per-specialist wall times and overlap in
+    invocation_state["specialist_timings"].
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, specialist_timeout: Optional[float] = None, **kwargs):
+        """
+        Args:
+            max_workers: Maximum specialists running at once
+            specialist_timeout: Seconds allowed for each specialist
+        """
+        super().__init__()
+        self.max_workers = max_workers or int(os.getenv("PROMPTRCA_EVIDENCE_MAX_WORKERS", str(DEFAULT_EVIDENCE_MAX_WORKERS)))
+        self.specialist_timeout = specialist_timeout or float(
+            os.getenv("PROMPTRCA_EVIDENCE_SPECIALIST_TIMEOUT", str(DEFAULT_EVIDENCE_SPECIALIST_TIMEOUT))
+        )
+
+    async def invoke_async(self, task, invocation_state, **kwargs):
+        """
+        Collect evidence for the discovered resources and traces.
+
+        Args:
+            task: Combined input from Graph (original task + results from dependency nodes)
+            invocation_state: Shared state with parsed_inputs, exemplar_traces and region
+
+        Returns:
+            MultiAgentResult whose agent text carries the fact bundle
+        """
+        start = time.monotonic()
+        invocation_state = invocation_state if invocation_state is not None else {}
+        parsed_inputs = invocation_state.get("parsed_inputs")
+        region = invocation_state.get("region") or getattr(parsed_inputs, "region", None) or "us-east-1"
+
+        trace_ids = investigation_trace_ids(invocation_state)
+
+        context = InvestigationContext(
+            trace_ids=trace_ids,
+            region=region,
+            parsed_inputs=parsed_inputs,
+            investigation_id=invocation_state.get("investigation_id")
+        )
+
+        resources = await self._discover_resources(parsed_inputs, trace_ids, region)
+        invocation_state["discovered_resources"] = resources
+        logger.info(f"🧺 Pre-collecting evidence for {len(resources)} resources and {len(trace_ids)} traces")
+
+        executor = get_investigation_executor()
+        owns_executor = executor is None
+        if owns_executor:
+            executor = InvestigationExecutor()
+            set_investigation_executor(executor)
+        try:
+            bundle = await self.collect(
+                resources, trace_ids, context,
+                on_result=lambda results: publish_facts(invocation_state, results),
+                executor=executor
+            )
+        finally:
+            if owns_executor:
+                clear_investigation_executor()
+                executor.shutdown()
+        invocation_state["precollected_facts"] = bundle
+        timings = executor.timing_report()
+        invocation_state["specialist_timings"] = timings
+
+        fact_count = sum(len(entry.get("facts", [])) for entry in bundle)
+        logger.info(f"✅ Pre-collected {fact_count} facts from {len(bundle)} specialist runs in {time.monotonic() - start:.2f}s "
+                    f"(specialists busy {timings['busy_seconds']:.2f}s, overlap {timings['overlap']:.1f}x)")
+
+        text = self._format_output(task, bundle)
+        agent_result = AgentResult(
+            stop_reason="end_turn",
+            message={"role": "assistant", "content": [{"text": text}]},
+            metrics=EventLoopMetrics(),
+            state={}
+        )
+        execution_time = int((time.monotonic() - start) * 1000)
+        return MultiAgentResult(
+            status=Status.COMPLETED,
+            results={
+                "evidence_collector": NodeResult(
+                    result=agent_result,
+                    execution_time=execution_time,
+                    status=Status.COMPLETED
+                )
+            },
+            execution_time=execution_time,
+            accumulated_usage={"totalTokens": 0, "inputTokens": 0, "outputTokens": 0}
+        )
+
+    @staticmethod
+    async def _discover_resources(parsed_inputs, trace_ids: List[str], region: str) -> List[Dict[str, Any]]:
+        """Collect explicit targets and trace resources, deduplicated by ARN or name."""
+        resources = []
+        for target in getattr(parsed_inputs, "primary_targets", None) or []:
+            resources.append({
+                'type': target.type,
+                'name': target.name,
+                'arn': target.arn,
+                'region': target.region or region,
+                'source': 'explicit_target',
+                'metadata': target.metadata
+            })
+
+        if trace_ids:
+            trace_resources = await asyncio.gather(
+                *(asyncio.to_thread(EvidenceCollectionNode._resources_from_trace, trace_id, region)
+                  for trace_id in trace_ids)
+            )
+            for found in trace_resources:
+                resources.extend(found)
+
+        unique_resources = {}
+        for resource in resources:
+            key = resource.get('arn') or resource.get('name')
+            if key and key not in unique_resources:
+                unique_resources[key] = resource
+        return list(unique_resources.values())
+
+    @staticmethod
+    def _resources_from_trace(trace_id: str, region: str) -> List[Dict[str, Any]]:
+        from ..tools import fetch_all_resources_from_trace
+
+        try:
+            trace_resources = fetch_all_resources_from_trace(trace_id)
+        except Exception as e:
+            logger.warning(f"Failed to extract resources from trace {trace_id}: {e}")
+            return []
+        if "error" in trace_resources:
+            return []
+        return [
+            {
+                'type': resource.get('type'),
+                'name': resource.get('name'),
+                'arn': resource.get('arn'),
+                'region': region,
+                'source': 'xray_trace',
+                'metadata': resource.get('metadata', {})
+            }
+            for resource in trace_resources.get("resources", [])
+        ]
+
+    async def collect(
+        self,
+        resources: List[Dict[str, Any]],
+        trace_ids: List[str],
+        context: InvestigationContext,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        executor: Optional[InvestigationExecutor] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run every matching specialist concurrently.
+
+        Args:
+            on_result: Called with each specialist run's result as soon as it finishes
+            executor: Records each specialist run's wall time, if given
+
+        Returns:
+            One formatted result per specialist run; failed or timed-out runs
+            are reported with an error field instead of facts
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        runs = []
+        for resource in resources:
+            resource_type = (resource.get('type') or '').lower()
+            for specialist_class in RESOURCE_SPECIALISTS:
+                specialist = specialist_class()
+                if specialist.can_analyze(resource_type):
+                    runs.append(self._run(semaphore, specialist, resource_type, resource, context, executor))
+                    break
+        for trace_id in trace_ids:
+            runs.append(self._run_trace(semaphore, trace_id, context, executor))
+
+        if on_result is not None:
+            runs = [self._notify(run, on_result) for run in runs]
+        return list(await asyncio.gather(*runs))
+
+    @staticmethod
+    async def _notify(run, on_result: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        result = await run
+        on_result(result)
+        return result
+
+    async def _run(self, semaphore, specialist, specialist_type: str, resource: Dict[str, Any],
+                   context: InvestigationContext, executor: Optional[InvestigationExecutor] = None) -> Dict[str, Any]:
+        resource_name = resource.get('name') or 'unknown'
+        async with semaphore, self._timed(executor, f"{specialist_type}:{resource_name}"):
+            try:
+                facts = await asyncio.wait_for(
+                    asyncio.to_thread(_run_specialist_analysis, specialist, resource, context),
+                    timeout=self.specialist_timeout
+                )
+                return _format_specialist_results(specialist_type, resource_name, facts)
+            except asyncio.TimeoutError:
+                return self._failed(specialist_type, resource_name, f"timed out after {self.specialist_timeout:.0f}s")
+            except Exception as e:
+                return self._failed(specialist_type, resource_name, str(e))
+
+    async def _run_trace(self, semaphore, trace_id: str, context: InvestigationContext,
+                         executor: Optional[InvestigationExecutor] = None) -> Dict[str, Any]:
+        async with semaphore, self._timed(executor, f"trace:{trace_id}"):
+            try:
+                facts = await asyncio.wait_for(
+                    asyncio.to_thread(self._analyze_trace, trace_id, context),
+                    timeout=self.specialist_timeout
+                )
+                return _format_specialist_results("trace", trace_id, facts)
+            except asyncio.TimeoutError:
+                return self._failed("trace", trace_id, f"timed out after {self.specialist_timeout:.0f}s")
+            except Exception as e:
+                return self._failed("trace", trace_id, str(e))
+
+    @staticmethod
+    @asynccontextmanager
+    async def _timed(executor: Optional[InvestigationExecutor], label: str):
+        if executor is None:
+            yield
+            return
+        with executor.timed(label):
+            yield
+
+    @staticmethod
+    def _analyze_trace(trace_id: str, context: InvestigationContext) -> List[Fact]:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(TraceSpecialist().analyze_trace(trace_id, context))
+        finally:
+            loop.close()
+
+    @staticmethod
+    def _failed(specialist_type: str, resource_name: str, error: str) -> Dict[str, Any]:
+        logger.warning(f"Evidence pre-collection failed for {specialist_type} {resource_name}: {error}")
+        return {
+            "specialist_type": specialist_type,
+            "resource_name": resource_name,
+            "facts": [],
+            "error": error
+        }
+
+    @staticmethod
+    def _format_output(task, bundle: List[Dict[str, Any]]) -> str:
+        """Forward the dependency outputs and append the fact bundle for the swarm."""
+        forwarded = previous_node_outputs(task)
+
+        evidence = json.dumps(
+            [entry for entry in bundle if entry.get("facts") or entry.get("error")],
+            separators=(',', ':'),
+            default=str
+        )
+        sections = [forwarded] if forwarded else []
+        sections.append(
+            f"{PRECOLLECTED_EVIDENCE_HEADER} (specialists already ran for these resources; "
+            f"build on these facts and only call tools for gaps):\n{evidence}"
+        )
+        return "\n\n".join(sections)
+
+
+def investigation_trace_ids(invocation_state: Dict[str, Any]) -> List[str]:
+    """Trace IDs from the deterministic parse followed by any exemplar traces."""
+    trace_ids = list(getattr(invocation_state.get("parsed_inputs"), "trace_ids", None) or [])
+    for exemplar in invocation_state.get("exemplar_traces") or []:
+        if exemplar.get("trace_id") and exemplar["trace_id"] not in trace_ids:
+            trace_ids.append(exemplar["trace_id"])
+    return trace_ids
+
+
+def previous_node_outputs(task) -> str:
+    """Text produced by a node's dependencies, without the original task the graph prepends."""
+    if isinstance(task, str):
+        text = task
+    else:
+        text = "".join(block.get("text", "") for block in task if isinstance(block, dict))
+
+    marker = "Inputs from previous nodes:"
+    return text.split(marker, 1)[1].strip() if marker in text else ""
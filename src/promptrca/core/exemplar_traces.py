@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Exemplar Trace Selection for PromptRCA
+
+When an investigation names resources but no X-Ray trace, picks a small set
+of representative faulted traces from the incident window so the
+investigation can stay trace-driven. The window ends shortly after the
+incident time when the input has one, so a delayed investigation does not
+pick traces from after the incident.
+
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+from ..context import get_aws_client
+from ..tools.xray_tools import fetch_traces
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EXEMPLAR_LOOKBACK_MINUTES = 60
+DEFAULT_MAX_EXEMPLARS = 3
+DEFAULT_MAX_SUMMARIES = 500
+# Traces of a failure can start a little after the alarm or reported time
+EXEMPLAR_WINDOW_AFTER_INCIDENT_MINUTES = 5
+
+# ISO 8601 date and time, as in alarm StateChangeTime or EventBridge event time
+_TIMESTAMP_PATTERN = re.compile(
+    r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?'
+)
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, str) and value.strip():
+        try:
+            moment = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def find_incident_time(
+    free_text: str = "",
+    time_range: Optional[Dict[str, Any]] = None,
+    incident_time: Any = None
+) -> Optional[datetime]:
+    """
+    When the incident happened, if the input says.
+
+    Args:
+        free_text: Investigation input; its first ISO 8601 timestamp is used
+        time_range: Parsed time range; its end (or start) is used
+        incident_time: Explicit incident time, e.g. from the alarm; preferred
+
+    Returns:
+        Timezone-aware incident time, or None
+    """
+    candidates = [incident_time]
+    if time_range:
+        candidates += [time_range.get('end'), time_range.get('start')]
+    match = _TIMESTAMP_PATTERN.search(free_text or "")
+    if match:
+        candidates.append(match.group(0))
+    for candidate in candidates:
+        moment = _parse_time(candidate)
+        if moment:
+            return moment
+    return None
+
+
+@dataclass
+class TraceExemplar:
+    """A representative trace for one cluster of failing traces."""
+    trace_id: str
+    signature: str
+    cluster_size: int
+    root_cause_service: Optional[str] = None
+    exception: Optional[str] = None
+    service_path: List[str] = field(default_factory=list)
+    duration: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "signature": self.signature,
+            "cluster_size": self.cluster_size,
+            "root_cause_service": self.root_cause_service,
+            "exception": self.exception,
+            "service_path": self.service_path,
+            "duration": self.duration
+        }
+
+
+class ExemplarTraceSelector:
+    """
+    Selects exemplar traces for resources via X-Ray GetTraceSummaries.
+
+    Faulted and errored traces in the incident window are clustered by
+    signature (root-cause service, entity path and exception, plus the set of
+    services the trace touched). One representative per cluster is kept, the
+    largest clusters first, and the selected traces are prefetched in
+    parallel into the investigation trace store.
+    """
+
+    def __init__(
+        self,
+        max_exemplars: Optional[int] = None,
+        lookback_minutes: Optional[int] = None,
+        max_summaries: int = DEFAULT_MAX_SUMMARIES
+    ):
+        self.max_exemplars = max_exemplars or int(
+            os.getenv('PROMPTRCA_MAX_EXEMPLAR_TRACES', DEFAULT_MAX_EXEMPLARS)
+        )
+        self.lookback_minutes = lookback_minutes or int(
+            os.getenv('PROMPTRCA_EXEMPLAR_LOOKBACK_MINUTES', DEFAULT_EXEMPLAR_LOOKBACK_MINUTES)
+        )
+        self.max_summaries = max_summaries
+
+    def select(
+        self,
+        service_names: List[str],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        prefetch: bool = True,
+        incident_time: Optional[datetime] = None
+    ) -> List[TraceExemplar]:
+        """
+        Pick exemplar traces for the given X-Ray service names.
+
+        Args:
+            service_names: X-Ray service names (e.g. Lambda function names)
+            start_time: Start of the incident window (default: end_time - lookback)
+            end_time: End of the incident window (default: shortly after
+                incident_time if given, otherwise now)
+            prefetch: Whether to download the selected traces into the trace store
+            incident_time: When the incident happened, anchoring the window
+
+        Returns:
+            List of TraceExemplar, largest cluster first
+        """
+        service_names = [name for name in dict.fromkeys(service_names) if name]
+        if not service_names:
+            return []
+
+        now = datetime.now(timezone.utc)
+        if end_time is None and incident_time is not None:
+            end_time = min(incident_time + timedelta(minutes=EXEMPLAR_WINDOW_AFTER_INCIDENT_MINUTES), now)
+        end_time = end_time or now
+        start_time = start_time or end_time - timedelta(minutes=self.lookback_minutes)
+        filter_expression = self.build_filter_expression(service_names)
+
+        logger.info(f"🔍 Selecting exemplar traces with filter: {filter_expression}")
+        summaries = self._get_trace_summaries(filter_expression, start_time, end_time)
+        exemplars = self.cluster_summaries(summaries)[:self.max_exemplars]
+
+        logger.info(
+            f"✅ Selected {len(exemplars)} exemplar traces from {len(summaries)} faulted trace summaries"
+        )
+
+        if prefetch and exemplars:
+            try:
+                fetch_traces([exemplar.trace_id for exemplar in exemplars])
+            except Exception as e:
+                logger.warning(f"Failed to prefetch exemplar traces: {e}")
+
+        return exemplars
+
+    @staticmethod
+    def build_filter_expression(service_names: List[str]) -> str:
+        """Build a filter expression matching faulted or errored traces through any service."""
+        services = " OR ".join(f'service("{name}")' for name in service_names)
+        if len(service_names) > 1:
+            services = f"({services})"
+        return f"{services} AND (fault = true OR error = true)"
+
+    def _get_trace_summaries(
+        self,
+        filter_expression: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict[str, Any]]:
+        """Page through GetTraceSummaries up to max_summaries results."""
+        client = get_aws_client().get_client('xray')
+        kwargs = {
+            'StartTime': start_time,
+            'EndTime': end_time,
+            'FilterExpression': filter_expression
+        }
+
+        summaries: List[Dict[str, Any]] = []
+        while len(summaries) < self.max_summaries:
+            response = client.get_trace_summaries(**kwargs)
+            summaries.extend(response.get('TraceSummaries', []))
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+            kwargs['NextToken'] = next_token
+
+        return summaries[:self.max_summaries]
+
+    def cluster_summaries(self, summaries: List[Dict[str, Any]]) -> List[TraceExemplar]:
+        """
+        Cluster trace summaries by failure signature and pick one representative each.
+
+        The representative is the most recent complete trace of the cluster,
+        falling back to a partial one when nothing else is available.
+        """
+        clusters: Dict[str, List[Dict[str, Any]]] = {}
+        details: Dict[str, Tuple[Optional[str], Optional[str], List[str]]] = {}
+
+        for summary in summaries:
+            if not summary.get('Id'):
+                continue
+            root_service, exception, entity_path = self._root_cause(summary)
+            service_path = sorted({
+                service.get('Name') for service in summary.get('ServiceIds', []) if service.get('Name')
+            })
+            signature = "|".join([
+                root_service or "unknown",
+                ">".join(entity_path),
+                exception or "unknown",
+                ",".join(service_path)
+            ])
+            clusters.setdefault(signature, []).append(summary)
+            details.setdefault(signature, (root_service, exception, service_path))
+
+        exemplars = []
+        for signature, members in clusters.items():
+            representative = max(
+                members,
+                key=lambda s: (not s.get('IsPartial', False), self._start_time_key(s))
+            )
+            root_service, exception, service_path = details[signature]
+            exemplars.append(TraceExemplar(
+                trace_id=representative['Id'],
+                signature=signature,
+                cluster_size=len(members),
+                root_cause_service=root_service,
+                exception=exception,
+                service_path=service_path,
+                duration=representative.get('Duration')
+            ))
+
+        exemplars.sort(key=lambda e: e.cluster_size, reverse=True)
+        return exemplars
+
+    @staticmethod
+    def _root_cause(summary: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """Extract (service, exception, entity path) of the first fault or error root cause."""
+        root_causes = summary.get('FaultRootCauses') or summary.get('ErrorRootCauses') or []
+        for root_cause in root_causes:
+            for service in root_cause.get('Services', []):
+                entity_path = [entity.get('Name', '') for entity in service.get('EntityPath', [])]
+                exception = None
+                for entity in service.get('EntityPath', []):
+                    if entity.get('Exceptions'):
+                        exception = entity['Exceptions'][0].get('Name')
+                return service.get('Name'), exception, entity_path
+        return None, None, []
+
+    @staticmethod
+    def _start_time_key(summary: Dict[str, Any]) -> float:
+        start = summary.get('StartTime')
+        if isinstance(start, datetime):
+            return start.timestamp()
+        if isinstance(start, (int, float)):
+            return float(start)
+        return 0.0
@@ -24,7 +24,11 @@ Contact: info@promptrca.com
 """
 
 import asyncio
-from typing import Dict, Any, List
+from typing import Awaitable, Dict, Any, List
+from ..context import (
+    InvestigationExecutor, get_investigation_executor,
+    set_investigation_executor, clear_investigation_executor
+)
 from ..models import Fact
 from ..specialists import (
     BaseSpecialist, InvestigationContext,
@@ -41,7 +45,11 @@ class FactCollector:
     Coordinates specialist execution to collect facts about AWS resources.
     
     This service manages the parallel execution of specialists and ensures
-    consistent fact collection across different resource types.
+    consistent fact collection across different resource types. Specialists'
+    blocking AWS calls run on the investigation's executor (a private one if
+    the caller has not set one), so resources and traces are really analyzed
+    in parallel; the wall time of each specialist run and the overlap achieved
+    are kept in `last_timings`.
     """
     
     def __init__(self):
@@ -52,6 +60,7 @@ class FactCollector:
         }
         self.trace_specialist = TraceSpecialist()
         self.max_facts_total = 50  # Global limit
+        self.last_timings: Dict[str, Any] = {}
     
     async def collect_facts(self, resources: List[Dict[str, Any]], 
                           context: InvestigationContext) -> List[Fact]:
@@ -65,21 +74,39 @@ class FactCollector:
         Returns:
             List of facts collected from all specialists
         """
-        facts = []
+        executor = get_investigation_executor()
+        owns_executor = executor is None
+        if owns_executor:
+            executor = InvestigationExecutor()
+            set_investigation_executor(executor)
         
-        # Collect facts from resource specialists
-        resource_facts = await self._collect_resource_facts(resources, context)
-        facts.extend(resource_facts)
+        try:
+            # Resource specialists and trace analysis run side by side
+            resource_facts, trace_facts = await asyncio.gather(
+                self._collect_resource_facts(resources, context, executor),
+                self._collect_trace_facts(context, executor)
+            )
+        finally:
+            self.last_timings = executor.timing_report()
+            if owns_executor:
+                clear_investigation_executor()
+                executor.shutdown()
         
-        # Collect facts from trace analysis
-        trace_facts = await self._collect_trace_facts(context)
-        facts.extend(trace_facts)
+        logger.info(f"   ⏱️ Specialists busy {self.last_timings['busy_seconds']:.2f}s over "
+                    f"{self.last_timings['wall_seconds']:.2f}s wall (overlap {self.last_timings['overlap']:.1f}x)")
         
         # Limit total facts to prevent overwhelming the AI
+        facts = resource_facts + trace_facts
         return facts[:self.max_facts_total]
     
+    @staticmethod
+    async def _timed(executor: InvestigationExecutor, label: str, analysis: Awaitable[List[Fact]]) -> List[Fact]:
+        with executor.timed(label):
+            return await analysis
+    
     async def _collect_resource_facts(self, resources: List[Dict[str, Any]], 
-                                    context: InvestigationContext) -> List[Fact]:
+                                    context: InvestigationContext,
+                                    executor: InvestigationExecutor) -> List[Fact]:
         """Collect facts from resource-specific specialists."""
         tasks = []
         
@@ -89,7 +116,9 @@ class FactCollector:
             
             if specialist:
                 logger.info(f"   → Scheduling {resource_type} specialist for {resource.get('name')}")
-                tasks.append(specialist.analyze(resource, context))
+                tasks.append(self._timed(
+                    executor, f"{resource_type}:{resource.get('name')}", specialist.analyze(resource, context)
+                ))
             else:
                 logger.debug(f"No specialist available for resource type: {resource_type}")
         
@@ -114,7 +143,8 @@ class FactCollector:
         logger.info(f"   ✓ Collected {len(facts)} facts from resource specialists")
         return facts
     
-    async def _collect_trace_facts(self, context: InvestigationContext) -> List[Fact]:
+    async def _collect_trace_facts(self, context: InvestigationContext,
+                                 executor: InvestigationExecutor) -> List[Fact]:
         """Collect facts from X-Ray trace analysis."""
         if not context.trace_ids:
             return []
@@ -123,7 +153,9 @@ class FactCollector:
         
         tasks = []
         for trace_id in context.trace_ids:
-            tasks.append(self.trace_specialist.analyze_trace(trace_id, context))
+            tasks.append(self._timed(
+                executor, f"trace:{trace_id}", self.trace_specialist.analyze_trace(trace_id, context)
+            ))
         
         # Execute trace analysis in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
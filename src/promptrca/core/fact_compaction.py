@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Fact compaction and token budgeting
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Keeps the input of the synthesis nodes (hypothesis generation, root cause
+analysis) within a token budget. Facts are deduplicated, ranked by
+confidence and relevance, stripped of bulky metadata and cut at the budget;
+everything removed is recorded so the report can say what was left out.
+
+Environment Variables:
+- PROMPTRCA_FACT_TOKEN_BUDGET: Default input budget per synthesis node in tokens (default: 8000, 0 disables)
+- PROMPTRCA_TOKEN_BUDGET_<NODE>: Per-node override, e.g. PROMPTRCA_TOKEN_BUDGET_ROOT_CAUSE_ANALYSIS
+- PROMPTRCA_METADATA_MAX_CHARS: Serialized size cap per fact's metadata (default: 600)
+"""
+
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FACT_TOKEN_BUDGET = 8000
+DEFAULT_METADATA_MAX_CHARS = 600
+# Conservative for JSON-heavy text, which tokenizes denser than prose
+CHARS_PER_TOKEN = 3.5
+
+METADATA_MAX_LIST_ITEMS = 3
+METADATA_MAX_STRING_CHARS = 200
+METADATA_MAX_DEPTH = 3
+
+RELEVANCE_KEYWORDS = (
+    'error', 'exception', 'fail', 'timeout', 'timed out', 'denied', 'unauthorized',
+    'throttl', 'limit', '5xx', '4xx', 'fault', 'retry', 'dlq', 'oom', 'memory'
+)
+
+_VOLATILE_TOKENS = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'  # UUIDs / request ids
+    r'|1-[0-9a-f]{8}-[0-9a-f]{24}'  # X-Ray trace ids
+    r'|\d+(?:\.\d+)?'  # counts, durations, timestamps
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text locally, without a tokenizer call."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def get_node_token_budget(node_id: str) -> int:
+    """Input token budget for a graph node (0 means unlimited)."""
+    override = os.getenv(f"PROMPTRCA_TOKEN_BUDGET_{node_id.upper()}")
+    if override is not None:
+        return int(override)
+    return int(os.getenv("PROMPTRCA_FACT_TOKEN_BUDGET", str(DEFAULT_FACT_TOKEN_BUDGET)))
+
+
+def _truncate_value(value: Any, depth: int = 0) -> Any:
+    if isinstance(value, str):
+        if len(value) > METADATA_MAX_STRING_CHARS:
+            return value[:METADATA_MAX_STRING_CHARS] + f"...(+{len(value) - METADATA_MAX_STRING_CHARS} chars)"
+        return value
+    if isinstance(value, dict):
+        if depth >= METADATA_MAX_DEPTH:
+            return f"{{{len(value)} keys}}"
+        return {k: _truncate_value(v, depth + 1) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        if depth >= METADATA_MAX_DEPTH:
+            return f"[{len(value)} items]"
+        items = [_truncate_value(v, depth + 1) for v in value[:METADATA_MAX_LIST_ITEMS]]
+        if len(value) > METADATA_MAX_LIST_ITEMS:
+            items.append(f"...(+{len(value) - METADATA_MAX_LIST_ITEMS} more)")
+        return items
+    return value
+
+
+def compact_metadata(metadata: Optional[Dict[str, Any]], max_chars: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Shrink fact metadata: long strings and lists are truncated, deep nesting
+    is summarized, and if the result is still over max_chars only scalar
+    fields are kept plus a list of the omitted keys. Small metadata is
+    returned unchanged.
+    """
+    if not metadata:
+        return {}
+    max_chars = max_chars if max_chars is not None else int(os.getenv("PROMPTRCA_METADATA_MAX_CHARS", str(DEFAULT_METADATA_MAX_CHARS)))
+    if len(json.dumps(metadata, default=str)) <= max_chars:
+        return metadata
+
+    compacted = _truncate_value(metadata)
+    if len(json.dumps(compacted, default=str)) <= max_chars:
+        return compacted
+
+    scalars = {k: v for k, v in compacted.items() if isinstance(v, (int, float, bool)) or v is None
+               or (isinstance(v, str) and len(v) <= 80)}
+    omitted = [k for k in compacted if k not in scalars]
+    if omitted:
+        scalars["omitted_keys"] = omitted
+    return scalars
+
+
+def _normalize(content: str) -> str:
+    return " ".join(_VOLATILE_TOKENS.sub("#", content.lower()).split())
+
+
+def _fact_dict(fact: Any) -> Dict[str, Any]:
+    if isinstance(fact, dict):
+        return fact
+    return {
+        "source": getattr(fact, "source", "unknown"),
+        "content": getattr(fact, "content", str(fact)),
+        "confidence": getattr(fact, "confidence", 0.5),
+        "metadata": getattr(fact, "metadata", {}) or {}
+    }
+
+
+@dataclass
+class CompactionResult:
+    """Facts kept within the budget and a record of what was dropped."""
+    facts: List[Dict[str, Any]]
+    dropped: List[Dict[str, Any]] = field(default_factory=list)
+    input_count: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    budget: int = 0
+
+    def to_prompt_section(self) -> str:
+        """Render the kept facts, one compact JSON object per line."""
+        lines = [json.dumps(fact, separators=(',', ':'), default=str) for fact in self.facts]
+        header = f"FACTS ({len(self.facts)} of {self.input_count}, ranked by confidence and relevance"
+        if self.dropped:
+            header += f"; {len(self.dropped)} duplicates or low-ranked facts omitted for size"
+        return header + "):\n" + "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input_count": self.input_count,
+            "kept": len(self.facts),
+            "dropped": self.dropped,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "budget": self.budget
+        }
+
+
+class FactCompactor:
+    """
+    Deduplicate, rank, trim and budget facts for a synthesis prompt.
+
+    Facts whose content matches after lowercasing and masking ids and
+    numbers are merged (the highest-confidence copy is kept and counts its
+    occurrences). Ranking is confidence plus a bonus for failure keywords
+    and for naming one of the investigation's target resources.
+    """
+
+    def __init__(self, relevance_terms: Optional[Iterable[str]] = None, metadata_max_chars: Optional[int] = None):
+        """
+        Args:
+            relevance_terms: Resource names (or other terms) that make a fact more relevant
+            metadata_max_chars: Serialized size cap per fact's metadata
+        """
+        self.relevance_terms = [t.lower() for t in (relevance_terms or []) if t]
+        self.metadata_max_chars = metadata_max_chars
+
+    def score(self, fact: Dict[str, Any]) -> float:
+        content = str(fact.get("content", "")).lower()
+        score = float(fact.get("confidence") or 0.0)
+        if any(keyword in content for keyword in RELEVANCE_KEYWORDS):
+            score += 0.2
+        if any(term in content for term in self.relevance_terms):
+            score += 0.1
+        return score
+
+    def compact(self, facts: Iterable[Any], budget: int) -> CompactionResult:
+        """
+        Args:
+            facts: Fact objects or fact dicts
+            budget: Token budget for the rendered facts (0 means unlimited)
+
+        Returns:
+            CompactionResult with kept facts in rank order
+        """
+        facts = [_fact_dict(f) for f in facts]
+        tokens_before = sum(estimate_tokens(json.dumps(f, separators=(',', ':'), default=str)) for f in facts)
+        dropped: List[Dict[str, Any]] = []
+
+        unique: Dict[str, Dict[str, Any]] = {}
+        for fact in facts:
+            key = _normalize(str(fact.get("content", "")))
+            existing = unique.get(key)
+            if existing is None:
+                unique[key] = dict(fact, occurrences=1)
+                continue
+            occurrences = existing["occurrences"] + 1
+            if (fact.get("confidence") or 0) > (existing.get("confidence") or 0):
+                dropped.append(self._dropped(existing, "duplicate"))
+                unique[key] = dict(fact, occurrences=occurrences)
+            else:
+                dropped.append(self._dropped(fact, "duplicate"))
+                existing["occurrences"] = occurrences
+
+        ranked = sorted(unique.values(), key=self.score, reverse=True)
+
+        kept: List[Dict[str, Any]] = []
+        used = 0
+        for fact in ranked:
+            compacted = {
+                "source": fact.get("source"),
+                "content": fact.get("content"),
+                "confidence": fact.get("confidence"),
+            }
+            metadata = compact_metadata(fact.get("metadata"), self.metadata_max_chars)
+            if metadata:
+                compacted["metadata"] = metadata
+            if fact["occurrences"] > 1:
+                compacted["occurrences"] = fact["occurrences"]
+
+            cost = estimate_tokens(json.dumps(compacted, separators=(',', ':'), default=str)) + 1
+            if budget and used + cost > budget:
+                dropped.append(self._dropped(fact, "budget"))
+                continue
+            kept.append(compacted)
+            used += cost
+
+        return CompactionResult(
+            facts=kept,
+            dropped=dropped,
+            input_count=len(facts),
+            tokens_before=tokens_before,
+            tokens_after=used,
+            budget=budget
+        )
+
+    @staticmethod
+    def _dropped(fact: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        return {
+            "source": fact.get("source"),
+            "content": str(fact.get("content", ""))[:120],
+            "confidence": fact.get("confidence"),
+            "reason": reason
+        }
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """Cut text to roughly `budget` tokens, keeping the start and the end."""
+    if budget <= 0:
+        return ""
+    if estimate_tokens(text) <= budget:
+        return text
+    max_chars = int(budget * CHARS_PER_TOKEN)
+    head = text[:max_chars * 2 // 3]
+    tail = text[-(max_chars // 3):] if max_chars >= 3 else ""
+    omitted = len(text) - len(head) - len(tail)
+    return f"{head}\n[... {estimate_tokens(text[len(head):len(text) - len(tail)])} tokens ({omitted} chars) omitted ...]\n{tail}"
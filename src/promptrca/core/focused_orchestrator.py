@@ -177,13 +177,12 @@ class FocusedDirectOrchestrator:
 
         # Discover from X-Ray traces
         if parsed_inputs.trace_ids:
-            from ..tools import get_all_resources_from_trace
+            from ..tools import fetch_all_resources_from_trace
 
             for trace_id in parsed_inputs.trace_ids:
                 try:
                     logger.info(f"   → Extracting resources from trace {trace_id}...")
-                    resources_json = get_all_resources_from_trace(trace_id)
-                    trace_resources = json.loads(resources_json)
+                    trace_resources = fetch_all_resources_from_trace(trace_id)
 
                     if "error" not in trace_resources:
                         for resource in trace_resources.get("resources", []):
@@ -249,11 +248,10 @@ class FocusedDirectOrchestrator:
         facts = []
         
         try:
-            from ..tools import get_xray_trace
+            from ..tools import fetch_xray_trace
             logger.info(f"     → Getting trace data for {trace_id}...")
             
-            trace_json = get_xray_trace(trace_id)
-            trace_data = json.loads(trace_json)
+            trace_data = fetch_xray_trace(trace_id)
 
             if "error" in trace_data:
                 facts.append(Fact(
@@ -386,9 +384,8 @@ class FocusedDirectOrchestrator:
         
         try:
             # Get configuration
-            from ..tools.lambda_tools import get_lambda_config
-            config_json = get_lambda_config(function_name)
-            config = json.loads(config_json)
+            from ..tools.lambda_tools import fetch_lambda_config
+            config = fetch_lambda_config(function_name)
             
             if 'error' not in config:
                 timeout = config.get('timeout', 0)
@@ -403,9 +400,8 @@ class FocusedDirectOrchestrator:
                 ))
 
             # Get recent failed invocations
-            from ..tools.lambda_tools import get_lambda_failed_invocations
-            failures_json = get_lambda_failed_invocations(function_name, hours_back=24, limit=10)
-            failures = json.loads(failures_json)
+            from ..tools.lambda_tools import fetch_lambda_failed_invocations
+            failures = fetch_lambda_failed_invocations(function_name, hours_back=24, limit=10)
             
             if 'error' not in failures:
                 failure_count = failures.get('failure_count', 0)
@@ -444,9 +440,8 @@ class FocusedDirectOrchestrator:
             stage = parts[1] if len(parts) > 1 else 'prod'
             
             # Get stage configuration
-            from ..tools.apigateway_tools import get_api_gateway_stage_config
-            config_json = get_api_gateway_stage_config(api_id, stage)
-            config = json.loads(config_json)
+            from ..tools.apigateway_tools import fetch_api_gateway_stage_config
+            config = fetch_api_gateway_stage_config(api_id, stage)
             
             if 'error' not in config:
                 xray_enabled = config.get('xray_tracing_enabled', False)
@@ -468,9 +463,8 @@ class FocusedDirectOrchestrator:
         
         try:
             # Get state machine definition
-            from ..tools.stepfunctions_tools import get_stepfunctions_definition
-            definition_json = get_stepfunctions_definition(state_machine_name)
-            definition = json.loads(definition_json)
+            from ..tools.stepfunctions_tools import fetch_stepfunctions_definition
+            definition = fetch_stepfunctions_definition(state_machine_name)
             
             if 'error' not in definition:
                 status = definition.get('status', 'unknown')
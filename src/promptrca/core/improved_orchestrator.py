@@ -26,7 +26,6 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Contact: info@promptrca.com
 """
 
-import asyncio
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
@@ -235,9 +234,8 @@ class ImprovedDirectOrchestrator:
         This is what was missing - we now actually analyze the trace!
         """
         try:
-            from ..tools import get_xray_trace
-            trace_json = get_xray_trace(trace_id)
-            trace_data = json.loads(trace_json)
+            from ..tools import fetch_xray_trace
+            trace_data = fetch_xray_trace(trace_id)
 
             if "error" in trace_data:
                 return None
@@ -281,7 +279,7 @@ class ImprovedDirectOrchestrator:
         This is critical - we need actual log data, not just config!
         """
         try:
-            from ..tools import get_cloudwatch_logs
+            from ..tools import fetch_cloudwatch_logs
 
             log_group_map = {
                 'lambda': f'/aws/lambda/{resource_name}',
@@ -294,8 +292,7 @@ class ImprovedDirectOrchestrator:
                 return None
 
             # Get logs from last hour
-            logs_json = get_cloudwatch_logs(log_group, hours_back=1, region=region)
-            logs_data = json.loads(logs_json)
+            logs_data = fetch_cloudwatch_logs(log_group, hours_back=1, region=region)
 
             if "error" in logs_data:
                 return None
@@ -322,17 +319,15 @@ class ImprovedDirectOrchestrator:
         """Get resource configuration."""
         try:
             if resource_type.lower() == 'lambda':
-                from ..tools import get_lambda_config
-                config_json = get_lambda_config(resource_name)
-                return json.loads(config_json)
+                from ..tools import fetch_lambda_config
+                return fetch_lambda_config(resource_name)
             elif resource_type.lower() == 'apigateway':
-                from ..tools import get_api_gateway_stage_config
+                from ..tools import fetch_api_gateway_stage_config
                 # Extract API ID and stage from resource_name
                 parts = resource_name.split('/')
                 api_id = parts[0] if parts else resource_name
                 stage = parts[1] if len(parts) > 1 else 'prod'
-                config_json = get_api_gateway_stage_config(api_id, stage)
-                return json.loads(config_json)
+                return fetch_api_gateway_stage_config(api_id, stage)
             # Add more resource types as needed
             return None
         except Exception as e:
@@ -343,16 +338,14 @@ class ImprovedDirectOrchestrator:
         """Get resource metrics."""
         try:
             if resource_type.lower() == 'lambda':
-                from ..tools import get_lambda_metrics
-                metrics_json = get_lambda_metrics(resource_name)
-                return json.loads(metrics_json)
+                from ..tools import fetch_lambda_metrics
+                return fetch_lambda_metrics(resource_name)
             elif resource_type.lower() == 'apigateway':
-                from ..tools import get_api_gateway_metrics
+                from ..tools import fetch_api_gateway_metrics
                 parts = resource_name.split('/')
                 api_id = parts[0] if parts else resource_name
                 stage = parts[1] if len(parts) > 1 else 'prod'
-                metrics_json = get_api_gateway_metrics(api_id, stage)
-                return json.loads(metrics_json)
+                return fetch_api_gateway_metrics(api_id, stage)
             return None
         except Exception as e:
             logger.error(f"Failed to get metrics for {resource_name}: {e}")
@@ -438,8 +431,7 @@ Provide a concise summary."""
             return None
 
         # Run summarization
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, agent, prompt)
+        result = await agent.invoke_async(prompt)
         summary_text = str(result.content) if hasattr(result, 'content') else str(result)
 
         return {
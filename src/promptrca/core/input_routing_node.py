@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Deterministic input routing node
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Graph entry node that applies the regex input parse before any model call.
+When it finds targets or trace IDs, the graph routes straight past the LLM
+input_parser node; otherwise the input_parser node runs as before.
+"""
+
+import re
+from typing import Any, Dict, List
+
+from strands.agent.agent_result import AgentResult
+from strands.multiagent.base import MultiAgentBase, MultiAgentResult, NodeResult, Status
+from strands.multiagent.graph import GraphState
+from strands.telemetry.metrics import EventLoopMetrics
+
+from ..utils import get_logger
+from .swarm_tools import ExtractedIdentifiers
+
+logger = get_logger(__name__)
+
+INPUT_ROUTING_NODE_ID = "input_routing"
+
+
+class DeterministicInputNode(MultiAgentBase):
+    """
+    Custom Strands node that emits ExtractedIdentifiers from the regex parse.
+
+    Reads the ParsedInputs computed by the orchestrator from
+    invocation_state["parsed_inputs"] (parsing the task text if absent) and
+    records in its result state whether the parse resolved any targets or
+    trace IDs. Edge conditions use that flag to skip the LLM input parser.
+    """
+
+    def __init__(self, input_parser=None, **kwargs):
+        """
+        Args:
+            input_parser: InputParserAgent used when no parse is provided
+        """
+        super().__init__()
+        self.input_parser = input_parser
+
+    async def invoke_async(self, task, invocation_state, **kwargs):
+        """
+        Emit the deterministic parse and whether it resolved the input.
+
+        Args:
+            task: Original investigation prompt
+            invocation_state: Shared state with parsed_inputs and region
+
+        Returns:
+            MultiAgentResult with the identifiers as agent text
+        """
+        invocation_state = invocation_state if invocation_state is not None else {}
+        parsed_inputs = invocation_state.get("parsed_inputs")
+        if parsed_inputs is None and self.input_parser is not None:
+            text = task if isinstance(task, str) else "".join(
+                block.get("text", "") for block in task if isinstance(block, dict)
+            )
+            parsed_inputs = self.input_parser._parse_free_text_deterministic(text, invocation_state.get("region"))
+
+        resolved = is_resolved(parsed_inputs)
+        identifiers = to_extracted_identifiers(parsed_inputs, invocation_state.get("free_text_input", ""), self.input_parser)
+        if resolved:
+            logger.info("⏭️ Deterministic parse found targets or trace IDs; skipping LLM input parser")
+        else:
+            logger.info("🔀 Deterministic parse found no targets or trace IDs; routing to LLM input parser")
+
+        agent_result = AgentResult(
+            stop_reason="end_turn",
+            message={"role": "assistant", "content": [{"text": identifiers.model_dump_json()}]},
+            metrics=EventLoopMetrics(),
+            state={"resolved": resolved}
+        )
+        return MultiAgentResult(
+            status=Status.COMPLETED,
+            results={
+                "input_parser": NodeResult(
+                    result=agent_result,
+                    execution_time=0,
+                    status=Status.COMPLETED
+                )
+            },
+            execution_time=0,
+            accumulated_usage={"totalTokens": 0, "inputTokens": 0, "outputTokens": 0}
+        )
+
+
+def is_resolved(parsed_inputs) -> bool:
+    """True if a parse found at least one target or trace ID."""
+    if parsed_inputs is None:
+        return False
+    return bool(getattr(parsed_inputs, "primary_targets", None) or getattr(parsed_inputs, "trace_ids", None))
+
+
+def to_extracted_identifiers(parsed_inputs, free_text_input: str = "", input_parser=None) -> ExtractedIdentifiers:
+    """Convert ParsedInputs into the input_parser node's output schema."""
+    resource_names: List[str] = []
+    arns: List[str] = []
+    execution_arns: List[str] = []
+    for target in getattr(parsed_inputs, "primary_targets", None) or []:
+        if target.name and target.name not in resource_names:
+            resource_names.append(target.name)
+        if target.arn:
+            if re.match(r'arn:aws:states:[^:]*:[^:]*:execution:', target.arn):
+                execution_arns.append(target.arn)
+            elif target.arn not in arns:
+                arns.append(target.arn)
+    if input_parser is not None and free_text_input:
+        for name in input_parser._extract_resource_names(free_text_input):
+            if name not in resource_names:
+                resource_names.append(name)
+
+    return ExtractedIdentifiers(
+        resource_names=resource_names,
+        arns=arns,
+        trace_ids=list(getattr(parsed_inputs, "trace_ids", None) or []),
+        execution_arns=execution_arns
+    )
+
+
+def _routing_result(state: GraphState) -> Dict[str, Any]:
+    node_result = state.results.get(INPUT_ROUTING_NODE_ID)
+    if node_result is None:
+        return {}
+    for agent_result in node_result.get_agent_results():
+        return getattr(agent_result, "state", None) or {}
+    return {}
+
+
+def deterministic_parse_resolved(state: GraphState) -> bool:
+    """Edge condition: the regex parse was enough, bypass the LLM parser."""
+    return bool(_routing_result(state).get("resolved"))
+
+
+def needs_llm_input_parser(state: GraphState) -> bool:
+    """Edge condition: the regex parse found nothing, run the LLM parser."""
+    return not deterministic_parse_resolved(state)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Investigation progress events
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Progress events published while an investigation runs, consumed by the
+streaming HTTP endpoint. The stream travels in invocation_state under
+"event_stream"; graph nodes and specialist tools publish to it, from the
+event loop or from tool threads.
+
+Event types:
+- phase: a graph node started or completed
+- facts: one specialist run's facts
+- hypotheses: the hypothesis generator's structured output
+- report: the final investigation report
+- error: the investigation failed
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+EVENT_STREAM_KEY = "event_stream"
+
+EVENT_PHASE = "phase"
+EVENT_FACTS = "facts"
+EVENT_HYPOTHESES = "hypotheses"
+EVENT_REPORT = "report"
+EVENT_ERROR = "error"
+
+_CLOSED = object()
+
+
+class InvestigationEventStream:
+    """
+    Unbounded queue of investigation events bound to one event loop.
+
+    emit() may be called from any thread; events from other threads are
+    handed to the owning loop with call_soon_threadsafe. Iterating the
+    stream yields {"event": type, "data": payload} dicts until close().
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Args:
+            loop: Loop the consumer runs on (default: the running loop)
+        """
+        self._loop = loop or asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    def emit(self, event: str, data: Any) -> None:
+        """Publish an event; ignored once the stream is closed."""
+        if self.closed:
+            return
+        self._put({"event": event, "data": data})
+
+    def close(self) -> None:
+        """End the stream; iteration stops after the queued events."""
+        if not self.closed:
+            self.closed = True
+            self._put(_CLOSED)
+
+    def _put(self, item: Any) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        try:
+            if running is self._loop:
+                self._queue.put_nowait(item)
+            else:
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError as e:
+            # The consumer's loop is gone; nobody is listening any more
+            logger.debug(f"Dropping investigation event: {e}")
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            item = await self._queue.get()
+            if item is _CLOSED:
+                return
+            yield item
+
+
+class EventFanout:
+    """
+    Event sink shared by the consumers of one coalesced investigation.
+
+    Quacks like an InvestigationEventStream for the publishers: emit() may
+    be called from any thread and forwards the event to every subscribed
+    stream. Events are also kept, so a consumer that subscribes late first
+    receives everything published so far.
+    """
+
+    def __init__(self):
+        self._history: List[Dict[str, Any]] = []
+        self._subscribers: List[InvestigationEventStream] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, data: Any) -> None:
+        with self._lock:
+            self._history.append({"event": event, "data": data})
+            subscribers = list(self._subscribers)
+        for stream in subscribers:
+            stream.emit(event, data)
+
+    def subscribe(self, stream: InvestigationEventStream) -> None:
+        """Replay the events so far to the stream, then forward new ones."""
+        with self._lock:
+            for item in self._history:
+                stream.emit(item["event"], item["data"])
+            self._subscribers.append(stream)
+
+    def unsubscribe(self, stream: InvestigationEventStream) -> None:
+        with self._lock:
+            if stream in self._subscribers:
+                self._subscribers.remove(stream)
+
+
+def get_event_stream(invocation_state: Optional[Dict[str, Any]]) -> Optional[InvestigationEventStream]:
+    """The investigation's event stream, if a client is listening."""
+    if not invocation_state:
+        return None
+    return invocation_state.get(EVENT_STREAM_KEY)
+
+
+def publish_facts(invocation_state: Optional[Dict[str, Any]], results: Dict[str, Any]) -> None:
+    """Publish one specialist run's formatted results as a facts event."""
+    event_stream = get_event_stream(invocation_state)
+    if event_stream is None:
+        return
+    event_stream.emit(EVENT_FACTS, {
+        "specialist_type": results.get("specialist_type"),
+        "resource_name": results.get("resource_name"),
+        "facts": results.get("facts", []),
+        **({"error": results["error"]} if results.get("error") else {})
+    })
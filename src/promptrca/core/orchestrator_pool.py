@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Orchestrator Pool for PromptRCA
+
+Keeps warm SwarmOrchestrator instances so the agents, Bedrock models, swarm
+and graph are built once per worker instead of once per investigation.
+
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Callable, List, Optional
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENT_INVESTIGATIONS = 4
+
+
+def get_max_concurrent_investigations() -> int:
+    """Get the per-worker investigation concurrency (PROMPTRCA_MAX_CONCURRENT_INVESTIGATIONS)."""
+    return int(os.getenv("PROMPTRCA_MAX_CONCURRENT_INVESTIGATIONS", str(DEFAULT_MAX_CONCURRENT_INVESTIGATIONS)))
+
+
+class OrchestratorPool:
+    """
+    Pool of warm SwarmOrchestrator instances.
+
+    Each instance serves one investigation at a time. acquire() hands out an
+    idle instance after resetting its per-investigation state, or builds a new
+    one if none is idle; release keeps at most `size` idle instances. The pool
+    does not limit concurrency itself, so it works the same under a
+    long-running server loop and under asyncio.run() per Lambda invocation.
+    """
+
+    def __init__(self, size: Optional[int] = None, factory: Optional[Callable[[], object]] = None):
+        """
+        Args:
+            size: Maximum number of idle instances kept warm (default: server concurrency)
+            factory: Callable building a new orchestrator (default: SwarmOrchestrator())
+        """
+        self.size = size or int(os.getenv("PROMPTRCA_ORCHESTRATOR_POOL_SIZE", str(get_max_concurrent_investigations())))
+        self._factory = factory or self._default_factory
+        self._idle: List[object] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    @staticmethod
+    def _default_factory():
+        from .swarm_orchestrator import SwarmOrchestrator
+        return SwarmOrchestrator()
+
+    def _build(self):
+        orchestrator = self._factory()
+        with self._lock:
+            self.created += 1
+        return orchestrator
+
+    def prewarm(self, count: Optional[int] = None) -> int:
+        """
+        Build instances up front (e.g. at server startup) until `count` are idle.
+
+        Returns:
+            Number of idle instances after prewarming
+        """
+        target = min(count or self.size, self.size)
+        while True:
+            with self._lock:
+                if len(self._idle) >= target:
+                    return len(self._idle)
+            orchestrator = self._build()
+            with self._lock:
+                self._idle.append(orchestrator)
+
+    @asynccontextmanager
+    async def acquire(self, region: Optional[str] = None):
+        """
+        Borrow an orchestrator for one investigation.
+
+        Args:
+            region: Investigation region applied to the instance
+
+        Yields:
+            A SwarmOrchestrator with fresh per-investigation state
+        """
+        with self._lock:
+            orchestrator = self._idle.pop() if self._idle else None
+            if orchestrator is not None:
+                self.reused += 1
+
+        if orchestrator is None:
+            # Construction reads prompts and creates Bedrock clients; keep it off the event loop
+            orchestrator = await asyncio.to_thread(self._build)
+
+        orchestrator.reset_for_invocation(region)
+
+        try:
+            yield orchestrator
+        except asyncio.CancelledError:
+            # Instances interrupted mid-investigation are discarded, not reused
+            raise
+        except Exception:
+            self._release(orchestrator)
+            raise
+        self._release(orchestrator)
+
+    def _release(self, orchestrator) -> None:
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(orchestrator)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "created": self.created,
+                "reused": self.reused
+            }
+
+
+_orchestrator_pool: Optional[OrchestratorPool] = None
+_orchestrator_pool_lock = threading.Lock()
+
+
+def get_orchestrator_pool() -> OrchestratorPool:
+    """Get the process-wide orchestrator pool."""
+    global _orchestrator_pool
+    if _orchestrator_pool is None:
+        with _orchestrator_pool_lock:
+            if _orchestrator_pool is None:
+                _orchestrator_pool = OrchestratorPool()
+    return _orchestrator_pool
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Parallel specialist fan-out
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Alternative to the handoff swarm for investigations whose services are
+already known. A routing node maps the discovered resource types to
+specialists; each selected specialist runs as its own graph branch, all in
+the same batch, and the branches join into hypothesis generation. When the
+resources are unknown or span too many specialists, the routing node sends
+the investigation to the swarm instead.
+
+Environment Variables:
+- PROMPTRCA_PARALLEL_SPECIALISTS_MAX_BRANCHES: Largest fan-out before falling back to the swarm (default: 5)
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from strands import Agent
+from strands.agent.agent_result import AgentResult
+from strands.agent.state import AgentState
+from strands.multiagent.base import MultiAgentBase, MultiAgentResult, NodeResult, Status
+from strands.multiagent.graph import GraphState
+from strands.telemetry.metrics import EventLoopMetrics
+
+from ..utils import get_logger
+from .evidence_collection_node import EvidenceCollectionNode, investigation_trace_ids, previous_node_outputs
+from .swarm_tools import (
+    RESOURCE_TYPE_LAMBDA, RESOURCE_TYPE_APIGATEWAY, RESOURCE_TYPE_STEPFUNCTIONS,
+    RESOURCE_TYPE_IAM, RESOURCE_TYPE_S3, RESOURCE_TYPE_SQS, RESOURCE_TYPE_SNS,
+    SPECIALIST_TYPE_LAMBDA, SPECIALIST_TYPE_APIGATEWAY, SPECIALIST_TYPE_STEPFUNCTIONS,
+    SPECIALIST_TYPE_TRACE, SPECIALIST_TYPE_IAM, SPECIALIST_TYPE_S3, SPECIALIST_TYPE_SQS, SPECIALIST_TYPE_SNS
+)
+
+logger = get_logger(__name__)
+
+SPECIALIST_ROUTING_NODE_ID = "specialist_routing"
+
+DEFAULT_PARALLEL_SPECIALISTS_MAX_BRANCHES = 5
+
+RESOURCE_TYPE_SPECIALISTS = {
+    RESOURCE_TYPE_LAMBDA: SPECIALIST_TYPE_LAMBDA,
+    RESOURCE_TYPE_APIGATEWAY: SPECIALIST_TYPE_APIGATEWAY,
+    RESOURCE_TYPE_STEPFUNCTIONS: SPECIALIST_TYPE_STEPFUNCTIONS,
+    RESOURCE_TYPE_IAM: SPECIALIST_TYPE_IAM,
+    RESOURCE_TYPE_S3: SPECIALIST_TYPE_S3,
+    RESOURCE_TYPE_SQS: SPECIALIST_TYPE_SQS,
+    RESOURCE_TYPE_SNS: SPECIALIST_TYPE_SNS,
+}
+
+# Branch order; the trace specialist comes first as it does in the swarm
+SPECIALIST_TYPES = (
+    SPECIALIST_TYPE_TRACE, SPECIALIST_TYPE_APIGATEWAY, SPECIALIST_TYPE_STEPFUNCTIONS, SPECIALIST_TYPE_LAMBDA,
+    SPECIALIST_TYPE_SQS, SPECIALIST_TYPE_SNS, SPECIALIST_TYPE_S3, SPECIALIST_TYPE_IAM
+)
+
+
+def branch_node_id(specialist_type: str) -> str:
+    """Graph node ID of a specialist's parallel branch."""
+    return f"parallel_{specialist_type}_specialist"
+
+
+def plan_specialists(resources: List[Dict[str, Any]], trace_ids: List[str],
+                     max_branches: Optional[int] = None) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Decide which specialists can run in parallel for these resources.
+
+    Args:
+        resources: Discovered resources with a 'type' field
+        trace_ids: Trace IDs of the investigation
+        max_branches: Largest fan-out allowed (default: PROMPTRCA_PARALLEL_SPECIALISTS_MAX_BRANCHES)
+
+    Returns:
+        Resources per specialist type (the trace specialist gets the traces),
+        or None when the case is ambiguous and the swarm should run
+    """
+    if max_branches is None:
+        max_branches = int(os.getenv(
+            "PROMPTRCA_PARALLEL_SPECIALISTS_MAX_BRANCHES", str(DEFAULT_PARALLEL_SPECIALISTS_MAX_BRANCHES)
+        ))
+    if not resources:
+        return None
+
+    plan: Dict[str, List[Dict[str, Any]]] = {}
+    if trace_ids:
+        plan[SPECIALIST_TYPE_TRACE] = [{'type': 'trace', 'name': trace_id} for trace_id in trace_ids]
+    for resource in resources:
+        specialist_type = RESOURCE_TYPE_SPECIALISTS.get((resource.get('type') or '').lower())
+        if specialist_type is None:
+            logger.info(f"🔀 No specialist for resource type {resource.get('type')!r}; using the swarm")
+            return None
+        plan.setdefault(specialist_type, []).append(resource)
+
+    if len(plan) > max_branches:
+        logger.info(f"🔀 {len(plan)} specialists exceed the parallel limit of {max_branches}; using the swarm")
+        return None
+    return {specialist_type: plan[specialist_type] for specialist_type in SPECIALIST_TYPES if specialist_type in plan}
+
+
+def _routing_result(state: GraphState) -> Dict[str, Any]:
+    node_result = state.results.get(SPECIALIST_ROUTING_NODE_ID)
+    if node_result is None:
+        return {}
+    for agent_result in node_result.get_agent_results():
+        return getattr(agent_result, "state", None) or {}
+    return {}
+
+
+def needs_specialist_swarm(state: GraphState) -> bool:
+    """Edge condition: no parallel plan, hand the investigation to the swarm."""
+    return not _routing_result(state).get("specialists")
+
+
+def specialist_selected(specialist_type: str):
+    """Edge condition factory: the routing node selected this specialist."""
+    def condition(state: GraphState) -> bool:
+        return specialist_type in (_routing_result(state).get("specialists") or [])
+    condition.__name__ = f"{specialist_type}_specialist_selected"
+    return condition
+
+
+def parallel_specialists_complete(state: GraphState) -> bool:
+    """Edge condition: every selected branch has finished, so the join may run once."""
+    selected = _routing_result(state).get("specialists") or []
+    completed = {node.node_id for node in state.completed_nodes}
+    return bool(selected) and all(branch_node_id(t) in completed for t in selected)
+
+
+def _text_result(name: str, text: str, state: Optional[Dict[str, Any]] = None,
+                 execution_time: int = 0, usage: Optional[Dict[str, int]] = None) -> MultiAgentResult:
+    agent_result = AgentResult(
+        stop_reason="end_turn",
+        message={"role": "assistant", "content": [{"text": text}]},
+        metrics=EventLoopMetrics(),
+        state=state or {}
+    )
+    usage = usage or {"totalTokens": 0, "inputTokens": 0, "outputTokens": 0}
+    return MultiAgentResult(
+        status=Status.COMPLETED,
+        results={
+            name: NodeResult(
+                result=agent_result,
+                execution_time=execution_time,
+                status=Status.COMPLETED,
+                accumulated_usage=usage
+            )
+        },
+        execution_time=execution_time,
+        accumulated_usage=usage
+    )
+
+
+class SpecialistRoutingNode(MultiAgentBase):
+    """
+    Custom Strands node that chooses between parallel branches and the swarm.
+
+    Uses the resources found by evidence pre-collection when it ran
+    (invocation_state["discovered_resources"]), otherwise discovers them from
+    the deterministic parse and the investigation's traces. The plan is
+    stored in invocation_state["parallel_specialists"] and the selected
+    specialist types in the result state, where edge conditions read them.
+    The node's output forwards its dependencies' text unchanged.
+    """
+
+    def __init__(self, max_branches: Optional[int] = None, **kwargs):
+        """
+        Args:
+            max_branches: Largest fan-out before falling back to the swarm
+        """
+        super().__init__()
+        self.max_branches = max_branches
+
+    async def invoke_async(self, task, invocation_state, **kwargs):
+        """
+        Plan the specialist fan-out.
+
+        Args:
+            task: Combined input from Graph (original task + results from dependency nodes)
+            invocation_state: Shared state with parsed_inputs, exemplar_traces and region
+
+        Returns:
+            MultiAgentResult whose result state lists the selected specialists
+        """
+        invocation_state = invocation_state if invocation_state is not None else {}
+        parsed_inputs = invocation_state.get("parsed_inputs")
+        region = invocation_state.get("region") or getattr(parsed_inputs, "region", None) or "us-east-1"
+        trace_ids = investigation_trace_ids(invocation_state)
+
+        resources = invocation_state.get("discovered_resources")
+        if resources is None:
+            resources = await EvidenceCollectionNode._discover_resources(parsed_inputs, trace_ids, region)
+
+        plan = plan_specialists(resources, trace_ids, self.max_branches)
+        specialists = list(plan) if plan else []
+        invocation_state["parallel_specialists"] = {
+            "specialists": specialists,
+            "resources": plan or {},
+            "timings": {}
+        }
+        if specialists:
+            logger.info(f"🪭 Running {len(specialists)} specialists in parallel: {', '.join(specialists)}")
+        else:
+            logger.info(f"🐝 Resources are ambiguous ({len(resources)} discovered); running the specialist swarm")
+
+        return _text_result(
+            "specialist_router",
+            previous_node_outputs(task) or "No previous node output.",
+            state={"specialists": specialists}
+        )
+
+
+class SpecialistBranchNode(MultiAgentBase):
+    """
+    Graph node that runs one specialist agent as a parallel branch.
+
+    The agent is told which resources are its own and that handoffs are
+    unavailable. Failures and timeouts are reported as text so one branch
+    cannot fail the graph, and the branch's wall time is recorded in
+    invocation_state["parallel_specialists"]["timings"].
+    """
+
+    def __init__(self, agent: Agent, specialist_type: str, timeout: Optional[float] = None, **kwargs):
+        """
+        Args:
+            agent: Specialist agent to run
+            specialist_type: Specialist type the routing plan is keyed by
+            timeout: Seconds allowed for the branch (None means no limit)
+        """
+        super().__init__()
+        self.agent = agent
+        self.specialist_type = specialist_type
+        self.timeout = timeout
+
+    def reset(self) -> None:
+        """Discard conversation history so a pooled graph starts clean."""
+        self.agent.messages = []
+        self.agent.state = AgentState()
+
+    async def invoke_async(self, task, invocation_state=None, **kwargs):
+        """
+        Run the specialist on its share of the resources.
+
+        Returns:
+            MultiAgentResult wrapping the agent's findings
+        """
+        start = time.monotonic()
+        invocation_state = invocation_state if invocation_state is not None else {}
+        fanout = invocation_state.get("parallel_specialists") or {}
+        resources = (fanout.get("resources") or {}).get(self.specialist_type, [])
+        others = [t for t in fanout.get("specialists", []) if t != self.specialist_type]
+
+        prompt = self._branch_prompt(task, resources, others)
+        usage = None
+        try:
+            result = await asyncio.wait_for(
+                self.agent.invoke_async(prompt, invocation_state=invocation_state),
+                timeout=self.timeout
+            )
+            text = str(result)
+            usage = result.metrics.accumulated_usage
+        except asyncio.TimeoutError:
+            text = f"{self.agent.name} did not finish within {self.timeout:.0f}s; no findings from this branch."
+            logger.warning(f"⏱️ Parallel branch {self.agent.name} timed out after {self.timeout:.0f}s")
+        except Exception as e:
+            text = f"{self.agent.name} failed: {e}"
+            logger.warning(f"⚠️ Parallel branch {self.agent.name} failed: {e}")
+
+        elapsed = time.monotonic() - start
+        fanout.setdefault("timings", {})[self.specialist_type] = round(elapsed, 3)
+        logger.info(f"✅ Parallel branch {self.agent.name} finished in {elapsed:.2f}s")
+        return _text_result(self.agent.name, text, execution_time=int(elapsed * 1000), usage=usage)
+
+    def _branch_prompt(self, task, resources: List[Dict[str, Any]], others: List[str]) -> str:
+        text = task if isinstance(task, str) else "".join(
+            block.get("text", "") for block in task if isinstance(block, dict)
+        )
+        scope = json.dumps(
+            [{k: r.get(k) for k in ('type', 'name', 'arn') if r.get(k)} for r in resources],
+            separators=(',', ':')
+        )
+        parallel = f" in parallel with the {', '.join(others)} specialists" if others else ""
+        return (
+            f"{text}\n\n"
+            f"PARALLEL BRANCH: You are running{parallel}. Investigate only these resources: {scope}. "
+            f"Handoffs are not available; finish with your findings for the hypothesis generator."
+        )
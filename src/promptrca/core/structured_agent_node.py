@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Structured output agent node
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+"""
+
+from typing import Optional, Type
+
+from pydantic import BaseModel
+from strands import Agent
+from strands.agent.agent_result import AgentResult
+from strands.agent.state import AgentState
+from strands.multiagent.base import MultiAgentBase, MultiAgentResult, NodeResult, Status
+from strands.types.exceptions import StructuredOutputException
+
+from ..utils import get_logger
+from .fact_compaction import FactCompactor, estimate_tokens, truncate_to_tokens
+
+logger = get_logger(__name__)
+
+
+class StructuredAgentNode(MultiAgentBase):
+    """
+    Graph node that runs an agent with a structured output model.
+
+    The parsed model is stored in invocation_state["structured_outputs"]
+    under the node's output key, where the report node reads it, and its
+    JSON replaces the agent's final message so downstream nodes receive
+    the structured content as text.
+
+    With a token budget, the node input is rebuilt before the model call:
+    the investigation's facts (invocation_state["collected_facts"] and
+    ["precollected_facts"]) are compacted to fit and the graph transcript is
+    truncated to the remainder. What was dropped is recorded in
+    invocation_state["fact_compaction"].
+    """
+
+    def __init__(self, agent: Agent, output_model: Type[BaseModel], output_key: str,
+                 token_budget: Optional[int] = None, **kwargs):
+        """
+        Args:
+            agent: Agent to run
+            output_model: Pydantic model the agent must produce
+            output_key: Key under invocation_state["structured_outputs"]
+            token_budget: Input token budget (None or 0 means unlimited)
+        """
+        super().__init__()
+        self.agent = agent
+        self.output_model = output_model
+        self.output_key = output_key
+        self.token_budget = token_budget
+
+    def reset(self) -> None:
+        """Discard conversation history so a pooled graph starts clean."""
+        self.agent.messages = []
+        self.agent.state = AgentState()
+
+    async def invoke_async(self, task, invocation_state=None, **kwargs):
+        """
+        Run the agent and publish its structured output.
+
+        Returns:
+            MultiAgentResult wrapping the agent result
+        """
+        invocation_state = invocation_state if invocation_state is not None else {}
+        if self.token_budget:
+            task = self._apply_token_budget(task, invocation_state)
+        
+        try:
+            result = await self.agent.invoke_async(
+                task,
+                invocation_state=invocation_state,
+                structured_output_model=self.output_model
+            )
+        except StructuredOutputException as e:
+            # Keep the investigation going with free text; the report node falls back to the LLM formatter
+            logger.warning(f"⚠️ {self.agent.name} structured output failed ({e}); retrying as free text")
+            self.reset()
+            result = await self.agent.invoke_async(task, invocation_state=invocation_state)
+
+        structured_output = result.structured_output
+        if structured_output is not None:
+            invocation_state.setdefault("structured_outputs", {})[self.output_key] = structured_output
+            result = AgentResult(
+                stop_reason=result.stop_reason,
+                message={"role": "assistant", "content": [{"text": structured_output.model_dump_json()}]},
+                metrics=result.metrics,
+                state=result.state,
+                structured_output=structured_output
+            )
+        else:
+            logger.warning(f"⚠️ {self.agent.name} returned no {self.output_model.__name__}; passing text output downstream")
+
+        usage = result.metrics.accumulated_usage
+        return MultiAgentResult(
+            status=Status.COMPLETED,
+            results={
+                self.agent.name: NodeResult(
+                    result=result,
+                    execution_time=0,
+                    status=Status.COMPLETED,
+                    accumulated_usage=usage
+                )
+            },
+            execution_time=0,
+            accumulated_usage=usage
+        )
+
+    def _apply_token_budget(self, task, invocation_state: dict):
+        """Rebuild the node input as budgeted transcript plus compacted facts."""
+        text = task if isinstance(task, str) else "".join(
+            block.get("text", "") for block in task if isinstance(block, dict)
+        )
+        facts = list(invocation_state.get("collected_facts") or [])
+        for entry in invocation_state.get("precollected_facts") or []:
+            facts.extend(entry.get("facts", []))
+
+        text_tokens = estimate_tokens(text)
+        if not facts and text_tokens <= self.token_budget:
+            return task
+
+        parsed_inputs = invocation_state.get("parsed_inputs")
+        compactor = FactCompactor(
+            relevance_terms=[t.name for t in getattr(parsed_inputs, "primary_targets", None) or []]
+        )
+        # Facts get whatever the transcript leaves, but never less than half the budget
+        result = compactor.compact(facts, max(self.token_budget - text_tokens, self.token_budget // 2))
+        text = truncate_to_tokens(text, self.token_budget - result.tokens_after)
+
+        invocation_state.setdefault("fact_compaction", {})[self.output_key] = result.to_dict()
+        logger.info(
+            f"✂️ {self.agent.name}: {result.input_count} facts ~{result.tokens_before} tokens -> "
+            f"{len(result.facts)} facts ~{result.tokens_after} tokens ({len(result.dropped)} dropped, "
+            f"budget {self.token_budget})"
+        )
+        if not facts:
+            return text
+        return f"{text}\n\n{result.to_prompt_section()}"
@@ -1,7 +1,15 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
 from strands import Agent
 from strands.multiagent.base import MultiAgentBase, MultiAgentResult, NodeResult, Status
 
-from ..models.base import InvestigationReport
+from ..agents.advice_agent import AdviceAgent
+from ..agents.severity_agent import SeverityAgent
+from ..models.base import (
+    AffectedResource, EventTimeline, Fact, HypothesesList, Hypothesis,
+    InvestigationReport, RootCauseAnalysis
+)
 from ..utils import get_logger
 from ..utils.config import create_synthesis_model
 
@@ -9,8 +17,12 @@ logger = get_logger(__name__)
 
 class StructuredReportNode(MultiAgentBase):
     """
-    A simple custom Strands node that generates a structured InvestigationReport using
-    Strands' structured output capabilities with Pydantic models.
+    A simple custom Strands node that builds the structured InvestigationReport.
+
+    When the hypothesis and root cause nodes produced structured output
+    (HypothesesList / RootCauseAnalysis in invocation_state["structured_outputs"]),
+    the report is assembled from them in code. Otherwise an LLM formats the
+    graph transcript into the report using Strands structured output.
     """
     def __init__(self, region: str, **kwargs):
         """
@@ -36,6 +48,15 @@ class StructuredReportNode(MultiAgentBase):
         """
         logger.info("🔧 StructuredReportNode: Processing investigation findings...")
         
+        structured_outputs = invocation_state.get("structured_outputs") or {}
+        if structured_outputs.get("root_cause_analysis") or structured_outputs.get("hypotheses"):
+            try:
+                report = self._assemble_report(invocation_state, structured_outputs)
+                logger.info("✅ StructuredReportNode: Assembled InvestigationReport from structured node outputs")
+                return self._wrap_report(report)
+            except Exception as e:
+                logger.warning(f"Deterministic report assembly failed, using LLM formatter: {e}")
+        
         # Extract data from invocation state
         resources = invocation_state.get("resources", [])
         
@@ -90,7 +111,11 @@ IMPORTANT: Follow the exact schema structure:
         
         logger.info("✅ StructuredReportNode: Generated structured InvestigationReport")
         
-        # Return wrapped in MultiAgentResult with the report directly
+        return self._wrap_report(report)
+    
+    @staticmethod
+    def _wrap_report(report: InvestigationReport) -> MultiAgentResult:
+        """Return the report wrapped in a MultiAgentResult."""
         return MultiAgentResult(
             status=Status.COMPLETED,
             results={
@@ -103,3 +128,134 @@ IMPORTANT: Follow the exact schema structure:
             execution_time=0,
             accumulated_usage={"totalTokens": 0, "inputTokens": 0, "outputTokens": 0}
         )
+
+    def _assemble_report(self, invocation_state: Dict[str, Any], structured_outputs: Dict[str, Any]) -> InvestigationReport:
+        """
+        Build the InvestigationReport from structured node outputs without a model call.
+        
+        Args:
+            invocation_state: Shared graph state (investigation id, start time, parsed inputs, pre-collected facts)
+            structured_outputs: HypothesesList and RootCauseAnalysis keyed by node
+            
+        Returns:
+            InvestigationReport
+        """
+        hypotheses_list: Optional[HypothesesList] = structured_outputs.get("hypotheses")
+        hypotheses = list(hypotheses_list.hypotheses) if hypotheses_list else []
+        
+        root_cause: Optional[RootCauseAnalysis] = structured_outputs.get("root_cause_analysis")
+        if root_cause is None:
+            ranked = sorted(hypotheses, key=lambda h: h.confidence, reverse=True)
+            root_cause = RootCauseAnalysis(
+                primary_root_cause=ranked[0] if ranked else None,
+                contributing_factors=ranked[1:],
+                confidence_score=ranked[0].confidence if ranked else 0.0,
+                analysis_summary="Root cause analysis unavailable; highest-confidence hypothesis reported as primary root cause"
+            )
+        if not hypotheses and root_cause.primary_root_cause:
+            hypotheses = [root_cause.primary_root_cause] + list(root_cause.contributing_factors)
+        
+        facts = self._collect_facts(invocation_state, root_cause, hypotheses)
+        affected_resources = self._collect_affected_resources(invocation_state, root_cause, hypotheses)
+        severity = SeverityAgent(aws_client=None).assess_severity(facts, affected_resources, hypotheses)
+        advice = AdviceAgent().generate_advice(facts, hypotheses)
+        
+        completed_at = datetime.now(timezone.utc)
+        started_at = invocation_state.get("investigation_start_time") or completed_at
+        timeline = [
+            EventTimeline(
+                timestamp=started_at,
+                event_type="detection",
+                component="swarm_orchestrator",
+                description="Investigation started"
+            )
+        ]
+        if root_cause.primary_root_cause:
+            timeline.append(EventTimeline(
+                timestamp=completed_at,
+                event_type="finding",
+                component="root_cause_analysis",
+                description=root_cause.primary_root_cause.description,
+                metadata={"confidence": root_cause.confidence_score}
+            ))
+        
+        return InvestigationReport(
+            run_id=invocation_state.get("investigation_id") or f"swarm_{int(started_at.timestamp())}",
+            status="completed",
+            started_at=started_at,
+            completed_at=completed_at,
+            duration_seconds=(completed_at - started_at).total_seconds(),
+            affected_resources=affected_resources,
+            severity_assessment=severity,
+            facts=facts,
+            root_cause_analysis=root_cause,
+            hypotheses=hypotheses,
+            advice=advice,
+            timeline=timeline,
+            summary=root_cause.analysis_summary
+        )
+    
+    @staticmethod
+    def _collect_facts(invocation_state: Dict[str, Any], root_cause: RootCauseAnalysis,
+                       hypotheses: List[Hypothesis]) -> List[Fact]:
+        """Specialist facts gathered during the investigation plus the evidence cited by the analysis, deduplicated."""
+        facts: List[Fact] = []
+        seen = set()
+        
+        specialist_facts = list(invocation_state.get("collected_facts") or [])
+        for entry in invocation_state.get("precollected_facts") or []:
+            specialist_facts.extend(entry.get("facts", []))
+        for fact in specialist_facts:
+            if fact.get("content") and fact["content"] not in seen:
+                seen.add(fact["content"])
+                facts.append(Fact(**fact))
+        
+        cited = ([root_cause.primary_root_cause] if root_cause.primary_root_cause else []) + list(hypotheses)
+        for hypothesis in cited:
+            for evidence in hypothesis.evidence:
+                if evidence and evidence not in seen:
+                    seen.add(evidence)
+                    facts.append(Fact(
+                        source=hypothesis.type,
+                        content=evidence,
+                        confidence=hypothesis.confidence,
+                        metadata={"cited_by": "root_cause_analysis" if hypothesis is root_cause.primary_root_cause else "hypothesis_generation"}
+                    ))
+        return facts
+    
+    @staticmethod
+    def _collect_affected_resources(invocation_state: Dict[str, Any], root_cause: RootCauseAnalysis,
+                                    hypotheses: List[Hypothesis]) -> List[AffectedResource]:
+        """Resources from the parsed input and pre-collected evidence, with issues that name them."""
+        candidates: Dict[str, Dict[str, Any]] = {}
+        parsed_inputs = invocation_state.get("parsed_inputs")
+        for target in getattr(parsed_inputs, "primary_targets", None) or []:
+            candidates.setdefault(target.name, {"type": target.type, "id": target.arn or target.name})
+        for resource in invocation_state.get("resources") or []:
+            if resource.get("name"):
+                candidates.setdefault(resource["name"], {"type": resource.get("type", "unknown"), "id": resource.get("arn") or resource["name"]})
+        for entry in invocation_state.get("precollected_facts") or []:
+            if entry.get("specialist_type") != "trace" and entry.get("resource_name"):
+                candidates.setdefault(entry["resource_name"], {"type": entry["specialist_type"], "id": entry["resource_name"]})
+        
+        primary = root_cause.primary_root_cause
+        primary_text = " ".join([primary.description] + list(primary.evidence)).lower() if primary else ""
+        
+        affected_resources = []
+        for name, info in candidates.items():
+            lowered = name.lower()
+            issues = [h.description for h in hypotheses if lowered in " ".join([h.description] + list(h.evidence)).lower()]
+            if lowered in primary_text:
+                health_status = "failed"
+            elif issues:
+                health_status = "degraded"
+            else:
+                health_status = "unknown"
+            affected_resources.append(AffectedResource(
+                resource_type=info["type"],
+                resource_id=info["id"],
+                resource_name=name,
+                health_status=health_status,
+                detected_issues=issues
+            ))
+        return affected_resources
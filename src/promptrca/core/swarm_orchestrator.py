@@ -29,6 +29,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Contact: info@promptrca.com
 """
 
+import asyncio
 import json
 import os
 from typing import Dict, Any, List, Optional
@@ -37,15 +38,20 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from strands.multiagent import Swarm, GraphBuilder
+from strands.multiagent.base import Status
 
 from ..models import (
-    InvestigationReport, Fact, Hypothesis, Advice,
+    InvestigationReport, Fact, Hypothesis, HypothesesList, Advice,
     AffectedResource, SeverityAssessment, RootCauseAnalysis, EventTimeline
 )
 from ..clients import AWSClient
-from ..context import set_aws_client, clear_aws_client
+from ..context import (
+    set_aws_client, clear_aws_client, TraceStore, set_trace_store, clear_trace_store,
+    InvestigationExecutor, set_investigation_executor, clear_investigation_executor
+)
 from ..utils.config import get_region
 from ..utils import get_logger
+from ..utils.feature_flags import FeatureFlags
 from ..agents.swarm_agents import create_specialist_swarm_agents, create_hypothesis_agent_standalone, create_root_cause_agent_standalone, create_swarm_agents, create_input_parser_agent
 from ..specialists import InvestigationContext
 from .swarm_tools import (
@@ -63,6 +69,8 @@ from .swarm_tools import (
     lambda_specialist_tool, apigateway_specialist_tool, stepfunctions_specialist_tool,
     trace_specialist_tool, iam_specialist_tool, s3_specialist_tool, sqs_specialist_tool, sns_specialist_tool
 )
+from .exemplar_traces import ExemplarTraceSelector, TraceExemplar, find_incident_time
+from .investigation_events import InvestigationEventStream, EVENT_STREAM_KEY, EVENT_PHASE, EVENT_HYPOTHESES
 
 logger = get_logger(__name__)
 
@@ -179,6 +187,40 @@ class SwarmOrchestrator:
         
         logger.info("✨ SwarmOrchestrator initialized with cost control and flow management")
     
+    def reset_for_invocation(self, region: Optional[str] = None):
+        """
+        Reset per-investigation state so a warm instance can be reused.
+        
+        Agent conversation history, swarm shared context and node results from
+        the previous investigation are discarded; agents, models and the graph
+        structure are kept.
+        """
+        from strands import Agent
+        from strands.multiagent.base import Status
+        from strands.multiagent.swarm import SharedContext
+        
+        if region:
+            self.region = region
+            self.report_generator.region = region
+        
+        from .structured_agent_node import StructuredAgentNode
+        from .specialist_fanout import SpecialistBranchNode
+        
+        for node in self.graph.nodes.values():
+            if isinstance(node.executor, Agent):
+                node.reset_executor_state()
+            elif isinstance(node.executor, (StructuredAgentNode, SpecialistBranchNode)):
+                node.executor.reset()
+            node.execution_status = Status.PENDING
+            node.result = None
+        
+        for node in self.swarm.nodes.values():
+            node.reset_executor_state()
+        self.swarm.shared_context = SharedContext()
+        
+        self.investigation_progress = None
+        self.tool_failure_count = 0
+    
     def _initialize_investigation_progress(self, investigation_id: str) -> InvestigationProgress:
         """Initialize investigation progress tracking."""
         progress = InvestigationProgress()
@@ -343,32 +385,64 @@ class SwarmOrchestrator:
             repetitive_handoff_min_unique_agents=3
         )
 
-        # Create hypothesis generator agent
-        hypothesis_agent = create_hypothesis_agent_standalone()
-
-        # Create root cause analyzer agent (NEW)
-        root_cause_agent = create_root_cause_agent_standalone()
+        # Hypothesis and root cause nodes emit structured output so the report is assembled in code
+        # Their input is compacted to a per-node token budget
+        from .structured_agent_node import StructuredAgentNode
+        from .fact_compaction import get_node_token_budget
+        hypothesis_agent = StructuredAgentNode(
+            create_hypothesis_agent_standalone(), HypothesesList, output_key="hypotheses",
+            token_budget=get_node_token_budget("hypothesis_generation")
+        )
+        root_cause_agent = StructuredAgentNode(
+            create_root_cause_agent_standalone(), RootCauseAnalysis, output_key="root_cause_analysis",
+            token_budget=get_node_token_budget("root_cause_analysis")
+        )
 
         # Create structured report generator custom node
         from .structured_report_node import StructuredReportNode
         report_generator = StructuredReportNode(region=self.region)
+        self.report_generator = report_generator
 
         # Build the graph
         builder = GraphBuilder()
         builder.add_node(input_parser_agent, "input_parser")
         builder.add_node(specialist_swarm, "investigation")
+        if FeatureFlags.is_evidence_precollection_enabled():
+            # Optional stage: run the specialists in code and hand their facts to the swarm
+            from .evidence_collection_node import EvidenceCollectionNode
+            builder.add_node(EvidenceCollectionNode(), "evidence_collection")
         builder.add_node(hypothesis_agent, "hypothesis_generation")
         builder.add_node(root_cause_agent, "root_cause_analysis")  # NEW
         builder.add_node(report_generator, "report_generation")
 
+        investigation_stage = "investigation"
+        if FeatureFlags.is_parallel_specialists_enabled():
+            # Known services fan out to parallel specialist branches; ambiguous cases still use the swarm
+            investigation_stage = self._add_parallel_specialist_branches(builder)
+
         # Define edges (deterministic flow)
-        builder.add_edge("input_parser", "investigation")
+        first_stage = "evidence_collection" if "evidence_collection" in builder.nodes else investigation_stage
+        entry_point = "input_parser"
+        if FeatureFlags.is_deterministic_input_routing_enabled():
+            # Regex parsing runs first; the LLM parser only runs when it finds nothing.
+            # Exactly one of the two conditional edges is traversed, so first_stage runs once.
+            from .input_routing_node import (
+                DeterministicInputNode, INPUT_ROUTING_NODE_ID,
+                deterministic_parse_resolved, needs_llm_input_parser
+            )
+            builder.add_node(DeterministicInputNode(input_parser=self.input_parser), INPUT_ROUTING_NODE_ID)
+            builder.add_edge(INPUT_ROUTING_NODE_ID, "input_parser", condition=needs_llm_input_parser)
+            builder.add_edge(INPUT_ROUTING_NODE_ID, first_stage, condition=deterministic_parse_resolved)
+            entry_point = INPUT_ROUTING_NODE_ID
+        builder.add_edge("input_parser", first_stage)
+        if first_stage == "evidence_collection":
+            builder.add_edge("evidence_collection", investigation_stage)
         builder.add_edge("investigation", "hypothesis_generation")
         builder.add_edge("hypothesis_generation", "root_cause_analysis")  # NEW
         builder.add_edge("root_cause_analysis", "report_generation")  # UPDATED
         
-        # Set entry point to input_parser (FIRST NODE)
-        builder.set_entry_point("input_parser")
+        # Set entry point (input routing when enabled, otherwise input_parser)
+        builder.set_entry_point(entry_point)
         
         # Set timeouts
         builder.set_execution_timeout(600.0)  # 10 minutes total
@@ -380,18 +454,52 @@ class SwarmOrchestrator:
         # For backward compatibility
         self.swarm = specialist_swarm  # The swarm node from the graph
     
+    def _add_parallel_specialist_branches(self, builder: GraphBuilder) -> str:
+        """
+        Add the routing node and one branch per specialist to the graph.
+        
+        The routing node sends the investigation either to the swarm or to
+        the selected branches, never both; the branches run in one parallel
+        batch and join into hypothesis generation once all have finished.
+        
+        Returns:
+            ID of the node that replaces the swarm as the investigation stage
+        """
+        from .specialist_fanout import (
+            SPECIALIST_ROUTING_NODE_ID, SPECIALIST_TYPES, SpecialistRoutingNode, SpecialistBranchNode,
+            branch_node_id, needs_specialist_swarm, specialist_selected, parallel_specialists_complete
+        )
+        
+        # Branches get their own agents; the swarm's agents keep their handoff conversation
+        branch_agents = {agent.name: agent for agent in create_specialist_swarm_agents()}
+        
+        builder.add_node(SpecialistRoutingNode(), SPECIALIST_ROUTING_NODE_ID)
+        builder.add_edge(SPECIALIST_ROUTING_NODE_ID, "investigation", condition=needs_specialist_swarm)
+        for specialist_type in SPECIALIST_TYPES:
+            node_id = branch_node_id(specialist_type)
+            branch = SpecialistBranchNode(
+                branch_agents[f"{specialist_type}_specialist"], specialist_type,
+                timeout=self.cost_control_config.node_timeout
+            )
+            builder.add_node(branch, node_id)
+            builder.add_edge(SPECIALIST_ROUTING_NODE_ID, node_id, condition=specialist_selected(specialist_type))
+            builder.add_edge(node_id, "hypothesis_generation", condition=parallel_specialists_complete)
+        return SPECIALIST_ROUTING_NODE_ID
+    
     async def investigate(
         self,
         inputs: Dict[str, Any],
         region: str = None,
         assume_role_arn: Optional[str] = None,
-        external_id: Optional[str] = None
+        external_id: Optional[str] = None,
+        event_stream: Optional[InvestigationEventStream] = None
     ) -> InvestigationReport:
         """
         Run investigation using Strands Swarm pattern.
         
         The swarm will autonomously coordinate between specialists based on
-        their findings and expertise.
+        their findings and expertise. With an event stream, phase transitions,
+        specialist facts and hypotheses are published to it as they happen.
         """
         region = region or self.region
         investigation_start_time = datetime.now(timezone.utc)
@@ -417,13 +525,17 @@ class SwarmOrchestrator:
         logger.info(f"🚀 SWARM INVESTIGATION STARTED (ID: {investigation_id})")
         logger.info("=" * 80)
         
+        investigation_executor = None
         try:
             # Initialize investigation progress tracking
             self.investigation_progress = self._initialize_investigation_progress(investigation_id)
             
             # Setup and validate AWS client context with comprehensive error handling
             try:
-                aws_client = self._create_and_validate_aws_client(region, assume_role_arn, external_id)
+                # Client creation makes STS calls; keep them off the event loop
+                aws_client = await asyncio.to_thread(
+                    self._create_and_validate_aws_client, region, assume_role_arn, external_id
+                )
                 set_aws_client(aws_client)
             except Exception as e:
                 logger.error(f"❌ AWS client setup failed: {e}")
@@ -450,6 +562,32 @@ class SwarmOrchestrator:
             # Pass raw input - input_parser will extract, swarm will investigate
             investigation_prompt = f"Investigate this AWS issue: {free_text_input}"
             
+            # Traces fetched during this investigation are kept in memory and reused
+            trace_store = TraceStore()
+            set_trace_store(trace_store)
+            
+            # Bounded pool for the specialists' blocking AWS calls, shared by every node and tool
+            investigation_executor = InvestigationExecutor()
+            set_investigation_executor(investigation_executor)
+            
+            # Model-free parse, shared by input routing, exemplar selection and evidence pre-collection
+            parsed_inputs = self._parse_inputs_deterministic(inputs, free_text_input, region)
+            
+            # Without an explicit trace ID, start from exemplar traces instead of nothing
+            exemplars = await asyncio.to_thread(
+                self._select_exemplar_traces, parsed_inputs, free_text_input, inputs.get('incident_time')
+            )
+            if exemplars:
+                exemplar_lines = [
+                    f"- {e.trace_id} ({e.cluster_size} traces; root cause: {e.root_cause_service or 'unknown'}"
+                    f"{', ' + e.exception if e.exception else ''})"
+                    for e in exemplars
+                ]
+                investigation_prompt += (
+                    "\n\nExemplar X-Ray traces from the incident window (one per failure signature):\n"
+                    + "\n".join(exemplar_lines)
+                )
+            
             # Execute graph investigation with proper context sharing
             logger.info("🤖 Step 3: Executing graph investigation...")
             
@@ -457,18 +595,27 @@ class SwarmOrchestrator:
             set_aws_client(aws_client)
             
             try:
-                # Execute graph with comprehensive error handling
-                graph_result = self.graph(
-                    investigation_prompt,
-                    invocation_state={
-                        "aws_client": aws_client,
-                        "investigation_context": investigation_context,
-                        "region": region,
-                        "investigation_id": investigation_id,
-                        "investigation_start_time": investigation_start_time,
-                        "debug_mode": os.getenv('DEBUG_MODE', False)
-                    }
-                )
+                # Drive the graph on the caller's event loop so concurrent investigations
+                # interleave; model and tool calls are already offloaded to threads
+                # with the current context (AWS client, trace store) copied
+                invocation_state = {
+                    "aws_client": aws_client,
+                    "investigation_context": investigation_context,
+                    "region": region,
+                    "investigation_id": investigation_id,
+                    "investigation_start_time": investigation_start_time,
+                    "trace_store": trace_store,
+                    "exemplar_traces": [e.to_dict() for e in exemplars],
+                    "parsed_inputs": parsed_inputs,
+                    "free_text_input": free_text_input,
+                    "collected_facts": [],
+                    "debug_mode": os.getenv('DEBUG_MODE', False)
+                }
+                if event_stream is None:
+                    graph_result = await self.graph.invoke_async(investigation_prompt, invocation_state=invocation_state)
+                else:
+                    invocation_state[EVENT_STREAM_KEY] = event_stream
+                    graph_result = await self._stream_graph(investigation_prompt, invocation_state, event_stream)
                 
                 # Extract report from report_generation node
                 report_node_result = graph_result.results.get("report_generation")
@@ -526,6 +673,84 @@ class SwarmOrchestrator:
             
         finally:
             clear_aws_client()
+            clear_trace_store()
+            clear_investigation_executor()
+            if investigation_executor is not None:
+                investigation_executor.shutdown()
+    
+    async def _stream_graph(self, investigation_prompt: str, invocation_state: Dict[str, Any],
+                            event_stream: InvestigationEventStream):
+        """Run the graph, publishing node transitions and hypotheses as they happen."""
+        graph_result = None
+        async for event in self.graph.stream_async(investigation_prompt, invocation_state=invocation_state):
+            event_type = event.get("type")
+            if event_type == "multiagent_node_start":
+                event_stream.emit(EVENT_PHASE, {"phase": event["node_id"], "status": "started"})
+            elif event_type == "multiagent_node_stop":
+                failed = getattr(event.get("node_result"), "status", None) == Status.FAILED
+                event_stream.emit(EVENT_PHASE, {"phase": event["node_id"], "status": "failed" if failed else "completed"})
+                if event["node_id"] == "hypothesis_generation":
+                    hypotheses = (invocation_state.get("structured_outputs") or {}).get("hypotheses")
+                    if hypotheses is not None:
+                        event_stream.emit(EVENT_HYPOTHESES, hypotheses.model_dump(mode="json"))
+            elif event_type == "multiagent_node_stream":
+                # Agent turns inside the swarm
+                inner = event.get("event") or {}
+                if inner.get("type") == "multiagent_node_start":
+                    event_stream.emit(EVENT_PHASE, {
+                        "phase": event["node_id"], "agent": inner.get("node_id"), "status": "started"
+                    })
+            elif event_type == "multiagent_result":
+                graph_result = event["result"]
+        return graph_result
+    
+    def _parse_inputs_deterministic(self, inputs: Dict[str, Any], free_text_input: str, region: str):
+        """
+        Parse inputs without any model call.
+        
+        Structured payloads use their explicit targets and trace IDs; free text
+        uses the regex parser. Nothing found means the LLM input parser runs.
+        """
+        if isinstance(inputs.get('investigation_inputs'), dict):
+            try:
+                parsed = self.input_parser._parse_structured_input(inputs['investigation_inputs'], region)
+                if parsed.primary_targets or parsed.trace_ids:
+                    return parsed
+            except Exception as e:
+                logger.warning(f"Structured input parsing failed, using regex parsing: {e}")
+        return self.input_parser._parse_free_text_deterministic(free_text_input, region)
+    
+    def _select_exemplar_traces(self, parsed, free_text_input: str, incident_time=None) -> List[TraceExemplar]:
+        """
+        Pick exemplar traces for the named resources when the input has no trace ID.
+        
+        The window is anchored on the incident time given with the request
+        (e.g. the alarm time), parsed from the input, or otherwise on now.
+        
+        Selection is best-effort: any failure just means the investigation
+        starts without exemplars, as it did before.
+        """
+        if not FeatureFlags.is_exemplar_trace_selection_enabled():
+            return []
+        
+        try:
+            if parsed.trace_ids:
+                return []
+            
+            service_names = [target.name for target in parsed.primary_targets]
+            if not service_names:
+                service_names = self.input_parser._extract_resource_names(free_text_input)
+            if not service_names:
+                return []
+            
+            incident_time = find_incident_time(free_text_input, parsed.time_range, incident_time)
+            exemplars = ExemplarTraceSelector().select(service_names, incident_time=incident_time)
+            for exemplar in exemplars:
+                logger.info(f"🧭 Exemplar trace {exemplar.trace_id}: {exemplar.signature} ({exemplar.cluster_size} traces)")
+            return exemplars
+        except Exception as e:
+            logger.warning(f"Exemplar trace selection failed: {e}")
+            return []
     
     def _parse_inputs(self, inputs: Dict[str, Any], region: str):
         """
@@ -561,12 +786,11 @@ class SwarmOrchestrator:
         
         # Discover from X-Ray traces
         if parsed_inputs.trace_ids:
-            from ..tools import get_all_resources_from_trace
+            from ..tools import fetch_all_resources_from_trace
             
             for trace_id in parsed_inputs.trace_ids:
                 try:
-                    resources_json = get_all_resources_from_trace(trace_id)
-                    trace_resources = json.loads(resources_json)
+                    trace_resources = fetch_all_resources_from_trace(trace_id)
                     
                     if "error" not in trace_resources:
                         for resource in trace_resources.get("resources", []):
@@ -672,7 +896,7 @@ Investigation MUST end with root_cause_analyzer providing final analysis. Do not
         dumping raw SwarmResult objects.
         """
         from ..models import (
-            InvestigationReport, Fact, Hypothesis, Advice,
+            InvestigationReport, Fact, Hypothesis, HypothesesList, Advice,
             AffectedResource, SeverityAssessment, RootCauseAnalysis, EventTimeline
         )
         
@@ -40,7 +40,7 @@ from pydantic import BaseModel, Field
 from strands import tool, ToolContext, Agent
 
 from ..models import Fact
-from ..context import set_aws_client, get_aws_client
+from ..context import set_aws_client, get_aws_client, set_trace_store, TraceStore, isolated_context
 from ..utils.config import create_parser_model
 from ..specialists import (
     LambdaSpecialist, APIGatewaySpecialist, 
@@ -49,6 +49,8 @@ from ..specialists import (
     InvestigationContext
 )
 from ..utils import get_logger
+from .fact_compaction import compact_metadata
+from .investigation_events import publish_facts
 
 logger = get_logger(__name__)
 
@@ -477,7 +479,8 @@ def _format_specialist_results(
                 "source": fact.source,
                 "content": fact.content,
                 "confidence": fact.confidence,
-                "metadata": fact.metadata
+                # Raw invocation lists and trace segment dumps would dominate the prompt
+                "metadata": compact_metadata(fact.metadata)
             }
             for fact in facts
         ],
@@ -485,9 +488,18 @@ def _format_specialist_results(
     }
 
 
+def _record_facts(tool_context: ToolContext, results: dict) -> None:
+    """Add a tool's facts to the investigation's fact list and publish them to any listening client."""
+    collected = tool_context.invocation_state.get('collected_facts')
+    if isinstance(collected, list):
+        collected.extend(results.get("facts", []))
+    publish_facts(tool_context.invocation_state, results)
+
+
 # Specialist Tools - Following Strands Best Practices
 
 @tool(context=True)
+@isolated_context
 def lambda_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze Lambda function configuration, logs, and performance issues using real AWS API calls.
@@ -544,6 +556,7 @@ def lambda_specialist_tool(resource_data: str, investigation_context: str, tool_
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_LAMBDA, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -562,6 +575,7 @@ def lambda_specialist_tool(resource_data: str, investigation_context: str, tool_
 
 
 @tool(context=True)
+@isolated_context
 def apigateway_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze API Gateway configuration, stage settings, and integration issues using real AWS API calls.
@@ -618,6 +632,7 @@ def apigateway_specialist_tool(resource_data: str, investigation_context: str, t
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_APIGATEWAY, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -636,6 +651,7 @@ def apigateway_specialist_tool(resource_data: str, investigation_context: str, t
 
 
 @tool(context=True)
+@isolated_context
 def stepfunctions_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze Step Functions state machine executions, errors, and permissions using real AWS API calls.
@@ -692,6 +708,7 @@ def stepfunctions_specialist_tool(resource_data: str, investigation_context: str
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_STEPFUNCTIONS, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -710,6 +727,7 @@ def stepfunctions_specialist_tool(resource_data: str, investigation_context: str
 
 
 @tool(context=True)
+@isolated_context
 def trace_specialist_tool(trace_ids: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Perform deep X-Ray trace analysis to extract service interactions and errors using real AWS API calls.
@@ -755,6 +773,11 @@ def trace_specialist_tool(trace_ids: str, investigation_context: str, tool_conte
         except (AWSClientContextError, AWSPermissionError, CrossAccountAccessError) as e:
             return _create_error_response("aws_client", str(e), SPECIALIST_TYPE_TRACE)
         
+        # Reuse traces already fetched in this investigation (e.g. prefetched exemplars)
+        trace_store = tool_context.invocation_state.get('trace_store')
+        if isinstance(trace_store, TraceStore):
+            set_trace_store(trace_store)
+        
         # Create investigation context
         context = InvestigationContext(
             trace_ids=trace_id_list,
@@ -802,7 +825,7 @@ def trace_specialist_tool(trace_ids: str, investigation_context: str, tool_conte
                         "source": fact.source,
                         "content": fact.content,
                         "confidence": fact.confidence,
-                        "metadata": fact.metadata
+                        "metadata": compact_metadata(fact.metadata)
                     }
                     for fact in all_facts
                 ],
@@ -812,6 +835,7 @@ def trace_specialist_tool(trace_ids: str, investigation_context: str, tool_conte
             # Add degradation warning if some traces failed
             if failed_traces > 0:
                 results["degradation_warning"] = f"{failed_traces} out of {len(trace_id_list)} traces failed to analyze"
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -831,6 +855,7 @@ def trace_specialist_tool(trace_ids: str, investigation_context: str, tool_conte
 
 
 @tool(context=True)
+@isolated_context
 def iam_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze IAM roles, users, and policies for permission issues and security concerns using real AWS API calls.
@@ -887,6 +912,7 @@ def iam_specialist_tool(resource_data: str, investigation_context: str, tool_con
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_IAM, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -905,6 +931,7 @@ def iam_specialist_tool(resource_data: str, investigation_context: str, tool_con
 
 
 @tool(context=True)
+@isolated_context
 def s3_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze S3 bucket configuration, policies, and metrics for access and performance issues using real AWS API calls.
@@ -961,6 +988,7 @@ def s3_specialist_tool(resource_data: str, investigation_context: str, tool_cont
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_S3, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -979,6 +1007,7 @@ def s3_specialist_tool(resource_data: str, investigation_context: str, tool_cont
 
 
 @tool(context=True)
+@isolated_context
 def sqs_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze SQS queue configuration, metrics, and dead letter queue setup for message processing issues using real AWS API calls.
@@ -1035,6 +1064,7 @@ def sqs_specialist_tool(resource_data: str, investigation_context: str, tool_con
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_SQS, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -1053,6 +1083,7 @@ def sqs_specialist_tool(resource_data: str, investigation_context: str, tool_con
 
 
 @tool(context=True)
+@isolated_context
 def sns_specialist_tool(resource_data: str, investigation_context: str, tool_context: ToolContext) -> dict:
     """
     Analyze SNS topic configuration, subscriptions, and delivery metrics for notification issues using real AWS API calls.
@@ -1109,6 +1140,7 @@ def sns_specialist_tool(resource_data: str, investigation_context: str, tool_con
             
             # Format results using helper function
             results = _format_specialist_results(SPECIALIST_TYPE_SNS, resource_name, facts)
+            _record_facts(tool_context, results)
             
             return {
                 "status": "success",
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Compact encoding of tool output sent to the model
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Tools return pretty-printed JSON because specialists parse it directly.
+Before a tool result reaches the model it is re-encoded here: whitespace
+and null/empty fields are dropped, lists of records become a column header
+plus rows, and the result is capped per tool. Each call's raw and sent
+token estimates are recorded on the tool span and in invocation_state.
+
+Environment Variables:
+- PROMPTRCA_COMPACT_TOOL_OUTPUT: Enable the encoder (default: true)
+- PROMPTRCA_TOOL_OUTPUT_MAX_CHARS: Default size cap per tool result (default: 12000)
+- PROMPTRCA_TOOL_OUTPUT_MAX_CHARS_<TOOL>: Per-tool cap, e.g. PROMPTRCA_TOOL_OUTPUT_MAX_CHARS_GET_XRAY_TRACE
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from opentelemetry import trace as trace_api
+from strands.hooks import AfterToolCallEvent, HookProvider, HookRegistry
+
+from ..utils import get_logger
+from ..utils.feature_flags import FeatureFlags
+from .fact_compaction import estimate_tokens
+
+logger = get_logger(__name__)
+
+DEFAULT_TOOL_OUTPUT_MAX_CHARS = 12000
+
+# Tools whose useful output is routinely larger (or smaller) than the default
+TOOL_OUTPUT_MAX_CHARS = {
+    "get_xray_trace": 24000,
+    "get_all_resources_from_trace": 16000,
+    "get_stepfunctions_execution_details": 16000,
+    "trace_specialist_tool": 16000,
+    "get_cloudwatch_logs": 8000,
+    "query_logs_by_trace_id": 8000,
+}
+
+# Lists of at least this many records are encoded as columns + rows
+MIN_TABULAR_ROWS = 2
+MAX_CAP_PASSES = 20
+
+
+def get_tool_output_max_chars(tool_name: str) -> int:
+    """Size cap for one tool's result."""
+    override = os.getenv(f"PROMPTRCA_TOOL_OUTPUT_MAX_CHARS_{tool_name.upper()}")
+    if override is not None:
+        return int(override)
+    if tool_name in TOOL_OUTPUT_MAX_CHARS:
+        return TOOL_OUTPUT_MAX_CHARS[tool_name]
+    return int(os.getenv("PROMPTRCA_TOOL_OUTPUT_MAX_CHARS", str(DEFAULT_TOOL_OUTPUT_MAX_CHARS)))
+
+
+def _drop_empty(value: Any) -> Any:
+    if isinstance(value, dict):
+        cleaned = {k: _drop_empty(v) for k, v in value.items()}
+        return {k: v for k, v in cleaned.items() if v is not None and v != "" and v != {} and v != []}
+    if isinstance(value, list):
+        return [_drop_empty(v) for v in value]
+    return value
+
+
+def _tabulate(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _tabulate(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [_tabulate(v) for v in value]
+        if len(items) >= MIN_TABULAR_ROWS and all(isinstance(v, dict) for v in items):
+            cols: List[str] = []
+            for item in items:
+                cols.extend(k for k in item if k not in cols)
+            return {"cols": cols, "rows": [[item.get(c) for c in cols] for item in items]}
+        return items
+    return value
+
+
+def compact_value(value: Any) -> Any:
+    """Drop null/empty fields and encode lists of records as columns + rows."""
+    return _tabulate(_drop_empty(value))
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'), default=str)
+
+
+def _longest_list(value: Any, path: Tuple = ()) -> Tuple[Optional[Tuple], int]:
+    """Find the path to the list with the largest serialized size."""
+    best_path, best_size = None, 0
+    if isinstance(value, list) and len(value) > 1:
+        best_path, best_size = path, len(_dumps(value))
+    children = value.items() if isinstance(value, dict) else enumerate(value) if isinstance(value, list) else ()
+    for key, child in children:
+        child_path, child_size = _longest_list(child, path + (key,))
+        if child_size > best_size:
+            best_path, best_size = child_path, child_size
+    return best_path, best_size
+
+
+def _is_marker(item: Any) -> bool:
+    return isinstance(item, str) and item.startswith("...(+")
+
+
+def _cap(value: Any, max_chars: int) -> Tuple[str, bool]:
+    """Serialize value within max_chars, halving the largest lists first."""
+    encoded = _dumps(value)
+    passes = 0
+    while len(encoded) > max_chars and passes < MAX_CAP_PASSES:
+        path, _size = _longest_list(value)
+        if not path:
+            break
+        parent = value
+        for key in path[:-1]:
+            parent = parent[key]
+        items = parent[path[-1]]
+        # Carry over the count from a marker left by an earlier pass
+        omitted = sum(int(i[5:].split()[0]) for i in items if _is_marker(i))
+        real = [i for i in items if not _is_marker(i)]
+        keep = max(1, len(real) // 2)
+        parent[path[-1]] = real[:keep] + [f"...(+{len(real) - keep + omitted} more)"]
+        encoded = _dumps(value)
+        passes += 1
+
+    if len(encoded) <= max_chars:
+        return encoded, passes > 0
+    return encoded[:max_chars] + f"...[truncated {len(encoded) - max_chars} chars]", True
+
+
+def encode_tool_output(raw: Any, tool_name: str = "") -> Tuple[str, bool]:
+    """
+    Encode a tool result for the model.
+
+    Args:
+        raw: Tool output, either a JSON string or an already-parsed value
+        tool_name: Tool name, used for the size cap
+
+    Returns:
+        (encoded text, whether it was truncated)
+    """
+    max_chars = get_tool_output_max_chars(tool_name)
+    if isinstance(raw, str):
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            if len(raw) <= max_chars:
+                return raw, False
+            return raw[:max_chars] + f"...[truncated {len(raw) - max_chars} chars]", True
+    else:
+        value = raw
+    return _cap(compact_value(value), max_chars)
+
+
+class CompactToolOutputHook(HookProvider):
+    """
+    Agent hook that re-encodes every tool result before the model sees it.
+
+    Per-call token estimates are set on the current (tool call) span as
+    promptrca.tool.raw_tokens / promptrca.tool.output_tokens and summed per
+    tool in invocation_state["tool_token_usage"].
+    """
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        registry.add_callback(AfterToolCallEvent, self.on_after_tool_call)
+
+    def on_after_tool_call(self, event: AfterToolCallEvent) -> None:
+        result = event.result
+        if not isinstance(result, dict) or not result.get("content"):
+            return
+
+        tool_name = event.tool_use.get("name", "")
+        raw_tokens = sent_tokens = 0
+        truncated = False
+        content = []
+        for block in result["content"]:
+            if "text" in block:
+                raw_text = block["text"]
+                encoded, was_truncated = encode_tool_output(raw_text, tool_name)
+            elif "json" in block:
+                raw_text = json.dumps(block["json"], default=str)
+                encoded, was_truncated = encode_tool_output(block["json"], tool_name)
+            else:
+                content.append(block)
+                continue
+            raw_tokens += estimate_tokens(raw_text)
+            sent_tokens += estimate_tokens(encoded)
+            truncated = truncated or was_truncated
+            content.append({"text": encoded})
+
+        event.result = {**result, "content": content}
+        self._record(event.invocation_state, tool_name, raw_tokens, sent_tokens, truncated)
+
+    @staticmethod
+    def _record(invocation_state: Optional[Dict[str, Any]], tool_name: str,
+                raw_tokens: int, sent_tokens: int, truncated: bool) -> None:
+        span = trace_api.get_current_span()
+        if span.is_recording():
+            span.set_attributes({
+                "promptrca.tool.raw_tokens": raw_tokens,
+                "promptrca.tool.output_tokens": sent_tokens,
+                "promptrca.tool.truncated": truncated
+            })
+
+        if isinstance(invocation_state, dict):
+            usage = invocation_state.setdefault("tool_token_usage", {}).setdefault(
+                tool_name, {"calls": 0, "raw_tokens": 0, "output_tokens": 0, "truncated": 0}
+            )
+            usage["calls"] += 1
+            usage["raw_tokens"] += raw_tokens
+            usage["output_tokens"] += sent_tokens
+            usage["truncated"] += int(truncated)
+
+        logger.debug(f"🧮 {tool_name}: ~{raw_tokens} -> ~{sent_tokens} tokens{' (truncated)' if truncated else ''}")
+
+
+def tool_output_hooks() -> List[HookProvider]:
+    """Hooks to pass to Agent(hooks=...) for agents with tools."""
+    if not FeatureFlags.is_compact_tool_output_enabled():
+        return []
+    return [CompactToolOutputHook()]
@@ -25,23 +25,14 @@ Used by both the HTTP server and AWS Lambda deployments.
 import os
 import asyncio
 import re
-from typing import Dict, Any, Optional
-from strands import Agent
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
 
-from .core import PromptRCAInvestigator
-from .utils.config import get_region, create_orchestrator_model
+from .utils.config import get_region
 from .utils import get_logger
 
 logger = get_logger(__name__)
 
-# Configure orchestrator model - initialized once, reused across invocations
-# In Lambda, this happens during cold start and is reused for warm invocations
-orchestrator_model = create_orchestrator_model()
-
-agent = Agent(model=orchestrator_model)
-
-
-async def handle_investigation(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_investigation(payload: Dict[str, Any], event_stream=None) -> Dict[str, Any]:
     """
     Core investigation handler - shared between server and Lambda.
 
@@ -51,7 +42,8 @@ async def handle_investigation(payload: Dict[str, Any]) -> Dict[str, Any]:
                 "investigation": {
                     "input": "Free text description",
                     "xray_trace_id": "1-...",  # optional, defaults to empty string
-                    "region": "eu-west-1"  # optional, uses service_config.region if not provided
+                    "region": "eu-west-1",  # optional, uses service_config.region if not provided
+                    "incident_time": "2025-01-01T12:00:00Z"  # optional, e.g. the alarm time
                 },
                 "service_config": {
                     "role_arn": "arn:aws:iam::...",  # optional
@@ -59,6 +51,7 @@ async def handle_investigation(payload: Dict[str, Any]) -> Dict[str, Any]:
                     "region": "eu-west-1"  # tenant default region
                 }
             }
+        event_stream: Optional InvestigationEventStream receiving progress events
 
     Returns:
         Investigation report as dictionary
@@ -77,6 +70,7 @@ async def handle_investigation(payload: Dict[str, Any]) -> Dict[str, Any]:
         # Extract investigation data
         free_text_input = investigation.get("input", "")
         xray_trace_id = investigation.get("xray_trace_id", "")
+        incident_time = investigation.get("incident_time")
         investigation_region = investigation.get("region")
         
         # Extract service configuration
@@ -110,10 +104,11 @@ async def handle_investigation(payload: Dict[str, Any]) -> Dict[str, Any]:
         return await _handle_free_text_investigation(
             free_text_input,
             region,
-            agent,
             assume_role_arn,
             external_id,
-            xray_trace_id
+            xray_trace_id,
+            event_stream,
+            incident_time
         )
 
     except Exception as e:
@@ -127,10 +122,11 @@ async def handle_investigation(payload: Dict[str, Any]) -> Dict[str, Any]:
 async def _handle_free_text_investigation(
     free_text: str,
     region: str,
-    strands_agent: Agent,
     assume_role_arn: Optional[str] = None,
     external_id: Optional[str] = None,
-    xray_trace_id: Optional[str] = None
+    xray_trace_id: Optional[str] = None,
+    event_stream=None,
+    incident_time: Optional[str] = None
 ) -> Dict[str, Any]:
     """Handle free text investigation using Swarm orchestration."""
     print(f"🔍 Debug: _handle_free_text_investigation called with free_text: {free_text}")
@@ -149,20 +145,20 @@ async def _handle_free_text_investigation(
     )
     
     try:
-        print(f"🔍 Debug: Starting SwarmOrchestrator import")
-        from .core.swarm_orchestrator import SwarmOrchestrator
-
-        # Initialize Swarm orchestrator
-        orchestrator = SwarmOrchestrator(region=region)
+        from .core.orchestrator_pool import get_orchestrator_pool
 
         # Prepare input for investigation
         inputs = {
             "free_text_input": free_text,
-            "xray_trace_id": xray_trace_id or ""
+            "xray_trace_id": xray_trace_id or "",
+            "incident_time": incident_time
         }
 
-        # Run Swarm investigation (async) - await since we're in an async context
-        report = await orchestrator.investigate(inputs, region, assume_role_arn, external_id)
+        # Run Swarm investigation (async) on a warm orchestrator from the pool
+        async with get_orchestrator_pool().acquire(region) as orchestrator:
+            report = await orchestrator.investigate(
+                inputs, region, assume_role_arn, external_id, event_stream=event_stream
+            )
         
         # Debug: Check what type of object we received
         print(f"🔍 Debug: Handler received report type: {type(report)}")
@@ -202,7 +198,6 @@ async def _handle_free_text_investigation(
 async def _handle_investigation_inputs(
     investigation_inputs: str,
     region: str,
-    strands_agent: Agent,
     assume_role_arn: Optional[str] = None,
     external_id: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -221,18 +216,16 @@ async def _handle_investigation_inputs(
     )
     
     try:
-        from .core.swarm_orchestrator import SwarmOrchestrator
-
-        # Initialize Swarm orchestrator
-        orchestrator = SwarmOrchestrator(region=region)
+        from .core.orchestrator_pool import get_orchestrator_pool
 
         # Prepare input for investigation
         inputs = {
             "investigation_inputs": investigation_inputs
         }
 
-        # Run Swarm investigation (async) - await since we're in an async context
-        report = await orchestrator.investigate(inputs, region, assume_role_arn, external_id)
+        # Run Swarm investigation (async) on a warm orchestrator from the pool
+        async with get_orchestrator_pool().acquire(region) as orchestrator:
+            report = await orchestrator.investigate(inputs, region, assume_role_arn, external_id)
         
         # Debug: Check what type of object we received
         print(f"🔍 Debug: Handler received report type: {type(report)}")
@@ -261,3 +254,52 @@ async def _handle_investigation_inputs(
             "success": False,
             "error": f"Multi-agent investigation failed: {str(e)}"
         }
+
+
+async def stream_investigation(
+    payload: Dict[str, Any],
+    runner: Optional[Callable[[Any], Awaitable[Dict[str, Any]]]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run an investigation and yield its progress events as they happen.
+
+    Yields {"event": type, "data": payload} dicts: phase, facts and
+    hypotheses events while the investigation runs, then a single report
+    event (or an error event if the investigation failed). If the consumer
+    stops iterating, the investigation is cancelled.
+
+    Args:
+        payload: Investigation request in the structured format of handle_investigation
+        runner: Coroutine function running the investigation with the event
+            stream (default: handle_investigation on the payload)
+    """
+    from .core.investigation_events import InvestigationEventStream, EVENT_REPORT, EVENT_ERROR
+
+    event_stream = InvestigationEventStream()
+    if runner is None:
+        runner = lambda stream: handle_investigation(payload, event_stream=stream)
+
+    async def _run() -> Dict[str, Any]:
+        try:
+            return await runner(event_stream)
+        finally:
+            event_stream.close()
+
+    task = asyncio.create_task(_run())
+    try:
+        async for event in event_stream:
+            yield event
+
+        try:
+            result = await task
+        except Exception as e:
+            logger.error(f"Streamed investigation failed: {e}", exc_info=True)
+            result = {"success": False, "error": str(e)}
+        if result.get("success") is False:
+            yield {"event": EVENT_ERROR, "data": result}
+        else:
+            yield {"event": EVENT_REPORT, "data": result}
+    finally:
+        if not task.done():
+            logger.info("🔌 Stream consumer went away; cancelling investigation")
+            task.cancel()
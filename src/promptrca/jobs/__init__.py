@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - AI-powered root cause analysis for AWS infrastructure
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+"""
+
+from .store import (
+    JobStatus, InvestigationJob, JobStore, InMemoryJobStore, SQLiteJobStore, create_job_store
+)
+from .admission import (
+    AdmissionController, AdmissionRejected, AdmissionTicket, get_admission_controller, tenant_key
+)
+from .coalescing import SingleFlight, coalescing_key, get_single_flight, investigation_fingerprint
+from .alarm_clusters import AlarmCluster, AlarmEvent, alarm_keys, cluster_alarms
+from .report_cache import ReportCache, cached_report, get_report_cache, remember_report
+from .manager import InvestigationJobManager, get_job_manager
+
+__all__ = [
+    'JobStatus', 'InvestigationJob', 'JobStore', 'InMemoryJobStore', 'SQLiteJobStore', 'create_job_store',
+    'AdmissionController', 'AdmissionRejected', 'AdmissionTicket', 'get_admission_controller', 'tenant_key',
+    'SingleFlight', 'coalescing_key', 'get_single_flight', 'investigation_fingerprint',
+    'AlarmCluster', 'AlarmEvent', 'alarm_keys', 'cluster_alarms',
+    'ReportCache', 'cached_report', 'get_report_cache', 'remember_report',
+    'InvestigationJobManager', 'get_job_manager'
+]
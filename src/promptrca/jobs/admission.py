@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Jobs - Admission control for concurrent investigations
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Every investigation entering the server (synchronous, streamed or queued
+as a job) takes a ticket from one admission controller. A ticket runs when
+both the global and its tenant's concurrency limits allow, in arrival
+order among the tenants that are under their limit. Tickets beyond the
+queue depth are rejected with an estimate of when to retry, so a burst of
+alarms saturates gracefully instead of every investigation slowing down
+under Bedrock and AWS API throttling.
+
+Tenants are keyed by the account of service_config.role_arn; requests
+without a role run in the server's own account and share one tenant.
+
+Environment Variables:
+- PROMPTRCA_MAX_CONCURRENT_INVESTIGATIONS: Investigations running at once (default: 4)
+- PROMPTRCA_MAX_CONCURRENT_PER_TENANT: Investigations running at once per tenant (default: 2)
+- PROMPTRCA_MAX_QUEUE_DEPTH: Investigations waiting before new ones are rejected (default: 50)
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENT_PER_TENANT = 2
+DEFAULT_MAX_QUEUE_DEPTH = 50
+# Used for Retry-After until real investigations have been timed
+DEFAULT_ESTIMATED_INVESTIGATION_SECONDS = 120.0
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+
+DEFAULT_TENANT = "default"
+
+
+class AdmissionRejected(Exception):
+    """The admission queue is full; retry after `retry_after` seconds."""
+
+    def __init__(self, retry_after: int, queued: int):
+        super().__init__(f"Investigation queue is full ({queued} waiting); retry after {retry_after}s")
+        self.retry_after = retry_after
+        self.queued = queued
+
+
+def tenant_key(payload: Dict[str, Any]) -> str:
+    """
+    Tenant of an investigation request.
+
+    Returns:
+        "account:<id>" for a role ARN, "role:<value>" if the ARN has no
+        account field, otherwise the default tenant
+    """
+    service_config = (payload or {}).get("service_config") or {}
+    role_arn = service_config.get("role_arn")
+    if not role_arn:
+        return DEFAULT_TENANT
+    parts = role_arn.split(":")
+    if len(parts) > 4 and parts[4]:
+        return f"account:{parts[4]}"
+    return f"role:{role_arn}"
+
+
+@dataclass(eq=False)
+class AdmissionTicket:
+    """One investigation's place in the admission queue."""
+    tenant: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    admitted_at: Optional[float] = None
+    released: bool = False
+
+
+class AdmissionController:
+    """
+    Global and per-tenant concurrency limits with a bounded wait queue.
+
+    enqueue() takes a ticket or raises AdmissionRejected; wait() returns once
+    the ticket is admitted; release() frees its slot. admit() combines the
+    three for a single block of work. All methods must be called from the
+    event loop the controller is used on.
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None, max_per_tenant: Optional[int] = None,
+                 max_queue_depth: Optional[int] = None):
+        """
+        Args:
+            max_concurrent: Investigations running at once (default: PROMPTRCA_MAX_CONCURRENT_INVESTIGATIONS)
+            max_per_tenant: Running investigations per tenant (default: PROMPTRCA_MAX_CONCURRENT_PER_TENANT)
+            max_queue_depth: Waiting investigations allowed (default: PROMPTRCA_MAX_QUEUE_DEPTH)
+        """
+        if max_concurrent is None:
+            from ..core.orchestrator_pool import get_max_concurrent_investigations
+            max_concurrent = get_max_concurrent_investigations()
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_tenant = max(1, max_per_tenant or int(
+            os.getenv("PROMPTRCA_MAX_CONCURRENT_PER_TENANT", str(DEFAULT_MAX_CONCURRENT_PER_TENANT))
+        ))
+        self.max_queue_depth = max_queue_depth if max_queue_depth is not None else int(
+            os.getenv("PROMPTRCA_MAX_QUEUE_DEPTH", str(DEFAULT_MAX_QUEUE_DEPTH))
+        )
+        self._waiting: Deque[AdmissionTicket] = deque()
+        self._running: Counter = Counter()
+        self._running_total = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.avg_wait_seconds = 0.0
+        self.avg_duration_seconds = DEFAULT_ESTIMATED_INVESTIGATION_SECONDS
+
+    def enqueue(self, tenant: str = DEFAULT_TENANT) -> AdmissionTicket:
+        """
+        Take a place in the queue, admitting immediately if there is room.
+
+        Raises:
+            AdmissionRejected: The queue is at its depth limit
+        """
+        ticket = AdmissionTicket(tenant=tenant, future=asyncio.get_running_loop().create_future())
+        self._waiting.append(ticket)
+        self._dispatch()
+        if not ticket.future.done() and len(self._waiting) > self.max_queue_depth:
+            self._waiting.remove(ticket)
+            self.rejected += 1
+            retry_after = self.retry_after()
+            logger.warning(f"🚦 Rejected investigation for {tenant}: {len(self._waiting)} waiting, "
+                           f"retry after {retry_after}s")
+            raise AdmissionRejected(retry_after, len(self._waiting))
+        if not ticket.future.done():
+            logger.info(f"⏳ Investigation for {tenant} queued ({len(self._waiting)} waiting, "
+                        f"{self._running_total}/{self.max_concurrent} running)")
+        return ticket
+
+    async def wait(self, ticket: AdmissionTicket) -> None:
+        """Wait until the ticket is admitted; cancelling gives up its place or slot."""
+        try:
+            await asyncio.shield(ticket.future)
+        except asyncio.CancelledError:
+            if ticket.future.done():
+                self.release(ticket)
+            else:
+                ticket.future.cancel()
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                self._dispatch()
+            raise
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free an admitted ticket's slot, or drop a ticket that never ran."""
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket.admitted_at is None:
+            if ticket in self._waiting:
+                self._waiting.remove(ticket)
+            return
+
+        self._running_total -= 1
+        self._running[ticket.tenant] -= 1
+        if self._running[ticket.tenant] <= 0:
+            del self._running[ticket.tenant]
+        duration = time.monotonic() - ticket.admitted_at
+        self.avg_duration_seconds += EWMA_ALPHA * (duration - self.avg_duration_seconds)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, tenant: str = DEFAULT_TENANT):
+        """
+        Run a block of work under the admission limits.
+
+        Raises:
+            AdmissionRejected: The queue is at its depth limit
+        """
+        ticket = self.enqueue(tenant)
+        await self.wait(ticket)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def retry_after(self) -> int:
+        """Seconds until a new request would likely find room in the queue."""
+        ahead = len(self._waiting) + 1
+        return max(1, math.ceil(self.avg_duration_seconds * ahead / self.max_concurrent))
+
+    def _dispatch(self) -> None:
+        """Admit waiting tickets, oldest first, while the limits allow."""
+        for ticket in list(self._waiting):
+            if self._running_total >= self.max_concurrent:
+                return
+            if ticket.future.cancelled():
+                self._waiting.remove(ticket)
+                continue
+            if self._running[ticket.tenant] >= self.max_per_tenant:
+                continue
+            self._waiting.remove(ticket)
+            ticket.admitted_at = time.monotonic()
+            self._running_total += 1
+            self._running[ticket.tenant] += 1
+            self.admitted += 1
+            wait = ticket.admitted_at - ticket.enqueued_at
+            self.avg_wait_seconds += EWMA_ALPHA * (wait - self.avg_wait_seconds)
+            ticket.future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue metrics for /status."""
+        queued = Counter(ticket.tenant for ticket in self._waiting)
+        tenants = {
+            tenant: {"running": self._running.get(tenant, 0), "queued": queued.get(tenant, 0)}
+            for tenant in set(self._running) | set(queued)
+        }
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_per_tenant": self.max_per_tenant,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self._running_total,
+            "queued": len(self._waiting),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avg_wait_seconds": round(self.avg_wait_seconds, 3),
+            "avg_duration_seconds": round(self.avg_duration_seconds, 3),
+            "retry_after_seconds": self.retry_after(),
+            "tenants": tenants
+        }
+
+
+_admission_controller: Optional[AdmissionController] = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide admission controller."""
+    global _admission_controller
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                _admission_controller = AdmissionController()
+    return _admission_controller
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Jobs - Clustering of alarm storms into shared investigations
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+When one dependency fails, dozens of alarms arrive in the same SNS or SQS
+batch. Alarms are linked when they name the same resource (ARN or the
+resource name inside it) or the same X-Ray trace, which also links the
+services on one failing request path, or resources that call the same
+downstream node in a cached X-Ray service graph snapshot, and fired within
+the clustering window of each other; linking is transitive. Alarms naming nothing are
+linked only to identical alarms. Alarms from different accounts or
+regions are never linked. Each cluster runs one investigation whose
+input lists every member alarm, and its result is returned for every
+member.
+
+Environment Variables:
+- PROMPTRCA_ALARM_CLUSTERING: Cluster batched alarms (default: true)
+- PROMPTRCA_ALARM_CLUSTER_WINDOW_SECONDS: Maximum gap between linked alarms (default: 300)
+"""
+
+import copy
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from ..utils import get_logger
+from ..utils.config import get_region
+from .admission import tenant_key
+from .coalescing import get_input_parser, investigation_fingerprint
+
+logger = get_logger(__name__)
+
+DEFAULT_ALARM_CLUSTER_WINDOW_SECONDS = 300
+# Member alarms listed in a cluster's investigation input
+MAX_RELATED_ALARMS_IN_INPUT = 20
+
+
+@dataclass
+class AlarmEvent:
+    """One alarm from an event batch, already parsed into an investigation payload."""
+    event_id: str
+    payload: Dict[str, Any]
+    timestamp: float
+    keys: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class AlarmCluster:
+    """Alarms sharing one investigation; members are ordered by time."""
+    cluster_id: str
+    members: List[AlarmEvent]
+
+    @property
+    def event_ids(self) -> List[str]:
+        return [member.event_id for member in self.members]
+
+    def investigation_payload(self) -> Dict[str, Any]:
+        """
+        Payload of the cluster's investigation: the first alarm's, with the
+        other alarms listed in its input so every named resource is covered.
+        """
+        lead = self.members[0].payload
+        if len(self.members) == 1:
+            return lead
+
+        lead_input = lead["investigation"].get("input", "")
+        related: List[str] = []
+        for member in self.members[1:]:
+            investigation = member.payload["investigation"]
+            line = investigation.get("input", "")
+            if investigation.get("xray_trace_id"):
+                line = f"{line} (X-Ray trace: {investigation['xray_trace_id']})"
+            if line and line != lead_input and line not in related:
+                related.append(line)
+        if not related:
+            return lead
+
+        payload = copy.deepcopy(lead)
+        lines = "\n".join(f"- {line}" for line in related[:MAX_RELATED_ALARMS_IN_INPUT])
+        if len(related) > MAX_RELATED_ALARMS_IN_INPUT:
+            lines += f"\n- ... and {len(related) - MAX_RELATED_ALARMS_IN_INPUT} more"
+        payload["investigation"]["input"] = (
+            f"{lead_input}\n\n{len(self.members) - 1} related alarm(s) fired with this one "
+            f"(same resource, trace or dependency):\n{lines}"
+        )
+        return payload
+
+
+def _downstream_nodes(account_id: Optional[str], region: str, resource_name: str) -> List[str]:
+    """Downstream nodes of a resource in a cached service graph snapshot, if any."""
+    # Snapshots are cached by the service graph tools; until they are imported none exist
+    service_graph_tools = sys.modules.get("promptrca.tools.service_graph_tools")
+    if service_graph_tools is None or not account_id:
+        return []
+    try:
+        return service_graph_tools.cached_downstream_nodes(account_id, region, resource_name)
+    except Exception as e:
+        logger.debug(f"Could not read cached service graph for {resource_name}: {e}")
+        return []
+
+
+def alarm_keys(payload: Dict[str, Any]) -> Set[str]:
+    """
+    Identifiers an alarm can be linked on, scoped to its account and region.
+
+    Returns:
+        Trace, ARN, resource-name and downstream-node keys; the input
+        fingerprint if the alarm names none of them
+    """
+    investigation = payload.get("investigation") or {}
+    service_config = payload.get("service_config") or {}
+    region = investigation.get("region") or service_config.get("region") or get_region()
+    tenant = tenant_key(payload)
+    scope = f"{tenant}|{region}"
+
+    parsed = get_input_parser()._parse_free_text_deterministic(investigation.get("input") or "", region)
+    keys = {f"{scope}|trace:{trace_id}" for trace_id in parsed.trace_ids}
+    if investigation.get("xray_trace_id"):
+        keys.add(f"{scope}|trace:{investigation['xray_trace_id'].replace('Root=', '').strip()}")
+    role_account = tenant.split(":", 1)[1] if tenant.startswith("account:") else None
+    for target in parsed.primary_targets:
+        if target.arn:
+            keys.add(f"{scope}|arn:{target.arn}")
+        keys.add(f"{scope}|resource:{target.type}:{target.name}")
+        arn_parts = (target.arn or "").split(":")
+        account_id = arn_parts[4] if len(arn_parts) > 4 and arn_parts[4] else role_account
+        for node in _downstream_nodes(account_id, region, target.name):
+            keys.add(f"{scope}|downstream:{node}")
+
+    if not keys:
+        keys.add(f"{scope}|input:{investigation_fingerprint(payload)}")
+    return keys
+
+
+def cluster_alarms(events: List[AlarmEvent], window_seconds: Optional[float] = None) -> List[AlarmCluster]:
+    """
+    Group alarms that share an identifier and fired close together.
+
+    Args:
+        events: Alarms of one batch
+        window_seconds: Maximum gap between linked alarms (default: PROMPTRCA_ALARM_CLUSTER_WINDOW_SECONDS)
+
+    Returns:
+        Clusters ordered by their first alarm
+    """
+    if window_seconds is None:
+        window_seconds = float(os.getenv("PROMPTRCA_ALARM_CLUSTER_WINDOW_SECONDS", DEFAULT_ALARM_CLUSTER_WINDOW_SECONDS))
+
+    parent = list(range(len(events)))
+
+    def _root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    by_key: Dict[str, List[int]] = {}
+    for i, event in enumerate(events):
+        if not event.keys:
+            event.keys = alarm_keys(event.payload)
+        for key in event.keys:
+            by_key.setdefault(key, []).append(i)
+
+    # Link consecutive alarms on each identifier; chains make the window a maximum gap
+    for members in by_key.values():
+        members.sort(key=lambda i: events[i].timestamp)
+        for earlier, later in zip(members, members[1:]):
+            if events[later].timestamp - events[earlier].timestamp <= window_seconds:
+                parent[_root(later)] = _root(earlier)
+
+    groups: Dict[int, List[AlarmEvent]] = {}
+    for i, event in enumerate(events):
+        groups.setdefault(_root(i), []).append(event)
+
+    ordered = sorted(
+        (sorted(members, key=lambda event: event.timestamp) for members in groups.values()),
+        key=lambda members: members[0].timestamp
+    )
+    clusters = [AlarmCluster(cluster_id=f"cluster-{n}", members=members) for n, members in enumerate(ordered, 1)]
+    logger.info(f"🧩 Clustered {len(events)} alarms into {len(clusters)} investigation(s)")
+    return clusters
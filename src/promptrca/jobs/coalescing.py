@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Jobs - Coalescing of duplicate in-flight investigations
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+When an alarm fires repeatedly, or several people paste the same trace
+ID, identical investigations arrive while the first is still running.
+Each request is fingerprinted from what the deterministic input parser
+extracts (trace IDs and resource ARNs) plus its region and credentials; a
+request whose fingerprint is already in flight attaches to that run and
+shares its result and its progress events instead of starting another.
+Only the first request takes an admission slot.
+
+Environment Variables:
+- PROMPTRCA_COALESCE_INVESTIGATIONS: Coalesce duplicate in-flight investigations (default: true)
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..core.investigation_events import EventFanout
+from ..utils import get_logger
+from ..utils.config import get_region
+from ..utils.feature_flags import FeatureFlags
+from .admission import tenant_key
+
+logger = get_logger(__name__)
+
+# Runs one investigation, publishing its progress to the given event sink
+InvestigationRunner = Callable[[Any], Awaitable[Dict[str, Any]]]
+
+_input_parser = None
+_input_parser_lock = threading.Lock()
+
+
+def get_input_parser():
+    """Process-wide InputParserAgent for regex-only parsing of request input."""
+    global _input_parser
+    if _input_parser is None:
+        with _input_parser_lock:
+            if _input_parser is None:
+                from ..agents.input_parser_agent import InputParserAgent
+                _input_parser = InputParserAgent()
+    return _input_parser
+
+
+def investigation_fingerprint(payload: Dict[str, Any]) -> Optional[str]:
+    """
+    Fingerprint of an investigation request's normalized input.
+
+    Requests naming the same trace IDs and resource ARNs in the same region
+    with the same credentials get the same fingerprint, however the free
+    text around them is worded. The credentials are the full role ARN and
+    a hash of the external ID, so a caller who only knows another tenant's
+    account and trace ID never shares that tenant's investigation. Input
+    without any trace ID or ARN is fingerprinted on its whitespace- and
+    case-normalized text instead.
+
+    Returns:
+        Hex digest, or None for a payload without investigation input
+    """
+    investigation = (payload or {}).get("investigation") or {}
+    service_config = (payload or {}).get("service_config") or {}
+    free_text = investigation.get("input") or ""
+    if not free_text:
+        return None
+
+    region = investigation.get("region") or service_config.get("region") or get_region()
+    parsed = get_input_parser()._parse_free_text_deterministic(free_text, region)
+
+    trace_ids = set(parsed.trace_ids)
+    if investigation.get("xray_trace_id"):
+        trace_ids.add(investigation["xray_trace_id"].replace("Root=", "").strip())
+    resources = {target.arn or f"{target.type}:{target.name}" for target in parsed.primary_targets}
+
+    external_id = service_config.get("external_id") or ""
+    material: Dict[str, Any] = {
+        "account": tenant_key(payload),
+        "role_arn": service_config.get("role_arn") or "",
+        "external_id": hashlib.sha256(external_id.encode("utf-8")).hexdigest() if external_id else "",
+        "region": region
+    }
+    if trace_ids or resources:
+        material["trace_ids"] = sorted(trace_ids)
+        material["resources"] = sorted(resources)
+    else:
+        material["input"] = " ".join(free_text.lower().split())
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def coalescing_key(payload: Dict[str, Any]) -> Optional[str]:
+    """Key to coalesce the request on, or None when coalescing is off or the input is unusable."""
+    if not FeatureFlags.is_investigation_coalescing_enabled():
+        return None
+    try:
+        return investigation_fingerprint(payload)
+    except Exception as e:
+        logger.warning(f"Could not fingerprint investigation request, not coalescing: {e}")
+        return None
+
+
+@dataclass(eq=False)
+class _Flight:
+    """One running investigation and the requests waiting on it."""
+    key: str
+    events: EventFanout
+    task: Optional[asyncio.Task] = None
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    At most one running investigation per key.
+
+    do() starts the investigation for the first request with a key and
+    attaches later requests with the same key until it finishes. Each
+    caller gets its own copy of the result. The investigation is cancelled
+    only when every attached caller has gone away. All methods must be
+    called from the event loop the investigations run on.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def in_flight(self, key: Optional[str]) -> bool:
+        """Whether a request with this key would attach to a running investigation."""
+        return key is not None and key in self._flights
+
+    async def do(self, key: Optional[str], runner: InvestigationRunner, event_stream=None) -> Dict[str, Any]:
+        """
+        Run the investigation, or attach to the one running for the same key.
+
+        Args:
+            key: Coalescing key; None always runs the investigation on its own
+            runner: Runs the investigation; called only if nothing is in flight
+            event_stream: Optional InvestigationEventStream receiving the progress
+                events, including those published before this request attached
+
+        Returns:
+            The investigation result
+        """
+        if key is None:
+            return await runner(event_stream)
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(key=key, events=EventFanout())
+            flight.task = asyncio.create_task(runner(flight.events), name=f"investigation-{key[:12]}")
+            flight.task.add_done_callback(lambda _: self._forget(flight))
+            self._flights[key] = flight
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"🔗 Attaching to in-flight investigation {key[:12]} "
+                        f"({flight.waiters} request(s) already waiting)")
+
+        flight.waiters += 1
+        if event_stream is not None:
+            flight.events.subscribe(event_stream)
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if event_stream is not None:
+                flight.events.unsubscribe(event_stream)
+            if flight.waiters == 0 and not flight.task.done():
+                logger.info(f"🛑 No requests left waiting on investigation {key[:12]}; cancelling it")
+                flight.task.cancel()
+        return copy.deepcopy(result)
+
+    def _forget(self, flight: _Flight) -> None:
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing metrics for /status."""
+        return {
+            "enabled": FeatureFlags.is_investigation_coalescing_enabled(),
+            "in_flight": len(self._flights),
+            "waiting": sum(flight.waiters for flight in self._flights.values()),
+            "started": self.started,
+            "coalesced": self.coalesced
+        }
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight group."""
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight()
+    return _single_flight
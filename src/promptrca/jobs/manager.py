@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Jobs - Investigation jobs under admission control
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Investigations submitted as jobs are admitted through the process-wide
+admission controller, the same one that gates synchronous requests, so a
+burst of alerts is worked off at a predictable rate instead of all at
+once, and no HTTP connection stays open while an investigation runs.
+"""
+
+import asyncio
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..utils import get_logger
+from .admission import AdmissionController, AdmissionTicket, get_admission_controller, tenant_key
+from .coalescing import coalescing_key, get_single_flight
+from .report_cache import cached_report, remember_report
+from .store import InvestigationJob, JobStatus, JobStore, create_job_store
+
+logger = get_logger(__name__)
+
+JobRunner = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+async def _default_runner(payload: Dict[str, Any], event_stream=None) -> Dict[str, Any]:
+    from ..handlers import handle_investigation
+
+    return await handle_investigation(payload, event_stream=event_stream)
+
+
+class _AdmittedJobRun:
+    """
+    Runner for SingleFlight.do running a job's investigation under admission control.
+
+    Only the job that starts an investigation calls it; a job coalesced onto
+    a running investigation gives its ticket back instead of holding a slot
+    while it waits. A ticket taken at submit time is used if still held,
+    otherwise one is taken when the run starts. Once started, the run owns
+    the ticket, which may outlive the job while other requests still wait on
+    the investigation.
+    """
+
+    def __init__(self, admission: AdmissionController, payload: Dict[str, Any],
+                 ticket: Optional[AdmissionTicket], on_admitted: Callable[[], None]):
+        self.admission = admission
+        self.payload = payload
+        # Set once the report cache has been checked; called with the flight's event sink
+        self.investigate: Optional[Callable[[Any], Awaitable[Dict[str, Any]]]] = None
+        self.ticket = ticket
+        self.on_admitted = on_admitted
+        self.started = False
+
+    def detach(self) -> None:
+        """Stop reporting to a job that has left the run; other requests may still wait on it."""
+        self.on_admitted = lambda: None
+
+    def give_up_ticket(self) -> None:
+        """Return the ticket of a job that attaches to someone else's run."""
+        if self.ticket is not None:
+            self.admission.release(self.ticket)
+            self.ticket = None
+
+    async def __call__(self, event_stream=None) -> Dict[str, Any]:
+        self.started = True
+        if self.ticket is None:
+            async with self.admission.admit(tenant_key(self.payload)):
+                self.on_admitted()
+                return await self.investigate(event_stream)
+        await self.admission.wait(self.ticket)
+        try:
+            self.on_admitted()
+            return await self.investigate(event_stream)
+        finally:
+            self.admission.release(self.ticket)
+
+
+class InvestigationJobManager:
+    """
+    Investigation jobs run under admission control.
+
+    submit() takes an admission ticket for the job's tenant (raising
+    AdmissionRejected when the queue is full) and starts a task that waits
+    for admission and then runs the investigation. A job identical to an
+    in-flight investigation waits on it instead, without an admission slot. Each job is recorded in
+    the store when queued, when it starts and when it finishes; queued and
+    running jobs are also held in memory so they can be cancelled. A job
+    fails when the runner raises or returns {"success": False, ...}.
+    """
+
+    def __init__(self, store: Optional[JobStore] = None, workers: Optional[int] = None,
+                 runner: Optional[JobRunner] = None, admission: Optional[AdmissionController] = None):
+        """
+        Args:
+            store: Where job status and results are kept (default: PROMPTRCA_JOB_STORE)
+            workers: Jobs run at once under a private admission controller
+                (default: share the process-wide controller)
+            runner: Coroutine function running one payload (default: handlers.handle_investigation,
+                answered from the report cache or coalesced with identical in-flight investigations)
+            admission: Admission controller to use instead of the process-wide one
+        """
+        if admission is None:
+            admission = AdmissionController(max_concurrent=workers) if workers else get_admission_controller()
+        self.admission = admission
+        self.store = store or create_job_store()
+        self._runner = runner or _default_runner
+        # Only the default runner is answered from the report cache and coalesced
+        self._coalesce = runner is None
+        self._active: Dict[str, InvestigationJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._shutting_down = False
+
+    def start(self) -> None:
+        """Accept jobs again after shutdown()."""
+        self._shutting_down = False
+
+    async def shutdown(self) -> None:
+        """Cancel queued and running jobs."""
+        self._shutting_down = True
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def submit(self, payload: Dict[str, Any]) -> InvestigationJob:
+        """
+        Queue an investigation.
+
+        Args:
+            payload: Investigation request in the structured format of handle_investigation
+
+        Returns:
+            The queued job
+
+        Raises:
+            AdmissionRejected: The admission queue is full
+        """
+        key = coalescing_key(payload) if self._coalesce else None
+        # A duplicate of an in-flight investigation attaches to it without an admission slot
+        ticket = None if get_single_flight().in_flight(key) else self.admission.enqueue(tenant_key(payload))
+        job = InvestigationJob(job_id=str(uuid.uuid4()), payload=payload)
+        self._active[job.job_id] = job
+        self.store.save(job)
+        run = _AdmittedJobRun(self.admission, payload, ticket, on_admitted=lambda: self._mark_running(job))
+        task = asyncio.create_task(self._run(job, run, key), name=f"investigation-job-{job.job_id}")
+        task.add_done_callback(lambda _: self._cleanup(job, run))
+        self._tasks[job.job_id] = task
+        logger.info(f"📥 Queued investigation job {job.job_id} for {tenant_key(payload)}")
+        return job
+
+    def get(self, job_id: str) -> Optional[InvestigationJob]:
+        """Return a queued, running or finished job."""
+        return self._active.get(job_id) or self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[InvestigationJob]:
+        """
+        Cancel a job.
+
+        A queued job gives up its place in the admission queue; a running
+        job's investigation is cancelled. Finished jobs are returned unchanged.
+
+        Returns:
+            The job, or None if unknown
+        """
+        job = self._active.get(job_id)
+        if job is None:
+            return self.store.get(job_id)
+
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        logger.info(f"🛑 Cancellation requested for investigation job {job_id}")
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": sum(1 for job in self._active.values() if job.status == JobStatus.QUEUED),
+            "running": sum(1 for job in self._active.values() if job.status == JobStatus.RUNNING),
+            "store": self.store.stats()
+        }
+
+    def _mark_running(self, job: InvestigationJob) -> None:
+        if job.job_id not in self._active:
+            return
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        self.store.save(job)
+
+    async def _investigate(self, job: InvestigationJob, run: _AdmittedJobRun, key: Optional[str]) -> Dict[str, Any]:
+        if not self._coalesce:
+            run.investigate = lambda event_stream: self._runner(run.payload)
+            return await get_single_flight().do(None, run)
+
+        cache_key, report = cached_report(run.payload)
+        if report is not None:
+            run.give_up_ticket()
+            self._mark_running(job)
+            return report
+
+        async def _investigate(event_stream) -> Dict[str, Any]:
+            result = await self._runner(run.payload, event_stream)
+            remember_report(cache_key, result)
+            return result
+
+        run.investigate = _investigate
+        single_flight = get_single_flight()
+        if single_flight.in_flight(key):
+            # Someone else's run holds the slot; waiting on it needs none
+            run.give_up_ticket()
+            self._mark_running(job)
+        return await single_flight.do(key, run)
+
+    async def _run(self, job: InvestigationJob, run: _AdmittedJobRun, key: Optional[str]) -> None:
+        try:
+            result = await self._investigate(job, run, key)
+        except asyncio.CancelledError:
+            self._finish(job, JobStatus.CANCELLED, error="Server shutting down" if self._shutting_down else None)
+            return
+        except Exception as e:
+            self._finish(job, JobStatus.FAILED, error=str(e))
+            return
+
+        if isinstance(result, dict) and result.get("success") is False:
+            self._finish(job, JobStatus.FAILED, error=result.get("error"), result=result)
+        else:
+            self._finish(job, JobStatus.SUCCEEDED, result=result)
+
+    def _cleanup(self, job: InvestigationJob, run: _AdmittedJobRun) -> None:
+        """Task done callback; also covers tasks cancelled before they ever ran."""
+        self._tasks.pop(job.job_id, None)
+        run.detach()
+        if not run.started:
+            run.give_up_ticket()
+        if job.job_id in self._active:
+            self._finish(job, JobStatus.CANCELLED, error="Server shutting down" if self._shutting_down else None)
+
+    def _finish(self, job: InvestigationJob, status: JobStatus, error: Optional[str] = None,
+                result: Optional[Dict[str, Any]] = None) -> None:
+        job.status = status
+        job.finished_at = datetime.now(timezone.utc)
+        job.error = error
+        job.result = result
+        job.payload = {}
+        self.store.save(job)
+        self._active.pop(job.job_id, None)
+        started = job.started_at or job.created_at
+        logger.info(f"🏁 Investigation job {job.job_id} {status.value} "
+                    f"after {(job.finished_at - started).total_seconds():.2f}s")
+
+
+_job_manager: Optional[InvestigationJobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> InvestigationJobManager:
+    """Get the process-wide job manager."""
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = InvestigationJobManager()
+    return _job_manager
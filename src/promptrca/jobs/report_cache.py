@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Jobs - Cache of completed investigation reports
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+A repeat request for the same trace IDs or resources shortly after an
+investigation completed is answered from its report instead of running
+again. Reports are keyed by the investigation fingerprint, which covers
+the normalized input and region and the caller's credentials: the full
+role ARN and a hash of the external ID. A hit is served before the role
+is assumed, so a request naming another tenant's role with a wrong
+external ID must never match that tenant's report. Setting
+"force_refresh": true in the investigation payload skips the lookup; the
+fresh report then replaces the cached one.
+
+The memory tier is an LRU of encoded reports; the optional SQLite tier is
+shared by every worker process on the host.
+
+Environment Variables:
+- PROMPTRCA_REPORT_CACHE: Enable the cache (default: true)
+- PROMPTRCA_REPORT_CACHE_TTL_SECONDS: How long a report is served (default: 300)
+- PROMPTRCA_REPORT_CACHE_MAX_ENTRIES: In-memory tier size (default: 128)
+- PROMPTRCA_REPORT_CACHE_SQLITE: Enable the SQLite tier (default: false)
+- PROMPTRCA_REPORT_CACHE_PATH: SQLite database file (default: ~/.cache/promptrca/reports.sqlite3,
+  /tmp/promptrca/reports.sqlite3 on Lambda)
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils import get_logger
+from ..utils.feature_flags import FeatureFlags
+from .coalescing import investigation_fingerprint
+
+logger = get_logger(__name__)
+
+DEFAULT_REPORT_CACHE_TTL_SECONDS = 300
+DEFAULT_REPORT_CACHE_MAX_ENTRIES = 128
+
+
+class ReportCache:
+    """
+    Two-tier (memory, then optional SQLite) TTL cache of investigation reports.
+
+    Reports are stored JSON-encoded and decoded on every hit, so callers
+    may modify what they get back. Hits and misses are counted per tier.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_REPORT_CACHE_TTL_SECONDS,
+                 max_entries: int = DEFAULT_REPORT_CACHE_MAX_ENTRIES,
+                 path: Optional[str] = None):
+        """
+        Args:
+            ttl_seconds: How long a report is served
+            max_entries: Reports kept in memory
+            path: SQLite database file for the shared tier (default: memory only)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "stores": 0}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS investigation_reports ("
+                    " cache_key TEXT PRIMARY KEY,"
+                    " created_at REAL NOT NULL,"
+                    " report TEXT NOT NULL)"
+                )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached report, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                else:
+                    del self._entries[key]
+                    entry = None
+        if entry is not None:
+            return self._decode(entry, now)
+
+        entry = self._read_sqlite(key, now)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["sqlite_hits"] += 1
+        self._put_memory(key, entry)
+        return self._decode(entry, now)
+
+    def put(self, key: str, report: Dict[str, Any]) -> None:
+        entry = (time.time(), json.dumps(report, default=str))
+        self._put_memory(key, entry)
+        self._write_sqlite(key, entry)
+        with self._lock:
+            self._stats["stores"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the hit rate."""
+        with self._lock:
+            stats = dict(self._stats, memory_entries=len(self._entries), ttl_seconds=self.ttl_seconds,
+                         sqlite_path=self.path)
+        lookups = stats["memory_hits"] + stats["sqlite_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["sqlite_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "stores": 0}
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM investigation_reports")
+
+    @staticmethod
+    def _decode(entry: Tuple[float, str], now: float) -> Dict[str, Any]:
+        report = json.loads(entry[1])
+        if isinstance(report.get("investigation"), dict):
+            report["investigation"]["cached"] = True
+            report["investigation"]["cache_age_seconds"] = round(now - entry[0], 3)
+        return report
+
+    def _put_memory(self, key: str, entry: Tuple[float, str]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _read_sqlite(self, key: str, now: float) -> Optional[Tuple[float, str]]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT created_at, report FROM investigation_reports WHERE cache_key = ? AND created_at >= ?",
+                    (key, now - self.ttl_seconds)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Report cache read failed for {key[:12]}: {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def _write_sqlite(self, key: str, entry: Tuple[float, str]) -> None:
+        if self._conn is None:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO investigation_reports (cache_key, created_at, report) VALUES (?, ?, ?)",
+                    (key, entry[0], entry[1])
+                )
+                self._conn.execute(
+                    "DELETE FROM investigation_reports WHERE created_at < ?", (entry[0] - self.ttl_seconds,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Report cache write failed for {key[:12]}: {e}")
+
+
+_report_cache: Optional[ReportCache] = None
+_report_cache_lock = threading.Lock()
+
+
+def _default_cache_path() -> str:
+    if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        return os.path.join(tempfile.gettempdir(), 'promptrca', 'reports.sqlite3')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'promptrca', 'reports.sqlite3')
+
+
+def get_report_cache() -> Optional[ReportCache]:
+    """
+    Get the process-wide report cache configured from the environment.
+
+    Returns:
+        The ReportCache, or None if PROMPTRCA_REPORT_CACHE=false
+    """
+    global _report_cache
+    if not FeatureFlags.is_report_cache_enabled():
+        return None
+
+    if _report_cache is None:
+        with _report_cache_lock:
+            if _report_cache is None:
+                path = None
+                if os.getenv('PROMPTRCA_REPORT_CACHE_SQLITE', 'false').lower() == 'true':
+                    path = os.getenv('PROMPTRCA_REPORT_CACHE_PATH') or _default_cache_path()
+                    logger.info(f"🗄️ Using SQLite report cache at {path}")
+                _report_cache = ReportCache(
+                    ttl_seconds=int(os.getenv('PROMPTRCA_REPORT_CACHE_TTL_SECONDS', DEFAULT_REPORT_CACHE_TTL_SECONDS)),
+                    max_entries=int(os.getenv('PROMPTRCA_REPORT_CACHE_MAX_ENTRIES', DEFAULT_REPORT_CACHE_MAX_ENTRIES)),
+                    path=path
+                )
+    return _report_cache
+
+
+def cached_report(payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Look up the report for an investigation request.
+
+    Returns:
+        (cache key, cached report). The key is None when the cache is off or
+        the request cannot be fingerprinted; the report is None on a miss or
+        when the request asks for force_refresh.
+    """
+    cache = get_report_cache()
+    if cache is None:
+        return None, None
+    try:
+        key = investigation_fingerprint(payload)
+    except Exception as e:
+        logger.warning(f"Could not fingerprint investigation request, not caching: {e}")
+        return None, None
+    if key is None:
+        return None, None
+
+    if ((payload or {}).get("investigation") or {}).get("force_refresh"):
+        logger.info(f"🔄 Report cache bypassed for {key[:12]} (force_refresh)")
+        return key, None
+    report = cache.get(key)
+    if report is not None:
+        logger.info(f"♻️ Serving cached investigation report {key[:12]}")
+    return key, report
+
+
+def remember_report(key: Optional[str], result: Dict[str, Any]) -> None:
+    """Cache a completed investigation's report; failed or cost-limited ones are not cached."""
+    cache = get_report_cache()
+    if cache is None or key is None or not isinstance(result, dict):
+        return
+    if (result.get("investigation") or {}).get("status") != "completed":
+        return
+    cache.put(key, result)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Jobs - Investigation job model and result stores
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+A job store keeps the status and result of each investigation job so
+GET /investigations/{id} can answer after the worker has moved on. The
+request payload is never persisted: it may carry role ARNs and external IDs.
+
+Environment Variables:
+- PROMPTRCA_JOB_STORE: 'memory' or 'sqlite' (default: memory)
+- PROMPTRCA_JOB_STORE_PATH: SQLite database file (default: ~/.cache/promptrca/jobs.sqlite3,
+  /tmp/promptrca/jobs.sqlite3 on Lambda)
+- PROMPTRCA_JOB_STORE_MAX_ENTRIES: Jobs kept by the store; the SQLite store only
+  deletes finished jobs (default: 1000)
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_JOB_STORE_MAX_ENTRIES = 1000
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of an investigation job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class InvestigationJob:
+    """One queued investigation and, once finished, its outcome."""
+    job_id: str
+    payload: Dict[str, Any] = field(default_factory=dict, repr=False)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API representation; the result is included only once the job succeeded."""
+        data = {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if self.error:
+            data["error"] = self.error
+        if self.status == JobStatus.SUCCEEDED:
+            data["result"] = self.result
+        return data
+
+
+class JobStore(ABC):
+    """Storage for job status and results."""
+
+    @abstractmethod
+    def save(self, job: InvestigationJob) -> None:
+        """Insert or update a job."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[InvestigationJob]:
+        """Return the job, or None if unknown or evicted."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"type": type(self).__name__}
+
+
+class InMemoryJobStore(JobStore):
+    """Bounded store that drops the oldest jobs first; lost on restart."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries: Jobs kept (default: PROMPTRCA_JOB_STORE_MAX_ENTRIES)
+        """
+        self.max_entries = max_entries or int(
+            os.getenv("PROMPTRCA_JOB_STORE_MAX_ENTRIES", str(DEFAULT_JOB_STORE_MAX_ENTRIES))
+        )
+        self._jobs: "OrderedDict[str, InvestigationJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, job: InvestigationJob) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self.max_entries:
+                self._jobs.popitem(last=False)
+
+    def get(self, job_id: str) -> Optional[InvestigationJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"type": "memory", "jobs": len(self._jobs), "max_entries": self.max_entries}
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # Exists, owned by someone else
+    return True
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Store backed by a SQLite file, so results survive restarts and can be
+    read by every worker process on the host.
+
+    Each row records the process running the job. On open, queued and
+    running jobs whose process is gone can never finish and are marked
+    failed; jobs of other live workers sharing the file are left alone.
+    Only the newest max_entries finished jobs are kept.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None):
+        """
+        Args:
+            path: Database file, created with its directory if missing
+            max_entries: Jobs kept (default: PROMPTRCA_JOB_STORE_MAX_ENTRIES)
+        """
+        self.path = path
+        self.max_entries = max_entries or int(
+            os.getenv("PROMPTRCA_JOB_STORE_MAX_ENTRIES", str(DEFAULT_JOB_STORE_MAX_ENTRIES))
+        )
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS investigation_jobs ("
+                " job_id TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " created_at TEXT NOT NULL,"
+                " started_at TEXT,"
+                " finished_at TEXT,"
+                " result TEXT,"
+                " error TEXT)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(investigation_jobs)")}
+            if "owner_pid" not in columns:
+                self._conn.execute("ALTER TABLE investigation_jobs ADD COLUMN owner_pid INTEGER")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS investigation_jobs_created_at ON investigation_jobs (created_at)"
+            )
+        self._fail_orphaned_jobs()
+
+    def _fail_orphaned_jobs(self) -> None:
+        """Mark unfinished jobs of processes that no longer exist as failed."""
+        unfinished = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, owner_pid FROM investigation_jobs WHERE status IN (?, ?)", unfinished
+            ).fetchall()
+        orphaned = [job_id for job_id, pid in rows if not pid or (pid != os.getpid() and not _process_alive(pid))]
+        if not orphaned:
+            return
+        finished_at = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE investigation_jobs SET status = ?, finished_at = ?, error = ? "
+                "WHERE job_id = ? AND status IN (?, ?)",
+                [(JobStatus.FAILED.value, finished_at, "Worker stopped before the job finished", job_id, *unfinished)
+                 for job_id in orphaned]
+            )
+        logger.warning(f"⚠️ Marked {len(orphaned)} investigation job(s) left unfinished by a stopped worker as failed")
+
+    def save(self, job: InvestigationJob) -> None:
+        row = (
+            job.job_id,
+            job.status.value,
+            job.created_at.isoformat(),
+            job.started_at.isoformat() if job.started_at else None,
+            job.finished_at.isoformat() if job.finished_at else None,
+            json.dumps(job.result, default=str) if job.result is not None else None,
+            job.error,
+            os.getpid(),
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO investigation_jobs "
+                "(job_id, status, created_at, started_at, finished_at, result, error, owner_pid) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            )
+            if job.status.finished:
+                self._conn.execute(
+                    "DELETE FROM investigation_jobs WHERE job_id IN ("
+                    " SELECT job_id FROM investigation_jobs WHERE status NOT IN (?, ?)"
+                    " ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (JobStatus.QUEUED.value, JobStatus.RUNNING.value, self.max_entries)
+                )
+
+    def get(self, job_id: str) -> Optional[InvestigationJob]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, status, created_at, started_at, finished_at, result, error "
+                "FROM investigation_jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return InvestigationJob(
+            job_id=row[0],
+            status=JobStatus(row[1]),
+            created_at=datetime.fromisoformat(row[2]),
+            started_at=datetime.fromisoformat(row[3]) if row[3] else None,
+            finished_at=datetime.fromisoformat(row[4]) if row[4] else None,
+            result=json.loads(row[5]) if row[5] else None,
+            error=row[6]
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM investigation_jobs").fetchone()[0]
+        return {"type": "sqlite", "path": self.path, "jobs": count, "max_entries": self.max_entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _default_store_path() -> str:
+    if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        return os.path.join(tempfile.gettempdir(), 'promptrca', 'jobs.sqlite3')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'promptrca', 'jobs.sqlite3')
+
+
+def create_job_store() -> JobStore:
+    """Create the job store selected by PROMPTRCA_JOB_STORE."""
+    store_type = os.getenv("PROMPTRCA_JOB_STORE", "memory").lower()
+    if store_type == "sqlite":
+        path = os.getenv("PROMPTRCA_JOB_STORE_PATH") or _default_store_path()
+        logger.info(f"🗄️ Using SQLite job store at {path}")
+        return SQLiteJobStore(path)
+    if store_type != "memory":
+        logger.warning(f"Unknown PROMPTRCA_JOB_STORE '{store_type}', using the in-memory store")
+    return InMemoryJobStore()
@@ -24,7 +24,13 @@ Deployment options:
   1. Direct invocation: Invoke Lambda directly with investigation payload
   2. API Gateway: HTTP API that triggers Lambda
   3. EventBridge: Scheduled or event-driven investigations
-  4. SNS/SQS: Queue-based processing
+  4. SNS/SQS: Queue-based processing. A batch of records is clustered into
+     related alarms (see jobs/alarm_clusters.py); each cluster is investigated
+     once and every record gets its cluster's result. Clusters run
+     concurrently under one event loop, sharing the warm orchestrator pool
+     and the report cache. For SQS the response lists batchItemFailures
+     (enable ReportBatchItemFailures on the event source mapping) so only
+     records whose investigation failed or never ran are retried.
 
 Example events:
 
@@ -47,19 +53,63 @@ Example events:
        "region": "eu-west-1"
      }
    }
+
+Environment Variables:
+- PROMPTRCA_LAMBDA_BATCH_CONCURRENCY: Investigations run at once for a batch
+  (default: PROMPTRCA_MAX_CONCURRENT_INVESTIGATIONS)
+- PROMPTRCA_LAMBDA_MIN_START_SECONDS: No investigation starts with less time left (default: 60)
+- PROMPTRCA_LAMBDA_DEADLINE_RESERVE_SECONDS: Time kept to cancel unfinished investigations
+  and respond before the deadline (default: 10)
+- PROMPTRCA_LAMBDA_PREWARM: Build the orchestrators, their agents and the input
+  parser during INIT instead of on the first invocation (default: false). Worth
+  enabling with provisioned concurrency or SnapStart, where INIT is not billed
+  against a waiting request.
+- PROMPTRCA_LAMBDA_PREWARM_COUNT: Orchestrators built during INIT (default: 1)
+
+Importing this module loads neither strands, boto3 nor opentelemetry; they are
+imported by the first investigation, or by the INIT prewarm when enabled.
 """
 
 import json
 import asyncio
-from typing import Dict, Any
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
 
 from .handlers import handle_investigation
+from .jobs.alarm_clusters import AlarmCluster, AlarmEvent, cluster_alarms
+from .jobs.report_cache import cached_report, remember_report
+from .utils.feature_flags import FeatureFlags
+
+DEFAULT_LAMBDA_MIN_START_SECONDS = 60
+DEFAULT_LAMBDA_DEADLINE_RESERVE_SECONDS = 10
 
 # Initialize telemetry on module import (Lambda cold start)
 from .utils.config import setup_strands_telemetry
 setup_strands_telemetry()
 
 
+def _prewarm() -> None:
+    """Build the clients and agents an investigation needs, once per execution environment."""
+    from .core.orchestrator_pool import get_orchestrator_pool
+    from .jobs.coalescing import get_input_parser
+
+    started = time.monotonic()
+    try:
+        get_input_parser()
+        idle = get_orchestrator_pool().prewarm(int(os.getenv("PROMPTRCA_LAMBDA_PREWARM_COUNT", "1")))
+        print(f"[PromptRCA Lambda] Prewarmed {idle} orchestrator(s) during INIT "
+              f"in {time.monotonic() - started:.2f}s")
+    except Exception as e:
+        # The first invocation builds whatever is missing
+        print(f"[PromptRCA Lambda] INIT prewarm failed: {e}")
+
+
+if os.getenv("PROMPTRCA_LAMBDA_PREWARM", "false").lower() == "true":
+    _prewarm()
+
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     AWS Lambda handler for PromptRCA investigations.
@@ -73,13 +123,26 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     print(f"[PromptRCA Lambda] Received event: {json.dumps(event, default=str)}")
 
+    # SQS batches and multi-record SNS events: one investigation per cluster of related alarms
+    if _is_record_batch(event):
+        return _handle_record_batch(event, context)
+
     # Parse payload based on event source
     payload = _parse_event(event)
 
     # Run investigation using shared handler (async, so use asyncio.run at Lambda level)
-    result = asyncio.run(handle_investigation(payload))
+    result = asyncio.run(_investigate(payload))
+
+    _add_lambda_metadata(result, context)
+
+    print(f"[PromptRCA Lambda] Investigation completed: {result.get('investigation', {}).get('status', 'unknown')}")
+
+    # Return response (format depends on trigger)
+    return _format_response(event, result)
+
 
-    # Add Lambda-specific metadata
+def _add_lambda_metadata(result: Dict[str, Any], context: Any) -> None:
+    """Add Lambda-specific metadata to an investigation result."""
     if "investigation" in result:
         result["investigation"]["execution_environment"] = "lambda"
         result["investigation"]["aws_request_id"] = context.aws_request_id
@@ -87,10 +150,186 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         result["investigation"]["memory_limit_mb"] = context.memory_limit_in_mb
         result["investigation"]["remaining_time_ms"] = context.get_remaining_time_in_millis()
 
-    print(f"[PromptRCA Lambda] Investigation completed: {result.get('investigation', {}).get('status', 'unknown')}")
 
-    # Return response (format depends on trigger)
-    return _format_response(event, result)
+async def _investigate(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one investigation, answering repeat alarms within the cache TTL from the last report."""
+    cache_key, result = cached_report(payload)
+    if result is None:
+        result = await handle_investigation(payload)
+        remember_report(cache_key, result)
+    return result
+
+
+def _is_record_batch(event: Dict[str, Any]) -> bool:
+    """Whether the event is an SQS batch, or an SNS event with more than one record."""
+    records = event.get("Records")
+    if not isinstance(records, list) or not records:
+        return False
+    sources = {_record_source(record) for record in records}
+    if sources == {"aws:sqs"}:
+        return True
+    return sources <= {"aws:sns", "aws:sqs"} and len(records) > 1
+
+
+def _handle_record_batch(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Investigate a batch of alarms, once per cluster of related alarms.
+
+    Each cluster is listed once with its status and record ids, and
+    "records" maps every record to its cluster; records that are not valid
+    investigation payloads are listed under "rejected" and not retried.
+    SNS batches get each cluster's report once, on the cluster. SQS
+    ignores everything but batchItemFailures, so its response carries no
+    reports, keeping it well below Lambda's 6 MB response limit: a larger
+    response would fail and retry the whole batch. Records of failed
+    clusters and of clusters that did not finish before the deadline are
+    returned as batchItemFailures.
+    """
+    alarms: List[AlarmEvent] = []
+    rejected: List[Dict[str, Any]] = []
+    for index, record in enumerate(event["Records"]):
+        record_id = _record_id(record, index)
+        payload, timestamp = _parse_record(record)
+        if "error" in payload:
+            rejected.append({"record_id": record_id, **payload})
+            continue
+        alarms.append(AlarmEvent(event_id=record_id, payload=payload, timestamp=timestamp or time.time()))
+
+    if FeatureFlags.is_alarm_clustering_enabled():
+        clusters = cluster_alarms(alarms)
+    else:
+        clusters = [AlarmCluster(cluster_id=f"cluster-{n}", members=[alarm]) for n, alarm in enumerate(alarms, 1)]
+    results = asyncio.run(_investigate_clusters(clusters, context))
+    is_sqs = any(_record_source(record) == "aws:sqs" for record in event["Records"])
+
+    response = {"clusters": [], "records": [], "rejected": rejected}
+    failed_ids: List[str] = []
+    for cluster, result in zip(clusters, results):
+        if result is None:
+            result = {"success": False, "error": "Not investigated before the invocation deadline"}
+            status = "not_finished"
+        else:
+            _add_lambda_metadata(result, context)
+            status = result.get("investigation", {}).get("status", "failed" if result.get("success") is False else "unknown")
+        if result.get("success") is False or status == "failed":
+            failed_ids.extend(cluster.event_ids)
+        entry = {"cluster_id": cluster.cluster_id, "record_ids": cluster.event_ids, "status": status}
+        if is_sqs:
+            if result.get("error"):
+                entry["error"] = result["error"]
+        else:
+            entry["result"] = result
+        response["clusters"].append(entry)
+        for record_id in cluster.event_ids:
+            response["records"].append({"record_id": record_id, "cluster_id": cluster.cluster_id})
+
+    if is_sqs:
+        response["batchItemFailures"] = [{"itemIdentifier": record_id} for record_id in failed_ids]
+
+    print(f"[PromptRCA Lambda] Investigated {len(alarms)} alarms as {len(clusters)} cluster(s), "
+          f"{len(failed_ids)} record(s) failed, {len(rejected)} rejected")
+    return response
+
+
+def _batch_concurrency() -> int:
+    from .core.orchestrator_pool import get_max_concurrent_investigations
+    return max(1, int(os.getenv("PROMPTRCA_LAMBDA_BATCH_CONCURRENCY", str(get_max_concurrent_investigations()))))
+
+
+async def _investigate_clusters(clusters: List[AlarmCluster], context: Any) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run the clusters' investigations concurrently under one event loop.
+
+    No investigation starts once less than PROMPTRCA_LAMBDA_MIN_START_SECONDS
+    remain, and investigations still running when only the deadline reserve
+    is left are cancelled.
+
+    Returns:
+        One result per cluster; None for clusters that did not finish
+    """
+    if not clusters:
+        return []
+
+    min_start_ms = 1000 * float(os.getenv("PROMPTRCA_LAMBDA_MIN_START_SECONDS", DEFAULT_LAMBDA_MIN_START_SECONDS))
+    reserve_seconds = float(os.getenv("PROMPTRCA_LAMBDA_DEADLINE_RESERVE_SECONDS", DEFAULT_LAMBDA_DEADLINE_RESERVE_SECONDS))
+    limit = asyncio.Semaphore(_batch_concurrency())
+
+    async def _run(cluster: AlarmCluster) -> Optional[Dict[str, Any]]:
+        async with limit:
+            if context.get_remaining_time_in_millis() < min_start_ms:
+                print(f"[PromptRCA Lambda] Not starting {cluster.cluster_id}: too close to the deadline")
+                return None
+            try:
+                return await _investigate(cluster.investigation_payload())
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+    tasks = [asyncio.create_task(_run(cluster)) for cluster in clusters]
+    timeout = max(0.0, context.get_remaining_time_in_millis() / 1000 - reserve_seconds)
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    if pending:
+        print(f"[PromptRCA Lambda] Cancelling {len(pending)} investigation(s) at the deadline")
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return [task.result() if task in done else None for task in tasks]
+
+
+def _record_source(record: Dict[str, Any]) -> Optional[str]:
+    # SNS records use EventSource, SQS records eventSource
+    return record.get("EventSource") or record.get("eventSource")
+
+
+def _record_id(record: Dict[str, Any], index: int) -> str:
+    return record.get("messageId") or (record.get("Sns") or {}).get("MessageId") or str(index)
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Epoch seconds from an ISO 8601 time or epoch milliseconds."""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, (int, float)) or str(value).isdigit():
+            return int(value) / 1000.0
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_record(record: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[float]]:
+    """
+    Parse one SNS or SQS record into an investigation payload and the time it was sent.
+
+    A message that is an EventBridge event (an EventBridge rule targeting the
+    topic or queue) contributes its detail and event time. The time is used
+    as the investigation's incident_time unless the payload has one.
+    """
+    if _record_source(record) == "aws:sns":
+        label = "SNS message"
+        timestamp = _parse_timestamp((record.get("Sns") or {}).get("Timestamp"))
+        try:
+            message = json.loads(record["Sns"]["Message"])
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return {"error": f"Invalid SNS message: {str(e)}"}, timestamp
+    else:
+        label = "SQS message"
+        timestamp = _parse_timestamp((record.get("attributes") or {}).get("SentTimestamp"))
+        try:
+            message = json.loads(record["body"])
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return {"error": f"Invalid SQS message: {str(e)}"}, timestamp
+
+    if isinstance(message, dict) and "detail" in message and "source" in message:
+        label = "EventBridge detail"
+        timestamp = _parse_timestamp(message.get("time")) or timestamp
+        message = message["detail"]
+    if isinstance(message, dict) and "investigation" in message and "service_config" in message:
+        if timestamp is not None and isinstance(message["investigation"], dict):
+            message["investigation"].setdefault(
+                "incident_time", datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+            )
+        return message, timestamp
+    return {"error": f"{label} must have 'investigation' and 'service_config' keys"}, timestamp
 
 
 def _parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -102,7 +341,8 @@ def _parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
         "investigation": {
             "input": "...",
             "xray_trace_id": "...",  # optional
-            "region": "..."  # optional
+            "region": "...",  # optional
+            "incident_time": "..."  # optional, ISO 8601; SNS/SQS batches default to the alarm time
         },
         "service_config": {
             "role_arn": "...",  # optional
@@ -140,25 +380,9 @@ def _parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
             return detail
         return {"error": "EventBridge detail must have 'investigation' and 'service_config' keys"}
 
-    # SNS
-    if "Records" in event and event["Records"][0].get("EventSource") == "aws:sns":
-        try:
-            message = json.loads(event["Records"][0]["Sns"]["Message"])
-            if "investigation" in message and "service_config" in message:
-                return message
-            return {"error": "SNS message must have 'investigation' and 'service_config' keys"}
-        except (json.JSONDecodeError, KeyError) as e:
-            return {"error": f"Invalid SNS message: {str(e)}"}
-
-    # SQS
-    if "Records" in event and event["Records"][0].get("eventSource") == "aws:sqs":
-        try:
-            body = json.loads(event["Records"][0]["body"])
-            if "investigation" in body and "service_config" in body:
-                return body
-            return {"error": "SQS message must have 'investigation' and 'service_config' keys"}
-        except (json.JSONDecodeError, KeyError) as e:
-            return {"error": f"Invalid SQS message: {str(e)}"}
+    # SNS or SQS
+    if "Records" in event and _record_source(event["Records"][0]) in ("aws:sns", "aws:sqs"):
+        return _parse_record(event["Records"][0])[0]
 
     # Direct invocation - validate structured format
     if "investigation" in event and "service_config" in event:
@@ -23,9 +23,10 @@ HTTP server implementation using Starlette
 """
 
 import argparse
+import asyncio
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # IMPORTANT: Initialize telemetry BEFORE any imports
 from .utils.config import setup_strands_telemetry
@@ -34,9 +35,85 @@ setup_strands_telemetry()
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse
 from starlette.routing import Route
+from sse_starlette.sse import EventSourceResponse
 
-from .handlers import handle_investigation, get_region
+from .handlers import handle_investigation, stream_investigation, get_region
+from .jobs.admission import AdmissionRejected, AdmissionTicket, get_admission_controller, tenant_key
+from .jobs.coalescing import coalescing_key, get_single_flight
+from .jobs.report_cache import cached_report, get_report_cache, remember_report
 from .utils.config import get_environment_info, DEFAULT_REGION
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _read_payload(request):
+    """Parse and validate the structured request body; returns (payload, error response)."""
+    try:
+        # Parse JSON payload from request body
+        payload = await request.json()
+    except json.JSONDecodeError:
+        return None, JSONResponse({
+            "success": False,
+            "error": "Invalid JSON in request body"
+        }, status_code=400)
+    
+    # Validate structured format
+    if "investigation" not in payload or "service_config" not in payload:
+        return None, JSONResponse({
+            "success": False,
+            "error": "Payload must have 'investigation' and 'service_config' keys in structured format",
+            "received_keys": list(payload.keys())
+        }, status_code=400)
+    
+    return payload, None
+
+
+def _rejected_response(rejection: AdmissionRejected) -> JSONResponse:
+    """429 telling the client when the admission queue is likely to have room."""
+    return JSONResponse({
+        "success": False,
+        "error": str(rejection),
+        "retry_after_seconds": rejection.retry_after
+    }, status_code=429, headers={"Retry-After": str(rejection.retry_after)})
+
+
+class _AdmittedRunner:
+    """
+    Runner for SingleFlight.do that investigates under admission control.
+
+    Only the request that starts an investigation calls it, so requests
+    coalesced onto a running investigation never take an admission slot.
+    A ticket taken up front is used if given, otherwise one is taken when
+    the run starts; once started, the runner owns the ticket. The report
+    is cached under cache_key once the investigation completes.
+    """
+
+    def __init__(self, payload: Dict[str, Any], ticket: Optional[AdmissionTicket] = None,
+                 cache_key: Optional[str] = None):
+        self.payload = payload
+        self.ticket = ticket
+        self.cache_key = cache_key
+        self.started = False
+
+    async def __call__(self, event_stream) -> Dict[str, Any]:
+        self.started = True
+        result = await self._investigate(event_stream)
+        remember_report(self.cache_key, result)
+        return result
+
+    async def _investigate(self, event_stream) -> Dict[str, Any]:
+        admission = get_admission_controller()
+        if self.ticket is None:
+            async with admission.admit(tenant_key(self.payload)):
+                return await handle_investigation(self.payload, event_stream=event_stream)
+        if not self.ticket.future.done() and event_stream is not None:
+            event_stream.emit("phase", {"phase": "queued", "queued": admission.stats()["queued"]})
+        await admission.wait(self.ticket)
+        try:
+            return await handle_investigation(self.payload, event_stream=event_stream)
+        finally:
+            admission.release(self.ticket)
 
 
 async def invoke(request):
@@ -58,24 +135,16 @@ async def invoke(request):
         }
     }
     """
-    try:
-        # Parse JSON payload from request body
-        payload = await request.json()
-    except json.JSONDecodeError:
-        return JSONResponse({
-            "success": False,
-            "error": "Invalid JSON in request body"
-        }, status_code=400)
-    
-    # Validate structured format
-    if "investigation" not in payload or "service_config" not in payload:
-        return JSONResponse({
-            "success": False,
-            "error": "Payload must have 'investigation' and 'service_config' keys in structured format",
-            "received_keys": list(payload.keys())
-        }, status_code=400)
+    payload, error_response = await _read_payload(request)
+    if error_response is not None:
+        return error_response
     
-    result = await handle_investigation(payload)
+    cache_key, result = cached_report(payload)
+    if result is None:
+        try:
+            result = await get_single_flight().do(coalescing_key(payload), _AdmittedRunner(payload, cache_key=cache_key))
+        except AdmissionRejected as e:
+            return _rejected_response(e)
 
     # Add server-specific metadata
     if "investigation" in result:
@@ -84,6 +153,107 @@ async def invoke(request):
     return JSONResponse(result)
 
 
+async def invoke_stream(request):
+    """
+    Streaming investigation entrypoint (Server-Sent Events).
+    
+    Accepts the same payload as /invocations. Emits phase, facts and
+    hypotheses events while the investigation runs and ends with a report
+    (or error) event. Comment pings keep idle proxies from closing the
+    connection; a client disconnect cancels the investigation unless other
+    requests are attached to it. A request that has to wait for admission
+    first receives a "queued" phase event; a duplicate of an investigation
+    already in flight attaches to it and replays its events so far, and a
+    request answered from the report cache receives only the report event.
+    
+    Environment Variables:
+    - PROMPTRCA_SSE_PING_SECONDS: Seconds between keep-alive pings (default: 15)
+    """
+    payload, error_response = await _read_payload(request)
+    if error_response is not None:
+        return error_response
+    
+    ping = int(os.getenv("PROMPTRCA_SSE_PING_SECONDS", "15"))
+    cache_key, cached = cached_report(payload)
+    if cached is not None:
+        cached["investigation"]["execution_environment"] = "http_server"
+        
+        async def _cached_events():
+            yield {"event": "report", "data": json.dumps(cached, default=str)}
+        
+        return EventSourceResponse(_cached_events(), ping=ping)
+    
+    admission = get_admission_controller()
+    flights = get_single_flight()
+    key = coalescing_key(payload)
+    ticket = None
+    if not flights.in_flight(key):
+        try:
+            ticket = admission.enqueue(tenant_key(payload))
+        except AdmissionRejected as e:
+            return _rejected_response(e)
+    
+    runner = _AdmittedRunner(payload, ticket, cache_key)
+    
+    async def _events():
+        try:
+            async for event in stream_investigation(payload, lambda stream: flights.do(key, runner, stream)):
+                if event["event"] == "report" and "investigation" in event["data"]:
+                    event["data"]["investigation"]["execution_environment"] = "http_server"
+                yield {"event": event["event"], "data": json.dumps(event["data"], default=str)}
+        finally:
+            # A ticket the investigation never picked up (this request attached
+            # to another run, or left before its run started) is freed here
+            if ticket is not None and not runner.started:
+                admission.release(ticket)
+    
+    return EventSourceResponse(_events(), ping=ping)
+
+
+async def submit_investigation(request):
+    """
+    Queue an investigation and return its job id without waiting for it.
+    
+    Accepts the same payload as /invocations; poll GET /investigations/{job_id}.
+    """
+    payload, error_response = await _read_payload(request)
+    if error_response is not None:
+        return error_response
+    
+    from .jobs import get_job_manager
+    try:
+        job = get_job_manager().submit(payload)
+    except AdmissionRejected as e:
+        return _rejected_response(e)
+    return JSONResponse({
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "links": {"self": f"/investigations/{job.job_id}"}
+    }, status_code=202)
+
+
+async def get_investigation(request):
+    """Return a job's status, and its report once it has succeeded."""
+    from .jobs import get_job_manager
+    job = get_job_manager().get(request.path_params["job_id"])
+    if job is None:
+        return JSONResponse({"success": False, "error": "Investigation job not found"}, status_code=404)
+    return JSONResponse(job.to_dict())
+
+
+async def cancel_investigation(request):
+    """Cancel a queued or running job; finished jobs are returned with 409."""
+    from .jobs import get_job_manager
+    job_id = request.path_params["job_id"]
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return JSONResponse({"success": False, "error": "Investigation job not found"}, status_code=404)
+    if job.status.finished:
+        return JSONResponse(job.to_dict(), status_code=409)
+    job = get_job_manager().cancel(job_id)
+    return JSONResponse(job.to_dict(), status_code=202)
+
+
 # Health check endpoint
 async def health(request):
     """Health check endpoint - simple status check."""
@@ -102,13 +272,29 @@ async def status(request):
         env_info = get_environment_info()
         
         
+        from .core.orchestrator_pool import get_orchestrator_pool
+        from .utils.llm_cache import get_llm_response_cache
+        from .utils.model_registry import get_model_registry
+        from .jobs import get_job_manager
+        llm_cache = get_llm_response_cache()
+        report_cache = get_report_cache()
+        
         return JSONResponse({
             "status": "healthy",
             "service": "promptrca-server",
             "version": "1.0.0",
             "environment": env_info,
+            "orchestrator_pool": get_orchestrator_pool().stats(),
+            "llm_cache": llm_cache.stats() if llm_cache else {"enabled": False},
+            "model_registry": get_model_registry().stats(),
+            "admission": get_admission_controller().stats(),
+            "coalescing": get_single_flight().stats(),
+            "report_cache": report_cache.stats() if report_cache else {"enabled": False},
+            "jobs": get_job_manager().stats(),
             "endpoints": {
                 "investigations": "/invocations",
+                "investigations_stream": "/invocations/stream",
+                "investigation_jobs": "/investigations",
                 "health": "/health",
                 "status": "/status",
                 "ping": "/ping"
@@ -127,13 +313,46 @@ async def ping(request):
     return JSONResponse({"status": "ok"})
 
 
+async def prewarm_orchestrators():
+    """Build the warm orchestrator pool in the background so the first requests skip construction."""
+    if os.getenv("PROMPTRCA_ORCHESTRATOR_POOL_PREWARM", "true").lower() != "true":
+        return
+    
+    from .core.orchestrator_pool import get_orchestrator_pool
+    
+    async def _prewarm():
+        try:
+            idle = await asyncio.to_thread(get_orchestrator_pool().prewarm)
+            logger.info(f"🔥 Orchestrator pool prewarmed with {idle} instances")
+        except Exception as e:
+            logger.warning(f"Orchestrator pool prewarm failed: {e}")
+    
+    app.state.prewarm_task = asyncio.create_task(_prewarm())
+
+
+async def start_job_workers():
+    """Start the investigation job workers on the server's event loop."""
+    from .jobs import get_job_manager
+    get_job_manager().start()
+
+
+async def stop_job_workers():
+    """Stop the job workers; running jobs are recorded as cancelled."""
+    from .jobs import get_job_manager
+    await get_job_manager().shutdown()
+
+
 # Create Starlette application with routes
 app = Starlette(routes=[
     Route("/invocations", invoke, methods=["POST"]),
+    Route("/invocations/stream", invoke_stream, methods=["POST"]),
+    Route("/investigations", submit_investigation, methods=["POST"]),
+    Route("/investigations/{job_id}", get_investigation, methods=["GET"]),
+    Route("/investigations/{job_id}", cancel_investigation, methods=["DELETE"]),
     Route("/health", health, methods=["GET"]),
     Route("/status", status, methods=["GET"]),
     Route("/ping", ping, methods=["GET"]),
-])
+], on_startup=[prewarm_orchestrators, start_job_workers], on_shutdown=[stop_job_workers])
 
 
 def main():
@@ -156,6 +375,10 @@ def main():
     parser.add_argument("--host",
                        default="0.0.0.0",
                        help="Host to bind to (default: 0.0.0.0)")
+    parser.add_argument("--concurrency", "-c",
+                       type=int,
+                       default=None,
+                       help="Investigations admitted at once per worker; also sizes the orchestrator pool (default: 4)")
     
     args = parser.parse_args()
     
@@ -163,6 +386,9 @@ def main():
     if args.region != DEFAULT_REGION:
         os.environ["AWS_REGION"] = args.region
     
+    if args.concurrency:
+        os.environ["PROMPTRCA_MAX_CONCURRENT_INVESTIGATIONS"] = str(args.concurrency)
+    
     print("🔍 PromptRCA - AI Root-Cause Investigator (HTTP Server)")
     print("=====================================================")
     print(f"🌍 AWS Region: {get_region()}")
@@ -47,15 +47,14 @@ class APIGatewaySpecialist(BaseSpecialist):
         
         self.logger.info(f"   → Analyzing API Gateway: {api_id}")
         
-        # Get API Gateway configuration and metrics
-        facts.extend(await self._analyze_configuration(api_id, stage))
-        facts.extend(await self._analyze_metrics(api_id, stage))
-        
-        # Check IAM permissions for Step Functions integration
-        facts.extend(await self._analyze_iam_permissions(api_id, stage))
-        
-        # Check API Gateway execution logs
-        facts.extend(await self._analyze_execution_logs(api_id, stage, context))
+        # Configuration, metrics, IAM permissions for Step Functions integration
+        # and execution logs are independent
+        facts.extend(await self._gather_analyses(
+            self._analyze_configuration(api_id, stage),
+            self._analyze_metrics(api_id, stage),
+            self._analyze_iam_permissions(api_id, stage),
+            self._analyze_execution_logs(api_id, stage, context)
+        ))
         
         return self._limit_facts(facts)
     
@@ -64,9 +63,8 @@ class APIGatewaySpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.apigateway_tools import get_api_gateway_stage_config
-            config_json = get_api_gateway_stage_config(api_id, stage)
-            config = json.loads(config_json)
+            from ..tools.apigateway_tools import fetch_api_gateway_stage_config
+            config = await self._run_blocking(fetch_api_gateway_stage_config, api_id, stage)
             
             if 'error' not in config:
                 facts.append(self._create_fact(
@@ -95,9 +93,8 @@ class APIGatewaySpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.apigateway_tools import get_api_gateway_metrics
-            metrics_json = get_api_gateway_metrics(api_id, stage)
-            metrics = json.loads(metrics_json)
+            from ..tools.apigateway_tools import fetch_api_gateway_metrics
+            metrics = await self._run_blocking(fetch_api_gateway_metrics, api_id, stage)
             
             if 'error' not in metrics:
                 metrics_keys = list(metrics.get('metrics', {}).keys())
@@ -128,11 +125,10 @@ class APIGatewaySpecialist(BaseSpecialist):
         
         try:
             # Discover integration credentials (role ARN) directly from API Gateway config
-            from ..tools.apigateway_tools import get_api_gateway_stage_config
-            from ..tools.iam_tools import get_iam_role_config
+            from ..tools.apigateway_tools import fetch_api_gateway_stage_config
+            from ..tools.iam_tools import fetch_iam_role_config
 
-            config_json = get_api_gateway_stage_config(api_id, stage)
-            config = json.loads(config_json)
+            config = await self._run_blocking(fetch_api_gateway_stage_config, api_id, stage)
 
             if 'error' in config:
                 facts.append(self._create_fact(
@@ -179,8 +175,7 @@ class APIGatewaySpecialist(BaseSpecialist):
                 role_name = role_arn.split('/')[-1] if '/' in role_arn else role_arn.split(':')[-1]
                 try:
                     self.logger.info(f"   → Checking IAM role from integration: {role_name}")
-                    role_config_json = get_iam_role_config(role_name)
-                    role_config = json.loads(role_config_json)
+                    role_config = await self._run_blocking(fetch_iam_role_config, role_name)
 
                     if 'error' in role_config:
                         self.logger.debug(f"Could not load role config for {role_name}: {role_config.get('error')}")
@@ -234,7 +229,7 @@ class APIGatewaySpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.cloudwatch_tools import query_logs_by_trace_id
+            from ..tools.trace_log_correlation import correlate_trace_logs
             
             # Look for trace IDs in the context to check execution logs
             for trace_id in context.trace_ids:
@@ -242,14 +237,11 @@ class APIGatewaySpecialist(BaseSpecialist):
                     self.logger.info(f"   → Checking API Gateway execution logs for trace {trace_id}")
                     log_group = f"API-Gateway-Execution-Logs_{api_id}/{stage}"
                     
-                    logs_result_json = query_logs_by_trace_id(log_group, trace_id, hours_back=1)
-                    logs_result = json.loads(logs_result_json)
+                    logs_result = await self._run_blocking(correlate_trace_logs, trace_id, log_groups=[log_group])
                     
                     if 'error' not in logs_result:
-                        log_entries = logs_result.get('log_entries', [])
-                        
-                        for entry in log_entries:
-                            message = entry.get('message', '')
+                        for entry in logs_result.get('logs', []):
+                            message = entry.get('@message', '')
                             
                             # Look for permission errors in log messages
                             if 'AccessDeniedException' in message or 'not authorized' in message:
@@ -22,14 +22,18 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Contact: info@promptrca.com
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional, TypeVar
 from dataclasses import dataclass
+from ..context import run_blocking
 from ..models import Fact
 from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class InvestigationContext:
@@ -77,6 +81,26 @@ class BaseSpecialist(ABC):
         """Check if this specialist can analyze the given resource type."""
         return resource_type.lower() in [t.lower() for t in self.supported_resource_types]
     
+    async def _run_blocking(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a synchronous AWS tool call on the investigation's executor."""
+        return await run_blocking(fn, *args, **kwargs)
+    
+    async def _gather_analyses(self, *analyses: Awaitable[List[Fact]]) -> List[Fact]:
+        """
+        Run independent sub-analyses concurrently.
+        
+        Facts keep the order the analyses were given in; a sub-analysis that
+        raises is logged and contributes no facts.
+        """
+        results = await asyncio.gather(*analyses, return_exceptions=True)
+        facts = []
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.debug(f"Sub-analysis failed: {result}")
+            else:
+                facts.extend(result)
+        return facts
+    
     def _create_fact(self, source: str, content: str, confidence: float, 
                      metadata: Optional[Dict[str, Any]] = None) -> Fact:
         """Helper method to create facts with consistent formatting."""
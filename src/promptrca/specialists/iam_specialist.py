@@ -63,9 +63,8 @@ class IAMSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.iam_tools import get_iam_role_config
-            config_json = get_iam_role_config(role_name)
-            config = json.loads(config_json)
+            from ..tools.iam_tools import fetch_iam_role_config
+            config = await self._run_blocking(fetch_iam_role_config, role_name)
             
             if 'error' not in config:
                 facts.append(self._create_fact(
@@ -173,9 +172,8 @@ class IAMSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.iam_tools import get_iam_user_policies
-            config_json = get_iam_user_policies(user_name)
-            config = json.loads(config_json)
+            from ..tools.iam_tools import fetch_iam_user_policies
+            config = await self._run_blocking(fetch_iam_user_policies, user_name)
             
             if 'error' not in config:
                 facts.append(self._create_fact(
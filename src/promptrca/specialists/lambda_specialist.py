@@ -46,14 +46,12 @@ class LambdaSpecialist(BaseSpecialist):
         
         self.logger.info(f"   → Analyzing Lambda function: {function_name}")
         
-        # Get Lambda configuration
-        facts.extend(await self._analyze_configuration(function_name))
-        
-        # Get Lambda metrics
-        facts.extend(await self._analyze_metrics(function_name))
-        
-        # Get recent failed invocations
-        facts.extend(await self._analyze_failed_invocations(function_name))
+        # Configuration, metrics and recent failed invocations are independent
+        facts.extend(await self._gather_analyses(
+            self._analyze_configuration(function_name),
+            self._analyze_metrics(function_name),
+            self._analyze_failed_invocations(function_name)
+        ))
         
         return self._limit_facts(facts)
     
@@ -62,9 +60,8 @@ class LambdaSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.lambda_tools import get_lambda_config
-            config_json = get_lambda_config(function_name)
-            config = json.loads(config_json)
+            from ..tools.lambda_tools import fetch_lambda_config
+            config = await self._run_blocking(fetch_lambda_config, function_name)
             
             if 'error' not in config:
                 timeout = config.get('timeout')
@@ -109,9 +106,8 @@ class LambdaSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.lambda_tools import get_lambda_metrics
-            metrics_json = get_lambda_metrics(function_name)
-            metrics = json.loads(metrics_json)
+            from ..tools.lambda_tools import fetch_lambda_metrics
+            metrics = await self._run_blocking(fetch_lambda_metrics, function_name)
             
             if 'error' not in metrics:
                 metrics_data = metrics.get('metrics', {})
@@ -159,9 +155,8 @@ class LambdaSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.lambda_tools import get_lambda_failed_invocations
-            failures_json = get_lambda_failed_invocations(function_name, hours_back=24, limit=5)
-            failures = json.loads(failures_json)
+            from ..tools.lambda_tools import fetch_lambda_failed_invocations
+            failures = await self._run_blocking(fetch_lambda_failed_invocations, function_name, hours_back=24, limit=5)
             
             if 'error' not in failures:
                 failure_count = failures.get('failure_count', 0)
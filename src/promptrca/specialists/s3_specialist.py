@@ -46,14 +46,12 @@ class S3Specialist(BaseSpecialist):
         
         self.logger.info(f"   → Analyzing S3 bucket: {bucket_name}")
         
-        # Get S3 bucket configuration
-        facts.extend(await self._analyze_configuration(bucket_name))
-        
-        # Get S3 bucket metrics
-        facts.extend(await self._analyze_metrics(bucket_name))
-        
-        # Get S3 bucket policy
-        facts.extend(await self._analyze_policy(bucket_name))
+        # Configuration, metrics and bucket policy are independent
+        facts.extend(await self._gather_analyses(
+            self._analyze_configuration(bucket_name),
+            self._analyze_metrics(bucket_name),
+            self._analyze_policy(bucket_name)
+        ))
         
         return self._limit_facts(facts)
     
@@ -62,9 +60,8 @@ class S3Specialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.s3_tools import get_s3_bucket_config
-            config_json = get_s3_bucket_config(bucket_name)
-            config = json.loads(config_json)
+            from ..tools.s3_tools import fetch_s3_bucket_config
+            config = await self._run_blocking(fetch_s3_bucket_config, bucket_name)
             
             if 'error' not in config:
                 facts.append(self._create_fact(
@@ -175,9 +172,8 @@ class S3Specialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.s3_tools import get_s3_bucket_metrics
-            metrics_json = get_s3_bucket_metrics(bucket_name)
-            metrics = json.loads(metrics_json)
+            from ..tools.s3_tools import fetch_s3_bucket_metrics
+            metrics = await self._run_blocking(fetch_s3_bucket_metrics, bucket_name)
             
             if 'error' not in metrics:
                 metrics_data = metrics.get('metrics', {})
@@ -248,9 +244,8 @@ class S3Specialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.s3_tools import get_s3_bucket_policy
-            policy_json = get_s3_bucket_policy(bucket_name)
-            policy_data = json.loads(policy_json)
+            from ..tools.s3_tools import fetch_s3_bucket_policy
+            policy_data = await self._run_blocking(fetch_s3_bucket_policy, bucket_name)
             
             if 'error' not in policy_data:
                 policy = policy_data.get('policy', {})
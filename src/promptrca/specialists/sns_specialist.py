@@ -47,14 +47,12 @@ class SNSSpecialist(BaseSpecialist):
         topic_name = topic_arn.split(':')[-1] if ':' in topic_arn else topic_arn
         self.logger.info(f"   → Analyzing SNS topic: {topic_name}")
         
-        # Get SNS topic configuration
-        facts.extend(await self._analyze_configuration(topic_arn))
-        
-        # Get SNS topic metrics
-        facts.extend(await self._analyze_metrics(topic_name))
-        
-        # Get SNS topic subscriptions
-        facts.extend(await self._analyze_subscriptions(topic_arn))
+        # Configuration, metrics and subscriptions are independent
+        facts.extend(await self._gather_analyses(
+            self._analyze_configuration(topic_arn),
+            self._analyze_metrics(topic_name),
+            self._analyze_subscriptions(topic_arn)
+        ))
         
         return self._limit_facts(facts)
     
@@ -64,9 +62,8 @@ class SNSSpecialist(BaseSpecialist):
         topic_name = topic_arn.split(':')[-1] if ':' in topic_arn else topic_arn
         
         try:
-            from ..tools.sns_tools import get_sns_topic_config
-            config_json = get_sns_topic_config(topic_arn)
-            config = json.loads(config_json)
+            from ..tools.sns_tools import fetch_sns_topic_config
+            config = await self._run_blocking(fetch_sns_topic_config, topic_arn)
             
             if 'error' not in config:
                 facts.append(self._create_fact(
@@ -198,9 +195,8 @@ class SNSSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.sns_tools import get_sns_topic_metrics
-            metrics_json = get_sns_topic_metrics(topic_name)
-            metrics = json.loads(metrics_json)
+            from ..tools.sns_tools import fetch_sns_topic_metrics
+            metrics = await self._run_blocking(fetch_sns_topic_metrics, topic_name)
             
             if 'error' not in metrics:
                 metrics_data = metrics.get('metrics', {})
@@ -301,9 +297,8 @@ class SNSSpecialist(BaseSpecialist):
         topic_name = topic_arn.split(':')[-1] if ':' in topic_arn else topic_arn
         
         try:
-            from ..tools.sns_tools import get_sns_subscriptions
-            subs_json = get_sns_subscriptions(topic_arn)
-            subs_data = json.loads(subs_json)
+            from ..tools.sns_tools import fetch_sns_subscriptions
+            subs_data = await self._run_blocking(fetch_sns_subscriptions, topic_arn)
             
             if 'error' not in subs_data:
                 subscription_count = subs_data.get('subscription_count', 0)
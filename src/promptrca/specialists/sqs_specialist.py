@@ -46,14 +46,12 @@ class SQSSpecialist(BaseSpecialist):
         
         self.logger.info(f"   → Analyzing SQS queue: {queue_url}")
         
-        # Get SQS queue configuration
-        facts.extend(await self._analyze_configuration(queue_url))
-        
-        # Get SQS queue metrics
-        facts.extend(await self._analyze_metrics(queue_url))
-        
-        # Get dead letter queue configuration
-        facts.extend(await self._analyze_dead_letter_queue(queue_url))
+        # Configuration, metrics and dead letter queue are independent
+        facts.extend(await self._gather_analyses(
+            self._analyze_configuration(queue_url),
+            self._analyze_metrics(queue_url),
+            self._analyze_dead_letter_queue(queue_url)
+        ))
         
         return self._limit_facts(facts)
     
@@ -62,9 +60,8 @@ class SQSSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.sqs_tools import get_sqs_queue_config
-            config_json = get_sqs_queue_config(queue_url)
-            config = json.loads(config_json)
+            from ..tools.sqs_tools import fetch_sqs_queue_config
+            config = await self._run_blocking(fetch_sqs_queue_config, queue_url)
             
             if 'error' not in config:
                 queue_name = queue_url.split('/')[-1]
@@ -191,9 +188,8 @@ class SQSSpecialist(BaseSpecialist):
         queue_name = queue_url.split('/')[-1]
         
         try:
-            from ..tools.sqs_tools import get_sqs_queue_metrics
-            metrics_json = get_sqs_queue_metrics(queue_name)
-            metrics = json.loads(metrics_json)
+            from ..tools.sqs_tools import fetch_sqs_queue_metrics
+            metrics = await self._run_blocking(fetch_sqs_queue_metrics, queue_name)
             
             if 'error' not in metrics:
                 metrics_data = metrics.get('metrics', {})
@@ -279,9 +275,8 @@ class SQSSpecialist(BaseSpecialist):
         queue_name = queue_url.split('/')[-1]
         
         try:
-            from ..tools.sqs_tools import get_sqs_dead_letter_queue
-            dlq_json = get_sqs_dead_letter_queue(queue_url)
-            dlq_data = json.loads(dlq_json)
+            from ..tools.sqs_tools import fetch_sqs_dead_letter_queue
+            dlq_data = await self._run_blocking(fetch_sqs_dead_letter_queue, queue_url)
             
             if 'error' not in dlq_data:
                 has_dlq = dlq_data.get('has_dlq', False)
@@ -92,9 +92,8 @@ class StepFunctionsSpecialist(BaseSpecialist):
         facts = []
         
         try:
-            from ..tools.stepfunctions_tools import get_stepfunctions_execution_details
-            exec_details_json = get_stepfunctions_execution_details(execution_arn)
-            exec_details = json.loads(exec_details_json)
+            from ..tools.stepfunctions_tools import fetch_stepfunctions_execution_details
+            exec_details = await self._run_blocking(fetch_stepfunctions_execution_details, execution_arn)
             
             if 'error' not in exec_details:
                 status = exec_details.get('status', 'UNKNOWN')
@@ -48,13 +48,11 @@ class TraceSpecialist(BaseSpecialist):
         self.logger.info(f"   → Analyzing trace {trace_id} deeply...")
         
         try:
-            from ..tools.xray_tools import get_xray_trace, get_all_resources_from_trace
+            from ..tools.xray_tools import fetch_xray_trace, fetch_all_resources_from_trace
             self.logger.info(f"     → Getting trace data for {trace_id}...")
 
-            trace_json = get_xray_trace(trace_id)
-            self.logger.info(f"     → Trace JSON length: {len(trace_json) if trace_json else 0}")
+            trace_data = await self._run_blocking(fetch_xray_trace, trace_id)
 
-            trace_data = json.loads(trace_json)
             self.logger.info(f"     → Parsed trace data keys: {list(trace_data.keys())}")
 
             if "error" in trace_data:
@@ -98,8 +96,7 @@ class TraceSpecialist(BaseSpecialist):
             # This discovers Lambda functions, API Gateways, Step Functions, etc.
             self.logger.info(f"     → Extracting resources from trace {trace_id}...")
             try:
-                resources_json = get_all_resources_from_trace(trace_id)
-                resources_data = json.loads(resources_json)
+                resources_data = await self._run_blocking(fetch_all_resources_from_trace, trace_id)
 
                 if "error" not in resources_data and "resources" in resources_data:
                     discovered_resources = resources_data.get("resources", [])
@@ -20,131 +20,184 @@ Contact: info@promptrca.com
 
 """
 
-# Lambda tools
-from .lambda_tools import (
-    get_lambda_config,
-    get_lambda_logs,
-    get_lambda_metrics,
-    get_lambda_layers
-)
-
-# API Gateway tools
-from .apigateway_tools import (
-    get_api_gateway_stage_config,
-    get_apigateway_logs,
-    resolve_api_gateway_id,
-    get_api_gateway_metrics
-)
-
-# Step Functions tools
-from .stepfunctions_tools import (
-    get_stepfunctions_definition,
-    get_stepfunctions_logs,
-    get_stepfunctions_execution_details,
-    get_stepfunctions_metrics
-)
-
-# IAM tools
-from .iam_tools import (
-    get_iam_role_config,
-    get_iam_policy_document,
-    simulate_iam_policy,
-    get_iam_user_policies
-)
-
-# X-Ray tools
-from .xray_tools import (
-    get_xray_trace,
-    get_all_resources_from_trace,
-    get_xray_service_graph,
-    get_xray_trace_summaries
-)
+from importlib import import_module
 
-# CloudWatch tools
-from .cloudwatch_tools import (
-    get_cloudwatch_logs,
-    query_logs_by_trace_id,
-    get_cloudwatch_metrics,
-    get_cloudwatch_alarms,
-    list_cloudwatch_dashboards
-)
-
-# DynamoDB tools
-from .dynamodb_tools import (
-    get_dynamodb_table_config,
-    get_dynamodb_table_metrics,
-    describe_dynamodb_streams,
-    list_dynamodb_tables
-)
+from ..utils.lazy_exports import lazy_exports
 
-# S3 tools
-from .s3_tools import (
-    get_s3_bucket_config,
-    get_s3_bucket_metrics,
-    list_s3_bucket_objects,
-    get_s3_bucket_policy
-)
-
-# SQS tools
-from .sqs_tools import (
-    get_sqs_queue_config,
-    get_sqs_queue_metrics,
-    get_sqs_dead_letter_queue,
-    list_sqs_queues
-)
-
-# SNS tools
-from .sns_tools import (
-    get_sns_topic_config,
-    get_sns_topic_metrics,
-    get_sns_subscriptions,
-    list_sns_topics
-)
-
-# EventBridge tools
-from .eventbridge_tools import (
-    get_eventbridge_rule_config,
-    get_eventbridge_targets,
-    get_eventbridge_metrics,
-    list_eventbridge_rules,
-    get_eventbridge_bus_config
-)
-
-# VPC/Network tools
-from .vpc_tools import (
-    get_vpc_config,
-    get_subnet_config,
-    get_security_group_config,
-    get_network_interface_config,
-    get_nat_gateway_config,
-    get_internet_gateway_config
-)
-
-# AWS Health and CloudTrail tools
-from .aws_health_tools import (
-    check_aws_service_health,
-    get_account_health_events,
-    check_service_quota_status
-)
-
-from .cloudtrail_tools import (
-    get_recent_cloudtrail_events,
-    find_correlated_changes,
-    get_iam_policy_changes
-)
+# Tool functions and the module defining each, imported on first access
+_TOOL_MODULES = {
+    # Lambda tools
+    "lambda_tools": (
+        "get_lambda_config",
+        "get_lambda_logs",
+        "get_lambda_metrics",
+        "get_lambda_layers",
+        "fetch_lambda_config",
+        "fetch_lambda_logs",
+        "fetch_lambda_metrics",
+        "fetch_lambda_layers",
+    ),
+    # API Gateway tools
+    "apigateway_tools": (
+        "get_api_gateway_stage_config",
+        "get_apigateway_logs",
+        "resolve_api_gateway_id",
+        "get_api_gateway_metrics",
+        "fetch_api_gateway_stage_config",
+        "fetch_apigateway_logs",
+        "fetch_api_gateway_id",
+        "fetch_api_gateway_metrics",
+    ),
+    # Step Functions tools
+    "stepfunctions_tools": (
+        "get_stepfunctions_definition",
+        "get_stepfunctions_logs",
+        "get_stepfunctions_execution_details",
+        "get_stepfunctions_metrics",
+        "fetch_stepfunctions_definition",
+        "fetch_stepfunctions_logs",
+        "fetch_stepfunctions_execution_details",
+        "fetch_stepfunctions_metrics",
+    ),
+    # IAM tools
+    "iam_tools": (
+        "get_iam_role_config",
+        "get_iam_policy_document",
+        "simulate_iam_policy",
+        "get_iam_user_policies",
+        "fetch_iam_role_config",
+        "fetch_iam_policy_document",
+        "fetch_iam_policy_simulation",
+        "fetch_iam_user_policies",
+    ),
+    # X-Ray tools
+    "xray_tools": (
+        "get_xray_trace",
+        "get_all_resources_from_trace",
+        "get_xray_service_graph",
+        "get_xray_trace_summaries",
+        "fetch_xray_trace",
+        "fetch_all_resources_from_trace",
+        "fetch_xray_service_graph",
+        "fetch_xray_trace_summaries",
+    ),
+    "service_graph_tools": (
+        "get_xray_service_graph_diff",
+        "fetch_xray_service_graph_diff",
+    ),
+    # CloudWatch tools
+    "cloudwatch_tools": (
+        "get_cloudwatch_logs",
+        "query_logs_by_trace_id",
+        "get_cloudwatch_metrics",
+        "get_cloudwatch_alarms",
+        "list_cloudwatch_dashboards",
+        "fetch_cloudwatch_logs",
+        "fetch_logs_by_trace_id",
+        "fetch_cloudwatch_metrics",
+        "fetch_cloudwatch_alarms",
+        "fetch_cloudwatch_dashboards",
+    ),
+    # DynamoDB tools
+    "dynamodb_tools": (
+        "get_dynamodb_table_config",
+        "get_dynamodb_table_metrics",
+        "describe_dynamodb_streams",
+        "list_dynamodb_tables",
+        "fetch_dynamodb_table_config",
+        "fetch_dynamodb_table_metrics",
+        "fetch_dynamodb_streams",
+        "fetch_dynamodb_tables",
+    ),
+    # S3 tools
+    "s3_tools": (
+        "get_s3_bucket_config",
+        "get_s3_bucket_metrics",
+        "list_s3_bucket_objects",
+        "get_s3_bucket_policy",
+        "fetch_s3_bucket_config",
+        "fetch_s3_bucket_metrics",
+        "fetch_s3_bucket_objects",
+        "fetch_s3_bucket_policy",
+    ),
+    # SQS tools
+    "sqs_tools": (
+        "get_sqs_queue_config",
+        "get_sqs_queue_metrics",
+        "get_sqs_dead_letter_queue",
+        "list_sqs_queues",
+        "fetch_sqs_queue_config",
+        "fetch_sqs_queue_metrics",
+        "fetch_sqs_dead_letter_queue",
+        "fetch_sqs_queues",
+    ),
+    # SNS tools
+    "sns_tools": (
+        "get_sns_topic_config",
+        "get_sns_topic_metrics",
+        "get_sns_subscriptions",
+        "list_sns_topics",
+        "fetch_sns_topic_config",
+        "fetch_sns_topic_metrics",
+        "fetch_sns_subscriptions",
+        "fetch_sns_topics",
+    ),
+    # EventBridge tools
+    "eventbridge_tools": (
+        "get_eventbridge_rule_config",
+        "get_eventbridge_targets",
+        "get_eventbridge_metrics",
+        "list_eventbridge_rules",
+        "get_eventbridge_bus_config",
+        "fetch_eventbridge_rule_config",
+        "fetch_eventbridge_targets",
+        "fetch_eventbridge_metrics",
+        "fetch_eventbridge_rules",
+        "fetch_eventbridge_bus_config",
+    ),
+    # VPC/Network tools
+    "vpc_tools": (
+        "get_vpc_config",
+        "get_subnet_config",
+        "get_security_group_config",
+        "get_network_interface_config",
+        "get_nat_gateway_config",
+        "get_internet_gateway_config",
+        "fetch_vpc_config",
+        "fetch_subnet_config",
+        "fetch_security_group_config",
+        "fetch_network_interface_config",
+        "fetch_nat_gateway_config",
+        "fetch_internet_gateway_config",
+    ),
+    # AWS Health and CloudTrail tools
+    "aws_health_tools": (
+        "check_aws_service_health",
+        "get_account_health_events",
+        "check_service_quota_status",
+        "fetch_aws_service_health",
+        "fetch_account_health_events",
+        "fetch_service_quota_status",
+    ),
+    "cloudtrail_tools": (
+        "get_recent_cloudtrail_events",
+        "find_correlated_changes",
+        "get_iam_policy_changes",
+        "fetch_recent_cloudtrail_events",
+        "fetch_correlated_changes",
+        "fetch_iam_policy_changes",
+    ),
+    # AWS Knowledge MCP tools (optional); available only if all of them import
+    "aws_knowledge_tools": (
+        "search_aws_documentation",
+        "read_aws_documentation",
+        "get_aws_documentation_recommendations",
+        "list_aws_regions",
+        "get_service_regional_availability",
+    ),
+}
 
-# AWS Knowledge MCP tools (optional) - conditionally imported based on feature flag
-try:
-    from .aws_knowledge_tools import (
-        search_aws_documentation,
-        read_aws_documentation,
-        get_aws_documentation_recommendations,
-        list_aws_regions,
-        get_service_regional_availability
-    )
-    _aws_knowledge_tools_available = True
-except ImportError:
-    _aws_knowledge_tools_available = False
+_TOOL_MODULE_BY_NAME = {name: module for module, names in _TOOL_MODULES.items() for name in names}
 
 __all__ = [
     # Lambda tools
@@ -176,6 +229,7 @@ __all__ = [
     'get_all_resources_from_trace',
     'get_xray_service_graph',
     'get_xray_trace_summaries',
+    'get_xray_service_graph_diff',
     
     # CloudWatch tools
     'get_cloudwatch_logs',
@@ -231,7 +285,89 @@ __all__ = [
     'find_correlated_changes',
     'get_iam_policy_changes',
     
-    # AWS Knowledge MCP tools (only if available)
-    *(['search_aws_documentation', 'read_aws_documentation', 'get_aws_documentation_recommendations', 'list_aws_regions', 'get_service_regional_availability'] if _aws_knowledge_tools_available else [])
+    # Core functions returning native results (used by specialists and orchestrators)
+    'fetch_lambda_config',
+    'fetch_lambda_logs',
+    'fetch_lambda_metrics',
+    'fetch_lambda_layers',
+    'fetch_api_gateway_stage_config',
+    'fetch_apigateway_logs',
+    'fetch_api_gateway_id',
+    'fetch_api_gateway_metrics',
+    'fetch_stepfunctions_definition',
+    'fetch_stepfunctions_logs',
+    'fetch_stepfunctions_execution_details',
+    'fetch_stepfunctions_metrics',
+    'fetch_iam_role_config',
+    'fetch_iam_policy_document',
+    'fetch_iam_policy_simulation',
+    'fetch_iam_user_policies',
+    'fetch_xray_trace',
+    'fetch_all_resources_from_trace',
+    'fetch_xray_service_graph',
+    'fetch_xray_trace_summaries',
+    'fetch_xray_service_graph_diff',
+    'fetch_cloudwatch_logs',
+    'fetch_logs_by_trace_id',
+    'fetch_cloudwatch_metrics',
+    'fetch_cloudwatch_alarms',
+    'fetch_cloudwatch_dashboards',
+    'fetch_dynamodb_table_config',
+    'fetch_dynamodb_table_metrics',
+    'fetch_dynamodb_streams',
+    'fetch_dynamodb_tables',
+    'fetch_s3_bucket_config',
+    'fetch_s3_bucket_metrics',
+    'fetch_s3_bucket_objects',
+    'fetch_s3_bucket_policy',
+    'fetch_sqs_queue_config',
+    'fetch_sqs_queue_metrics',
+    'fetch_sqs_dead_letter_queue',
+    'fetch_sqs_queues',
+    'fetch_sns_topic_config',
+    'fetch_sns_topic_metrics',
+    'fetch_sns_subscriptions',
+    'fetch_sns_topics',
+    'fetch_eventbridge_rule_config',
+    'fetch_eventbridge_targets',
+    'fetch_eventbridge_metrics',
+    'fetch_eventbridge_rules',
+    'fetch_eventbridge_bus_config',
+    'fetch_vpc_config',
+    'fetch_subnet_config',
+    'fetch_security_group_config',
+    'fetch_network_interface_config',
+    'fetch_nat_gateway_config',
+    'fetch_internet_gateway_config',
+    'fetch_aws_service_health',
+    'fetch_account_health_events',
+    'fetch_service_quota_status',
+    'fetch_recent_cloudtrail_events',
+    'fetch_correlated_changes',
+    'fetch_iam_policy_changes'
+
+    # AWS Knowledge MCP tools are optional and resolved on access only;
+    # listing them here would import their module to decide availability
 ]
 
+
+def _aws_knowledge_tools_importable() -> bool:
+    try:
+        module = import_module(".aws_knowledge_tools", __name__)
+    except ImportError:
+        return False
+    return all(hasattr(module, name) for name in _TOOL_MODULES["aws_knowledge_tools"])
+
+
+_tool_getattr, __dir__ = lazy_exports(
+    __name__, globals(), {name: f".{module}" for name, module in _TOOL_MODULE_BY_NAME.items()}
+)
+
+
+def __getattr__(name):
+    if name == "_aws_knowledge_tools_available":
+        value = globals()[name] = _aws_knowledge_tools_importable()
+        return value
+    if _TOOL_MODULE_BY_NAME.get(name) == "aws_knowledge_tools" and not __getattr__("_aws_knowledge_tools_available"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _tool_getattr(name)
@@ -26,62 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_api_gateway_stage_config(api_id: str, stage_name: str) -> str:
-    """
-    Retrieve comprehensive API Gateway stage configuration for integration and routing analysis.
-    
-    This tool fetches all critical stage settings needed to diagnose API Gateway issues:
-    - Integration configurations (Lambda, Step Functions, HTTP endpoints)
-    - IAM roles and credentials used for integrations
-    - Caching and performance settings
-    - X-Ray tracing configuration
-    - Method settings and throttling
-    - Stage variables and deployment details
-    
-    Args:
-        api_id: The API Gateway REST API ID (e.g., "abc123xyz", "142gh05m9a")
-        stage_name: The stage name (e.g., "test", "prod", "dev")
-        region: AWS region (default: from environment config)
-    
-    Returns:
-        JSON string containing:
-        - api_id: REST API ID
-        - stage_name: Stage name
-        - deployment_id: Current deployment ID
-        - xray_tracing_enabled: Whether X-Ray tracing is enabled
-        - cache_cluster_enabled: Whether caching is enabled
-        - cache_cluster_size: Cache cluster size if enabled
-        - method_settings: Method-level settings and throttling
-        - variables: Stage variables
-        - integrations: Array of integration details:
-          - resource_path: API resource path (e.g., "/users", "/orders")
-          - http_method: HTTP method (GET, POST, PUT, DELETE, etc.)
-          - integration_type: Type of integration (AWS_PROXY, AWS, HTTP, etc.)
-          - integration_uri: Target service URI
-          - target_service: Parsed target service (Lambda, Step Functions, HTTP)
-          - credentials_role: IAM role used for integration
-        - created_date: When the stage was created
-        - last_updated_date: When the stage was last updated
-    
-    Common Integration Issues:
-        - Wrong integration type: Mismatch between expected and actual integration
-        - Missing IAM permissions: Integration role lacks required permissions
-        - Incorrect URI: Integration points to wrong service or function
-        - Missing credentials: Integration lacks proper IAM role
-        - CORS issues: Missing or misconfigured CORS settings
-        - Throttling: Method-level throttling causing 429 errors
-    
-    Use Cases:
-        - Integration debugging (verify backend service connections)
-        - Permission analysis (check IAM role configurations)
-        - Routing issues (verify resource paths and methods)
-        - Performance optimization (check caching and throttling settings)
-        - Security auditing (review integration credentials and permissions)
-        - CORS troubleshooting (verify cross-origin resource sharing setup)
-    
-    Note: This tool examines the current stage configuration, not historical changes.
-    """
+def fetch_api_gateway_stage_config(api_id: str, stage_name: str) -> Dict[str, Any]:
+    """Retrieve comprehensive API Gateway stage configuration for integration and routing analysis."""
     
     try:
         # Get AWS client from context
@@ -152,56 +98,72 @@ def get_api_gateway_stage_config(api_id: str, stage_name: str) -> str:
             "last_updated_date": str(stage_response.get('lastUpdatedDate'))
         }
 
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "api_id": api_id, "stage": stage_name})
+        return {"error": str(e), "api_id": api_id, "stage": stage_name}
 
 
 @tool
-def get_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int = 1) -> str:
+def get_api_gateway_stage_config(api_id: str, stage_name: str) -> str:
     """
-    Retrieve CloudWatch logs for API Gateway request/response analysis and error debugging.
+    Retrieve comprehensive API Gateway stage configuration for integration and routing analysis.
     
-    This tool fetches execution logs from API Gateway to identify request patterns,
-    error responses, integration failures, and performance issues. Essential for
-    diagnosing API Gateway routing, integration, and client-side problems.
+    This tool fetches all critical stage settings needed to diagnose API Gateway issues:
+    - Integration configurations (Lambda, Step Functions, HTTP endpoints)
+    - IAM roles and credentials used for integrations
+    - Caching and performance settings
+    - X-Ray tracing configuration
+    - Method settings and throttling
+    - Stage variables and deployment details
     
     Args:
         api_id: The API Gateway REST API ID (e.g., "abc123xyz", "142gh05m9a")
         stage_name: The stage name (e.g., "test", "prod", "dev")
-        hours_back: Number of hours to look back for logs (default: 1, max recommended: 24)
         region: AWS region (default: from environment config)
     
     Returns:
         JSON string containing:
         - api_id: REST API ID
         - stage_name: Stage name
-        - log_group: CloudWatch log group path
-        - hours_back: Time range searched
-        - event_count: Number of log events found
-        - events: Array of log events with:
-          - timestamp: Unix timestamp in milliseconds
-          - message: Log message content (request/response details, errors)
+        - deployment_id: Current deployment ID
+        - xray_tracing_enabled: Whether X-Ray tracing is enabled
+        - cache_cluster_enabled: Whether caching is enabled
+        - cache_cluster_size: Cache cluster size if enabled
+        - method_settings: Method-level settings and throttling
+        - variables: Stage variables
+        - integrations: Array of integration details:
+          - resource_path: API resource path (e.g., "/users", "/orders")
+          - http_method: HTTP method (GET, POST, PUT, DELETE, etc.)
+          - integration_type: Type of integration (AWS_PROXY, AWS, HTTP, etc.)
+          - integration_uri: Target service URI
+          - target_service: Parsed target service (Lambda, Step Functions, HTTP)
+          - credentials_role: IAM role used for integration
+        - created_date: When the stage was created
+        - last_updated_date: When the stage was last updated
     
-    Common Log Patterns to Look For:
-        - HTTP status codes: 4xx (client errors), 5xx (server errors)
-        - Integration errors: Backend service failures or timeouts
-        - Authentication errors: Invalid API keys or IAM permissions
-        - Throttling: 429 Too Many Requests responses
-        - CORS errors: Cross-origin request failures
-        - Request validation: Malformed requests or missing parameters
-        - Response transformation: Integration response mapping issues
+    Common Integration Issues:
+        - Wrong integration type: Mismatch between expected and actual integration
+        - Missing IAM permissions: Integration role lacks required permissions
+        - Incorrect URI: Integration points to wrong service or function
+        - Missing credentials: Integration lacks proper IAM role
+        - CORS issues: Missing or misconfigured CORS settings
+        - Throttling: Method-level throttling causing 429 errors
     
     Use Cases:
-        - Request/response debugging (analyze API call patterns)
-        - Error investigation (identify 4xx/5xx error causes)
-        - Integration troubleshooting (check backend service calls)
-        - Performance analysis (analyze request latency and patterns)
-        - Security auditing (review authentication and authorization)
-        - Client debugging (help developers understand API behavior)
+        - Integration debugging (verify backend service connections)
+        - Permission analysis (check IAM role configurations)
+        - Routing issues (verify resource paths and methods)
+        - Performance optimization (check caching and throttling settings)
+        - Security auditing (review integration credentials and permissions)
+        - CORS troubleshooting (verify cross-origin resource sharing setup)
     
-    Note: Logs are retrieved from the most recent log streams to ensure relevance.
+    Note: This tool examines the current stage configuration, not historical changes.
     """
+    return json.dumps(fetch_api_gateway_stage_config(api_id, stage_name), indent=2, default=str)
+
+
+def fetch_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int = 1) -> Dict[str, Any]:
+    """Retrieve CloudWatch logs for API Gateway request/response analysis and error debugging."""
     
     from datetime import datetime, timedelta
     
@@ -250,25 +212,61 @@ def get_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int =
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "api_id": api_id, "stage_name": stage_name})
+        return {"error": str(e), "api_id": api_id, "stage_name": stage_name}
 
 
 @tool
-def resolve_api_gateway_id(resolve: str) -> str:
+def get_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int = 1) -> str:
     """
-    Resolve API Gateway name or ID to the actual REST API ID.
-    Handles both cases:
-    - If given a numeric ID (like "142gh05m9a"), returns it as-is
-    - If given a name (like "promptrca-test-test-api"), looks it up and returns the ID
-
+    Retrieve CloudWatch logs for API Gateway request/response analysis and error debugging.
+    
+    This tool fetches execution logs from API Gateway to identify request patterns,
+    error responses, integration failures, and performance issues. Essential for
+    diagnosing API Gateway routing, integration, and client-side problems.
+    
     Args:
-        api_name_or_id: API Gateway name or ID
-
+        api_id: The API Gateway REST API ID (e.g., "abc123xyz", "142gh05m9a")
+        stage_name: The stage name (e.g., "test", "prod", "dev")
+        hours_back: Number of hours to look back for logs (default: 1, max recommended: 24)
+        region: AWS region (default: from environment config)
+    
     Returns:
-        JSON string with the REST API ID
+        JSON string containing:
+        - api_id: REST API ID
+        - stage_name: Stage name
+        - log_group: CloudWatch log group path
+        - hours_back: Time range searched
+        - event_count: Number of log events found
+        - events: Array of log events with:
+          - timestamp: Unix timestamp in milliseconds
+          - message: Log message content (request/response details, errors)
+    
+    Common Log Patterns to Look For:
+        - HTTP status codes: 4xx (client errors), 5xx (server errors)
+        - Integration errors: Backend service failures or timeouts
+        - Authentication errors: Invalid API keys or IAM permissions
+        - Throttling: 429 Too Many Requests responses
+        - CORS errors: Cross-origin request failures
+        - Request validation: Malformed requests or missing parameters
+        - Response transformation: Integration response mapping issues
+    
+    Use Cases:
+        - Request/response debugging (analyze API call patterns)
+        - Error investigation (identify 4xx/5xx error causes)
+        - Integration troubleshooting (check backend service calls)
+        - Performance analysis (analyze request latency and patterns)
+        - Security auditing (review authentication and authorization)
+        - Client debugging (help developers understand API behavior)
+    
+    Note: Logs are retrieved from the most recent log streams to ensure relevance.
     """
+    return json.dumps(fetch_apigateway_logs(api_id, stage_name, hours_back), indent=2, default=str)
+
+
+def fetch_api_gateway_id(resolve: str) -> Dict[str, Any]:
+    """Resolve API Gateway name or ID to the actual REST API ID."""
     import re
 
     try:
@@ -277,11 +275,11 @@ def resolve_api_gateway_id(resolve: str) -> str:
         # Check if it's already a REST API ID format (alphanumeric, typically 10 chars)
         # REST API IDs look like: 142gh05m9a, abc123xyz, etc.
         if re.match(r'^[a-z0-9]{10}$', api_name_or_id):
-            return json.dumps({
+            return {
                 "api_id": api_name_or_id,
                 "source": "direct",
                 "message": "Already a valid REST API ID"
-            })
+            }
 
         # Otherwise, search for it by name
         client = aws_client.get_client('apigateway')
@@ -291,81 +289,43 @@ def resolve_api_gateway_id(resolve: str) -> str:
         for page in paginator.paginate():
             for api in page.get('items', []):
                 if api['name'] == api_name_or_id:
-                    return json.dumps({
+                    return {
                         "api_id": api['id'],
                         "api_name": api['name'],
                         "source": "name_lookup",
                         "message": f"Resolved '{api_name_or_id}' to REST API ID '{api['id']}'"
-                    })
+                    }
 
         # Not found
-        return json.dumps({
+        return {
             "error": "API Gateway not found",
             "api_name_or_id": api_name_or_id,
             "message": f"No REST API found with name '{api_name_or_id}'"
-        })
+        }
 
     except Exception as e:
-        return json.dumps({"error": str(e), "api_name_or_id": api_name_or_id})
+        return {"error": str(e), "api_name_or_id": api_name_or_id}
 
 
 @tool
-def get_api_gateway_access_logs_parsed(api_id: str, stage_name: str = "test", hours_back: int = 1, limit: int = 50) -> str:
+def resolve_api_gateway_id(resolve: str) -> str:
     """
-    Get parsed API Gateway access logs with structured request/response data.
-
-    This tool uses CloudWatch Logs Insights to parse API Gateway access logs,
-    extracting HTTP status codes, methods, paths, latencies, and error details.
-    Essential for diagnosing request failures, integration issues, and performance problems.
+    Resolve API Gateway name or ID to the actual REST API ID.
+    Handles both cases:
+    - If given a numeric ID (like "142gh05m9a"), returns it as-is
+    - If given a name (like "promptrca-test-test-api"), looks it up and returns the ID
 
     Args:
-        api_id: The API Gateway REST API ID (e.g., "abc123xyz", "142gh05m9a")
-        stage_name: The stage name (e.g., "test", "prod", "dev")
-        hours_back: Number of hours to look back (default: 1)
-        limit: Maximum number of requests to return (default: 50)
+        api_name_or_id: API Gateway name or ID
 
     Returns:
-        JSON string containing:
-        - api_id: REST API ID
-        - stage_name: Stage name
-        - hours_back: Time range searched
-        - request_count: Total number of requests found
-        - error_count: Number of failed requests (4xx/5xx)
-        - requests: Array of parsed requests with:
-          - timestamp: When the request occurred
-          - method: HTTP method (GET, POST, PUT, DELETE, etc.)
-          - path: API resource path
-          - status_code: HTTP status code (200, 403, 502, etc.)
-          - integration_status: Backend integration HTTP status
-          - request_latency_ms: Total request latency
-          - integration_latency_ms: Backend integration latency
-          - error_message: Error message if available
-          - request_id: AWS request ID for correlation
-          - ip: Client IP address (if available)
-
-    Common Error Analysis:
-        - 4xx errors: Client-side errors (bad requests, auth failures, not found)
-          - 400: Bad Request - malformed request
-          - 403: Forbidden - auth/permission issue
-          - 404: Not Found - wrong path or resource
-          - 429: Too Many Requests - throttling
-        - 5xx errors: Server-side errors (integration failures, timeouts)
-          - 500: Internal Server Error - general backend error
-          - 502: Bad Gateway - invalid response from integration
-          - 503: Service Unavailable - integration unavailable
-          - 504: Gateway Timeout - integration timed out
+        JSON string with the REST API ID
+    """
+    return json.dumps(fetch_api_gateway_id(resolve), indent=2, default=str)
 
-    Use Cases:
-        - Error investigation (identify failing requests and status codes)
-        - Integration troubleshooting (check backend integration status)
-        - Performance analysis (analyze latency patterns)
-        - Client debugging (understand request failures)
-        - CORS troubleshooting (identify preflight failures)
-        - Authentication debugging (track 403 errors)
 
-    Note: This tool uses CloudWatch Logs Insights which may take several seconds to execute.
-    Access logs must be enabled for the API Gateway stage.
-    """
+def fetch_api_gateway_access_logs_parsed(api_id: str, stage_name: str = "test", hours_back: int = 1, limit: int = 50) -> Dict[str, Any]:
+    """Get parsed API Gateway access logs with structured request/response data."""
     from datetime import datetime, timedelta
     import time
 
@@ -496,88 +456,80 @@ def get_api_gateway_access_logs_parsed(api_id: str, stage_name: str = "test", ho
             "query_status": status
         }
 
-        return json.dumps(config, indent=2)
+        return config
 
     except Exception as e:
-        return json.dumps({
+        return {
             "error": str(e),
             "error_type": type(e).__name__,
             "api_id": api_id,
             "stage_name": stage_name,
             "message": "Failed to parse access logs. Access logs may not be enabled or the log format may differ."
-        })
+        }
 
 
 @tool
-def get_api_gateway_deployment_history(api_id: str, limit: int = 10) -> str:
+def get_api_gateway_access_logs_parsed(api_id: str, stage_name: str = "test", hours_back: int = 1, limit: int = 50) -> str:
     """
-    Retrieve API Gateway deployment history to correlate API changes with incidents.
-
-    This tool lists recent deployments for an API Gateway REST API, enabling temporal correlation
-    between API changes and incidents. Critical for determining if an issue started after a
-    deployment of new routes, integrations, or configurations.
+    Get parsed API Gateway access logs with structured request/response data.
 
-    Use this tool when:
-    - Investigating if an issue started after an API deployment
-    - Correlating error timeline with API configuration changes
-    - Analyzing deployment frequency and patterns
-    - Checking what changed between working and failing states
-    - Understanding the deployment history of an API
-    - Identifying rollback candidates (previous working deployment)
+    This tool uses CloudWatch Logs Insights to parse API Gateway access logs,
+    extracting HTTP status codes, methods, paths, latencies, and error details.
+    Essential for diagnosing request failures, integration issues, and performance problems.
 
     Args:
         api_id: The API Gateway REST API ID (e.g., "abc123xyz", "142gh05m9a")
-        limit: Maximum number of deployments to return (default: 10, max: 25)
+        stage_name: The stage name (e.g., "test", "prod", "dev")
+        hours_back: Number of hours to look back (default: 1)
+        limit: Maximum number of requests to return (default: 50)
 
     Returns:
         JSON string containing:
         - api_id: REST API ID
-        - deployment_count: Number of deployments found
-        - deployments: Array of deployment details (newest first):
-          - id: Deployment ID
-          - created_date: ISO timestamp when this deployment was created
-          - description: Deployment description if provided
-          - api_stages: List of stages using this deployment
-          - api_summary: Summary of API changes in this deployment
-
-    Investigation Patterns:
-        - Recent deployment correlation: Compare created_date with incident start time
-        - Stage tracking: See which stages are using which deployments
-        - Rapid deployments: Multiple deployments in short time may indicate troubleshooting
-        - Deployment description: Look for clues about what changed
-        - Rollback identification: Find last known good deployment before issues started
+        - stage_name: Stage name
+        - hours_back: Time range searched
+        - request_count: Total number of requests found
+        - error_count: Number of failed requests (4xx/5xx)
+        - requests: Array of parsed requests with:
+          - timestamp: When the request occurred
+          - method: HTTP method (GET, POST, PUT, DELETE, etc.)
+          - path: API resource path
+          - status_code: HTTP status code (200, 403, 502, etc.)
+          - integration_status: Backend integration HTTP status
+          - request_latency_ms: Total request latency
+          - integration_latency_ms: Backend integration latency
+          - error_message: Error message if available
+          - request_id: AWS request ID for correlation
+          - ip: Client IP address (if available)
 
-    Common Deployment Scenarios:
-        - Issue started immediately after deployment: New integration or route has bug
-        - Issue started hours after deployment: Gradual traffic shift or cache problem
-        - Multiple rapid deployments: Team is trying to fix an issue
-        - No recent deployments: Issue is environmental, not API-related
-        - Stage-specific issue: Only one stage affected (check which deployment it's using)
+    Common Error Analysis:
+        - 4xx errors: Client-side errors (bad requests, auth failures, not found)
+          - 400: Bad Request - malformed request
+          - 403: Forbidden - auth/permission issue
+          - 404: Not Found - wrong path or resource
+          - 429: Too Many Requests - throttling
+        - 5xx errors: Server-side errors (integration failures, timeouts)
+          - 500: Internal Server Error - general backend error
+          - 502: Bad Gateway - invalid response from integration
+          - 503: Service Unavailable - integration unavailable
+          - 504: Gateway Timeout - integration timed out
 
-    Investigation Workflow:
-        1. List deployment history to see timeline
-        2. Compare incident start time with recent deployment timestamps
-        3. Identify which deployment each stage is currently using
-        4. Check deployment descriptions for clues about changes
-        5. Identify deployment deployed just before issue started
-        6. Use get_api_gateway_stage_config to compare stage configurations
+    Use Cases:
+        - Error investigation (identify failing requests and status codes)
+        - Integration troubleshooting (check backend integration status)
+        - Performance analysis (analyze latency patterns)
+        - Client debugging (understand request failures)
+        - CORS troubleshooting (identify preflight failures)
+        - Authentication debugging (track 403 errors)
 
-    Integration with Other Tools:
-        - Use with get_api_gateway_stage_config to see current deployment details
-        - Cross-reference timestamps with get_apigateway_logs for correlation
-        - Compare with get_api_gateway_metrics to see performance before/after deployment
-        - Validate against get_api_gateway_access_logs_parsed to confirm error timeline
+    Note: This tool uses CloudWatch Logs Insights which may take several seconds to execute.
+    Access logs must be enabled for the API Gateway stage.
+    """
+    return json.dumps(fetch_api_gateway_access_logs_parsed(api_id, stage_name, hours_back, limit), indent=2, default=str)
 
-    Example Use Cases:
-        - "Did this error start after the latest deployment?" → Check if latest deployment timestamp matches error start time
-        - "What changed in the last deployment?" → Use deployment ID to investigate stage config
-        - "Which deployment should we roll back to?" → Find deployment before issues started
-        - "How frequently is this API deployed?" → Analyze deployment creation patterns
-        - "Which stage is using which deployment?" → Check api_stages for each deployment
 
-    Note: Deployments are returned in reverse chronological order (newest first).
-    A deployment must be associated with a stage to actually serve traffic.
-    """
+def fetch_api_gateway_deployment_history(api_id: str, limit: int = 10) -> Dict[str, Any]:
+    """Retrieve API Gateway deployment history to correlate API changes with incidents."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -625,28 +577,90 @@ def get_api_gateway_deployment_history(api_id: str, limit: int = 10) -> str:
             "deployments": deployment_details
         }
 
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({
+        return {
             "error": str(e),
             "error_type": type(e).__name__,
             "api_id": api_id
-        })
+        }
 
 
 @tool
-def get_api_gateway_metrics(api_id: str, stage_name: str = "test", hours_back: int = 24) -> str:
+def get_api_gateway_deployment_history(api_id: str, limit: int = 10) -> str:
     """
-    Get CloudWatch metrics for an API Gateway.
-    
+    Retrieve API Gateway deployment history to correlate API changes with incidents.
+
+    This tool lists recent deployments for an API Gateway REST API, enabling temporal correlation
+    between API changes and incidents. Critical for determining if an issue started after a
+    deployment of new routes, integrations, or configurations.
+
+    Use this tool when:
+    - Investigating if an issue started after an API deployment
+    - Correlating error timeline with API configuration changes
+    - Analyzing deployment frequency and patterns
+    - Checking what changed between working and failing states
+    - Understanding the deployment history of an API
+    - Identifying rollback candidates (previous working deployment)
+
     Args:
-        api_id: The API Gateway REST API ID
-        stage_name: The stage name (e.g., 'test', 'prod')
-        hours_back: Number of hours to look back (default: 24)
-    
+        api_id: The API Gateway REST API ID (e.g., "abc123xyz", "142gh05m9a")
+        limit: Maximum number of deployments to return (default: 10, max: 25)
+
     Returns:
-        JSON string with API Gateway metrics
+        JSON string containing:
+        - api_id: REST API ID
+        - deployment_count: Number of deployments found
+        - deployments: Array of deployment details (newest first):
+          - id: Deployment ID
+          - created_date: ISO timestamp when this deployment was created
+          - description: Deployment description if provided
+          - api_stages: List of stages using this deployment
+          - api_summary: Summary of API changes in this deployment
+
+    Investigation Patterns:
+        - Recent deployment correlation: Compare created_date with incident start time
+        - Stage tracking: See which stages are using which deployments
+        - Rapid deployments: Multiple deployments in short time may indicate troubleshooting
+        - Deployment description: Look for clues about what changed
+        - Rollback identification: Find last known good deployment before issues started
+
+    Common Deployment Scenarios:
+        - Issue started immediately after deployment: New integration or route has bug
+        - Issue started hours after deployment: Gradual traffic shift or cache problem
+        - Multiple rapid deployments: Team is trying to fix an issue
+        - No recent deployments: Issue is environmental, not API-related
+        - Stage-specific issue: Only one stage affected (check which deployment it's using)
+
+    Investigation Workflow:
+        1. List deployment history to see timeline
+        2. Compare incident start time with recent deployment timestamps
+        3. Identify which deployment each stage is currently using
+        4. Check deployment descriptions for clues about changes
+        5. Identify deployment deployed just before issue started
+        6. Use get_api_gateway_stage_config to compare stage configurations
+
+    Integration with Other Tools:
+        - Use with get_api_gateway_stage_config to see current deployment details
+        - Cross-reference timestamps with get_apigateway_logs for correlation
+        - Compare with get_api_gateway_metrics to see performance before/after deployment
+        - Validate against get_api_gateway_access_logs_parsed to confirm error timeline
+
+    Example Use Cases:
+        - "Did this error start after the latest deployment?" → Check if latest deployment timestamp matches error start time
+        - "What changed in the last deployment?" → Use deployment ID to investigate stage config
+        - "Which deployment should we roll back to?" → Find deployment before issues started
+        - "How frequently is this API deployed?" → Analyze deployment creation patterns
+        - "Which stage is using which deployment?" → Check api_stages for each deployment
+
+    Note: Deployments are returned in reverse chronological order (newest first).
+    A deployment must be associated with a stage to actually serve traffic.
     """
+    return json.dumps(fetch_api_gateway_deployment_history(api_id, limit), indent=2, default=str)
+
+
+def fetch_api_gateway_metrics(api_id: str, stage_name: str = "test", hours_back: int = 24) -> Dict[str, Any]:
+    """Get CloudWatch metrics for an API Gateway."""
     from datetime import datetime, timedelta
     
     try:
@@ -698,6 +712,22 @@ def get_api_gateway_metrics(api_id: str, stage_name: str = "test", hours_back: i
             "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "api_id": api_id, "stage_name": stage_name})
+        return {"error": str(e), "api_id": api_id, "stage_name": stage_name}
+
+
+@tool
+def get_api_gateway_metrics(api_id: str, stage_name: str = "test", hours_back: int = 24) -> str:
+    """
+    Get CloudWatch metrics for an API Gateway.
+    
+    Args:
+        api_id: The API Gateway REST API ID
+        stage_name: The stage name (e.g., 'test', 'prod')
+        hours_back: Number of hours to look back (default: 24)
+    
+    Returns:
+        JSON string with API Gateway metrics
+    """
+    return json.dumps(fetch_api_gateway_metrics(api_id, stage_name, hours_back), indent=2, default=str)
@@ -22,6 +22,7 @@ AWS Health API tools for checking service status and account-specific events.
 """
 
 from strands import tool
+from typing import Dict, Any
 import json
 from datetime import datetime, timedelta
 from ..context import get_aws_client
@@ -30,22 +31,8 @@ from ..utils import get_logger
 logger = get_logger(__name__)
 
 
-@tool
-def check_aws_service_health(service_name: str, region: str = None) -> str:
-    """
-    Check AWS Service Health Dashboard for known issues.
-    This should be called FIRST in any investigation to rule out AWS-side issues.
-    
-    Args:
-        service_name: AWS service code (e.g., 'LAMBDA', 'APIGATEWAY', 'DYNAMODB', 'STATES')
-        region: AWS region (e.g., 'us-east-1'). If None, checks all regions.
-    
-    Returns:
-        JSON with active service events affecting the service
-    
-    Example:
-        check_aws_service_health('LAMBDA', 'us-east-1')
-    """
+def fetch_aws_service_health(service_name: str, region: str = None) -> Dict[str, Any]:
+    """Check AWS Service Health Dashboard for known issues."""
     try:
         # Get AWS client from context (singleton pattern)
         aws_client = get_aws_client()
@@ -68,7 +55,7 @@ def check_aws_service_health(service_name: str, region: str = None) -> str:
         
         if events:
             logger.info(f"⚠️ AWS Service Health: {len(events)} active events for {service_name}")
-            return json.dumps({
+            return {
                 "aws_service_issue_detected": True,
                 "service": service_name,
                 "region": region or "all_regions",
@@ -85,40 +72,46 @@ def check_aws_service_health(service_name: str, region: str = None) -> str:
                     }
                     for e in events
                 ]
-            }, indent=2)
+            }
         
         logger.info(f"✅ AWS Service Health: No active events for {service_name}")
-        return json.dumps({
+        return {
             "aws_service_issue_detected": False,
             "service": service_name,
             "region": region or "all_regions",
             "message": "No active AWS service events detected"
-        }, indent=2)
+        }
         
     except Exception as e:
         logger.warning(f"Failed to check AWS Health for {service_name}: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "service": service_name,
             "note": "AWS Health API requires Business or Enterprise support plan"
-        }, indent=2)
+        }
 
 
 @tool
-def get_account_health_events(hours_back: int = 24) -> str:
+def check_aws_service_health(service_name: str, region: str = None) -> str:
     """
-    Get all AWS Health events affecting this account in the last N hours.
-    Useful for identifying account-wide issues or multiple service problems.
+    Check AWS Service Health Dashboard for known issues.
+    This should be called FIRST in any investigation to rule out AWS-side issues.
     
     Args:
-        hours_back: How many hours to look back (default: 24)
+        service_name: AWS service code (e.g., 'LAMBDA', 'APIGATEWAY', 'DYNAMODB', 'STATES')
+        region: AWS region (e.g., 'us-east-1'). If None, checks all regions.
     
     Returns:
-        JSON with account-specific health events
+        JSON with active service events affecting the service
     
     Example:
-        get_account_health_events(24)
+        check_aws_service_health('LAMBDA', 'us-east-1')
     """
+    return json.dumps(fetch_aws_service_health(service_name, region), indent=2, default=str)
+
+
+def fetch_account_health_events(hours_back: int = 24) -> Dict[str, Any]:
+    """Get all AWS Health events affecting this account in the last N hours."""
     try:
         # Get AWS client from context (singleton pattern)
         aws_client = get_aws_client()
@@ -145,7 +138,7 @@ def get_account_health_events(hours_back: int = 24) -> str:
         
         logger.info(f"📊 AWS Health: Found {len(events)} events in last {hours_back} hours")
         
-        return json.dumps({
+        return {
             "total_events": len(events),
             "time_range_hours": hours_back,
             "services_affected": list(events_by_service.keys()),
@@ -166,32 +159,36 @@ def get_account_health_events(hours_back: int = 24) -> str:
                 }
                 for e in events
             ]
-        }, indent=2)
+        }
         
     except Exception as e:
         logger.warning(f"Failed to get account health events: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "note": "AWS Health API requires Business or Enterprise support plan"
-        }, indent=2)
+        }
 
 
 @tool
-def check_service_quota_status(service_code: str, quota_code: str = None) -> str:
+def get_account_health_events(hours_back: int = 24) -> str:
     """
-    Check Service Quotas to identify if limits are being hit.
-    Common cause of AWS issues is hitting service quotas.
+    Get all AWS Health events affecting this account in the last N hours.
+    Useful for identifying account-wide issues or multiple service problems.
     
     Args:
-        service_code: AWS service code (e.g., 'lambda', 'apigateway', 'dynamodb')
-        quota_code: Specific quota code (optional). If None, returns all quotas.
+        hours_back: How many hours to look back (default: 24)
     
     Returns:
-        JSON with quota information and usage
+        JSON with account-specific health events
     
     Example:
-        check_service_quota_status('lambda', 'L-B99A9384')  # Concurrent executions
+        get_account_health_events(24)
     """
+    return json.dumps(fetch_account_health_events(hours_back), indent=2, default=str)
+
+
+def fetch_service_quota_status(service_code: str, quota_code: str = None) -> Dict[str, Any]:
+    """Check Service Quotas to identify if limits are being hit."""
     try:
         # Get AWS client from context (singleton pattern)
         aws_client = get_aws_client()
@@ -205,7 +202,7 @@ def check_service_quota_status(service_code: str, quota_code: str = None) -> str
             )
             quota = response.get('Quota', {})
             
-            return json.dumps({
+            return {
                 "service": service_code,
                 "quota_name": quota.get('QuotaName'),
                 "quota_code": quota_code,
@@ -213,7 +210,7 @@ def check_service_quota_status(service_code: str, quota_code: str = None) -> str
                 "unit": quota.get('Unit'),
                 "adjustable": quota.get('Adjustable'),
                 "global_quota": quota.get('GlobalQuota')
-            }, indent=2)
+            }
         else:
             # List common quotas for the service
             response = quotas_client.list_service_quotas(
@@ -223,7 +220,7 @@ def check_service_quota_status(service_code: str, quota_code: str = None) -> str
             
             quotas = response.get('Quotas', [])
             
-            return json.dumps({
+            return {
                 "service": service_code,
                 "total_quotas": len(quotas),
                 "quotas": [
@@ -236,11 +233,30 @@ def check_service_quota_status(service_code: str, quota_code: str = None) -> str
                     }
                     for q in quotas[:10]  # Top 10
                 ]
-            }, indent=2)
+            }
             
     except Exception as e:
         logger.warning(f"Failed to check service quotas: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "service": service_code
-        }, indent=2)
+        }
+
+
+@tool
+def check_service_quota_status(service_code: str, quota_code: str = None) -> str:
+    """
+    Check Service Quotas to identify if limits are being hit.
+    Common cause of AWS issues is hitting service quotas.
+    
+    Args:
+        service_code: AWS service code (e.g., 'lambda', 'apigateway', 'dynamodb')
+        quota_code: Specific quota code (optional). If None, returns all quotas.
+    
+    Returns:
+        JSON with quota information and usage
+    
+    Example:
+        check_service_quota_status('lambda', 'L-B99A9384')  # Concurrent executions
+    """
+    return json.dumps(fetch_service_quota_status(service_code, quota_code), indent=2, default=str)
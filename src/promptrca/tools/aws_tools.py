@@ -26,18 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_api_gateway_stage_config(api_id: str, stage_name: str) -> str:
-    """
-    Get API Gateway stage configuration including integration details (Lambda, Step Functions, etc.).
-
-    Args:
-        api_id: The API Gateway REST API ID
-        stage_name: The stage name (e.g., 'test', 'prod')
-
-    Returns:
-        JSON string with stage configuration and integration details
-    """
+def fetch_api_gateway_stage_config(api_id: str, stage_name: str) -> Dict[str, Any]:
+    """Get API Gateway stage configuration including integration details (Lambda, Step Functions, etc.)."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -107,22 +97,28 @@ def get_api_gateway_stage_config(api_id: str, stage_name: str) -> str:
             "last_updated_date": str(stage_response.get('lastUpdatedDate'))
         }
 
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "api_id": api_id, "stage": stage_name})
+        return {"error": str(e), "api_id": api_id, "stage": stage_name}
 
 
 @tool
-def get_iam_role_config(role_name: str) -> str:
+def get_api_gateway_stage_config(api_id: str, stage_name: str) -> str:
     """
-    Get IAM role configuration including trust policy and attached policies.
-    
+    Get API Gateway stage configuration including integration details (Lambda, Step Functions, etc.).
+
     Args:
-        role_name: The IAM role name
-    
+        api_id: The API Gateway REST API ID
+        stage_name: The stage name (e.g., 'test', 'prod')
+
     Returns:
-        JSON string with role configuration
+        JSON string with stage configuration and integration details
     """
+    return json.dumps(fetch_api_gateway_stage_config(api_id, stage_name), indent=2, default=str)
+
+
+def fetch_iam_role_config(role_name: str) -> Dict[str, Any]:
+    """Get IAM role configuration including trust policy and attached policies."""
     from urllib.parse import unquote
     
     try:
@@ -166,22 +162,27 @@ def get_iam_role_config(role_name: str) -> str:
             "max_session_duration": role.get('MaxSessionDuration')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "role_name": role_name})
+        return {"error": str(e), "role_name": role_name}
 
 
 @tool
-def get_lambda_config(function_name: str) -> str:
+def get_iam_role_config(role_name: str) -> str:
     """
-    Get Lambda function configuration including environment variables and IAM role.
+    Get IAM role configuration including trust policy and attached policies.
     
     Args:
-        function_name: The Lambda function name
+        role_name: The IAM role name
     
     Returns:
-        JSON string with Lambda configuration
+        JSON string with role configuration
     """
+    return json.dumps(fetch_iam_role_config(role_name), indent=2, default=str)
+
+
+def fetch_lambda_config(function_name: str) -> Dict[str, Any]:
+    """Get Lambda function configuration including environment variables and IAM role."""
     
     try:
         # Get AWS client from context
@@ -204,22 +205,27 @@ def get_lambda_config(function_name: str) -> str:
             "last_modified": response.get('LastModified')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "function_name": function_name})
+        return {"error": str(e), "function_name": function_name}
 
 
 @tool
-def get_stepfunctions_definition(state_machine_arn: str) -> str:
+def get_lambda_config(function_name: str) -> str:
     """
-    Get Step Functions state machine definition.
+    Get Lambda function configuration including environment variables and IAM role.
     
     Args:
-        state_machine_arn: The state machine ARN
+        function_name: The Lambda function name
     
     Returns:
-        JSON string with state machine definition
+        JSON string with Lambda configuration
     """
+    return json.dumps(fetch_lambda_config(function_name), indent=2, default=str)
+
+
+def fetch_stepfunctions_definition(state_machine_arn: str) -> Dict[str, Any]:
+    """Get Step Functions state machine definition."""
     
     try:
         # Get AWS client from context
@@ -239,22 +245,27 @@ def get_stepfunctions_definition(state_machine_arn: str) -> str:
             "tracing_configuration": response.get('tracingConfiguration', {})
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "state_machine_arn": state_machine_arn})
+        return {"error": str(e), "state_machine_arn": state_machine_arn}
 
 
 @tool
-def get_xray_trace(trace_id: str) -> str:
+def get_stepfunctions_definition(state_machine_arn: str) -> str:
     """
-    Get X-Ray trace details.
+    Get Step Functions state machine definition.
     
     Args:
-        trace_id: The X-Ray trace ID
+        state_machine_arn: The state machine ARN
     
     Returns:
-        JSON string with trace details
+        JSON string with state machine definition
     """
+    return json.dumps(fetch_stepfunctions_definition(state_machine_arn), indent=2, default=str)
+
+
+def fetch_xray_trace(trace_id: str) -> Dict[str, Any]:
+    """Get X-Ray trace details."""
     
     try:
         # Get AWS client from context
@@ -271,25 +282,29 @@ def get_xray_trace(trace_id: str) -> str:
                 "segments": trace.get('Segments', []),
                 "is_partial": trace.get('IsPartial', False)
             }
-            return json.dumps(config, indent=2)
+            return config
         else:
-            return json.dumps({"error": "Trace not found", "trace_id": trace_id})
+            return {"error": "Trace not found", "trace_id": trace_id}
     except Exception as e:
-        return json.dumps({"error": str(e), "trace_id": trace_id})
+        return {"error": str(e), "trace_id": trace_id}
 
 
 @tool
-def get_cloudwatch_logs(log_group: str, hours_back: int = 1) -> str:
+def get_xray_trace(trace_id: str) -> str:
     """
-    Get CloudWatch logs for a log group.
+    Get X-Ray trace details.
     
     Args:
-        log_group: The CloudWatch log group name
-        hours_back: Number of hours to look back (default: 1)
+        trace_id: The X-Ray trace ID
     
     Returns:
-        JSON string with log events
+        JSON string with trace details
     """
+    return json.dumps(fetch_xray_trace(trace_id), indent=2, default=str)
+
+
+def fetch_cloudwatch_logs(log_group: str, hours_back: int = 1) -> Dict[str, Any]:
+    """Get CloudWatch logs for a log group."""
     from datetime import datetime, timedelta
     
     try:
@@ -332,23 +347,28 @@ def get_cloudwatch_logs(log_group: str, hours_back: int = 1) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "log_group": log_group})
+        return {"error": str(e), "log_group": log_group}
 
 
 @tool
-def get_lambda_logs(function_name: str, hours_back: int = 1) -> str:
+def get_cloudwatch_logs(log_group: str, hours_back: int = 1) -> str:
     """
-    Get CloudWatch logs for a Lambda function.
+    Get CloudWatch logs for a log group.
     
     Args:
-        function_name: The Lambda function name
+        log_group: The CloudWatch log group name
         hours_back: Number of hours to look back (default: 1)
     
     Returns:
-        JSON string with Lambda log events
+        JSON string with log events
     """
+    return json.dumps(fetch_cloudwatch_logs(log_group, hours_back), indent=2, default=str)
+
+
+def fetch_lambda_logs(function_name: str, hours_back: int = 1) -> Dict[str, Any]:
+    """Get CloudWatch logs for a Lambda function."""
     from datetime import datetime, timedelta
     
     try:
@@ -395,24 +415,28 @@ def get_lambda_logs(function_name: str, hours_back: int = 1) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "function_name": function_name})
+        return {"error": str(e), "function_name": function_name}
 
 
 @tool
-def get_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int = 1) -> str:
+def get_lambda_logs(function_name: str, hours_back: int = 1) -> str:
     """
-    Get CloudWatch logs for an API Gateway.
+    Get CloudWatch logs for a Lambda function.
     
     Args:
-        api_id: The API Gateway REST API ID
-        stage_name: The stage name (e.g., 'test', 'prod')
+        function_name: The Lambda function name
         hours_back: Number of hours to look back (default: 1)
     
     Returns:
-        JSON string with API Gateway log events
+        JSON string with Lambda log events
     """
+    return json.dumps(fetch_lambda_logs(function_name, hours_back), indent=2, default=str)
+
+
+def fetch_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int = 1) -> Dict[str, Any]:
+    """Get CloudWatch logs for an API Gateway."""
     from datetime import datetime, timedelta
     
     try:
@@ -460,23 +484,29 @@ def get_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int =
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "api_id": api_id, "stage_name": stage_name})
+        return {"error": str(e), "api_id": api_id, "stage_name": stage_name}
 
 
 @tool
-def get_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> str:
+def get_apigateway_logs(api_id: str, stage_name: str = "test", hours_back: int = 1) -> str:
     """
-    Get CloudWatch logs for a Step Functions state machine.
+    Get CloudWatch logs for an API Gateway.
     
     Args:
-        state_machine_arn: The Step Functions state machine ARN
+        api_id: The API Gateway REST API ID
+        stage_name: The stage name (e.g., 'test', 'prod')
         hours_back: Number of hours to look back (default: 1)
     
     Returns:
-        JSON string with Step Functions log events
+        JSON string with API Gateway log events
     """
+    return json.dumps(fetch_apigateway_logs(api_id, stage_name, hours_back), indent=2, default=str)
+
+
+def fetch_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> Dict[str, Any]:
+    """Get CloudWatch logs for a Step Functions state machine."""
     from datetime import datetime, timedelta
     
     try:
@@ -527,7 +557,22 @@ def get_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "state_machine_arn": state_machine_arn})
+        return {"error": str(e), "state_machine_arn": state_machine_arn}
+
+
+@tool
+def get_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> str:
+    """
+    Get CloudWatch logs for a Step Functions state machine.
+    
+    Args:
+        state_machine_arn: The Step Functions state machine ARN
+        hours_back: Number of hours to look back (default: 1)
+    
+    Returns:
+        JSON string with Step Functions log events
+    """
+    return json.dumps(fetch_stepfunctions_logs(state_machine_arn, hours_back), indent=2, default=str)
 
@@ -22,6 +22,7 @@ CloudTrail tools for tracking configuration changes and correlating with inciden
 """
 
 from strands import tool
+from typing import Dict, Any
 import json
 from datetime import datetime, timedelta
 from ..context import get_aws_client
@@ -30,27 +31,12 @@ from ..utils import get_logger
 logger = get_logger(__name__)
 
 
-@tool
-def get_recent_cloudtrail_events(
+def fetch_recent_cloudtrail_events(
     resource_name: str,
     hours_back: int = 24,
     event_category: str = "Management"
-) -> str:
-    """
-    Get recent CloudTrail events for a resource to identify configuration changes.
-    Essential for "what changed?" analysis in RCA.
-    
-    Args:
-        resource_name: Resource name (e.g., Lambda function name, API Gateway ID)
-        hours_back: How many hours to look back (default: 24)
-        event_category: Event category - 'Management' for config changes, 'Data' for data events
-    
-    Returns:
-        JSON with recent CloudTrail events showing configuration changes
-    
-    Example:
-        get_recent_cloudtrail_events('my-lambda-function', 24)
-    """
+) -> Dict[str, Any]:
+    """Get recent CloudTrail events for a resource to identify configuration changes."""
     try:
         # Get AWS client from context (singleton pattern)
         aws_client = get_aws_client()
@@ -80,7 +66,7 @@ def get_recent_cloudtrail_events(
         
         logger.info(f"📋 CloudTrail: Found {len(write_events)} configuration changes for {resource_name}")
         
-        return json.dumps({
+        return {
             "resource_name": resource_name,
             "total_events": len(write_events),
             "time_range_hours": hours_back,
@@ -105,38 +91,47 @@ def get_recent_cloudtrail_events(
                 }
                 for e in write_events[:15]  # Top 15 most recent
             ]
-        }, indent=2)
+        }
         
     except Exception as e:
         logger.warning(f"Failed to get CloudTrail events for {resource_name}: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "resource_name": resource_name,
             "note": "CloudTrail may not be enabled or resource name may not match"
-        }, indent=2)
+        }
 
 
 @tool
-def find_correlated_changes(
-    incident_time: str,
-    window_minutes: int = 30,
-    services: str = "lambda,apigateway,iam,dynamodb"
+def get_recent_cloudtrail_events(
+    resource_name: str,
+    hours_back: int = 24,
+    event_category: str = "Management"
 ) -> str:
     """
-    Find all AWS configuration changes around the incident time.
-    Critical for identifying what changed before the incident started.
+    Get recent CloudTrail events for a resource to identify configuration changes.
+    Essential for "what changed?" analysis in RCA.
     
     Args:
-        incident_time: ISO timestamp of incident (e.g., "2025-01-20T10:30:00Z")
-        window_minutes: Time window BEFORE incident to check (default: 30)
-        services: Comma-separated AWS services to check (default: lambda,apigateway,iam,dynamodb)
+        resource_name: Resource name (e.g., Lambda function name, API Gateway ID)
+        hours_back: How many hours to look back (default: 24)
+        event_category: Event category - 'Management' for config changes, 'Data' for data events
     
     Returns:
-        JSON with correlated configuration changes grouped by service
+        JSON with recent CloudTrail events showing configuration changes
     
     Example:
-        find_correlated_changes("2025-01-20T10:30:00Z", 30, "lambda,iam")
+        get_recent_cloudtrail_events('my-lambda-function', 24)
     """
+    return json.dumps(fetch_recent_cloudtrail_events(resource_name, hours_back, event_category), indent=2, default=str)
+
+
+def fetch_correlated_changes(
+    incident_time: str,
+    window_minutes: int = 30,
+    services: str = "lambda,apigateway,iam,dynamodb"
+) -> Dict[str, Any]:
+    """Find all AWS configuration changes around the incident time."""
     try:
         # Get AWS client from context (singleton pattern)
         aws_client = get_aws_client()
@@ -191,7 +186,7 @@ def find_correlated_changes(
         
         logger.info(f"🔍 CloudTrail: Found {len(write_events)} changes in {window_minutes}min before incident")
         
-        return json.dumps({
+        return {
             "incident_time": incident_time,
             "window_minutes": window_minutes,
             "total_changes": len(write_events),
@@ -210,34 +205,45 @@ def find_correlated_changes(
                     for event in events
                 )
             }
-        }, indent=2)
+        }
         
     except Exception as e:
         logger.warning(f"Failed to find correlated changes: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "incident_time": incident_time
-        }, indent=2)
+        }
 
 
 @tool
-def get_iam_policy_changes(
-    role_name: str,
-    hours_back: int = 168
+def find_correlated_changes(
+    incident_time: str,
+    window_minutes: int = 30,
+    services: str = "lambda,apigateway,iam,dynamodb"
 ) -> str:
     """
-    Get IAM policy changes for a role. Essential for permission-related RCA.
+    Find all AWS configuration changes around the incident time.
+    Critical for identifying what changed before the incident started.
     
     Args:
-        role_name: IAM role name
-        hours_back: How many hours to look back (default: 168 = 7 days)
+        incident_time: ISO timestamp of incident (e.g., "2025-01-20T10:30:00Z")
+        window_minutes: Time window BEFORE incident to check (default: 30)
+        services: Comma-separated AWS services to check (default: lambda,apigateway,iam,dynamodb)
     
     Returns:
-        JSON with IAM policy changes
+        JSON with correlated configuration changes grouped by service
     
     Example:
-        get_iam_policy_changes('my-lambda-execution-role', 168)
+        find_correlated_changes("2025-01-20T10:30:00Z", 30, "lambda,iam")
     """
+    return json.dumps(fetch_correlated_changes(incident_time, window_minutes, services), indent=2, default=str)
+
+
+def fetch_iam_policy_changes(
+    role_name: str,
+    hours_back: int = 168
+) -> Dict[str, Any]:
+    """Get IAM policy changes for a role. Essential for permission-related RCA."""
     try:
         # Get AWS client from context (singleton pattern)
         aws_client = get_aws_client()
@@ -271,7 +277,7 @@ def get_iam_policy_changes(
         
         logger.info(f"🔐 CloudTrail: Found {len(iam_events)} IAM policy changes for {role_name}")
         
-        return json.dumps({
+        return {
             "role_name": role_name,
             "total_policy_changes": len(iam_events),
             "time_range_hours": hours_back,
@@ -285,11 +291,32 @@ def get_iam_policy_changes(
                 }
                 for e in iam_events
             ]
-        }, indent=2)
+        }
         
     except Exception as e:
         logger.warning(f"Failed to get IAM policy changes: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "role_name": role_name
-        }, indent=2)
+        }
+
+
+@tool
+def get_iam_policy_changes(
+    role_name: str,
+    hours_back: int = 168
+) -> str:
+    """
+    Get IAM policy changes for a role. Essential for permission-related RCA.
+    
+    Args:
+        role_name: IAM role name
+        hours_back: How many hours to look back (default: 168 = 7 days)
+    
+    Returns:
+        JSON with IAM policy changes
+    
+    Example:
+        get_iam_policy_changes('my-lambda-execution-role', 168)
+    """
+    return json.dumps(fetch_iam_policy_changes(role_name, hours_back), indent=2, default=str)
@@ -26,18 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_cloudwatch_logs(log_group: str, hours_back: int = 1) -> str:
-    """
-    Get CloudWatch logs for a log group.
-    
-    Args:
-        log_group: The CloudWatch log group name
-        hours_back: Number of hours to look back (default: 1)
-    
-    Returns:
-        JSON string with log events
-    """
+def fetch_cloudwatch_logs(log_group: str, hours_back: int = 1) -> Dict[str, Any]:
+    """Get CloudWatch logs for a log group."""
     
     from datetime import datetime, timedelta
     
@@ -81,140 +71,59 @@ def get_cloudwatch_logs(log_group: str, hours_back: int = 1) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "log_group": log_group})
+        return {"error": str(e), "log_group": log_group}
 
 
 @tool
-def query_logs_by_trace_id(query: str) -> str:
+def get_cloudwatch_logs(log_group: str, hours_back: int = 1) -> str:
     """
-    Query CloudWatch Logs Insights for ALL logs related to a specific X-Ray trace ID.
-    This is THE KEY tool for trace-driven investigation - it correlates logs with traces.
-
+    Get CloudWatch logs for a log group.
+    
     Args:
-        trace_id: The X-Ray trace ID to search for (e.g., "1-68e915e7-7a2c7c6d1427db5e5b97c431")
-
+        log_group: The CloudWatch log group name
+        hours_back: Number of hours to look back (default: 1)
+    
     Returns:
-        JSON string with all logs matching the trace ID across all log groups
+        JSON string with log events
     """
-    
-    import time
-    from datetime import datetime, timedelta
-    
-    try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('logs')
-
-        # CloudWatch Insights query to find logs with this trace ID
-        query = f'''
-        fields @timestamp, @message, @logStream, @log
-        | filter @message like /{trace_id}/
-        | sort @timestamp desc
-        | limit 100
-        '''
-
-        # Start the query (24 hours lookback)
-        start_time = int((datetime.now() - timedelta(hours=24)).timestamp())
-        end_time = int(datetime.now().timestamp())
-
-        # Try to find existing log groups
-        existing_log_groups = []
-        try:
-            paginator = client.get_paginator('describe_log_groups')
-            for page in paginator.paginate():
-                for log_group in page.get('logGroups', []):
-                    log_group_name = log_group['logGroupName']
-                    # Include Lambda, Step Functions, and API Gateway logs
-                    if any(prefix in log_group_name for prefix in ['/aws/lambda/', '/aws/stepfunctions/', 'API-Gateway-Execution-Logs']):
-                        existing_log_groups.append(log_group_name)
-                        if len(existing_log_groups) >= 20:  # Limit to 20 log groups
-                            break
-                if len(existing_log_groups) >= 20:
-                    break
-        except Exception as e:
-            return json.dumps({
-                "trace_id": trace_id,
-                "error": f"Failed to list log groups: {str(e)}"
-            })
-
-        if not existing_log_groups:
-            return json.dumps({
-                "trace_id": trace_id,
-                "error": "No serverless log groups found",
-                "searched_patterns": ["/aws/lambda/", "/aws/stepfunctions/", "API-Gateway-Execution-Logs"]
-            })
+    return json.dumps(fetch_cloudwatch_logs(log_group, hours_back), indent=2, default=str)
 
-        # Start Insights query
-        response = client.start_query(
-            logGroupNames=existing_log_groups,
-            startTime=start_time,
-            endTime=end_time,
-            queryString=query
-        )
-
-        query_id = response['queryId']
-
-        # Wait for query to complete (max 30 seconds)
-        max_wait = 30
-        waited = 0
-        while waited < max_wait:
-            time.sleep(1)
-            waited += 1
-
-            result = client.get_query_results(queryId=query_id)
-            status = result['status']
-
-            if status == 'Complete':
-                logs = []
-                for result_row in result.get('results', []):
-                    log_entry = {}
-                    for field in result_row:
-                        log_entry[field['field']] = field['value']
-                    logs.append(log_entry)
-
-                return json.dumps({
-                    "trace_id": trace_id,
-                    "log_groups_searched": existing_log_groups,
-                    "match_count": len(logs),
-                    "logs": logs[:50],  # Return top 50 matches
-                    "query": query
-                }, indent=2)
 
-            elif status in ['Failed', 'Cancelled']:
-                return json.dumps({
-                    "trace_id": trace_id,
-                    "error": f"Query {status.lower()}",
-                    "status": status
-                })
-
-        # Timeout
-        return json.dumps({
-            "trace_id": trace_id,
-            "error": "Query timeout after 30 seconds",
-            "status": "Timeout"
-        })
+def fetch_logs_by_trace_id(trace_id: str) -> Dict[str, Any]:
+    """Query CloudWatch Logs Insights for ALL logs related to a specific X-Ray trace ID."""
+    from .trace_log_correlation import correlate_trace_logs
 
+    try:
+        result = correlate_trace_logs(trace_id)
+        if "logs" in result:
+            result["logs"] = result["logs"][:50]  # Return top 50 matches
+        return result
     except Exception as e:
-        return json.dumps({"error": str(e), "trace_id": trace_id})
+        return {"error": str(e), "trace_id": trace_id}
 
 
 @tool
-def get_cloudwatch_metrics(metric_name: str, hours_back: int = 24) -> str:
+def query_logs_by_trace_id(trace_id: str) -> str:
     """
-    Get CloudWatch metrics for a specific namespace and metric.
-    
+    Query CloudWatch Logs Insights for ALL logs related to a specific X-Ray trace ID.
+    This is THE KEY tool for trace-driven investigation - it correlates logs with traces.
+
+    The trace is used to find exactly which log groups, request IDs and time
+    ranges are involved, and one narrow query per log group is run in parallel.
+
     Args:
-        namespace: The CloudWatch namespace (e.g., "AWS/Lambda", "AWS/ApiGateway")
-        metric_name: The metric name (e.g., "Invocations", "Errors")
-        dimensions: List of dimension dictionaries (e.g., [{"Name": "FunctionName", "Value": "my-function"}])
-        hours_back: Number of hours to look back (default: 24)
-    
+        trace_id: The X-Ray trace ID to search for (e.g., "1-68e915e7-7a2c7c6d1427db5e5b97c431")
+
     Returns:
-        JSON string with metric data
+        JSON string with the logs of every log group the trace touched
     """
+    return json.dumps(fetch_logs_by_trace_id(trace_id), indent=2, default=str)
+
+
+def fetch_cloudwatch_metrics(metric_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Get CloudWatch metrics for a specific namespace and metric."""
     
     from datetime import datetime, timedelta
     
@@ -253,22 +162,30 @@ def get_cloudwatch_metrics(metric_name: str, hours_back: int = 24) -> str:
             "datapoints": response.get('Datapoints', [])
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "namespace": namespace, "metric_name": metric_name})
+        return {"error": str(e), "namespace": namespace, "metric_name": metric_name}
 
 
 @tool
-def get_cloudwatch_alarms(alarm_name: str) -> str:
+def get_cloudwatch_metrics(metric_name: str, hours_back: int = 24) -> str:
     """
-    Get CloudWatch alarms and their status.
+    Get CloudWatch metrics for a specific namespace and metric.
     
     Args:
-        alarm_names: Optional list of alarm names to filter by
+        namespace: The CloudWatch namespace (e.g., "AWS/Lambda", "AWS/ApiGateway")
+        metric_name: The metric name (e.g., "Invocations", "Errors")
+        dimensions: List of dimension dictionaries (e.g., [{"Name": "FunctionName", "Value": "my-function"}])
+        hours_back: Number of hours to look back (default: 24)
     
     Returns:
-        JSON string with alarm information
+        JSON string with metric data
     """
+    return json.dumps(fetch_cloudwatch_metrics(metric_name, hours_back), indent=2, default=str)
+
+
+def fetch_cloudwatch_alarms(alarm_name: str) -> Dict[str, Any]:
+    """Get CloudWatch alarms and their status."""
     
     try:
         # Get AWS client from context
@@ -303,21 +220,27 @@ def get_cloudwatch_alarms(alarm_name: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "alarm_names": alarm_names})
+        return {"error": str(e), "alarm_names": alarm_names}
 
 
 @tool
-def list_cloudwatch_dashboards(list: str) -> str:
+def get_cloudwatch_alarms(alarm_name: str) -> str:
     """
-    List CloudWatch dashboards.
+    Get CloudWatch alarms and their status.
     
     Args:
+        alarm_names: Optional list of alarm names to filter by
     
     Returns:
-        JSON string with dashboard information
+        JSON string with alarm information
     """
+    return json.dumps(fetch_cloudwatch_alarms(alarm_name), indent=2, default=str)
+
+
+def fetch_cloudwatch_dashboards(list: str) -> Dict[str, Any]:
+    """List CloudWatch dashboards."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -339,6 +262,19 @@ def list_cloudwatch_dashboards(list: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return {"error": str(e)}
+
+
+@tool
+def list_cloudwatch_dashboards(list: str) -> str:
+    """
+    List CloudWatch dashboards.
+    
+    Args:
+    
+    Returns:
+        JSON string with dashboard information
+    """
+    return json.dumps(fetch_cloudwatch_dashboards(list), indent=2, default=str)
@@ -26,6 +26,40 @@ import json
 from ..context import get_aws_client
 
 
+def fetch_dynamodb_table_config(table_name: str) -> Dict[str, Any]:
+    """Retrieve comprehensive DynamoDB table configuration for capacity and performance analysis."""
+    try:
+        # Get AWS client from context
+        aws_client = get_aws_client()
+        region = aws_client.region
+        client = aws_client.get_client('dynamodb')
+        response = client.describe_table(TableName=table_name)
+        table = response['Table']
+        
+        config = {
+            "table_name": table.get('TableName'),
+            "table_arn": table.get('TableArn'),
+            "table_status": table.get('TableStatus'),
+            "creation_date": str(table.get('CreationDateTime')),
+            "item_count": table.get('ItemCount', 0),
+            "table_size_bytes": table.get('TableSizeBytes', 0),
+            "key_schema": table.get('KeySchema', []),
+            "attribute_definitions": table.get('AttributeDefinitions', []),
+            "provisioned_throughput": table.get('ProvisionedThroughput', {}),
+            "billing_mode": table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED'),
+            "global_secondary_indexes": table.get('GlobalSecondaryIndexes', []),
+            "local_secondary_indexes": table.get('LocalSecondaryIndexes', []),
+            "stream_specification": table.get('StreamSpecification', {}),
+            "sse_description": table.get('SSEDescription', {}),
+            "archival_summary": table.get('ArchivalSummary', {}),
+            "table_class": table.get('TableClass', 'STANDARD')
+        }
+        
+        return config
+    except Exception as e:
+        return {"error": str(e), "table_name": table_name}
+
+
 @tool
 def get_dynamodb_table_config(table_name: str) -> str:
     """
@@ -78,36 +112,62 @@ def get_dynamodb_table_config(table_name: str) -> str:
     
     Note: This tool provides the current configuration, not historical changes.
     """
+    return json.dumps(fetch_dynamodb_table_config(table_name), indent=2, default=str)
+
+
+def fetch_dynamodb_table_metrics(table_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Retrieve CloudWatch metrics for DynamoDB table performance and throttling analysis."""
+    from datetime import datetime, timedelta
+
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
         region = aws_client.region
-        client = aws_client.get_client('dynamodb')
-        response = client.describe_table(TableName=table_name)
-        table = response['Table']
+        client = aws_client.get_client('cloudwatch')
+        
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(hours=hours_back)
+        
+        metrics = {}
+        
+        # Common DynamoDB metrics
+        metric_names = [
+            'ConsumedReadCapacityUnits', 'ConsumedWriteCapacityUnits',
+            'ReadThrottleEvents', 'WriteThrottleEvents',
+            'SuccessfulRequestLatency', 'UserErrors', 'SystemErrors'
+        ]
+        
+        for metric_name in metric_names:
+            response = client.get_metric_statistics(
+                Namespace='AWS/DynamoDB',
+                MetricName=metric_name,
+                Dimensions=[
+                    {
+                        'Name': 'TableName',
+                        'Value': table_name
+                    }
+                ],
+                StartTime=start_time,
+                EndTime=end_time,
+                Period=3600,  # 1 hour periods
+                Statistics=['Sum', 'Average', 'Maximum']
+            )
+            
+            metrics[metric_name] = response.get('Datapoints', [])
         
         config = {
-            "table_name": table.get('TableName'),
-            "table_arn": table.get('TableArn'),
-            "table_status": table.get('TableStatus'),
-            "creation_date": str(table.get('CreationDateTime')),
-            "item_count": table.get('ItemCount', 0),
-            "table_size_bytes": table.get('TableSizeBytes', 0),
-            "key_schema": table.get('KeySchema', []),
-            "attribute_definitions": table.get('AttributeDefinitions', []),
-            "provisioned_throughput": table.get('ProvisionedThroughput', {}),
-            "billing_mode": table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED'),
-            "global_secondary_indexes": table.get('GlobalSecondaryIndexes', []),
-            "local_secondary_indexes": table.get('LocalSecondaryIndexes', []),
-            "stream_specification": table.get('StreamSpecification', {}),
-            "sse_description": table.get('SSEDescription', {}),
-            "archival_summary": table.get('ArchivalSummary', {}),
-            "table_class": table.get('TableClass', 'STANDARD')
+            "table_name": table_name,
+            "time_range": {
+                "start": start_time.isoformat(),
+                "end": end_time.isoformat(),
+                "hours_back": hours_back
+            },
+            "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "table_name": table_name})
+        return {"error": str(e), "table_name": table_name}
 
 
 @tool
@@ -154,57 +214,55 @@ def get_dynamodb_table_metrics(table_name: str, hours_back: int = 24) -> str:
     
     Note: Metrics are aggregated in 1-hour periods for the specified time range.
     """
-    from datetime import datetime, timedelta
+    return json.dumps(fetch_dynamodb_table_metrics(table_name, hours_back), indent=2, default=str)
+
 
+def fetch_dynamodb_streams(table_name: str) -> Dict[str, Any]:
+    """Retrieve DynamoDB Streams configuration for real-time data processing analysis."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
         region = aws_client.region
-        client = aws_client.get_client('cloudwatch')
-        
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours_back)
-        
-        metrics = {}
-        
-        # Common DynamoDB metrics
-        metric_names = [
-            'ConsumedReadCapacityUnits', 'ConsumedWriteCapacityUnits',
-            'ReadThrottleEvents', 'WriteThrottleEvents',
-            'SuccessfulRequestLatency', 'UserErrors', 'SystemErrors'
-        ]
+        client = aws_client.get_client('dynamodb')
+        response = client.describe_table(TableName=table_name)
+        table = response['Table']
         
-        for metric_name in metric_names:
-            response = client.get_metric_statistics(
-                Namespace='AWS/DynamoDB',
-                MetricName=metric_name,
-                Dimensions=[
-                    {
-                        'Name': 'TableName',
-                        'Value': table_name
-                    }
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=3600,  # 1 hour periods
-                Statistics=['Sum', 'Average', 'Maximum']
-            )
-            
-            metrics[metric_name] = response.get('Datapoints', [])
+        stream_spec = table.get('StreamSpecification', {})
         
         config = {
             "table_name": table_name,
-            "time_range": {
-                "start": start_time.isoformat(),
-                "end": end_time.isoformat(),
-                "hours_back": hours_back
-            },
-            "metrics": metrics
+            "stream_enabled": stream_spec.get('StreamEnabled', False),
+            "stream_view_type": stream_spec.get('StreamViewType'),
+            "latest_stream_label": table.get('LatestStreamLabel'),
+            "latest_stream_arn": table.get('LatestStreamArn')
         }
         
-        return json.dumps(config, indent=2)
+        # If streams are enabled, get more details
+        if config["stream_enabled"] and config["latest_stream_arn"]:
+            try:
+                streams_client = aws_client.get_client('dynamodbstreams')
+                stream_response = streams_client.describe_stream(StreamArn=config["latest_stream_arn"])
+                stream = stream_response['StreamDescription']
+                
+                config.update({
+                    "stream_arn": stream.get('StreamArn'),
+                    "stream_status": stream.get('StreamStatus'),
+                    "creation_request_id": stream.get('CreationRequestId'),
+                    "shards": [
+                        {
+                            "shard_id": shard.get('ShardId'),
+                            "sequence_number_range": shard.get('SequenceNumberRange', {}),
+                            "parent_shard_id": shard.get('ParentShardId')
+                        }
+                        for shard in stream.get('Shards', [])
+                    ]
+                })
+            except Exception as stream_error:
+                config["stream_error"] = str(stream_error)
+        
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "table_name": table_name})
+        return {"error": str(e), "table_name": table_name}
 
 
 @tool
@@ -249,50 +307,29 @@ def describe_dynamodb_streams(table_name: str) -> str:
     
     Note: Stream information is retrieved from the table configuration and stream details.
     """
+    return json.dumps(fetch_dynamodb_streams(table_name), indent=2, default=str)
+
+
+def fetch_dynamodb_tables() -> Dict[str, Any]:
+    """List all DynamoDB tables in the region for discovery and inventory purposes."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
         region = aws_client.region
         client = aws_client.get_client('dynamodb')
-        response = client.describe_table(TableName=table_name)
-        table = response['Table']
+        response = client.list_tables()
         
-        stream_spec = table.get('StreamSpecification', {})
+        tables = response.get('TableNames', [])
         
         config = {
-            "table_name": table_name,
-            "stream_enabled": stream_spec.get('StreamEnabled', False),
-            "stream_view_type": stream_spec.get('StreamViewType'),
-            "latest_stream_label": table.get('LatestStreamLabel'),
-            "latest_stream_arn": table.get('LatestStreamArn')
+            "region": region,
+            "table_count": len(tables),
+            "tables": tables
         }
         
-        # If streams are enabled, get more details
-        if config["stream_enabled"] and config["latest_stream_arn"]:
-            try:
-                streams_client = aws_client.get_client('dynamodbstreams')
-                stream_response = streams_client.describe_stream(StreamArn=config["latest_stream_arn"])
-                stream = stream_response['StreamDescription']
-                
-                config.update({
-                    "stream_arn": stream.get('StreamArn'),
-                    "stream_status": stream.get('StreamStatus'),
-                    "creation_request_id": stream.get('CreationRequestId'),
-                    "shards": [
-                        {
-                            "shard_id": shard.get('ShardId'),
-                            "sequence_number_range": shard.get('SequenceNumberRange', {}),
-                            "parent_shard_id": shard.get('ParentShardId')
-                        }
-                        for shard in stream.get('Shards', [])
-                    ]
-                })
-            except Exception as stream_error:
-                config["stream_error"] = str(stream_error)
-        
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "table_name": table_name})
+        return {"error": str(e), "region": region}
 
 
 @tool
@@ -323,21 +360,4 @@ def list_dynamodb_tables() -> str:
     
     Note: This tool only lists table names, not their configurations or metrics.
     """
-    try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('dynamodb')
-        response = client.list_tables()
-        
-        tables = response.get('TableNames', [])
-        
-        config = {
-            "region": region,
-            "table_count": len(tables),
-            "tables": tables
-        }
-        
-        return json.dumps(config, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e), "region": region})
+    return json.dumps(fetch_dynamodb_tables(), indent=2, default=str)
@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_eventbridge_rule_config(rule_name: str) -> str:
-    """
-    Get EventBridge rule configuration.
-    
-    Args:
-        rule_name: The EventBridge rule name
-    
-    Returns:
-        JSON string with rule configuration
-    """
+def fetch_eventbridge_rule_config(rule_name: str) -> Dict[str, Any]:
+    """Get EventBridge rule configuration."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -59,22 +50,27 @@ def get_eventbridge_rule_config(rule_name: str) -> str:
             "event_bus_name": rule.get('EventBusName', 'default')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "rule_name": rule_name})
+        return {"error": str(e), "rule_name": rule_name}
 
 
 @tool
-def get_eventbridge_targets(rule_name: str) -> str:
+def get_eventbridge_rule_config(rule_name: str) -> str:
     """
-    Get EventBridge rule targets.
+    Get EventBridge rule configuration.
     
     Args:
         rule_name: The EventBridge rule name
     
     Returns:
-        JSON string with target details
+        JSON string with rule configuration
     """
+    return json.dumps(fetch_eventbridge_rule_config(rule_name), indent=2, default=str)
+
+
+def fetch_eventbridge_targets(rule_name: str) -> Dict[str, Any]:
+    """Get EventBridge rule targets."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -110,23 +106,27 @@ def get_eventbridge_targets(rule_name: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "rule_name": rule_name})
+        return {"error": str(e), "rule_name": rule_name}
 
 
 @tool
-def get_eventbridge_metrics(rule_name: str, hours_back: int = 24) -> str:
+def get_eventbridge_targets(rule_name: str) -> str:
     """
-    Get CloudWatch metrics for an EventBridge rule.
+    Get EventBridge rule targets.
     
     Args:
         rule_name: The EventBridge rule name
-        hours_back: Number of hours to look back (default: 24)
     
     Returns:
-        JSON string with rule metrics
+        JSON string with target details
     """
+    return json.dumps(fetch_eventbridge_targets(rule_name), indent=2, default=str)
+
+
+def fetch_eventbridge_metrics(rule_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Get CloudWatch metrics for an EventBridge rule."""
     from datetime import datetime, timedelta
     
     try:
@@ -171,21 +171,28 @@ def get_eventbridge_metrics(rule_name: str, hours_back: int = 24) -> str:
             "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "rule_name": rule_name})
+        return {"error": str(e), "rule_name": rule_name}
 
 
 @tool
-def list_eventbridge_rules(list: str) -> str:
+def get_eventbridge_metrics(rule_name: str, hours_back: int = 24) -> str:
     """
-    List EventBridge rules in the region.
+    Get CloudWatch metrics for an EventBridge rule.
     
     Args:
+        rule_name: The EventBridge rule name
+        hours_back: Number of hours to look back (default: 24)
     
     Returns:
-        JSON string with rule list
+        JSON string with rule metrics
     """
+    return json.dumps(fetch_eventbridge_metrics(rule_name, hours_back), indent=2, default=str)
+
+
+def fetch_eventbridge_rules(list: str) -> Dict[str, Any]:
+    """List EventBridge rules in the region."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -211,22 +218,26 @@ def list_eventbridge_rules(list: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "region": region})
+        return {"error": str(e), "region": region}
 
 
 @tool
-def get_eventbridge_bus_config(event_bus_name: str = "default") -> str:
+def list_eventbridge_rules(list: str) -> str:
     """
-    Get EventBridge event bus configuration.
+    List EventBridge rules in the region.
     
     Args:
-        event_bus_name: The EventBridge event bus name (default: "default")
     
     Returns:
-        JSON string with event bus configuration
+        JSON string with rule list
     """
+    return json.dumps(fetch_eventbridge_rules(list), indent=2, default=str)
+
+
+def fetch_eventbridge_bus_config(event_bus_name: str = "default") -> Dict[str, Any]:
+    """Get EventBridge event bus configuration."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -244,6 +255,20 @@ def get_eventbridge_bus_config(event_bus_name: str = "default") -> str:
             "creation_time": str(response.get('CreationTime', ''))
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "event_bus_name": event_bus_name})
+        return {"error": str(e), "event_bus_name": event_bus_name}
+
+
+@tool
+def get_eventbridge_bus_config(event_bus_name: str = "default") -> str:
+    """
+    Get EventBridge event bus configuration.
+    
+    Args:
+        event_bus_name: The EventBridge event bus name (default: "default")
+    
+    Returns:
+        JSON string with event bus configuration
+    """
+    return json.dumps(fetch_eventbridge_bus_config(event_bus_name), indent=2, default=str)
@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_iam_role_config(role_name: str) -> str:
-    """
-    Get IAM role configuration including trust policy and attached policies.
-    
-    Args:
-        role_name: The IAM role name
-    
-    Returns:
-        JSON string with role configuration
-    """
+def fetch_iam_role_config(role_name: str) -> Dict[str, Any]:
+    """Get IAM role configuration including trust policy and attached policies."""
     from urllib.parse import unquote
     
     try:
@@ -80,22 +71,27 @@ def get_iam_role_config(role_name: str) -> str:
             "max_session_duration": role.get('MaxSessionDuration')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "role_name": role_name})
+        return {"error": str(e), "role_name": role_name}
 
 
 @tool
-def get_iam_policy_document(policy_arn: str) -> str:
+def get_iam_role_config(role_name: str) -> str:
     """
-    Get IAM policy document details.
+    Get IAM role configuration including trust policy and attached policies.
     
     Args:
-        policy_arn: The IAM policy ARN
+        role_name: The IAM role name
     
     Returns:
-        JSON string with policy document details
+        JSON string with role configuration
     """
+    return json.dumps(fetch_iam_role_config(role_name), indent=2, default=str)
+
+
+def fetch_iam_policy_document(policy_arn: str) -> Dict[str, Any]:
+    """Get IAM policy document details."""
     
     try:
         # Get AWS client from context
@@ -126,24 +122,27 @@ def get_iam_policy_document(policy_arn: str) -> str:
             "attachment_count": policy['AttachmentCount']
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "policy_arn": policy_arn})
+        return {"error": str(e), "policy_arn": policy_arn}
 
 
 @tool
-def simulate_iam_policy(policy_document: str, action: str, resource: str = "*") -> str:
+def get_iam_policy_document(policy_arn: str) -> str:
     """
-    Simulate IAM policy to check if an action is allowed.
+    Get IAM policy document details.
     
     Args:
-        policy_document: The IAM policy document (JSON string)
-        action: The action to test (e.g., "lambda:InvokeFunction")
-        resource: The resource ARN to test (default: "*")
+        policy_arn: The IAM policy ARN
     
     Returns:
-        JSON string with simulation results
+        JSON string with policy document details
     """
+    return json.dumps(fetch_iam_policy_document(policy_arn), indent=2, default=str)
+
+
+def fetch_iam_policy_simulation(policy_document: str, action: str, resource: str = "*") -> Dict[str, Any]:
+    """Simulate IAM policy to check if an action is allowed."""
     import json as json_lib
     
     try:
@@ -183,22 +182,29 @@ def simulate_iam_policy(policy_document: str, action: str, resource: str = "*")
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "action": action, "resource": resource})
+        return {"error": str(e), "action": action, "resource": resource}
 
 
 @tool
-def get_iam_user_policies(user_name: str) -> str:
+def simulate_iam_policy(policy_document: str, action: str, resource: str = "*") -> str:
     """
-    Get IAM user policies and permissions.
+    Simulate IAM policy to check if an action is allowed.
     
     Args:
-        user_name: The IAM user name
+        policy_document: The IAM policy document (JSON string)
+        action: The action to test (e.g., "lambda:InvokeFunction")
+        resource: The resource ARN to test (default: "*")
     
     Returns:
-        JSON string with user policies
+        JSON string with simulation results
     """
+    return json.dumps(fetch_iam_policy_simulation(policy_document, action, resource), indent=2, default=str)
+
+
+def fetch_iam_user_policies(user_name: str) -> Dict[str, Any]:
+    """Get IAM user policies and permissions."""
     
     try:
         # Get AWS client from context
@@ -250,6 +256,20 @@ def get_iam_user_policies(user_name: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "user_name": user_name})
+        return {"error": str(e), "user_name": user_name}
+
+
+@tool
+def get_iam_user_policies(user_name: str) -> str:
+    """
+    Get IAM user policies and permissions.
+    
+    Args:
+        user_name: The IAM user name
+    
+    Returns:
+        JSON string with user policies
+    """
+    return json.dumps(fetch_iam_user_policies(user_name), indent=2, default=str)
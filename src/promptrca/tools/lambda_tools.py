@@ -26,6 +26,34 @@ import json
 from ..context import get_aws_client
 
 
+def fetch_lambda_config(function_name: str) -> Dict[str, Any]:
+    """Get comprehensive Lambda function configuration for root cause analysis."""
+    try:
+        # Get AWS client from context
+        aws_client = get_aws_client()
+        region = aws_client.region
+        client = aws_client.get_client('lambda')
+        response = client.get_function_configuration(FunctionName=function_name)
+        
+        config = {
+            "function_name": response.get('FunctionName'),
+            "function_arn": response.get('FunctionArn'),
+            "runtime": response.get('Runtime'),
+            "role": response.get('Role'),
+            "handler": response.get('Handler'),
+            "timeout": response.get('Timeout'),
+            "memory_size": response.get('MemorySize'),
+            "environment_variables": response.get('Environment', {}).get('Variables', {}),
+            "tracing_config": response.get('TracingConfig', {}),
+            "layers": response.get('Layers', []),
+            "last_modified": response.get('LastModified')
+        }
+        
+        return config
+    except Exception as e:
+        return {"error": str(e), "function_name": function_name}
+
+
 @tool
 def get_lambda_config(function_name: str) -> str:
     """
@@ -68,74 +96,11 @@ def get_lambda_config(function_name: str) -> str:
         - Runtime compatibility issues (check runtime version)
         - Environment variable problems (verify env vars are set correctly)
     """
-    try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('lambda')
-        response = client.get_function_configuration(FunctionName=function_name)
-        
-        config = {
-            "function_name": response.get('FunctionName'),
-            "function_arn": response.get('FunctionArn'),
-            "runtime": response.get('Runtime'),
-            "role": response.get('Role'),
-            "handler": response.get('Handler'),
-            "timeout": response.get('Timeout'),
-            "memory_size": response.get('MemorySize'),
-            "environment_variables": response.get('Environment', {}).get('Variables', {}),
-            "tracing_config": response.get('TracingConfig', {}),
-            "layers": response.get('Layers', []),
-            "last_modified": response.get('LastModified')
-        }
-        
-        return json.dumps(config, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e), "function_name": function_name})
+    return json.dumps(fetch_lambda_config(function_name), indent=2, default=str)
 
 
-@tool
-def get_lambda_logs(function_name: str, hours_back: int = 1) -> str:
-    """
-    Retrieve CloudWatch logs for Lambda function error analysis and debugging.
-    
-    This tool fetches recent log events from the Lambda function's CloudWatch log group
-    to identify errors, exceptions, performance issues, and execution patterns.
-    Essential for diagnosing runtime errors, timeout issues, and code problems.
-    
-    Args:
-        function_name: The Lambda function name (e.g., "my-function", "prod-api-handler")
-        hours_back: Number of hours to look back for logs (default: 1, max recommended: 24)
-    
-    Returns:
-        JSON string containing:
-        - function_name: Name of the function
-        - log_group: CloudWatch log group path (e.g., "/aws/lambda/my-function")
-        - hours_back: Time range searched
-        - event_count: Number of log events found
-        - events: Array of log events with:
-          - timestamp: Unix timestamp in milliseconds
-          - message: Log message content (may contain errors, stack traces, etc.)
-    
-    Common Error Patterns to Look For:
-        - "Task timed out": Function exceeded timeout limit
-        - "Memory limit exceeded": Function ran out of allocated memory
-        - "AccessDenied": IAM permission issues
-        - "ResourceNotFoundException": Missing AWS resources
-        - "ValidationException": Invalid input parameters
-        - Stack traces: Code errors and exceptions
-        - "RequestId": Unique identifier for each invocation
-    
-    Use Cases:
-        - Debugging runtime errors and exceptions
-        - Analyzing timeout issues (check for "Task timed out" messages)
-        - Memory problems (look for "Memory limit exceeded")
-        - Permission errors (search for "AccessDenied" or "Forbidden")
-        - Code bugs (examine stack traces and error messages)
-        - Performance analysis (check execution patterns and timing)
-    
-    Note: Logs are retrieved from the most recent log streams to ensure relevance.
-    """
+def fetch_lambda_logs(function_name: str, hours_back: int = 1) -> Dict[str, Any]:
+    """Retrieve CloudWatch logs for Lambda function error analysis and debugging."""
     from datetime import datetime, timedelta
     
     try:
@@ -182,52 +147,58 @@ def get_lambda_logs(function_name: str, hours_back: int = 1) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "function_name": function_name})
+        return {"error": str(e), "function_name": function_name}
 
 
 @tool
-def get_lambda_metrics(function_name: str, hours_back: int = 24) -> str:
+def get_lambda_logs(function_name: str, hours_back: int = 1) -> str:
     """
-    Retrieve CloudWatch metrics for Lambda function performance analysis.
+    Retrieve CloudWatch logs for Lambda function error analysis and debugging.
     
-    This tool fetches key performance metrics to identify patterns, bottlenecks,
-    and issues with Lambda function execution. Critical for understanding
-    invocation patterns, error rates, and resource utilization.
+    This tool fetches recent log events from the Lambda function's CloudWatch log group
+    to identify errors, exceptions, performance issues, and execution patterns.
+    Essential for diagnosing runtime errors, timeout issues, and code problems.
     
     Args:
         function_name: The Lambda function name (e.g., "my-function", "prod-api-handler")
-        hours_back: Number of hours to look back for metrics (default: 24)
+        hours_back: Number of hours to look back for logs (default: 1, max recommended: 24)
     
     Returns:
         JSON string containing:
         - function_name: Name of the function
-        - time_range: Start/end times and duration of metrics collection
-        - metrics: Dictionary with metric data:
-          - Invocations: Total number of function invocations
-          - Errors: Number of failed invocations
-          - Duration: Execution time statistics (avg, max, sum)
-          - Throttles: Number of throttled invocations
-          - ConcurrentExecutions: Peak concurrent executions
-          - UnreservedConcurrentExecutions: Available concurrency
+        - log_group: CloudWatch log group path (e.g., "/aws/lambda/my-function")
+        - hours_back: Time range searched
+        - event_count: Number of log events found
+        - events: Array of log events with:
+          - timestamp: Unix timestamp in milliseconds
+          - message: Log message content (may contain errors, stack traces, etc.)
     
-    Key Metrics Analysis:
-        - High Error Rate: Errors/Invocations > 5% indicates problems
-        - Duration Spikes: Max duration approaching timeout suggests issues
-        - Throttling: Throttles > 0 indicates concurrency limits exceeded
-        - Low Invocations: May indicate upstream issues or misconfiguration
+    Common Error Patterns to Look For:
+        - "Task timed out": Function exceeded timeout limit
+        - "Memory limit exceeded": Function ran out of allocated memory
+        - "AccessDenied": IAM permission issues
+        - "ResourceNotFoundException": Missing AWS resources
+        - "ValidationException": Invalid input parameters
+        - Stack traces: Code errors and exceptions
+        - "RequestId": Unique identifier for each invocation
     
     Use Cases:
-        - Performance monitoring and trend analysis
-        - Error rate investigation (high error percentages)
-        - Timeout analysis (duration vs configured timeout)
-        - Throttling issues (concurrent execution limits)
-        - Capacity planning (invocation patterns and scaling needs)
-        - SLA monitoring (availability and performance metrics)
+        - Debugging runtime errors and exceptions
+        - Analyzing timeout issues (check for "Task timed out" messages)
+        - Memory problems (look for "Memory limit exceeded")
+        - Permission errors (search for "AccessDenied" or "Forbidden")
+        - Code bugs (examine stack traces and error messages)
+        - Performance analysis (check execution patterns and timing)
     
-    Note: Metrics are aggregated in 1-hour periods for the specified time range.
+    Note: Logs are retrieved from the most recent log streams to ensure relevance.
     """
+    return json.dumps(fetch_lambda_logs(function_name, hours_back), indent=2, default=str)
+
+
+def fetch_lambda_metrics(function_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Retrieve CloudWatch metrics for Lambda function performance analysis."""
     from datetime import datetime, timedelta
     
     try:
@@ -275,55 +246,57 @@ def get_lambda_metrics(function_name: str, hours_back: int = 24) -> str:
             "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "function_name": function_name})
+        return {"error": str(e), "function_name": function_name}
 
 
 @tool
-def get_lambda_failed_invocations(function_name: str, hours_back: int = 24, limit: int = 10) -> str:
+def get_lambda_metrics(function_name: str, hours_back: int = 24) -> str:
     """
-    Get recent FAILED Lambda invocations with detailed error information.
-
-    This tool uses CloudWatch Logs Insights to query for failed invocations,
-    extracting error messages, stack traces, request IDs, and timing information.
-    Essential for diagnosing runtime errors, exceptions, and failure patterns.
-
+    Retrieve CloudWatch metrics for Lambda function performance analysis.
+    
+    This tool fetches key performance metrics to identify patterns, bottlenecks,
+    and issues with Lambda function execution. Critical for understanding
+    invocation patterns, error rates, and resource utilization.
+    
     Args:
         function_name: The Lambda function name (e.g., "my-function", "prod-api-handler")
-        hours_back: Number of hours to look back (default: 24)
-        limit: Maximum number of failed invocations to return (default: 10)
-
+        hours_back: Number of hours to look back for metrics (default: 24)
+    
     Returns:
         JSON string containing:
         - function_name: Name of the function
-        - hours_back: Time range searched
-        - failure_count: Total number of failures found
-        - failed_invocations: Array of failed invocations with:
-          - timestamp: When the error occurred
-          - request_id: AWS Request ID for correlation
-          - error_type: Type of error (e.g., "ZeroDivisionError", "KeyError")
-          - error_message: Detailed error message
-          - stack_trace: Stack trace if available
-          - duration_ms: Execution duration before failure
-          - memory_used_mb: Memory used before failure
-
-    Common Error Patterns:
-        - Runtime exceptions: ZeroDivisionError, KeyError, AttributeError, etc.
-        - Timeout errors: Task timed out after X seconds
-        - Memory errors: Memory limit exceeded
-        - Permission errors: AccessDenied, Forbidden
-        - Integration errors: Failed to connect to downstream service
-
+        - time_range: Start/end times and duration of metrics collection
+        - metrics: Dictionary with metric data:
+          - Invocations: Total number of function invocations
+          - Errors: Number of failed invocations
+          - Duration: Execution time statistics (avg, max, sum)
+          - Throttles: Number of throttled invocations
+          - ConcurrentExecutions: Peak concurrent executions
+          - UnreservedConcurrentExecutions: Available concurrency
+    
+    Key Metrics Analysis:
+        - High Error Rate: Errors/Invocations > 5% indicates problems
+        - Duration Spikes: Max duration approaching timeout suggests issues
+        - Throttling: Throttles > 0 indicates concurrency limits exceeded
+        - Low Invocations: May indicate upstream issues or misconfiguration
+    
     Use Cases:
-        - Debugging runtime errors (get exact error messages and stack traces)
-        - Pattern analysis (identify recurring error types)
-        - Input correlation (understand what inputs cause failures)
-        - Performance diagnosis (check duration and memory before failure)
-        - Error rate investigation (quantify failure frequency)
-
-    Note: This tool uses CloudWatch Logs Insights which may take several seconds to execute.
+        - Performance monitoring and trend analysis
+        - Error rate investigation (high error percentages)
+        - Timeout analysis (duration vs configured timeout)
+        - Throttling issues (concurrent execution limits)
+        - Capacity planning (invocation patterns and scaling needs)
+        - SLA monitoring (availability and performance metrics)
+    
+    Note: Metrics are aggregated in 1-hour periods for the specified time range.
     """
+    return json.dumps(fetch_lambda_metrics(function_name, hours_back), indent=2, default=str)
+
+
+def fetch_lambda_failed_invocations(function_name: str, hours_back: int = 24, limit: int = 10) -> Dict[str, Any]:
+    """Get recent FAILED Lambda invocations with detailed error information."""
     from datetime import datetime, timedelta
     import time
 
@@ -430,15 +403,111 @@ def get_lambda_failed_invocations(function_name: str, hours_back: int = 24, limi
             "query_status": status
         }
 
-        return json.dumps(config, indent=2)
+        return config
 
     except Exception as e:
-        return json.dumps({
+        return {
             "error": str(e),
             "error_type": type(e).__name__,
             "function_name": function_name,
             "log_group": f"/aws/lambda/{function_name}"
-        })
+        }
+
+
+@tool
+def get_lambda_failed_invocations(function_name: str, hours_back: int = 24, limit: int = 10) -> str:
+    """
+    Get recent FAILED Lambda invocations with detailed error information.
+
+    This tool uses CloudWatch Logs Insights to query for failed invocations,
+    extracting error messages, stack traces, request IDs, and timing information.
+    Essential for diagnosing runtime errors, exceptions, and failure patterns.
+
+    Args:
+        function_name: The Lambda function name (e.g., "my-function", "prod-api-handler")
+        hours_back: Number of hours to look back (default: 24)
+        limit: Maximum number of failed invocations to return (default: 10)
+
+    Returns:
+        JSON string containing:
+        - function_name: Name of the function
+        - hours_back: Time range searched
+        - failure_count: Total number of failures found
+        - failed_invocations: Array of failed invocations with:
+          - timestamp: When the error occurred
+          - request_id: AWS Request ID for correlation
+          - error_type: Type of error (e.g., "ZeroDivisionError", "KeyError")
+          - error_message: Detailed error message
+          - stack_trace: Stack trace if available
+          - duration_ms: Execution duration before failure
+          - memory_used_mb: Memory used before failure
+
+    Common Error Patterns:
+        - Runtime exceptions: ZeroDivisionError, KeyError, AttributeError, etc.
+        - Timeout errors: Task timed out after X seconds
+        - Memory errors: Memory limit exceeded
+        - Permission errors: AccessDenied, Forbidden
+        - Integration errors: Failed to connect to downstream service
+
+    Use Cases:
+        - Debugging runtime errors (get exact error messages and stack traces)
+        - Pattern analysis (identify recurring error types)
+        - Input correlation (understand what inputs cause failures)
+        - Performance diagnosis (check duration and memory before failure)
+        - Error rate investigation (quantify failure frequency)
+
+    Note: This tool uses CloudWatch Logs Insights which may take several seconds to execute.
+    """
+    return json.dumps(fetch_lambda_failed_invocations(function_name, hours_back, limit), indent=2, default=str)
+
+
+def fetch_lambda_version_history(function_name: str, limit: int = 10) -> Dict[str, Any]:
+    """Retrieve Lambda function version history to correlate failures with deployments."""
+    try:
+        # Get AWS client from context
+        aws_client = get_aws_client()
+        region = aws_client.region
+        client = aws_client.get_client('lambda')
+
+        # List versions (newest first)
+        response = client.list_versions_by_function(
+            FunctionName=function_name,
+            MaxItems=min(limit, 50)
+        )
+
+        versions = response.get('Versions', [])
+        version_details = []
+
+        for version in versions:
+            # Create a hash of environment variables to detect config changes
+            env_vars = version.get('Environment', {}).get('Variables', {})
+            import hashlib
+            env_hash = hashlib.md5(json.dumps(env_vars, sort_keys=True).encode()).hexdigest()[:8]
+
+            version_details.append({
+                "version": version.get('Version'),
+                "last_modified": version.get('LastModified'),
+                "code_sha256": version.get('CodeSha256'),
+                "runtime": version.get('Runtime'),
+                "memory_size": version.get('MemorySize'),
+                "timeout": version.get('Timeout'),
+                "environment_variables_hash": env_hash,
+                "description": version.get('Description', '')
+            })
+
+        config = {
+            "function_name": function_name,
+            "version_count": len(version_details),
+            "versions": version_details
+        }
+
+        return config
+    except Exception as e:
+        return {
+            "error": str(e),
+            "error_type": type(e).__name__,
+            "function_name": function_name
+        }
 
 
 @tool
@@ -514,51 +583,43 @@ def get_lambda_version_history(function_name: str, limit: int = 10) -> str:
     Note: Versions are returned in reverse chronological order (newest first).
     The $LATEST version represents the current editable version.
     """
+    return json.dumps(fetch_lambda_version_history(function_name, limit), indent=2, default=str)
+
+
+def fetch_lambda_layers(function_name: str) -> Dict[str, Any]:
+    """Retrieve Lambda function layer information for dependency analysis."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
         region = aws_client.region
         client = aws_client.get_client('lambda')
-
-        # List versions (newest first)
-        response = client.list_versions_by_function(
-            FunctionName=function_name,
-            MaxItems=min(limit, 50)
-        )
-
-        versions = response.get('Versions', [])
-        version_details = []
-
-        for version in versions:
-            # Create a hash of environment variables to detect config changes
-            env_vars = version.get('Environment', {}).get('Variables', {})
-            import hashlib
-            env_hash = hashlib.md5(json.dumps(env_vars, sort_keys=True).encode()).hexdigest()[:8]
-
-            version_details.append({
-                "version": version.get('Version'),
-                "last_modified": version.get('LastModified'),
-                "code_sha256": version.get('CodeSha256'),
-                "runtime": version.get('Runtime'),
-                "memory_size": version.get('MemorySize'),
-                "timeout": version.get('Timeout'),
-                "environment_variables_hash": env_hash,
-                "description": version.get('Description', '')
+        response = client.get_function_configuration(FunctionName=function_name)
+        
+        layers = response.get('Layers', [])
+        layer_details = []
+        
+        for layer in layers:
+            layer_arn = layer.get('Arn', '')
+            layer_version = layer.get('CodeSize', 0)
+            
+            # Extract layer name from ARN
+            layer_name = layer_arn.split(':')[-1] if layer_arn else 'unknown'
+            
+            layer_details.append({
+                "arn": layer_arn,
+                "name": layer_name,
+                "size": layer_version
             })
-
+        
         config = {
             "function_name": function_name,
-            "version_count": len(version_details),
-            "versions": version_details
+            "layer_count": len(layers),
+            "layers": layer_details
         }
-
-        return json.dumps(config, indent=2)
+        
+        return config
     except Exception as e:
-        return json.dumps({
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "function_name": function_name
-        })
+        return {"error": str(e), "function_name": function_name}
 
 
 @tool
@@ -598,35 +659,4 @@ def get_lambda_layers(function_name: str) -> str:
     
     Note: Layer information is retrieved from the function configuration.
     """
-    try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('lambda')
-        response = client.get_function_configuration(FunctionName=function_name)
-        
-        layers = response.get('Layers', [])
-        layer_details = []
-        
-        for layer in layers:
-            layer_arn = layer.get('Arn', '')
-            layer_version = layer.get('CodeSize', 0)
-            
-            # Extract layer name from ARN
-            layer_name = layer_arn.split(':')[-1] if layer_arn else 'unknown'
-            
-            layer_details.append({
-                "arn": layer_arn,
-                "name": layer_name,
-                "size": layer_version
-            })
-        
-        config = {
-            "function_name": function_name,
-            "layer_count": len(layers),
-            "layers": layer_details
-        }
-        
-        return json.dumps(config, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e), "function_name": function_name})
+    return json.dumps(fetch_lambda_layers(function_name), indent=2, default=str)
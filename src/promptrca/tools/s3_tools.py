@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_s3_bucket_config(bucket_name: str) -> str:
-    """
-    Get S3 bucket configuration and properties.
-    
-    Args:
-        bucket_name: The S3 bucket name
-    
-    Returns:
-        JSON string with bucket configuration
-    """
+def fetch_s3_bucket_config(bucket_name: str) -> Dict[str, Any]:
+    """Get S3 bucket configuration and properties."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -84,23 +75,27 @@ def get_s3_bucket_config(bucket_name: str) -> str:
             "notifications": notifications
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "bucket_name": bucket_name})
+        return {"error": str(e), "bucket_name": bucket_name}
 
 
 @tool
-def get_s3_bucket_metrics(bucket_name: str, hours_back: int = 24) -> str:
+def get_s3_bucket_config(bucket_name: str) -> str:
     """
-    Get CloudWatch metrics for an S3 bucket.
+    Get S3 bucket configuration and properties.
     
     Args:
         bucket_name: The S3 bucket name
-        hours_back: Number of hours to look back (default: 24)
     
     Returns:
-        JSON string with bucket metrics
+        JSON string with bucket configuration
     """
+    return json.dumps(fetch_s3_bucket_config(bucket_name), indent=2, default=str)
+
+
+def fetch_s3_bucket_metrics(bucket_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Get CloudWatch metrics for an S3 bucket."""
     from datetime import datetime, timedelta
 
     try:
@@ -152,24 +147,28 @@ def get_s3_bucket_metrics(bucket_name: str, hours_back: int = 24) -> str:
             "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "bucket_name": bucket_name})
+        return {"error": str(e), "bucket_name": bucket_name}
 
 
 @tool
-def list_s3_bucket_objects(bucket_name: str, prefix: str = "", max_keys: int = 100) -> str:
+def get_s3_bucket_metrics(bucket_name: str, hours_back: int = 24) -> str:
     """
-    List S3 bucket objects (for debugging purposes).
-
+    Get CloudWatch metrics for an S3 bucket.
+    
     Args:
         bucket_name: The S3 bucket name
-        prefix: Object key prefix to filter by
-        max_keys: Maximum number of objects to return (default: 100)
-
+        hours_back: Number of hours to look back (default: 24)
+    
     Returns:
-        JSON string with object list
+        JSON string with bucket metrics
     """
+    return json.dumps(fetch_s3_bucket_metrics(bucket_name, hours_back), indent=2, default=str)
+
+
+def fetch_s3_bucket_objects(bucket_name: str, prefix: str = "", max_keys: int = 100) -> Dict[str, Any]:
+    """List S3 bucket objects (for debugging purposes)."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -205,22 +204,29 @@ def list_s3_bucket_objects(bucket_name: str, prefix: str = "", max_keys: int = 1
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "bucket_name": bucket_name, "prefix": prefix})
+        return {"error": str(e), "bucket_name": bucket_name, "prefix": prefix}
 
 
 @tool
-def get_s3_bucket_policy(bucket_name: str) -> str:
+def list_s3_bucket_objects(bucket_name: str, prefix: str = "", max_keys: int = 100) -> str:
     """
-    Get S3 bucket policy.
-    
+    List S3 bucket objects (for debugging purposes).
+
     Args:
         bucket_name: The S3 bucket name
-    
+        prefix: Object key prefix to filter by
+        max_keys: Maximum number of objects to return (default: 100)
+
     Returns:
-        JSON string with bucket policy
+        JSON string with object list
     """
+    return json.dumps(fetch_s3_bucket_objects(bucket_name, prefix, max_keys), indent=2, default=str)
+
+
+def fetch_s3_bucket_policy(bucket_name: str) -> Dict[str, Any]:
+    """Get S3 bucket policy."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -241,6 +247,20 @@ def get_s3_bucket_policy(bucket_name: str) -> str:
             "policy": policy_doc
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "bucket_name": bucket_name})
+        return {"error": str(e), "bucket_name": bucket_name}
+
+
+@tool
+def get_s3_bucket_policy(bucket_name: str) -> str:
+    """
+    Get S3 bucket policy.
+    
+    Args:
+        bucket_name: The S3 bucket name
+    
+    Returns:
+        JSON string with bucket policy
+    """
+    return json.dumps(fetch_s3_bucket_policy(bucket_name), indent=2, default=str)
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - AI-powered root cause analysis for AWS infrastructure
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+from strands import tool
+
+from ..context import get_aws_client
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+# Graph windows are aligned to this bucket size so nearby requests share snapshots
+SERVICE_GRAPH_BUCKET_MINUTES = 5
+SERVICE_GRAPH_CACHE_MAX_ENTRIES = 128
+
+# Thresholds for reporting an edge as shifted between baseline and incident
+FAULT_RATE_SHIFT_THRESHOLD = 0.05
+ERROR_RATE_SHIFT_THRESHOLD = 0.05
+LATENCY_SHIFT_RATIO = 1.5
+MIN_EDGE_REQUESTS = 5
+
+EdgeKey = Tuple[str, str]
+
+
+class ServiceGraphSnapshotCache:
+    """
+    Bounded, thread-safe LRU cache of service graph snapshots.
+
+    Snapshots are keyed by (account, region, group, window start, window end)
+    with the window aligned to SERVICE_GRAPH_BUCKET_MINUTES, so a closed
+    window is only fetched from X-Ray once per process.
+    """
+
+    def __init__(self, max_entries: int = SERVICE_GRAPH_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._snapshots: "OrderedDict[tuple, Dict[EdgeKey, Dict[str, float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Dict[EdgeKey, Dict[str, float]]]:
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                self._snapshots.move_to_end(key)
+            return snapshot
+
+    def put(self, key: tuple, snapshot: Dict[EdgeKey, Dict[str, float]]) -> None:
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.popitem(last=False)
+
+    def latest(self, account_id: str, region: str) -> Optional[Dict[EdgeKey, Dict[str, float]]]:
+        """Most recently used snapshot of an account and region, whatever its window or group."""
+        with self._lock:
+            for key in reversed(self._snapshots):
+                if key[0] == account_id and key[1] == region:
+                    return self._snapshots[key]
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+
+_snapshot_cache = ServiceGraphSnapshotCache()
+
+
+def _align_to_bucket(moment: datetime) -> datetime:
+    """Round a timestamp down to the start of its time bucket."""
+    moment = moment.astimezone(timezone.utc).replace(second=0, microsecond=0)
+    return moment - timedelta(minutes=moment.minute % SERVICE_GRAPH_BUCKET_MINUTES)
+
+
+def _service_label(service: Dict[str, Any]) -> str:
+    name = service.get('Name') or 'unknown'
+    service_type = service.get('Type')
+    return f"{name} ({service_type})" if service_type else name
+
+
+def extract_edge_stats(services: List[Dict[str, Any]]) -> Dict[EdgeKey, Dict[str, float]]:
+    """
+    Reduce GetServiceGraph services to per-edge request, error, fault and latency statistics.
+
+    Args:
+        services: The Services list of a GetServiceGraph response
+
+    Returns:
+        Dictionary mapping (source, target) to edge statistics
+    """
+    labels = {service.get('ReferenceId'): _service_label(service) for service in services}
+    edges: Dict[EdgeKey, Dict[str, float]] = {}
+
+    for service in services:
+        source = labels.get(service.get('ReferenceId'), _service_label(service))
+        for edge in service.get('Edges', []):
+            target = labels.get(edge.get('ReferenceId'), 'unknown')
+            stats = edge.get('SummaryStatistics', {})
+            requests = stats.get('TotalCount', 0) or 0
+
+            entry = edges.setdefault((source, target), {
+                'requests': 0, 'errors': 0, 'faults': 0, 'response_time': 0.0
+            })
+            entry['requests'] += requests
+            entry['errors'] += stats.get('ErrorStatistics', {}).get('TotalCount', 0) or 0
+            entry['faults'] += stats.get('FaultStatistics', {}).get('TotalCount', 0) or 0
+            entry['response_time'] += stats.get('TotalResponseTime', 0.0) or 0.0
+
+    return edges
+
+
+def _rates(stats: Dict[str, float]) -> Dict[str, float]:
+    requests = stats.get('requests', 0)
+    if not requests:
+        return {'requests': 0, 'error_rate': 0.0, 'fault_rate': 0.0, 'avg_latency': 0.0}
+    return {
+        'requests': requests,
+        'error_rate': stats['errors'] / requests,
+        'fault_rate': stats['faults'] / requests,
+        'avg_latency': stats['response_time'] / requests
+    }
+
+
+def diff_service_graphs(
+    baseline: Dict[EdgeKey, Dict[str, float]],
+    incident: Dict[EdgeKey, Dict[str, float]]
+) -> Dict[str, Any]:
+    """
+    Compare baseline and incident edge statistics.
+
+    Returns:
+        Dictionary with new_edges, vanished_edges and shifted_edges. Edges are
+        rendered as "source -> target" and rates rounded to keep output small.
+    """
+    def label(key: EdgeKey) -> str:
+        return f"{key[0]} -> {key[1]}"
+
+    def compact(rates: Dict[str, float]) -> Dict[str, Any]:
+        return {
+            'n': int(rates['requests']),
+            'err': round(rates['error_rate'], 3),
+            'fault': round(rates['fault_rate'], 3),
+            'lat': round(rates['avg_latency'], 3)
+        }
+
+    new_edges = [
+        {'edge': label(key), **compact(_rates(incident[key]))}
+        for key in sorted(set(incident) - set(baseline))
+    ]
+    vanished_edges = [
+        {'edge': label(key), **compact(_rates(baseline[key]))}
+        for key in sorted(set(baseline) - set(incident))
+    ]
+
+    shifted_edges = []
+    for key in sorted(set(baseline) & set(incident)):
+        before = _rates(baseline[key])
+        after = _rates(incident[key])
+        if after['requests'] < MIN_EDGE_REQUESTS:
+            continue
+
+        shifts = []
+        if after['fault_rate'] - before['fault_rate'] >= FAULT_RATE_SHIFT_THRESHOLD:
+            shifts.append('fault')
+        if after['error_rate'] - before['error_rate'] >= ERROR_RATE_SHIFT_THRESHOLD:
+            shifts.append('error')
+        if before['avg_latency'] > 0 and after['avg_latency'] / before['avg_latency'] >= LATENCY_SHIFT_RATIO:
+            shifts.append('latency')
+
+        if shifts:
+            shifted_edges.append({
+                'edge': label(key),
+                'shift': shifts,
+                'before': compact(before),
+                'after': compact(after)
+            })
+
+    # Largest fault regressions first
+    shifted_edges.sort(key=lambda e: e['after']['fault'] - e['before']['fault'], reverse=True)
+
+    return {
+        'new_edges': new_edges,
+        'vanished_edges': vanished_edges,
+        'shifted_edges': shifted_edges
+    }
+
+
+def get_service_graph_snapshot(
+    start_time: datetime,
+    end_time: datetime,
+    group_name: Optional[str] = None
+) -> Dict[EdgeKey, Dict[str, float]]:
+    """
+    Get per-edge statistics for a bucket-aligned window, using the snapshot cache.
+
+    Args:
+        start_time: Window start (aligned down to the bucket)
+        end_time: Window end (aligned down to the bucket)
+        group_name: Optional X-Ray group name
+
+    Returns:
+        Dictionary mapping (source, target) to edge statistics
+    """
+    aws_client = get_aws_client()
+    start_time = _align_to_bucket(start_time)
+    end_time = _align_to_bucket(end_time)
+    key = (aws_client.account_id, aws_client.region, group_name, start_time.isoformat(), end_time.isoformat())
+
+    snapshot = _snapshot_cache.get(key)
+    if snapshot is not None:
+        logger.debug(f"Service graph snapshot cache hit for {key}")
+        return snapshot
+
+    client = aws_client.get_client('xray')
+    kwargs: Dict[str, Any] = {'StartTime': start_time, 'EndTime': end_time}
+    if group_name:
+        kwargs['GroupName'] = group_name
+
+    services: List[Dict[str, Any]] = []
+    while True:
+        response = client.get_service_graph(**kwargs)
+        services.extend(response.get('Services', []))
+        next_token = response.get('NextToken')
+        if not next_token:
+            break
+        kwargs['NextToken'] = next_token
+
+    snapshot = extract_edge_stats(services)
+    _snapshot_cache.put(key, snapshot)
+    return snapshot
+
+
+def _incident_window_end(incident_end: Optional[str]) -> datetime:
+    """Bucket-aligned end of the incident window: now, or the bucket containing incident_end."""
+    latest = _align_to_bucket(datetime.now(timezone.utc))
+    if not incident_end:
+        return latest
+    end = datetime.fromisoformat(incident_end.replace('Z', '+00:00'))
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    aligned = _align_to_bucket(end)
+    if aligned < end:
+        # Round up so the window covers the whole incident, but never into the open bucket
+        aligned += timedelta(minutes=SERVICE_GRAPH_BUCKET_MINUTES)
+    return min(aligned, latest)
+
+
+def _node_name(label: str) -> str:
+    return label.rsplit(' (', 1)[0]
+
+
+def cached_downstream_nodes(account_id: str, region: str, resource_name: str) -> List[str]:
+    """
+    Nodes a resource calls in the latest cached service graph, without calling X-Ray.
+
+    Nodes are matched on their name, or on the API name of an API Gateway
+    "<api>/<stage>" node. Only downstream nodes reached over edges with
+    errors or faults are returned, unless no edge of the resource has any.
+
+    Returns:
+        Labels of the downstream nodes; empty when no snapshot is cached
+    """
+    snapshot = _snapshot_cache.latest(account_id, region)
+    if not snapshot:
+        return []
+
+    edges = [
+        (target, stats) for (source, target), stats in snapshot.items()
+        if _node_name(source) == resource_name or _node_name(source).split('/')[0] == resource_name
+    ]
+    failing = [target for target, stats in edges if stats.get('errors') or stats.get('faults')]
+    return sorted(set(failing or [target for target, _stats in edges]))
+
+
+def fetch_xray_service_graph_diff(
+    incident_minutes: int = 60,
+    baseline_offset_minutes: int = 0,
+    group_name: str = None,
+    incident_end: str = None
+) -> Dict[str, Any]:
+    """Compare the X-Ray service graph of the incident window against a baseline window."""
+    try:
+        incident_end = _incident_window_end(incident_end)
+        incident_start = incident_end - timedelta(minutes=incident_minutes)
+        baseline_end = incident_start - timedelta(minutes=baseline_offset_minutes)
+        baseline_start = baseline_end - timedelta(minutes=incident_minutes)
+
+        baseline = get_service_graph_snapshot(baseline_start, baseline_end, group_name)
+        incident = get_service_graph_snapshot(incident_start, incident_end, group_name)
+
+        result = {
+            "baseline": [baseline_start.isoformat(), baseline_end.isoformat()],
+            "incident": [incident_start.isoformat(), incident_end.isoformat()],
+            "edge_count": {"baseline": len(baseline), "incident": len(incident)},
+            **diff_service_graphs(baseline, incident)
+        }
+        return result
+    except Exception as e:
+        return {"error": str(e), "group_name": group_name}
+
+
+@tool
+def get_xray_service_graph_diff(
+    incident_minutes: int = 60,
+    baseline_offset_minutes: int = 0,
+    group_name: str = None,
+    incident_end: str = None
+) -> str:
+    """
+    Compare the X-Ray service graph of the incident window against a baseline window.
+
+    Reports only what changed: new edges, vanished edges, and edges whose
+    error rate, fault rate or average latency shifted. Use this instead of
+    dumping full service graphs to localize a regression.
+
+    Args:
+        incident_minutes: Length of the incident window (default: 60)
+        baseline_offset_minutes: How far before the incident window the baseline
+            window ends; 0 means immediately before it (default: 0). Use 1440
+            to compare with the same window one day earlier.
+        group_name: Optional X-Ray group name
+        incident_end: End of the incident window in ISO format, e.g. the alarm
+            time of an incident that is already over (default: now)
+
+    Returns:
+        Compact JSON string with the graph diff
+    """
+    return json.dumps(
+        fetch_xray_service_graph_diff(incident_minutes, baseline_offset_minutes, group_name, incident_end),
+        separators=(',', ':')
+    )
@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_sns_topic_config(topic_arn: str) -> str:
-    """
-    Get SNS topic configuration and attributes.
-    
-    Args:
-        topic_arn: The SNS topic ARN
-    
-    Returns:
-        JSON string with topic configuration
-    """
+def fetch_sns_topic_config(topic_arn: str) -> Dict[str, Any]:
+    """Get SNS topic configuration and attributes."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -63,23 +54,27 @@ def get_sns_topic_config(topic_arn: str) -> str:
             "subscriptions_deleted": int(attributes.get('SubscriptionsDeleted', 0))
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "topic_arn": topic_arn})
+        return {"error": str(e), "topic_arn": topic_arn}
 
 
 @tool
-def get_sns_topic_metrics(topic_name: str, hours_back: int = 24) -> str:
+def get_sns_topic_config(topic_arn: str) -> str:
     """
-    Get CloudWatch metrics for an SNS topic.
+    Get SNS topic configuration and attributes.
     
     Args:
-        topic_name: The SNS topic name (without ARN)
-        hours_back: Number of hours to look back (default: 24)
+        topic_arn: The SNS topic ARN
     
     Returns:
-        JSON string with topic metrics
+        JSON string with topic configuration
     """
+    return json.dumps(fetch_sns_topic_config(topic_arn), indent=2, default=str)
+
+
+def fetch_sns_topic_metrics(topic_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Get CloudWatch metrics for an SNS topic."""
     from datetime import datetime, timedelta
     
     try:
@@ -128,22 +123,28 @@ def get_sns_topic_metrics(topic_name: str, hours_back: int = 24) -> str:
             "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "topic_name": topic_name})
+        return {"error": str(e), "topic_name": topic_name}
 
 
 @tool
-def get_sns_subscriptions(topic_arn: str) -> str:
+def get_sns_topic_metrics(topic_name: str, hours_back: int = 24) -> str:
     """
-    Get SNS topic subscriptions.
+    Get CloudWatch metrics for an SNS topic.
     
     Args:
-        topic_arn: The SNS topic ARN
+        topic_name: The SNS topic name (without ARN)
+        hours_back: Number of hours to look back (default: 24)
     
     Returns:
-        JSON string with subscription details
+        JSON string with topic metrics
     """
+    return json.dumps(fetch_sns_topic_metrics(topic_name, hours_back), indent=2, default=str)
+
+
+def fetch_sns_subscriptions(topic_arn: str) -> Dict[str, Any]:
+    """Get SNS topic subscriptions."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -168,21 +169,27 @@ def get_sns_subscriptions(topic_arn: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "topic_arn": topic_arn})
+        return {"error": str(e), "topic_arn": topic_arn}
 
 
 @tool
-def list_sns_topics(list: str) -> str:
+def get_sns_subscriptions(topic_arn: str) -> str:
     """
-    List SNS topics in the region.
+    Get SNS topic subscriptions.
     
     Args:
+        topic_arn: The SNS topic ARN
     
     Returns:
-        JSON string with topic list
+        JSON string with subscription details
     """
+    return json.dumps(fetch_sns_subscriptions(topic_arn), indent=2, default=str)
+
+
+def fetch_sns_topics(list: str) -> Dict[str, Any]:
+    """List SNS topics in the region."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -204,6 +211,19 @@ def list_sns_topics(list: str) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "region": region})
+        return {"error": str(e), "region": region}
+
+
+@tool
+def list_sns_topics(list: str) -> str:
+    """
+    List SNS topics in the region.
+    
+    Args:
+    
+    Returns:
+        JSON string with topic list
+    """
+    return json.dumps(fetch_sns_topics(list), indent=2, default=str)
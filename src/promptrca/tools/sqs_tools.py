@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_sqs_queue_config(queue_url: str) -> str:
-    """
-    Get SQS queue configuration and attributes.
-    
-    Args:
-        queue_url: The SQS queue URL
-    
-    Returns:
-        JSON string with queue configuration
-    """
+def fetch_sqs_queue_config(queue_url: str) -> Dict[str, Any]:
+    """Get SQS queue configuration and attributes."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -66,23 +57,27 @@ def get_sqs_queue_config(queue_url: str) -> str:
             "approximate_number_of_messages_delayed": int(attributes.get('ApproximateNumberOfMessagesDelayed', 0))
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "queue_url": queue_url})
+        return {"error": str(e), "queue_url": queue_url}
 
 
 @tool
-def get_sqs_queue_metrics(queue_name: str, hours_back: int = 24) -> str:
+def get_sqs_queue_config(queue_url: str) -> str:
     """
-    Get CloudWatch metrics for an SQS queue.
+    Get SQS queue configuration and attributes.
     
     Args:
-        queue_name: The SQS queue name (without URL)
-        hours_back: Number of hours to look back (default: 24)
+        queue_url: The SQS queue URL
     
     Returns:
-        JSON string with queue metrics
+        JSON string with queue configuration
     """
+    return json.dumps(fetch_sqs_queue_config(queue_url), indent=2, default=str)
+
+
+def fetch_sqs_queue_metrics(queue_name: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Get CloudWatch metrics for an SQS queue."""
     from datetime import datetime, timedelta
     
     try:
@@ -131,22 +126,28 @@ def get_sqs_queue_metrics(queue_name: str, hours_back: int = 24) -> str:
             "metrics": metrics
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "queue_name": queue_name})
+        return {"error": str(e), "queue_name": queue_name}
 
 
 @tool
-def get_sqs_dead_letter_queue(queue_url: str) -> str:
+def get_sqs_queue_metrics(queue_name: str, hours_back: int = 24) -> str:
     """
-    Get SQS dead letter queue configuration.
+    Get CloudWatch metrics for an SQS queue.
     
     Args:
-        queue_url: The SQS queue URL
+        queue_name: The SQS queue name (without URL)
+        hours_back: Number of hours to look back (default: 24)
     
     Returns:
-        JSON string with DLQ configuration
+        JSON string with queue metrics
     """
+    return json.dumps(fetch_sqs_queue_metrics(queue_name, hours_back), indent=2, default=str)
+
+
+def fetch_sqs_dead_letter_queue(queue_url: str) -> Dict[str, Any]:
+    """Get SQS dead letter queue configuration."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -207,22 +208,27 @@ def get_sqs_dead_letter_queue(queue_url: str) -> str:
                 "message": "No dead letter queue configured"
             }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "queue_url": queue_url})
+        return {"error": str(e), "queue_url": queue_url}
 
 
 @tool
-def list_sqs_queues(list: str) -> str:
+def get_sqs_dead_letter_queue(queue_url: str) -> str:
     """
-    List SQS queues in the region.
+    Get SQS dead letter queue configuration.
     
     Args:
-        prefix: Optional prefix to filter queue names
+        queue_url: The SQS queue URL
     
     Returns:
-        JSON string with queue list
+        JSON string with DLQ configuration
     """
+    return json.dumps(fetch_sqs_dead_letter_queue(queue_url), indent=2, default=str)
+
+
+def fetch_sqs_queues(list: str) -> Dict[str, Any]:
+    """List SQS queues in the region."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -244,6 +250,20 @@ def list_sqs_queues(list: str) -> str:
             "queues": queues
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "region": region, "prefix": prefix})
+        return {"error": str(e), "region": region, "prefix": prefix}
+
+
+@tool
+def list_sqs_queues(list: str) -> str:
+    """
+    List SQS queues in the region.
+    
+    Args:
+        prefix: Optional prefix to filter queue names
+    
+    Returns:
+        JSON string with queue list
+    """
+    return json.dumps(fetch_sqs_queues(list), indent=2, default=str)
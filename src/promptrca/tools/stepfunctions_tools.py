@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_stepfunctions_definition(state_machine_arn: str) -> str:
-    """
-    Get Step Functions state machine definition.
-    
-    Args:
-        state_machine_arn: The state machine ARN
-    
-    Returns:
-        JSON string with state machine definition
-    """
+def fetch_stepfunctions_definition(state_machine_arn: str) -> Dict[str, Any]:
+    """Get Step Functions state machine definition."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -55,23 +46,27 @@ def get_stepfunctions_definition(state_machine_arn: str) -> str:
             "tracing_configuration": response.get('tracingConfiguration', {})
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "state_machine_arn": state_machine_arn})
+        return {"error": str(e), "state_machine_arn": state_machine_arn}
 
 
 @tool
-def get_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> str:
+def get_stepfunctions_definition(state_machine_arn: str) -> str:
     """
-    Get Step Functions execution logs for debugging and analysis.
+    Get Step Functions state machine definition.
     
     Args:
         state_machine_arn: The state machine ARN
-        hours_back: Number of hours to look back for logs (default: 1)
     
     Returns:
-        JSON string with execution logs
+        JSON string with state machine definition
     """
+    return json.dumps(fetch_stepfunctions_definition(state_machine_arn), indent=2, default=str)
+
+
+def fetch_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> Dict[str, Any]:
+    """Get Step Functions execution logs for debugging and analysis."""
     
     from datetime import datetime, timedelta
     
@@ -122,9 +117,71 @@ def get_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> str:
             ]
         }
         
-        return json.dumps(config, indent=2)
+        return config
+    except Exception as e:
+        return {"error": str(e), "state_machine_arn": state_machine_arn}
+
+
+@tool
+def get_stepfunctions_logs(state_machine_arn: str, hours_back: int = 1) -> str:
+    """
+    Get Step Functions execution logs for debugging and analysis.
+    
+    Args:
+        state_machine_arn: The state machine ARN
+        hours_back: Number of hours to look back for logs (default: 1)
+    
+    Returns:
+        JSON string with execution logs
+    """
+    return json.dumps(fetch_stepfunctions_logs(state_machine_arn, hours_back), indent=2, default=str)
+
+
+def fetch_stepfunctions_execution_details(execution_arn: str) -> Dict[str, Any]:
+    """Retrieve comprehensive Step Functions execution details for failure analysis and debugging."""
+    
+    try:
+        # Get AWS client from context
+        aws_client = get_aws_client()
+        region = aws_client.region
+        client = aws_client.get_client('stepfunctions')
+
+        # Get execution details
+        exec_response = client.describe_execution(executionArn=execution_arn)
+
+        # Get execution history
+        history_response = client.get_execution_history(
+            executionArn=execution_arn,
+            maxResults=100,
+            reverseOrder=True
+        )
+
+        config = {
+            "execution_arn": exec_response.get('executionArn'),
+            "state_machine_arn": exec_response.get('stateMachineArn'),
+            "status": exec_response.get('status'),
+            "start_date": str(exec_response.get('startDate')),
+            "stop_date": str(exec_response.get('stopDate')) if exec_response.get('stopDate') else None,
+            "input": json.loads(exec_response.get('input', '{}')),
+            "output": json.loads(exec_response.get('output', '{}')) if exec_response.get('output') else None,
+            "error": exec_response.get('error'),
+            "cause": exec_response.get('cause'),
+            "trace_header": exec_response.get('traceHeader'),
+            "history_event_count": len(history_response.get('events', [])),
+            "history_events": [
+                {
+                    "id": event.get('id'),
+                    "timestamp": str(event.get('timestamp')),
+                    "type": event.get('type'),
+                    "details": {k: v for k, v in event.items() if k not in ['id', 'timestamp', 'type']}
+                }
+                for event in history_response.get('events', [])[:20]  # Top 20 events
+            ]
+        }
+
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "state_machine_arn": state_machine_arn})
+        return {"error": str(e), "execution_arn": execution_arn}
 
 
 @tool
@@ -192,63 +249,11 @@ def get_stepfunctions_execution_details(execution_arn: str) -> str:
 
     Note: History events are limited to most recent 20 for performance. For full history, check CloudWatch Logs.
     """
-    
-    try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('stepfunctions')
+    return json.dumps(fetch_stepfunctions_execution_details(execution_arn), indent=2, default=str)
 
-        # Get execution details
-        exec_response = client.describe_execution(executionArn=execution_arn)
-
-        # Get execution history
-        history_response = client.get_execution_history(
-            executionArn=execution_arn,
-            maxResults=100,
-            reverseOrder=True
-        )
 
-        config = {
-            "execution_arn": exec_response.get('executionArn'),
-            "state_machine_arn": exec_response.get('stateMachineArn'),
-            "status": exec_response.get('status'),
-            "start_date": str(exec_response.get('startDate')),
-            "stop_date": str(exec_response.get('stopDate')) if exec_response.get('stopDate') else None,
-            "input": json.loads(exec_response.get('input', '{}')),
-            "output": json.loads(exec_response.get('output', '{}')) if exec_response.get('output') else None,
-            "error": exec_response.get('error'),
-            "cause": exec_response.get('cause'),
-            "trace_header": exec_response.get('traceHeader'),
-            "history_event_count": len(history_response.get('events', [])),
-            "history_events": [
-                {
-                    "id": event.get('id'),
-                    "timestamp": str(event.get('timestamp')),
-                    "type": event.get('type'),
-                    "details": {k: v for k, v in event.items() if k not in ['id', 'timestamp', 'type']}
-                }
-                for event in history_response.get('events', [])[:20]  # Top 20 events
-            ]
-        }
-
-        return json.dumps(config, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e), "execution_arn": execution_arn})
-
-
-@tool
-def get_stepfunctions_metrics(state_machine_arn: str, hours_back: int = 24) -> str:
-    """
-    Get Step Functions metrics and performance data.
-    
-    Args:
-        state_machine_arn: The state machine ARN
-        hours_back: Number of hours to look back for metrics (default: 24)
-    
-    Returns:
-        JSON string with metrics data
-    """
+def fetch_stepfunctions_metrics(state_machine_arn: str, hours_back: int = 24) -> Dict[str, Any]:
+    """Get Step Functions metrics and performance data."""
     
     from datetime import datetime, timedelta
     
@@ -301,9 +306,67 @@ def get_stepfunctions_metrics(state_machine_arn: str, hours_back: int = 24) -> s
             "metrics": metrics
         }
 
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "state_machine_arn": state_machine_arn})
+        return {"error": str(e), "state_machine_arn": state_machine_arn}
+
+
+@tool
+def get_stepfunctions_metrics(state_machine_arn: str, hours_back: int = 24) -> str:
+    """
+    Get Step Functions metrics and performance data.
+    
+    Args:
+        state_machine_arn: The state machine ARN
+        hours_back: Number of hours to look back for metrics (default: 24)
+    
+    Returns:
+        JSON string with metrics data
+    """
+    return json.dumps(fetch_stepfunctions_metrics(state_machine_arn, hours_back), indent=2, default=str)
+
+
+def fetch_recent_stepfunctions_executions(state_machine_arn: str, status_filter: str = "FAILED", limit: int = 10) -> Dict[str, Any]:
+    """List recent Step Functions executions to identify failure patterns and trends."""
+    try:
+        # Get AWS client from context
+        aws_client = get_aws_client()
+        region = aws_client.region
+        client = aws_client.get_client('stepfunctions')
+
+        # List executions with filter
+        response = client.list_executions(
+            stateMachineArn=state_machine_arn,
+            statusFilter=status_filter,
+            maxResults=min(limit, 100)  # AWS API max is 1000, we limit to 100 for performance
+        )
+
+        executions = response.get('executions', [])
+
+        config = {
+            "state_machine_arn": state_machine_arn,
+            "status_filter": status_filter,
+            "execution_count": len(executions),
+            "executions": [
+                {
+                    "execution_arn": exec.get('executionArn'),
+                    "name": exec.get('name'),
+                    "status": exec.get('status'),
+                    "start_date": str(exec.get('startDate')),
+                    "stop_date": str(exec.get('stopDate')) if exec.get('stopDate') else None
+                }
+                for exec in executions
+            ]
+        }
+
+        return config
+    except Exception as e:
+        return {
+            "error": str(e),
+            "error_type": type(e).__name__,
+            "state_machine_arn": state_machine_arn,
+            "status_filter": status_filter
+        }
 
 
 @tool
@@ -372,42 +435,4 @@ def list_recent_stepfunctions_executions(state_machine_arn: str, status_filter:
     Note: Results are sorted by start time (most recent first). Use execution ARN from results
     with get_stepfunctions_execution_details for detailed failure analysis.
     """
-    try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('stepfunctions')
-
-        # List executions with filter
-        response = client.list_executions(
-            stateMachineArn=state_machine_arn,
-            statusFilter=status_filter,
-            maxResults=min(limit, 100)  # AWS API max is 1000, we limit to 100 for performance
-        )
-
-        executions = response.get('executions', [])
-
-        config = {
-            "state_machine_arn": state_machine_arn,
-            "status_filter": status_filter,
-            "execution_count": len(executions),
-            "executions": [
-                {
-                    "execution_arn": exec.get('executionArn'),
-                    "name": exec.get('name'),
-                    "status": exec.get('status'),
-                    "start_date": str(exec.get('startDate')),
-                    "stop_date": str(exec.get('stopDate')) if exec.get('stopDate') else None
-                }
-                for exec in executions
-            ]
-        }
-
-        return json.dumps(config, indent=2)
-    except Exception as e:
-        return json.dumps({
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "state_machine_arn": state_machine_arn,
-            "status_filter": status_filter
-        })
+    return json.dumps(fetch_recent_stepfunctions_executions(state_machine_arn, status_filter, limit), indent=2, default=str)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - AI-powered root cause analysis for AWS infrastructure
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+from ..context import get_aws_client
+from ..utils import get_logger
+from .xray_tools import _get_trace
+
+logger = get_logger(__name__)
+
+# Padding around segment times: logs may be written slightly before the
+# segment starts and flushed a while after it ends
+LOG_WINDOW_PAD_BEFORE_SECONDS = 30
+LOG_WINDOW_PAD_AFTER_SECONDS = 120
+
+MAX_CORRELATED_LOG_GROUPS = 10
+MAX_QUERY_WAIT_SECONDS = 30
+MAX_RESULTS_PER_QUERY = 100
+
+
+@dataclass
+class LogQueryTarget:
+    """A narrow Logs Insights query derived from a trace: one log group, a few minutes, known request ids."""
+    log_group: str
+    start_time: float
+    end_time: float
+    request_ids: List[str] = field(default_factory=list)
+    source: str = "lambda"
+    # State machine whose logging configuration names the actual log group
+    state_machine_arn: Optional[str] = None
+
+    def merge(self, other: "LogQueryTarget") -> None:
+        self.start_time = min(self.start_time, other.start_time)
+        self.end_time = max(self.end_time, other.end_time)
+        for request_id in other.request_ids:
+            if request_id not in self.request_ids:
+                self.request_ids.append(request_id)
+
+    def build_query(self, trace_id: str) -> str:
+        """Filter on request ids when known, otherwise on the trace id within this log group only."""
+        if self.request_ids and self.source == "lambda":
+            ids = ", ".join(f'"{request_id}"' for request_id in self.request_ids)
+            condition = f"@requestId in [{ids}]"
+        elif self.request_ids:
+            condition = " or ".join(f'@message like "{request_id}"' for request_id in self.request_ids)
+        else:
+            condition = f'@message like "{trace_id}"'
+        return (
+            "fields @timestamp, @message, @logStream, @log, @requestId"
+            f" | filter {condition}"
+            " | sort @timestamp asc"
+            f" | limit {MAX_RESULTS_PER_QUERY}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "log_group": self.log_group,
+            "start_time": int(self.start_time),
+            "end_time": int(self.end_time),
+            "request_ids": self.request_ids,
+            "source": self.source,
+            "state_machine_arn": self.state_machine_arn
+        }
+
+
+def _segment_documents(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
+    documents = []
+    for segment in trace.get('Segments', []):
+        document = segment.get('Document', {})
+        if isinstance(document, str):
+            try:
+                document = json.loads(document)
+            except (TypeError, ValueError):
+                continue
+        if isinstance(document, dict):
+            documents.append(document)
+    return documents
+
+
+def _walk_subsegments(document: Dict[str, Any]):
+    for subsegment in document.get('subsegments', []) or []:
+        yield subsegment
+        yield from _walk_subsegments(subsegment)
+
+
+def _state_machine_from_arn(arn: str) -> Optional[tuple]:
+    """(state machine ARN, execution ARN or None) from a state machine or (express) execution ARN."""
+    parts = arn.split(':')
+    # arn:aws:states:region:account:<stateMachine|execution|express>:<name>[:<execution>...]
+    if len(parts) < 7 or parts[2] != 'states':
+        return None
+    state_machine_arn = ':'.join(parts[:5] + ['stateMachine', parts[6]])
+    if parts[5] == 'stateMachine':
+        return state_machine_arn, None
+    if parts[5] in ('execution', 'express'):
+        return state_machine_arn, arn
+    return None
+
+
+def _stepfunctions_target(arn: str, window: tuple) -> Optional[LogQueryTarget]:
+    """Target for a state machine's execution log, filtered on the execution ARN when known."""
+    parsed = _state_machine_from_arn(arn)
+    if not parsed:
+        return None
+    state_machine_arn, execution_arn = parsed
+    return LogQueryTarget(
+        # Default name; replaced by the state machine's configured log group when it can be read
+        log_group=f"/aws/stepfunctions/{state_machine_arn.split(':')[-1]}",
+        start_time=window[0],
+        end_time=window[1],
+        request_ids=[execution_arn] if execution_arn else [],
+        source="stepfunctions",
+        state_machine_arn=state_machine_arn
+    )
+
+
+def _window(document: Dict[str, Any]) -> Optional[tuple]:
+    start = document.get('start_time')
+    if start is None:
+        return None
+    end = document.get('end_time') or start
+    return start - LOG_WINDOW_PAD_BEFORE_SECONDS, end + LOG_WINDOW_PAD_AFTER_SECONDS
+
+
+def build_log_query_targets(trace: Dict[str, Any], log_groups: Optional[List[str]] = None) -> List[LogQueryTarget]:
+    """
+    Derive the log groups, request ids and time ranges a trace actually touched.
+
+    - Lambda function segments give /aws/lambda/<name> and their aws.request_id.
+    - Invoke subsegments of callers give the invoked function and its request id.
+    - API Gateway stage segments give the execution log group and request id.
+    - Step Functions segments, and subsegments of callers starting an
+      execution, give the state machine's log group and execution ARN.
+
+    Args:
+        trace: Raw trace as returned by BatchGetTraces
+        log_groups: Only build targets for these log groups (default: every group the trace touched)
+
+    Returns:
+        One merged LogQueryTarget per log group
+    """
+    targets: Dict[str, LogQueryTarget] = {}
+
+    def add(target: LogQueryTarget) -> None:
+        if log_groups is not None and target.log_group not in log_groups:
+            return
+        existing = targets.get(target.log_group)
+        if existing:
+            existing.merge(target)
+        else:
+            targets[target.log_group] = target
+
+    for document in _segment_documents(trace):
+        window = _window(document)
+        if not window:
+            continue
+        origin = document.get('origin', '')
+        aws_metadata = document.get('aws', {}) or {}
+
+        if origin.startswith('AWS::Lambda'):
+            request_id = aws_metadata.get('request_id')
+            add(LogQueryTarget(
+                log_group=f"/aws/lambda/{document.get('name')}",
+                start_time=window[0],
+                end_time=window[1],
+                request_ids=[request_id] if request_id else []
+            ))
+
+        elif origin == 'AWS::ApiGateway::Stage':
+            resource_arn = document.get('resource_arn', '') or ''
+            parts = resource_arn.split('/')
+            # arn:aws:apigateway:region::/restapis/<api-id>/stages/<stage>
+            if '/restapis/' in resource_arn and len(parts) >= 5:
+                request_id = (aws_metadata.get('api_gateway', {}) or {}).get('request_id')
+                add(LogQueryTarget(
+                    log_group=f"API-Gateway-Execution-Logs_{parts[2]}/{parts[4]}",
+                    start_time=window[0],
+                    end_time=window[1],
+                    request_ids=[request_id] if request_id else [],
+                    source="apigateway"
+                ))
+
+        elif origin.startswith('AWS::StepFunctions'):
+            arn = aws_metadata.get('execution_arn') or document.get('resource_arn') or ''
+            target = _stepfunctions_target(arn, window)
+            if target:
+                add(target)
+
+        for subsegment in _walk_subsegments(document):
+            sub_aws = subsegment.get('aws', {}) or {}
+            state_machine_arn = sub_aws.get('execution_arn') or sub_aws.get('state_machine_arn')
+            if subsegment.get('namespace') == 'aws' and state_machine_arn:
+                target = _stepfunctions_target(state_machine_arn, _window(subsegment) or window)
+                if target:
+                    add(target)
+            function_name = sub_aws.get('function_name')
+            if subsegment.get('namespace') == 'aws' and function_name and sub_aws.get('operation') == 'Invoke':
+                sub_window = _window(subsegment) or window
+                request_id = sub_aws.get('request_id')
+                add(LogQueryTarget(
+                    log_group=f"/aws/lambda/{function_name.split(':')[-1]}",
+                    start_time=sub_window[0],
+                    end_time=sub_window[1],
+                    request_ids=[request_id] if request_id else []
+                ))
+
+    return list(targets.values())[:MAX_CORRELATED_LOG_GROUPS]
+
+
+def resolve_stepfunctions_log_groups(targets: List[LogQueryTarget]) -> None:
+    """
+    Point Step Functions targets at the log group in their state machine's
+    logging configuration. Targets keep the default name when the state
+    machine cannot be described or has no CloudWatch Logs destination.
+    """
+    client = None
+    for target in targets:
+        if not target.state_machine_arn:
+            continue
+        try:
+            client = client or get_aws_client().get_client('stepfunctions')
+            response = client.describe_state_machine(stateMachineArn=target.state_machine_arn)
+        except Exception as e:
+            logger.debug(f"Could not read logging configuration of {target.state_machine_arn}: {e}")
+            continue
+        for destination in (response.get('loggingConfiguration') or {}).get('destinations') or []:
+            # arn:aws:logs:region:account:log-group:<name>:*
+            log_group_arn = (destination.get('cloudWatchLogsLogGroup') or {}).get('logGroupArn') or ''
+            parts = log_group_arn.split(':')
+            if len(parts) > 6 and parts[5] == 'log-group':
+                target.log_group = parts[6]
+                break
+
+
+def run_log_queries(
+    trace_id: str,
+    targets: List[LogQueryTarget],
+    max_wait: int = MAX_QUERY_WAIT_SECONDS
+) -> Dict[str, Any]:
+    """
+    Start one Insights query per target, then poll them together until all finish.
+
+    Returns:
+        Dictionary with log entries (tagged with their log group) and per-group errors
+    """
+    client = get_aws_client().get_client('logs')
+    pending: Dict[str, LogQueryTarget] = {}
+    errors: Dict[str, str] = {}
+
+    for target in targets:
+        try:
+            response = client.start_query(
+                logGroupName=target.log_group,
+                startTime=int(target.start_time),
+                endTime=int(target.end_time) + 1,
+                queryString=target.build_query(trace_id),
+                limit=MAX_RESULTS_PER_QUERY
+            )
+            pending[response['queryId']] = target
+        except Exception as e:
+            # Typically ResourceNotFoundException for groups that were never created
+            errors[target.log_group] = str(e)
+
+    logs: List[Dict[str, Any]] = []
+    bytes_scanned = 0.0
+    deadline = time.monotonic() + max_wait
+
+    while pending and time.monotonic() < deadline:
+        time.sleep(1)
+        for query_id, target in list(pending.items()):
+            result = client.get_query_results(queryId=query_id)
+            status = result.get('status')
+            if status == 'Complete':
+                for row in result.get('results', []):
+                    entry = {item['field']: item['value'] for item in row}
+                    entry['log_group'] = target.log_group
+                    logs.append(entry)
+                bytes_scanned += result.get('statistics', {}).get('bytesScanned', 0.0)
+                del pending[query_id]
+            elif status in ('Failed', 'Cancelled', 'Timeout'):
+                errors[target.log_group] = f"Query {status.lower()}"
+                del pending[query_id]
+
+    for query_id, target in pending.items():
+        errors[target.log_group] = f"Query timeout after {max_wait} seconds"
+        try:
+            client.stop_query(queryId=query_id)
+        except Exception:
+            pass
+
+    logs.sort(key=lambda entry: entry.get('@timestamp', ''))
+    return {"logs": logs, "errors": errors, "bytes_scanned": bytes_scanned}
+
+
+def correlate_trace_logs(trace_id: str, log_groups: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Find the log entries belonging to an X-Ray trace with narrow, targeted queries.
+
+    Args:
+        trace_id: The X-Ray trace ID
+        log_groups: Only query these log groups, with the time range the trace
+            spent in them (default: every group the trace touched)
+
+    Returns:
+        Dictionary with the query targets used and the matching log entries,
+        or an "error" key when the trace cannot be correlated
+    """
+    trace = _get_trace(trace_id)
+    if not trace:
+        return {"trace_id": trace_id, "error": "Trace not found"}
+
+    targets = build_log_query_targets(trace, log_groups)
+    if not targets:
+        if log_groups is not None:
+            return {"trace_id": trace_id, "error": f"Trace did not touch log groups {', '.join(log_groups)}"}
+        return {"trace_id": trace_id, "error": "Trace has no segments with correlatable log groups"}
+
+    resolve_stepfunctions_log_groups(targets)
+    logger.info(f"🔗 Correlating trace {trace_id} with {len(targets)} log groups")
+    results = run_log_queries(trace_id, targets)
+
+    return {
+        "trace_id": trace_id,
+        "targets": [target.to_dict() for target in targets],
+        "match_count": len(results["logs"]),
+        "logs": results["logs"],
+        "errors": results["errors"],
+        "bytes_scanned": results["bytes_scanned"]
+    }
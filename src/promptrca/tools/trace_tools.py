@@ -21,23 +21,13 @@ Contact: info@promptrca.com
 """
 
 from strands import tool
-from typing import Optional
+from typing import Dict, Any, Optional
 import json
 from ..context import get_aws_client
 
 
-@tool
-def query_logs_by_trace_id(query: str) -> str:
-    """
-    Query CloudWatch Logs Insights for ALL logs related to a specific X-Ray trace ID.
-    This is THE KEY tool for trace-driven investigation - it correlates logs with traces.
-
-    Args:
-        trace_id: The X-Ray trace ID to search for (e.g., "1-68e915e7-7a2c7c6d1427db5e5b97c431")
-
-    Returns:
-        JSON string with all logs matching the trace ID across all log groups
-    """
+def fetch_logs_by_trace_id(query: str) -> Dict[str, Any]:
+    """Query CloudWatch Logs Insights for ALL logs related to a specific X-Ray trace ID."""
     import time
     from datetime import datetime, timedelta
 
@@ -73,17 +63,17 @@ def query_logs_by_trace_id(query: str) -> str:
                 if len(existing_log_groups) >= 20:
                     break
         except Exception as e:
-            return json.dumps({
+            return {
                 "trace_id": trace_id,
                 "error": f"Failed to list log groups: {str(e)}"
-            })
+            }
 
         if not existing_log_groups:
-            return json.dumps({
+            return {
                 "trace_id": trace_id,
                 "error": "No serverless log groups found",
                 "searched_patterns": ["/aws/lambda/", "/aws/stepfunctions/", "API-Gateway-Execution-Logs"]
-            })
+            }
 
         # Start Insights query
         response = client.start_query(
@@ -113,44 +103,49 @@ def query_logs_by_trace_id(query: str) -> str:
                         log_entry[field['field']] = field['value']
                     logs.append(log_entry)
 
-                return json.dumps({
+                return {
                     "trace_id": trace_id,
                     "log_groups_searched": existing_log_groups,
                     "match_count": len(logs),
                     "logs": logs[:50],  # Return top 50 matches
                     "query": query
-                }, indent=2)
+                }
 
             elif status in ['Failed', 'Cancelled']:
-                return json.dumps({
+                return {
                     "trace_id": trace_id,
                     "error": f"Query {status.lower()}",
                     "status": status
-                })
+                }
 
         # Timeout
-        return json.dumps({
+        return {
             "trace_id": trace_id,
             "error": "Query timeout after 30 seconds",
             "status": "Timeout"
-        })
+        }
 
     except Exception as e:
-        return json.dumps({"error": str(e), "trace_id": trace_id})
+        return {"error": str(e), "trace_id": trace_id}
 
 
 @tool
-def get_stepfunctions_execution_details(execution_arn: str) -> str:
+def query_logs_by_trace_id(query: str) -> str:
     """
-    Get detailed Step Functions execution information including status, input, output, and history.
-    Use this when you have a Step Functions execution ARN to investigate what happened.
+    Query CloudWatch Logs Insights for ALL logs related to a specific X-Ray trace ID.
+    This is THE KEY tool for trace-driven investigation - it correlates logs with traces.
 
     Args:
-        execution_arn: The Step Functions execution ARN
+        trace_id: The X-Ray trace ID to search for (e.g., "1-68e915e7-7a2c7c6d1427db5e5b97c431")
 
     Returns:
-        JSON string with execution details including history events
+        JSON string with all logs matching the trace ID across all log groups
     """
+    return json.dumps(fetch_logs_by_trace_id(query), indent=2, default=str)
+
+
+def fetch_stepfunctions_execution_details(execution_arn: str) -> Dict[str, Any]:
+    """Get detailed Step Functions execution information including status, input, output, and history."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -189,36 +184,39 @@ def get_stepfunctions_execution_details(execution_arn: str) -> str:
             ]
         }
 
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "execution_arn": execution_arn})
+        return {"error": str(e), "execution_arn": execution_arn}
 
 
 @tool
-def resolve_api_gateway_id(resolve: str) -> str:
+def get_stepfunctions_execution_details(execution_arn: str) -> str:
     """
-    Resolve API Gateway name or ID to the actual REST API ID.
-    Handles both cases:
-    - If given a numeric ID (like "142gh05m9a"), returns it as-is
-    - If given a name (like "promptrca-test-test-api"), looks it up and returns the ID
+    Get detailed Step Functions execution information including status, input, output, and history.
+    Use this when you have a Step Functions execution ARN to investigate what happened.
 
     Args:
-        api_name_or_id: API Gateway name or ID
+        execution_arn: The Step Functions execution ARN
 
     Returns:
-        JSON string with the REST API ID
+        JSON string with execution details including history events
     """
+    return json.dumps(fetch_stepfunctions_execution_details(execution_arn), indent=2, default=str)
+
+
+def fetch_api_gateway_id(resolve: str) -> Dict[str, Any]:
+    """Resolve API Gateway name or ID to the actual REST API ID."""
     import re
 
     try:
         # Check if it's already a REST API ID format (alphanumeric, typically 10 chars)
         # REST API IDs look like: 142gh05m9a, abc123xyz, etc.
         if re.match(r'^[a-z0-9]{10}$', api_name_or_id):
-            return json.dumps({
+            return {
                 "api_id": api_name_or_id,
                 "source": "direct",
                 "message": "Already a valid REST API ID"
-            })
+            }
 
         # Otherwise, search for it by name
         # Get AWS client from context
@@ -230,36 +228,43 @@ def resolve_api_gateway_id(resolve: str) -> str:
         for page in paginator.paginate():
             for api in page.get('items', []):
                 if api['name'] == api_name_or_id:
-                    return json.dumps({
+                    return {
                         "api_id": api['id'],
                         "api_name": api['name'],
                         "source": "name_lookup",
                         "message": f"Resolved '{api_name_or_id}' to REST API ID '{api['id']}'"
-                    })
+                    }
 
         # Not found
-        return json.dumps({
+        return {
             "error": "API Gateway not found",
             "api_name_or_id": api_name_or_id,
             "message": f"No REST API found with name '{api_name_or_id}'"
-        })
+        }
 
     except Exception as e:
-        return json.dumps({"error": str(e), "api_name_or_id": api_name_or_id})
+        return {"error": str(e), "api_name_or_id": api_name_or_id}
 
 
 @tool
-def get_all_resources_from_trace(trace_id: str) -> str:
+def resolve_api_gateway_id(resolve: str) -> str:
     """
-    Extract ALL AWS resources involved in an X-Ray trace.
-    This discovers Lambda functions, Step Functions, API Gateways, and other services.
+    Resolve API Gateway name or ID to the actual REST API ID.
+    Handles both cases:
+    - If given a numeric ID (like "142gh05m9a"), returns it as-is
+    - If given a name (like "promptrca-test-test-api"), looks it up and returns the ID
 
     Args:
-        trace_id: The X-Ray trace ID
+        api_name_or_id: API Gateway name or ID
 
     Returns:
-        JSON string with all discovered resources and their metadata
+        JSON string with the REST API ID
     """
+    return json.dumps(fetch_api_gateway_id(resolve), indent=2, default=str)
+
+
+def fetch_all_resources_from_trace(trace_id: str) -> Dict[str, Any]:
+    """Extract ALL AWS resources involved in an X-Ray trace."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -267,7 +272,7 @@ def get_all_resources_from_trace(trace_id: str) -> str:
         response = client.batch_get_traces(TraceIds=[trace_id])
 
         if not response.get('Traces'):
-            return json.dumps({"error": "Trace not found", "trace_id": trace_id})
+            return {"error": "Trace not found", "trace_id": trace_id}
 
         trace = response['Traces'][0]
         segments = trace.get('Segments', [])
@@ -346,13 +351,28 @@ def get_all_resources_from_trace(trace_id: str) -> str:
             if resource:
                 resources.append(resource)
 
-        return json.dumps({
+        return {
             "trace_id": trace_id,
             "duration": trace.get('Duration'),
             "is_partial": trace.get('IsPartial', False),
             "resource_count": len(resources),
             "resources": resources
-        }, indent=2)
+        }
 
     except Exception as e:
-        return json.dumps({"error": str(e), "trace_id": trace_id})
+        return {"error": str(e), "trace_id": trace_id}
+
+
+@tool
+def get_all_resources_from_trace(trace_id: str) -> str:
+    """
+    Extract ALL AWS resources involved in an X-Ray trace.
+    This discovers Lambda functions, Step Functions, API Gateways, and other services.
+
+    Args:
+        trace_id: The X-Ray trace ID
+
+    Returns:
+        JSON string with all discovered resources and their metadata
+    """
+    return json.dumps(fetch_all_resources_from_trace(trace_id), indent=2, default=str)
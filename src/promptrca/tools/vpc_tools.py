@@ -26,17 +26,8 @@ import json
 from ..context import get_aws_client
 
 
-@tool
-def get_vpc_config(vpc_id: str) -> str:
-    """
-    Get VPC configuration and details.
-    
-    Args:
-        vpc_id: The VPC ID
-    
-    Returns:
-        JSON string with VPC configuration
-    """
+def fetch_vpc_config(vpc_id: str) -> Dict[str, Any]:
+    """Get VPC configuration and details."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -58,22 +49,27 @@ def get_vpc_config(vpc_id: str) -> str:
             "tags": vpc.get('Tags', [])
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "vpc_id": vpc_id})
+        return {"error": str(e), "vpc_id": vpc_id}
 
 
 @tool
-def get_subnet_config(subnet_id: str) -> str:
+def get_vpc_config(vpc_id: str) -> str:
     """
-    Get subnet configuration and details.
+    Get VPC configuration and details.
     
     Args:
-        subnet_id: The subnet ID
+        vpc_id: The VPC ID
     
     Returns:
-        JSON string with subnet configuration
+        JSON string with VPC configuration
     """
+    return json.dumps(fetch_vpc_config(vpc_id), indent=2, default=str)
+
+
+def fetch_subnet_config(subnet_id: str) -> Dict[str, Any]:
+    """Get subnet configuration and details."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -100,22 +96,27 @@ def get_subnet_config(subnet_id: str) -> str:
             "tags": subnet.get('Tags', [])
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "subnet_id": subnet_id})
+        return {"error": str(e), "subnet_id": subnet_id}
 
 
 @tool
-def get_security_group_config(security_group_id: str) -> str:
+def get_subnet_config(subnet_id: str) -> str:
     """
-    Get security group configuration and rules.
+    Get subnet configuration and details.
     
     Args:
-        security_group_id: The security group ID
+        subnet_id: The subnet ID
     
     Returns:
-        JSON string with security group configuration
+        JSON string with subnet configuration
     """
+    return json.dumps(fetch_subnet_config(subnet_id), indent=2, default=str)
+
+
+def fetch_security_group_config(security_group_id: str) -> Dict[str, Any]:
+    """Get security group configuration and rules."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -136,22 +137,27 @@ def get_security_group_config(security_group_id: str) -> str:
             "tags": sg.get('Tags', [])
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "security_group_id": security_group_id})
+        return {"error": str(e), "security_group_id": security_group_id}
 
 
 @tool
-def get_network_interface_config(network_interface_id: str) -> str:
+def get_security_group_config(security_group_id: str) -> str:
     """
-    Get network interface (ENI) configuration.
+    Get security group configuration and rules.
     
     Args:
-        network_interface_id: The network interface ID
+        security_group_id: The security group ID
     
     Returns:
-        JSON string with network interface configuration
+        JSON string with security group configuration
     """
+    return json.dumps(fetch_security_group_config(security_group_id), indent=2, default=str)
+
+
+def fetch_network_interface_config(network_interface_id: str) -> Dict[str, Any]:
+    """Get network interface (ENI) configuration."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -184,22 +190,27 @@ def get_network_interface_config(network_interface_id: str) -> str:
             "interface_type": eni.get('InterfaceType')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "network_interface_id": network_interface_id})
+        return {"error": str(e), "network_interface_id": network_interface_id}
 
 
 @tool
-def get_nat_gateway_config(nat_gateway_id: str) -> str:
+def get_network_interface_config(network_interface_id: str) -> str:
     """
-    Get NAT Gateway configuration.
+    Get network interface (ENI) configuration.
     
     Args:
-        nat_gateway_id: The NAT Gateway ID
+        network_interface_id: The network interface ID
     
     Returns:
-        JSON string with NAT Gateway configuration
+        JSON string with network interface configuration
     """
+    return json.dumps(fetch_network_interface_config(network_interface_id), indent=2, default=str)
+
+
+def fetch_nat_gateway_config(nat_gateway_id: str) -> Dict[str, Any]:
+    """Get NAT Gateway configuration."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -220,22 +231,27 @@ def get_nat_gateway_config(nat_gateway_id: str) -> str:
             "tags": nat_gw.get('Tags', [])
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "nat_gateway_id": nat_gateway_id})
+        return {"error": str(e), "nat_gateway_id": nat_gateway_id}
 
 
 @tool
-def get_internet_gateway_config(igw_id: str) -> str:
+def get_nat_gateway_config(nat_gateway_id: str) -> str:
     """
-    Get Internet Gateway configuration.
+    Get NAT Gateway configuration.
     
     Args:
-        igw_id: The Internet Gateway ID
+        nat_gateway_id: The NAT Gateway ID
     
     Returns:
-        JSON string with Internet Gateway configuration
+        JSON string with NAT Gateway configuration
     """
+    return json.dumps(fetch_nat_gateway_config(nat_gateway_id), indent=2, default=str)
+
+
+def fetch_internet_gateway_config(igw_id: str) -> Dict[str, Any]:
+    """Get Internet Gateway configuration."""
     try:
         # Get AWS client from context
         aws_client = get_aws_client()
@@ -252,6 +268,20 @@ def get_internet_gateway_config(igw_id: str) -> str:
             "tags": igw.get('Tags', [])
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "igw_id": igw_id})
+        return {"error": str(e), "igw_id": igw_id}
+
+
+@tool
+def get_internet_gateway_config(igw_id: str) -> str:
+    """
+    Get Internet Gateway configuration.
+    
+    Args:
+        igw_id: The Internet Gateway ID
+    
+    Returns:
+        JSON string with Internet Gateway configuration
+    """
+    return json.dumps(fetch_internet_gateway_config(igw_id), indent=2, default=str)
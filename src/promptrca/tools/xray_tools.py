@@ -21,43 +21,138 @@ Contact: info@promptrca.com
 """
 
 from strands import tool
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import json
-from ..context import get_aws_client
+from ..context import get_aws_client, get_trace_store, submit_with_context
+from ..utils.trace_cache import get_trace_disk_cache, is_partial_trace
 
+# BatchGetTraces accepts at most 5 trace ids per call
+BATCH_GET_TRACES_MAX_IDS = 5
+DEFAULT_TRACE_FETCH_WORKERS = 4
 
-@tool
-def get_xray_trace(trace_id: str) -> str:
+
+def _batch_get_traces(client, trace_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch one BatchGetTraces chunk and index the returned traces by id."""
+    response = client.batch_get_traces(TraceIds=trace_ids)
+    traces = response.get('Traces', [])
+    if len(trace_ids) == 1:
+        # Single-id lookups keep the original Traces[0] semantics
+        return {trace_ids[0]: traces[0]} if traces else {}
+    return {trace['Id']: trace for trace in traces if trace.get('Id') in trace_ids}
+
+
+def fetch_traces(trace_ids: List[str], max_workers: int = DEFAULT_TRACE_FETCH_WORKERS) -> Dict[str, Dict[str, Any]]:
     """
-    Get X-Ray trace details.
-    
+    Fetch raw X-Ray traces, serving from the investigation trace store when possible.
+
+    Lookup order is the in-memory trace store, then the on-disk cache of
+    completed traces, then BatchGetTraces. Missing traces are requested in
+    BatchGetTraces-sized chunks issued in parallel, and stored back so later
+    tool calls (and later investigations, for completed traces) do not fetch
+    them again.
+
     Args:
-        trace_id: The X-Ray trace ID
-    
+        trace_ids: X-Ray trace IDs to fetch
+        max_workers: Maximum number of concurrent BatchGetTraces calls
+
     Returns:
-        JSON string with trace details
+        Dictionary mapping trace id to the raw trace (Id, Duration, LimitExceeded, Segments).
+        Traces that could not be found are omitted.
     """
+    trace_ids = list(dict.fromkeys(trace_ids))
+    store = get_trace_store()
+    traces: Dict[str, Dict[str, Any]] = {}
+
+    if store is not None:
+        for trace_id in trace_ids:
+            cached = store.get(trace_id)
+            if cached is not None:
+                traces[trace_id] = cached
+        missing = store.missing(trace_ids)
+    else:
+        missing = trace_ids
+
+    if not missing:
+        return traces
+
+    aws_client = get_aws_client()
+    account_id = getattr(aws_client, 'account_id', None)
+    disk_cache = get_trace_disk_cache() if isinstance(account_id, str) else None
+
+    if disk_cache is not None:
+        still_missing = []
+        for trace_id in missing:
+            cached = disk_cache.get(account_id, trace_id)
+            if cached is not None:
+                traces[trace_id] = cached
+                if store is not None:
+                    store.put(trace_id, cached)
+            else:
+                still_missing.append(trace_id)
+        missing = still_missing
+        if not missing:
+            return traces
+
+    client = aws_client.get_client('xray')
+    chunks = [missing[i:i + BATCH_GET_TRACES_MAX_IDS] for i in range(0, len(missing), BATCH_GET_TRACES_MAX_IDS)]
+
+    if len(chunks) == 1:
+        fetched = [_batch_get_traces(client, chunks[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            futures = [submit_with_context(executor, _batch_get_traces, client, chunk) for chunk in chunks]
+            fetched = [future.result() for future in futures]
+
+    for chunk_traces in fetched:
+        for trace_id, trace in chunk_traces.items():
+            traces[trace_id] = trace
+            if store is not None:
+                store.put(trace_id, trace)
+            if disk_cache is not None:
+                # Partial traces are still being written by X-Ray and are skipped
+                disk_cache.put(account_id, trace_id, trace)
+
+    return traces
+
+
+def _get_trace(trace_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a single raw trace, or None if X-Ray does not return it."""
+    return fetch_traces([trace_id]).get(trace_id)
+
+
+def fetch_xray_trace(trace_id: str) -> Dict[str, Any]:
+    """Get X-Ray trace details."""
     
     try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('xray')
-        response = client.batch_get_traces(TraceIds=[trace_id])
+        trace = _get_trace(trace_id)
         
-        if response.get('Traces'):
-            trace = response['Traces'][0]
+        if trace:
             config = {
                 "trace_id": trace_id,
                 "duration": trace.get('Duration'),
                 "segments": trace.get('Segments', []),
-                "is_partial": trace.get('IsPartial', False)
+                "is_partial": is_partial_trace(trace)
             }
-            return json.dumps(config, indent=2)
+            return config
         else:
-            return json.dumps({"error": "Trace not found", "trace_id": trace_id})
+            return {"error": "Trace not found", "trace_id": trace_id}
     except Exception as e:
-        return json.dumps({"error": str(e), "trace_id": trace_id})
+        return {"error": str(e), "trace_id": trace_id}
+
+
+@tool
+def get_xray_trace(trace_id: str) -> str:
+    """
+    Get X-Ray trace details.
+    
+    Args:
+        trace_id: The X-Ray trace ID
+    
+    Returns:
+        JSON string with trace details
+    """
+    return json.dumps(fetch_xray_trace(trace_id), indent=2, default=str)
 
 
 def _parse_arn(arn: str) -> dict:
@@ -85,30 +180,15 @@ def _parse_arn(arn: str) -> dict:
         return {}
 
 
-@tool
-def get_all_resources_from_trace(trace_id: str) -> str:
-    """
-    Extract ALL AWS resources involved in an X-Ray trace.
-    This discovers Lambda functions, Step Functions, API Gateways, and other services.
-
-    Args:
-        trace_id: The X-Ray trace ID
-
-    Returns:
-        JSON string with all discovered resources and their metadata
-    """
+def fetch_all_resources_from_trace(trace_id: str) -> Dict[str, Any]:
+    """Extract ALL AWS resources involved in an X-Ray trace."""
 
     try:
-        # Get AWS client from context
-        aws_client = get_aws_client()
-        region = aws_client.region
-        client = aws_client.get_client('xray')
-        response = client.batch_get_traces(TraceIds=[trace_id])
+        trace = _get_trace(trace_id)
 
-        if not response.get('Traces'):
-            return json.dumps({"error": "Trace not found", "trace_id": trace_id})
+        if not trace:
+            return {"error": "Trace not found", "trace_id": trace_id}
 
-        trace = response['Traces'][0]
         segments = trace.get('Segments', [])
 
         resources = []
@@ -207,30 +287,35 @@ def get_all_resources_from_trace(trace_id: str) -> str:
             if resource:
                 resources.append(resource)
 
-        return json.dumps({
+        return {
             "trace_id": trace_id,
             "duration": trace.get('Duration'),
-            "is_partial": trace.get('IsPartial', False),
+            "is_partial": is_partial_trace(trace),
             "resource_count": len(resources),
             "resources": resources
-        }, indent=2)
+        }
 
     except Exception as e:
-        return json.dumps({"error": str(e), "trace_id": trace_id})
+        return {"error": str(e), "trace_id": trace_id}
 
 
 @tool
-def get_xray_service_graph(service_name: str = None, hours_back: int = 1) -> str:
+def get_all_resources_from_trace(trace_id: str) -> str:
     """
-    Get X-Ray service graph showing service dependencies.
-    
+    Extract ALL AWS resources involved in an X-Ray trace.
+    This discovers Lambda functions, Step Functions, API Gateways, and other services.
+
     Args:
-        service_name: Optional service name to filter by
-        hours_back: Number of hours to look back (default: 1)
-    
+        trace_id: The X-Ray trace ID
+
     Returns:
-        JSON string with service graph data
+        JSON string with all discovered resources and their metadata
     """
+    return json.dumps(fetch_all_resources_from_trace(trace_id), indent=2, default=str)
+
+
+def fetch_xray_service_graph(service_name: str = None, hours_back: int = 1) -> Dict[str, Any]:
+    """Get X-Ray service graph showing service dependencies."""
     
     from datetime import datetime, timedelta
     
@@ -262,24 +347,28 @@ def get_xray_service_graph(service_name: str = None, hours_back: int = 1) -> str
             "next_token": response.get('NextToken')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "service_name": service_name})
+        return {"error": str(e), "service_name": service_name}
 
 
 @tool
-def get_xray_trace_summaries(start_time: str, end_time: str, filter_expression: str = None) -> str:
+def get_xray_service_graph(service_name: str = None, hours_back: int = 1) -> str:
     """
-    Get X-Ray trace summaries for a time range.
+    Get X-Ray service graph showing service dependencies.
     
     Args:
-        start_time: Start time in ISO format (e.g., "2024-01-01T00:00:00Z")
-        end_time: End time in ISO format (e.g., "2024-01-01T23:59:59Z")
-        filter_expression: Optional filter expression
+        service_name: Optional service name to filter by
+        hours_back: Number of hours to look back (default: 1)
     
     Returns:
-        JSON string with trace summaries
+        JSON string with service graph data
     """
+    return json.dumps(fetch_xray_service_graph(service_name, hours_back), indent=2, default=str)
+
+
+def fetch_xray_trace_summaries(start_time: str, end_time: str, filter_expression: str = None) -> Dict[str, Any]:
+    """Get X-Ray trace summaries for a time range."""
     
     from datetime import datetime
 
@@ -315,6 +404,22 @@ def get_xray_trace_summaries(start_time: str, end_time: str, filter_expression:
             "next_token": response.get('NextToken')
         }
         
-        return json.dumps(config, indent=2)
+        return config
     except Exception as e:
-        return json.dumps({"error": str(e), "start_time": start_time, "end_time": end_time})
+        return {"error": str(e), "start_time": start_time, "end_time": end_time}
+
+
+@tool
+def get_xray_trace_summaries(start_time: str, end_time: str, filter_expression: str = None) -> str:
+    """
+    Get X-Ray trace summaries for a time range.
+    
+    Args:
+        start_time: Start time in ISO format (e.g., "2024-01-01T00:00:00Z")
+        end_time: End time in ISO format (e.g., "2024-01-01T23:59:59Z")
+        filter_expression: Optional filter expression
+    
+    Returns:
+        JSON string with trace summaries
+    """
+    return json.dumps(fetch_xray_trace_summaries(start_time, end_time, filter_expression), indent=2, default=str)
@@ -21,6 +21,15 @@ Contact: info@promptrca.com
 """
 
 from .logger import setup_logger, get_logger
-from .validation import clamp_confidence, normalize_fact_item, normalize_facts
+from .lazy_exports import lazy_exports
+
+# Imported on first access; validation pulls in the pydantic models
+_LAZY_EXPORTS = {
+    "clamp_confidence": ".validation",
+    "normalize_fact_item": ".validation",
+    "normalize_facts": ".validation",
+}
 
 __all__ = ['setup_logger', 'get_logger', 'clamp_confidence', 'normalize_fact_item', 'normalize_facts']
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_EXPORTS)
@@ -23,8 +23,11 @@ Handles environment variable parsing and provides consistent defaults.
 """
 
 import os
-from typing import Dict, Any, Optional
-from strands.models import BedrockModel
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    # strands is imported on first model creation, keeping it out of cold-start imports
+    from strands.models import BedrockModel
 
 # Default region - can be overridden by environment variables
 DEFAULT_REGION = "eu-west-1"
@@ -75,7 +78,31 @@ def get_bedrock_model_config() -> Dict[str, Any]:
     return config
 
 
-def create_bedrock_model(temperature_override: Optional[float] = None) -> BedrockModel:
+def _new_model(**config: Any) -> "BedrockModel":
+    """
+    Get a BedrockModel for this configuration.
+
+    Models are shared across agents through the model registry unless
+    PROMPTRCA_SHARED_MODELS=false, and are served through the LLM response
+    cache when it is enabled and the temperature is low enough to cache.
+    """
+    from strands.models import BedrockModel
+    from .feature_flags import FeatureFlags
+    from .llm_cache import CachedBedrockModel, get_llm_response_cache, is_cacheable_temperature
+    from .model_registry import get_model_registry
+
+    factory = BedrockModel
+    cache = get_llm_response_cache()
+    if cache is not None and is_cacheable_temperature(config.get("temperature")):
+        factory = CachedBedrockModel
+        config["cache"] = cache
+
+    if FeatureFlags.is_shared_models_enabled():
+        return get_model_registry().get(factory, **config)
+    return factory(**config)
+
+
+def create_bedrock_model(temperature_override: Optional[float] = None) -> "BedrockModel":
     """
     Create a BedrockModel instance with environment-based configuration.
     
@@ -88,7 +115,7 @@ def create_bedrock_model(temperature_override: Optional[float] = None) -> Bedroc
     config = get_bedrock_model_config()
     if temperature_override is not None:
         config["temperature"] = temperature_override
-    return BedrockModel(**config)
+    return _new_model(**config)
 
 
 def get_max_tokens(default: int = 1500) -> int:
@@ -116,7 +143,7 @@ def get_temperature(agent: str | None = None, default: float = 0.2) -> float:
     return default
 
 
-def create_parser_model() -> BedrockModel:
+def create_parser_model() -> "BedrockModel":
     """
     Create a dedicated low-temp, low-token model for the fallback parser agent.
     Enforces temperature≈0.1 and max_tokens≈256 irrespective of global defaults.
@@ -126,10 +153,10 @@ def create_parser_model() -> BedrockModel:
     cfg["temperature"] = float(os.getenv("PROMPTRCA_PARSER_TEMPERATURE", "0.1"))
     # Ensure a tight cap for tokens used by the parser
     cfg["max_tokens"] = int(os.getenv("PROMPTRCA_PARSER_MAX_TOKENS", "256"))
-    return BedrockModel(**cfg)
+    return _new_model(**cfg)
 
 
-def create_synthesis_model() -> BedrockModel:
+def create_synthesis_model() -> "BedrockModel":
     """
     Create a model for synthesis with lower temperature.
     
@@ -140,7 +167,7 @@ def create_synthesis_model() -> BedrockModel:
     return create_bedrock_model(temperature_override=synthesis_temp)
 
 
-def create_orchestrator_model() -> BedrockModel:
+def create_orchestrator_model() -> "BedrockModel":
     """
     Create a model for the lead orchestrator agent.
     
@@ -149,10 +176,10 @@ def create_orchestrator_model() -> BedrockModel:
     """
     model_id = os.getenv("PROMPTRCA_ORCHESTRATOR_MODEL_ID") or os.getenv("BEDROCK_MODEL_ID", "openai.gpt-oss-120b-1:0")
     temperature = float(os.getenv("PROMPTRCA_ORCHESTRATOR_TEMPERATURE") or os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_lambda_agent_model() -> BedrockModel:
+def create_lambda_agent_model() -> "BedrockModel":
     """
     Create a model for the Lambda specialist agent.
     
@@ -168,10 +195,10 @@ def create_lambda_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_apigateway_agent_model() -> BedrockModel:
+def create_apigateway_agent_model() -> "BedrockModel":
     """
     Create a model for the API Gateway specialist agent.
     
@@ -187,10 +214,10 @@ def create_apigateway_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_stepfunctions_agent_model() -> BedrockModel:
+def create_stepfunctions_agent_model() -> "BedrockModel":
     """
     Create a model for the Step Functions specialist agent.
     
@@ -206,10 +233,10 @@ def create_stepfunctions_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_iam_agent_model() -> BedrockModel:
+def create_iam_agent_model() -> "BedrockModel":
     """
     Create a model for the IAM specialist agent.
     
@@ -225,10 +252,10 @@ def create_iam_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_dynamodb_agent_model() -> BedrockModel:
+def create_dynamodb_agent_model() -> "BedrockModel":
     """
     Create a model for the DynamoDB specialist agent.
     
@@ -244,10 +271,10 @@ def create_dynamodb_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_s3_agent_model() -> BedrockModel:
+def create_s3_agent_model() -> "BedrockModel":
     """
     Create a model for the S3 specialist agent.
     
@@ -263,10 +290,10 @@ def create_s3_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_sqs_agent_model() -> BedrockModel:
+def create_sqs_agent_model() -> "BedrockModel":
     """
     Create a model for the SQS specialist agent.
     
@@ -282,10 +309,10 @@ def create_sqs_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_sns_agent_model() -> BedrockModel:
+def create_sns_agent_model() -> "BedrockModel":
     """
     Create a model for the SNS specialist agent.
     
@@ -301,10 +328,10 @@ def create_sns_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_eventbridge_agent_model() -> BedrockModel:
+def create_eventbridge_agent_model() -> "BedrockModel":
     """
     Create a model for the EventBridge specialist agent.
     
@@ -320,10 +347,10 @@ def create_eventbridge_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_vpc_agent_model() -> BedrockModel:
+def create_vpc_agent_model() -> "BedrockModel":
     """
     Create a model for the VPC specialist agent.
     
@@ -339,10 +366,10 @@ def create_vpc_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_SPECIALIST_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    return BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    return _new_model(model_id=model_id, temperature=temperature, streaming=False)
 
 
-def create_hypothesis_agent_model() -> BedrockModel:
+def create_hypothesis_agent_model() -> "BedrockModel":
     """
     Create a model for the hypothesis generation agent.
     
@@ -359,7 +386,7 @@ def create_hypothesis_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
     # Apply max_tokens cap if provided
-    model = BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    model = _new_model(model_id=model_id, temperature=temperature, streaming=False)
     max_tokens = get_max_tokens()
     try:
         setattr(model, "max_tokens", max_tokens)
@@ -368,7 +395,7 @@ def create_hypothesis_agent_model() -> BedrockModel:
     return model
 
 
-def create_root_cause_agent_model() -> BedrockModel:
+def create_root_cause_agent_model() -> "BedrockModel":
     """
     Create a model for the root cause analysis agent.
     
@@ -384,7 +411,7 @@ def create_root_cause_agent_model() -> BedrockModel:
                        os.getenv("PROMPTRCA_ANALYSIS_TEMPERATURE") or 
                        os.getenv("PROMPTRCA_TEMPERATURE", "0.7"))
     
-    model = BedrockModel(model_id=model_id, temperature=temperature, streaming=False)
+    model = _new_model(model_id=model_id, temperature=temperature, streaming=False)
     max_tokens = get_max_tokens()
     try:
         setattr(model, "max_tokens", max_tokens)
@@ -492,8 +519,6 @@ def setup_strands_telemetry() -> None:
         return
     
     try:
-        from strands.telemetry import StrandsTelemetry
-        
         # Get configuration from environment
         otlp_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
         service_name = os.getenv("OTEL_SERVICE_NAME", "promptrca")
@@ -509,6 +534,9 @@ def setup_strands_telemetry() -> None:
             print("⚠️  OTEL_EXPORTER_OTLP_ENDPOINT not set, skipping telemetry setup")
             return
 
+        # Imported only when telemetry is configured; it pulls in strands and opentelemetry
+        from strands.telemetry import StrandsTelemetry
+
         # Initialize Strands telemetry
         strands_telemetry = StrandsTelemetry()
 
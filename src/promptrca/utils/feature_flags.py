@@ -37,6 +37,16 @@ class FeatureFlags:
     - PROMPTRCA_USE_DIRECT_ORCHESTRATION: Enable direct code orchestration (true/false)
     - PROMPTRCA_DIRECT_ORCHESTRATION_PERCENTAGE: Percentage of traffic to route to new orchestrator (0-100)
     - PROMPTRCA_FORCE_ORCHESTRATOR: Force specific orchestrator ('direct' or 'agent_tools')
+    - PROMPTRCA_EXEMPLAR_TRACES: Pick exemplar X-Ray traces when no trace ID is given (default: true)
+    - PROMPTRCA_EVIDENCE_PRECOLLECTION: Run specialists in code before the swarm (default: false)
+    - PROMPTRCA_DETERMINISTIC_INPUT_ROUTING: Skip the LLM input parser when regex parsing finds targets (default: true)
+    - PROMPTRCA_COMPACT_TOOL_OUTPUT: Compactly re-encode tool results before the model sees them (default: true)
+    - PROMPTRCA_LLM_CACHE: Serve repeated low-temperature model requests from a response cache (default: false)
+    - PROMPTRCA_SHARED_MODELS: Share Bedrock model instances and connections across agents (default: true)
+    - PROMPTRCA_PARALLEL_SPECIALISTS: Run the specialists for known services as parallel graph branches (default: false)
+    - PROMPTRCA_COALESCE_INVESTIGATIONS: Attach duplicate concurrent investigations to the one in flight (default: true)
+    - PROMPTRCA_REPORT_CACHE: Answer repeat investigations from recently completed reports (default: true)
+    - PROMPTRCA_ALARM_CLUSTERING: Investigate related alarms of an SNS/SQS batch once per cluster (default: true)
 
     Examples:
         # Enable for all traffic
@@ -157,6 +167,106 @@ class FeatureFlags:
         else:
             return f"dynamic_{percentage}%"
 
+    @staticmethod
+    def is_exemplar_trace_selection_enabled() -> bool:
+        """
+        Check if exemplar traces should be selected for investigations without a trace ID.
+
+        Returns:
+            True unless PROMPTRCA_EXEMPLAR_TRACES is set to false
+        """
+        return os.getenv("PROMPTRCA_EXEMPLAR_TRACES", "true").lower() == "true"
+
+    @staticmethod
+    def is_evidence_precollection_enabled() -> bool:
+        """
+        Check if the evidence pre-collection graph stage should run before the swarm.
+
+        Returns:
+            True if PROMPTRCA_EVIDENCE_PRECOLLECTION is set to true
+        """
+        return os.getenv("PROMPTRCA_EVIDENCE_PRECOLLECTION", "false").lower() == "true"
+
+    @staticmethod
+    def is_deterministic_input_routing_enabled() -> bool:
+        """
+        Check if the graph should bypass the LLM input parser when regex parsing succeeds.
+
+        Returns:
+            True unless PROMPTRCA_DETERMINISTIC_INPUT_ROUTING is set to false
+        """
+        return os.getenv("PROMPTRCA_DETERMINISTIC_INPUT_ROUTING", "true").lower() == "true"
+
+    @staticmethod
+    def is_compact_tool_output_enabled() -> bool:
+        """
+        Check if tool results should be compactly re-encoded for the model.
+
+        Returns:
+            True unless PROMPTRCA_COMPACT_TOOL_OUTPUT is set to false
+        """
+        return os.getenv("PROMPTRCA_COMPACT_TOOL_OUTPUT", "true").lower() == "true"
+
+    @staticmethod
+    def is_llm_response_cache_enabled() -> bool:
+        """
+        Check if low-temperature model responses should be cached.
+
+        Returns:
+            True if PROMPTRCA_LLM_CACHE is set to true
+        """
+        return os.getenv("PROMPTRCA_LLM_CACHE", "false").lower() == "true"
+
+    @staticmethod
+    def is_shared_models_enabled() -> bool:
+        """
+        Check if Bedrock model instances should be shared across agents.
+
+        Returns:
+            True unless PROMPTRCA_SHARED_MODELS is set to false
+        """
+        return os.getenv("PROMPTRCA_SHARED_MODELS", "true").lower() == "true"
+
+    @staticmethod
+    def is_parallel_specialists_enabled() -> bool:
+        """
+        Check if the graph should fan out to parallel specialist branches when services are known.
+
+        Returns:
+            True if PROMPTRCA_PARALLEL_SPECIALISTS is set to true
+        """
+        return os.getenv("PROMPTRCA_PARALLEL_SPECIALISTS", "false").lower() == "true"
+
+    @staticmethod
+    def is_investigation_coalescing_enabled() -> bool:
+        """
+        Check if concurrent duplicate investigations should share one run.
+
+        Returns:
+            True unless PROMPTRCA_COALESCE_INVESTIGATIONS is set to false
+        """
+        return os.getenv("PROMPTRCA_COALESCE_INVESTIGATIONS", "true").lower() == "true"
+
+    @staticmethod
+    def is_report_cache_enabled() -> bool:
+        """
+        Check if completed investigation reports should be served to repeat requests.
+
+        Returns:
+            True unless PROMPTRCA_REPORT_CACHE is set to false
+        """
+        return os.getenv("PROMPTRCA_REPORT_CACHE", "true").lower() == "true"
+
+    @staticmethod
+    def is_alarm_clustering_enabled() -> bool:
+        """
+        Check if batched Lambda alarms should be clustered into shared investigations.
+
+        Returns:
+            True unless PROMPTRCA_ALARM_CLUSTERING is set to false
+        """
+        return os.getenv("PROMPTRCA_ALARM_CLUSTERING", "true").lower() == "true"
+
     @staticmethod
     def get_all_flags() -> Dict[str, Any]:
         """
@@ -170,6 +280,16 @@ class FeatureFlags:
             "direct_orchestration_percentage": os.getenv("PROMPTRCA_DIRECT_ORCHESTRATION_PERCENTAGE", "100"),
             "force_orchestrator": os.getenv("PROMPTRCA_FORCE_ORCHESTRATOR", ""),
             "orchestrator_type": FeatureFlags.get_orchestrator_type(),
+            "exemplar_traces": os.getenv("PROMPTRCA_EXEMPLAR_TRACES", "true"),
+            "evidence_precollection": os.getenv("PROMPTRCA_EVIDENCE_PRECOLLECTION", "false"),
+            "deterministic_input_routing": os.getenv("PROMPTRCA_DETERMINISTIC_INPUT_ROUTING", "true"),
+            "compact_tool_output": os.getenv("PROMPTRCA_COMPACT_TOOL_OUTPUT", "true"),
+            "llm_response_cache": os.getenv("PROMPTRCA_LLM_CACHE", "false"),
+            "shared_models": os.getenv("PROMPTRCA_SHARED_MODELS", "true"),
+            "parallel_specialists": os.getenv("PROMPTRCA_PARALLEL_SPECIALISTS", "false"),
+            "coalesce_investigations": os.getenv("PROMPTRCA_COALESCE_INVESTIGATIONS", "true"),
+            "report_cache": os.getenv("PROMPTRCA_REPORT_CACHE", "true"),
+            "alarm_clustering": os.getenv("PROMPTRCA_ALARM_CLUSTERING", "true"),
         }
 
     @staticmethod
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Utilities - Lazily imported package exports
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Packages re-export names whose modules import strands, boto3,
+opentelemetry or pydantic. Importing them on first access keeps those
+libraries out of a cold start (e.g. Lambda INIT) that never uses them.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, namespace: Dict[str, Any],
+                 exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module-level __getattr__ and __dir__ importing each export on first access.
+
+    Usage in a package __init__:
+        __getattr__, __dir__ = lazy_exports(__name__, globals(), {"Name": ".module"})
+
+    Args:
+        package: The package's __name__, anchoring relative module names
+        namespace: The package's globals(); resolved names are cached there
+        exports: Public name -> module defining it
+
+    Returns:
+        (__getattr__, __dir__). A name whose module cannot be imported
+        raises AttributeError, so hasattr() reports it as unavailable.
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        try:
+            module = import_module(module_name, package)
+        except ImportError as e:
+            raise AttributeError(f"{name!r} is unavailable: {e}") from e
+        value = getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace.get("__all__", ())))
+
+    return __getattr__, __dir__
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Utilities - LLM response cache
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Opt-in cache of model responses for low-temperature models. A response is
+keyed by (model id, temperature, system prompt hash, messages hash); tool
+specs and tool choice are folded into the messages hash since they change
+what the model can answer. The recorded stream events are replayed on a hit,
+so retries and duplicate alarms skip the model call entirely.
+
+Environment Variables:
+- PROMPTRCA_LLM_CACHE: Enable the cache (default: false)
+- PROMPTRCA_LLM_CACHE_MAX_TEMPERATURE: Only models at or below this temperature are cached (default: 0.3)
+- PROMPTRCA_LLM_CACHE_TTL_SECONDS: Entry lifetime (default: 3600)
+- PROMPTRCA_LLM_CACHE_MAX_ENTRIES: In-memory tier size (default: 256)
+- PROMPTRCA_LLM_CACHE_DISK: Enable the disk tier (default: false)
+- PROMPTRCA_LLM_CACHE_DIR: Disk tier directory (default: ~/.cache/promptrca/llm,
+  /tmp/promptrca/llm on Lambda)
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from opentelemetry import trace as trace_api
+from strands.models import BedrockModel
+
+from .feature_flags import FeatureFlags
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LLM_CACHE_TTL_SECONDS = 3600
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 256
+DEFAULT_LLM_CACHE_MAX_TEMPERATURE = 0.3
+
+# Responses that ended any other way (max_tokens, guardrail, errors) are not reused
+CACHEABLE_STOP_REASONS = ("end_turn", "tool_use", "stop_sequence")
+
+
+def _sha256(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def make_cache_key(
+    model_id: str,
+    temperature: Optional[float],
+    system_prompt: Any,
+    messages: Any,
+    tool_specs: Any = None,
+    tool_choice: Any = None
+) -> str:
+    """Build the cache key for one model request."""
+    return _sha256({
+        "model_id": model_id,
+        "temperature": temperature,
+        "system": _sha256(system_prompt),
+        "messages": _sha256({"messages": messages, "tool_specs": tool_specs, "tool_choice": tool_choice})
+    })
+
+
+class LLMResponseCache:
+    """
+    Two-tier (memory, then optional disk) TTL cache of recorded model stream events.
+
+    The memory tier is a bounded LRU. Disk entries are JSON files at
+    <dir>/<k[:2]>/<k>.json written through a temporary file and os.replace,
+    so concurrent workers never read partial entries; a disk hit is promoted
+    to memory. Hits and misses are counted per tier.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_LLM_CACHE_TTL_SECONDS,
+                 max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+                 directory: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the recorded events for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[1]
+                del self._entries[key]
+
+        events = self._read_disk(key, now)
+        with self._lock:
+            if events is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+        self._put_memory(key, events, now)
+        return events
+
+    def put(self, key: str, events: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        self._put_memory(key, events, now)
+        self._write_disk(key, events, now)
+        with self._lock:
+            self._stats["stores"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the hit rate."""
+        with self._lock:
+            stats = dict(self._stats, memory_entries=len(self._entries))
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    def _put_memory(self, key: str, events: List[Dict[str, Any]], created_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (created_at, events)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str, now: float) -> Optional[List[Dict[str, Any]]]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable LLM cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        if entry.get('key') != key or now - entry.get('created_at', 0) > self.ttl_seconds:
+            self._remove(path)
+            return None
+        return entry.get('events')
+
+    def _write_disk(self, key: str, events: List[Dict[str, Any]], created_at: float) -> None:
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'key': key, 'created_at': created_at, 'events': events}, f, default=str)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {key[:12]}: {e}")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+_llm_response_cache_lock = threading.Lock()
+
+
+def _default_cache_dir() -> str:
+    if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        return os.path.join(tempfile.gettempdir(), 'promptrca', 'llm')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'promptrca', 'llm')
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide LLM response cache configured from the environment.
+
+    Returns:
+        The LLMResponseCache, or None unless PROMPTRCA_LLM_CACHE=true
+    """
+    global _llm_response_cache
+    if not FeatureFlags.is_llm_response_cache_enabled():
+        return None
+
+    if _llm_response_cache is None:
+        with _llm_response_cache_lock:
+            if _llm_response_cache is None:
+                directory = None
+                if os.getenv('PROMPTRCA_LLM_CACHE_DISK', 'false').lower() == 'true':
+                    directory = os.getenv('PROMPTRCA_LLM_CACHE_DIR') or _default_cache_dir()
+                _llm_response_cache = LLMResponseCache(
+                    ttl_seconds=int(os.getenv('PROMPTRCA_LLM_CACHE_TTL_SECONDS', DEFAULT_LLM_CACHE_TTL_SECONDS)),
+                    max_entries=int(os.getenv('PROMPTRCA_LLM_CACHE_MAX_ENTRIES', DEFAULT_LLM_CACHE_MAX_ENTRIES)),
+                    directory=directory
+                )
+    return _llm_response_cache
+
+
+def is_cacheable_temperature(temperature: Optional[float]) -> bool:
+    """Whether a model at this temperature is deterministic enough to cache."""
+    max_temperature = float(os.getenv('PROMPTRCA_LLM_CACHE_MAX_TEMPERATURE', DEFAULT_LLM_CACHE_MAX_TEMPERATURE))
+    return temperature is not None and temperature <= max_temperature
+
+
+def _replayed(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Zero the usage on a replayed metadata event; no tokens were spent."""
+    metadata = event.get("metadata")
+    if not metadata:
+        return copy.deepcopy(event)
+    return {"metadata": dict(
+        metadata,
+        usage={"inputTokens": 0, "outputTokens": 0, "totalTokens": 0},
+        metrics={"latencyMs": 0}
+    )}
+
+
+class CachedBedrockModel(BedrockModel):
+    """BedrockModel that serves repeated requests from an LLMResponseCache."""
+
+    def __init__(self, *, cache: LLMResponseCache, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt=None,
+        *,
+        tool_choice=None,
+        system_prompt_content=None,
+        **kwargs: Any
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        config = self.get_config()
+        key = make_cache_key(
+            config.get("model_id"),
+            config.get("temperature"),
+            system_prompt_content if system_prompt_content is not None else system_prompt,
+            messages,
+            tool_specs,
+            tool_choice
+        )
+        span = trace_api.get_current_span()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"♻️ LLM cache hit for {config.get('model_id')} ({key[:12]})")
+            if span.is_recording():
+                span.set_attribute("promptrca.llm_cache.hit", True)
+            for event in cached:
+                yield _replayed(event)
+            return
+
+        if span.is_recording():
+            span.set_attribute("promptrca.llm_cache.hit", False)
+        events: List[Dict[str, Any]] = []
+        stop_reason = None
+        async for event in super().stream(
+            messages, tool_specs, system_prompt,
+            tool_choice=tool_choice, system_prompt_content=system_prompt_content, **kwargs
+        ):
+            events.append(event)
+            if "messageStop" in event:
+                stop_reason = event["messageStop"].get("stopReason")
+            yield event
+
+        if stop_reason in CACHEABLE_STOP_REASONS:
+            self.cache.put(key, events)
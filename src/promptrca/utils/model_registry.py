@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Utilities - Shared Bedrock model registry
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+Every agent used to build its own BedrockModel, and with it a new
+bedrock-runtime client and connection pool, on every request. The registry
+hands out one model per (model parameters, region) for the life of the
+process; all of them are created from a single boto3 session with a pooled
+client config, so concurrent agents reuse warm TLS connections.
+
+Shared models must be treated as read-only: do not call update_config() on
+a model obtained from the registry.
+
+Environment Variables:
+- PROMPTRCA_SHARED_MODELS: Share model instances across agents (default: true)
+- PROMPTRCA_BEDROCK_MAX_POOL_CONNECTIONS: HTTP connections per Bedrock client (default: 50)
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config as BotocoreConfig
+from strands.models import BedrockModel
+from strands.models.bedrock import DEFAULT_READ_TIMEOUT
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BEDROCK_MAX_POOL_CONNECTIONS = 50
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class ModelRegistry:
+    """
+    Thread-safe registry of shared BedrockModel instances.
+
+    get() returns the existing model for the same parameters and region, or
+    builds one with the registry's boto3 session and pooled client config.
+    boto3 clients are thread-safe, so one model can serve every agent.
+    """
+
+    def __init__(self, max_pool_connections: Optional[int] = None, boto_session: Optional[boto3.Session] = None):
+        """
+        Args:
+            max_pool_connections: HTTP connections per Bedrock client
+                (default: PROMPTRCA_BEDROCK_MAX_POOL_CONNECTIONS)
+            boto_session: Session the models' clients are created from (default: a new session)
+        """
+        if max_pool_connections is None:
+            max_pool_connections = int(os.getenv(
+                "PROMPTRCA_BEDROCK_MAX_POOL_CONNECTIONS", str(DEFAULT_BEDROCK_MAX_POOL_CONNECTIONS)
+            ))
+        self.boto_session = boto_session or boto3.Session()
+        self.client_config = BotocoreConfig(
+            max_pool_connections=max_pool_connections,
+            read_timeout=DEFAULT_READ_TIMEOUT,
+            tcp_keepalive=True
+        )
+        self._models: Dict[Tuple, BedrockModel] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def _region(self) -> Optional[str]:
+        return self.boto_session.region_name or os.environ.get("AWS_REGION")
+
+    def get(self, factory: Callable[..., BedrockModel] = BedrockModel, **model_config: Any) -> BedrockModel:
+        """
+        Get the shared model for these parameters.
+
+        Args:
+            factory: Model class or callable accepting boto_session,
+                boto_client_config and the model config
+            **model_config: BedrockModel config (model_id, temperature, ...)
+
+        Returns:
+            Shared model instance
+        """
+        key = (getattr(factory, "__name__", repr(factory)), self._region(), _freeze(model_config))
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self.reused += 1
+                return model
+
+            model = factory(
+                boto_session=self.boto_session,
+                boto_client_config=self.client_config,
+                **model_config
+            )
+            self._models[key] = model
+            self.created += 1
+        logger.info(f"🔌 Created shared model {model_config.get('model_id')} "
+                    f"(temperature={model_config.get('temperature')}, {len(self._models)} shared)")
+        return model
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "models": len(self._models),
+                "created": self.created,
+                "reused": self.reused,
+                "max_pool_connections": self.client_config.max_pool_connections
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry."""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+    return _model_registry
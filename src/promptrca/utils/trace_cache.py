@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+PromptRCA Core - Persistent X-Ray trace cache
+Copyright (C) 2025 Christian Gennaro Faraone
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Contact: info@promptrca.com
+
+On-disk cache of completed X-Ray traces, shared by every worker on the host.
+Completed traces never change, so they are stored once per (account, trace id)
+and reused across investigations, retries and restarts. A trace is only
+treated as complete once its last segment ended longer ago than the settle
+window.
+
+Environment Variables:
+- PROMPTRCA_TRACE_CACHE_ENABLED: Enable the disk cache (default: true)
+- PROMPTRCA_TRACE_CACHE_DIR: Cache directory (default: ~/.cache/promptrca/traces,
+  /tmp/promptrca/traces on Lambda)
+- PROMPTRCA_TRACE_CACHE_MAX_MB: Size bound in megabytes (default: 256)
+- PROMPTRCA_TRACE_SETTLE_SECONDS: How long after its last segment ended a
+  trace is considered complete (default: 300)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TRACE_CACHE_MAX_MB = 256
+# Evict down to this fraction of the bound so eviction does not run on every write
+EVICTION_TARGET_RATIO = 0.9
+# Downstream segments can arrive well after the segments already visible have ended
+DEFAULT_TRACE_SETTLE_SECONDS = 300
+
+
+def _in_progress(document: Dict[str, Any]) -> bool:
+    if document.get('in_progress'):
+        return True
+    return any(_in_progress(sub) for sub in document.get('subsegments') or [] if isinstance(sub, dict))
+
+
+def _latest_time(document: Dict[str, Any]) -> float:
+    latest = document.get('end_time') or document.get('start_time') or 0.0
+    for sub in document.get('subsegments') or []:
+        if isinstance(sub, dict):
+            latest = max(latest, _latest_time(sub))
+    return latest
+
+
+def get_trace_settle_seconds() -> float:
+    """How long after its last segment ended a trace counts as complete (PROMPTRCA_TRACE_SETTLE_SECONDS)."""
+    return float(os.getenv('PROMPTRCA_TRACE_SETTLE_SECONDS', DEFAULT_TRACE_SETTLE_SECONDS))
+
+
+def is_partial_trace(trace: Dict[str, Any], settle_seconds: Optional[float] = None) -> bool:
+    """
+    Whether a trace returned by BatchGetTraces may still change.
+
+    BatchGetTraces does not report IsPartial (only GetTraceSummaries does),
+    so this is read from the trace itself: X-Ray truncated it (LimitExceeded),
+    a segment or subsegment is still in progress, or its latest segment
+    ended less than settle_seconds ago, so downstream segments X-Ray has not
+    ingested yet may still be missing. Unreadable segment documents count
+    as partial.
+
+    Args:
+        trace: Raw trace as returned by BatchGetTraces
+        settle_seconds: Settle window (default: PROMPTRCA_TRACE_SETTLE_SECONDS)
+    """
+    if trace.get('LimitExceeded'):
+        return True
+    latest = 0.0
+    for segment in trace.get('Segments') or []:
+        document = segment.get('Document')
+        if isinstance(document, str):
+            try:
+                document = json.loads(document)
+            except ValueError:
+                return True
+        if not isinstance(document, dict) or _in_progress(document):
+            return True
+        latest = max(latest, _latest_time(document))
+    if settle_seconds is None:
+        settle_seconds = get_trace_settle_seconds()
+    return time.time() - latest < settle_seconds
+
+
+class TraceDiskCache:
+    """
+    Content-addressed, gzip-compressed, size-bounded store of completed traces.
+
+    Entries live at <dir>/<k[:2]>/<k>.json.gz where k is the SHA-256 of
+    "<account>/<trace id>". Each entry records the SHA-256 of its trace
+    payload, which is verified on read. Writes go through a temporary file
+    and os.replace, so concurrent workers never observe partial entries.
+    Eviction removes least recently used entries (by mtime, refreshed on
+    every hit) once the directory exceeds the size bound.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_size: Optional[int] = None
+
+    @staticmethod
+    def _key(account_id: str, trace_id: str) -> str:
+        return hashlib.sha256(f"{account_id}/{trace_id}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    @staticmethod
+    def _digest(payload: bytes) -> str:
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, account_id: str, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached trace, or None on a miss or a corrupt entry."""
+        path = self._path(self._key(account_id, trace_id))
+        try:
+            with gzip.open(path, 'rb') as f:
+                entry = json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable trace cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        payload = json.dumps(entry.get('trace'), sort_keys=True, separators=(',', ':')).encode('utf-8')
+        if entry.get('trace_id') != trace_id or entry.get('sha256') != self._digest(payload):
+            logger.warning(f"Discarding trace cache entry {path} with mismatched content")
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)  # Refresh recency for LRU eviction
+        except OSError:
+            pass
+        return entry['trace']
+
+    def put(self, account_id: str, trace_id: str, trace: Dict[str, Any]) -> bool:
+        """
+        Store a completed trace. Partial traces (see is_partial_trace), including
+        ones that ended within the settle window, are never cached.
+
+        Returns:
+            True if the trace was written
+        """
+        if is_partial_trace(trace):
+            return False
+
+        payload = json.dumps(trace, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        entry = json.dumps({
+            'account_id': account_id,
+            'trace_id': trace_id,
+            'sha256': self._digest(payload),
+            'trace': trace
+        }, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        data = gzip.compress(entry)
+
+        path = self._path(self._key(account_id, trace_id))
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write trace cache entry for {trace_id}: {e}")
+            return False
+
+        self._account_for_write(len(data))
+        return True
+
+    def _account_for_write(self, size: int) -> None:
+        with self._lock:
+            if self._approx_size is None:
+                self._approx_size = self._directory_size()
+            else:
+                self._approx_size += size
+            if self._approx_size > self.max_bytes:
+                self._approx_size = self._evict(int(self.max_bytes * EVICTION_TARGET_RATIO))
+
+    def _entries(self):
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.json.gz'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # Removed by another worker
+                yield path, stat.st_size, stat.st_mtime
+
+    def _directory_size(self) -> int:
+        return sum(size for _path, size, _mtime in self._entries())
+
+    def _evict(self, target_bytes: int) -> int:
+        """Remove least recently used entries until the cache fits target_bytes; return the new size."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _path, size, _mtime in entries)
+        evicted = 0
+        for path, size, _mtime in entries:
+            if total <= target_bytes:
+                break
+            self._remove(path)
+            total -= size
+            evicted += 1
+        if evicted:
+            logger.info(f"🧹 Evicted {evicted} trace cache entries ({total} bytes remain)")
+        return total
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_trace_disk_cache: Optional[TraceDiskCache] = None
+_trace_disk_cache_lock = threading.Lock()
+
+
+def _default_cache_dir() -> str:
+    if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+        return os.path.join(tempfile.gettempdir(), 'promptrca', 'traces')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'promptrca', 'traces')
+
+
+def get_trace_disk_cache() -> Optional[TraceDiskCache]:
+    """
+    Get the process-wide trace disk cache configured from the environment.
+
+    Returns:
+        The TraceDiskCache, or None if disabled via PROMPTRCA_TRACE_CACHE_ENABLED=false
+    """
+    global _trace_disk_cache
+    if os.getenv('PROMPTRCA_TRACE_CACHE_ENABLED', 'true').lower() != 'true':
+        return None
+
+    if _trace_disk_cache is None:
+        with _trace_disk_cache_lock:
+            if _trace_disk_cache is None:
+                directory = os.getenv('PROMPTRCA_TRACE_CACHE_DIR') or _default_cache_dir()
+                max_mb = int(os.getenv('PROMPTRCA_TRACE_CACHE_MAX_MB', DEFAULT_TRACE_CACHE_MAX_MB))
+                _trace_disk_cache = TraceDiskCache(directory, max_mb * 1024 * 1024)
+    return _trace_disk_cache
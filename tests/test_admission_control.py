@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test suite for investigation admission control.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.jobs import (
+    AdmissionController, AdmissionRejected, InMemoryJobStore, InvestigationJobManager, tenant_key
+)
+
+
+def _payload(account):
+    return {
+        "investigation": {"input": "checkout 5XX errors"},
+        "service_config": {"role_arn": f"arn:aws:iam::{account}:role/PromptRCAReadOnly"}
+    }
+
+
+class TestTenantKey:
+    """Test how requests are grouped into tenants."""
+
+    def test_tenant_is_the_role_account(self):
+        assert tenant_key(_payload("111111111111")) == "account:111111111111"
+        assert tenant_key({"service_config": {}}) == "default"
+        assert tenant_key({"service_config": {"role_arn": "not-an-arn"}}) == "role:not-an-arn"
+
+
+class TestAdmissionController:
+    """Test limits, queueing order, rejection and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_per_tenant_limit_lets_other_tenants_through(self):
+        # Arrange
+        controller = AdmissionController(max_concurrent=3, max_per_tenant=1, max_queue_depth=10)
+
+        # Act
+        a1 = controller.enqueue("account:a")
+        a2 = controller.enqueue("account:a")
+        b1 = controller.enqueue("account:b")
+
+        # Assert: the second ticket for tenant a waits although a global slot is free
+        assert a1.future.done() and b1.future.done()
+        assert not a2.future.done()
+        stats = controller.stats()
+        assert (stats["running"], stats["queued"]) == (2, 1)
+        assert stats["tenants"]["account:a"] == {"running": 1, "queued": 1}
+
+        controller.release(a1)
+        await controller.wait(a2)
+        assert controller.stats()["tenants"]["account:a"] == {"running": 1, "queued": 0}
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_queue_depth_are_rejected_with_retry_after(self):
+        controller = AdmissionController(max_concurrent=1, max_per_tenant=1, max_queue_depth=1)
+        controller.avg_duration_seconds = 30.0
+        controller.enqueue("account:a")
+        controller.enqueue("account:b")
+
+        with pytest.raises(AdmissionRejected) as rejection:
+            controller.enqueue("account:c")
+
+        assert rejection.value.retry_after == 60
+        assert controller.stats()["rejected"] == 1
+        assert controller.stats()["queued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        controller = AdmissionController(max_concurrent=1, max_per_tenant=1, max_queue_depth=5)
+        running = controller.enqueue("account:a")
+        waiter = asyncio.create_task(controller.wait(controller.enqueue("account:b")))
+        later = controller.enqueue("account:c")
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        controller.release(running)
+
+        assert later.future.done()
+        assert controller.stats()["running"] == 1
+        assert controller.stats()["queued"] == 0
+
+
+class TestJobAdmission:
+    """Test that job submission is subject to the same queue limit."""
+
+    @pytest.mark.asyncio
+    async def test_submit_is_rejected_when_queue_is_full(self):
+        async def runner(payload):
+            await asyncio.sleep(5)
+
+        controller = AdmissionController(max_concurrent=1, max_per_tenant=1, max_queue_depth=0)
+        manager = InvestigationJobManager(store=InMemoryJobStore(), runner=runner, admission=controller)
+        manager.submit(_payload("111111111111"))
+
+        with pytest.raises(AdmissionRejected):
+            manager.submit(_payload("222222222222"))
+        await manager.shutdown()
+
+        assert controller.stats()["running"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
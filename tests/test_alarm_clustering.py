@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test suite for alarm-storm clustering and the Lambda batch handler.
+"""
+
+import json
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock, patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.jobs import AlarmEvent, cluster_alarms
+
+ORDERS_ARN = "arn:aws:lambda:eu-west-1:111111111111:function:orders"
+PAYMENTS_ARN = "arn:aws:lambda:eu-west-1:111111111111:function:payments"
+TRACE_ID = "1-68e904af-484b173354fff9607ee41871"
+
+
+def _alarm(event_id, text, timestamp=1000.0, account="111111111111"):
+    payload = {
+        "investigation": {"input": text, "region": "eu-west-1"},
+        "service_config": {"role_arn": f"arn:aws:iam::{account}:role/PromptRCAReadOnly"}
+    }
+    return AlarmEvent(event_id=event_id, payload=payload, timestamp=timestamp)
+
+
+class TestClusterAlarms:
+    """Test how alarms are grouped."""
+
+    def test_alarms_sharing_a_resource_or_trace_cluster_transitively(self):
+        # Arrange
+        alarms = [
+            _alarm("a", f"{ORDERS_ARN} 5XX errors"),
+            _alarm("b", f"{ORDERS_ARN} throttled in trace {TRACE_ID}", timestamp=1010.0),
+            _alarm("c", f"{PAYMENTS_ARN} timeouts, trace {TRACE_ID}", timestamp=1020.0),
+            _alarm("d", "disk almost full", timestamp=1030.0),
+        ]
+
+        # Act
+        clusters = cluster_alarms(alarms, window_seconds=300)
+
+        # Assert
+        assert [cluster.event_ids for cluster in clusters] == [["a", "b", "c"], ["d"]]
+        merged_input = clusters[0].investigation_payload()["investigation"]["input"]
+        assert merged_input.startswith(f"{ORDERS_ARN} 5XX errors")
+        assert PAYMENTS_ARN in merged_input
+        assert alarms[0].payload["investigation"]["input"] == f"{ORDERS_ARN} 5XX errors"
+
+    def test_time_gap_and_account_keep_alarms_apart(self):
+        alarms = [
+            _alarm("a", f"{ORDERS_ARN} errors"),
+            _alarm("b", f"{ORDERS_ARN} errors", timestamp=2000.0),
+            _alarm("c", f"{ORDERS_ARN} errors", account="222222222222"),
+        ]
+
+        clusters = cluster_alarms(alarms, window_seconds=300)
+
+        assert sorted(cluster.event_ids for cluster in clusters) == [["a"], ["b"], ["c"]]
+
+    def test_resources_behind_one_failing_dependency_cluster_via_cached_service_graph(self):
+        from promptrca.tools import service_graph_tools
+        from promptrca.tools.service_graph_tools import extract_edge_stats
+
+        def _service(ref, name, service_type, edges=()):
+            return {"ReferenceId": ref, "Name": name, "Type": service_type, "Edges": [
+                {"ReferenceId": target, "SummaryStatistics": {
+                    "TotalCount": 100, "FaultStatistics": {"TotalCount": faults},
+                    "ErrorStatistics": {"TotalCount": 0}, "TotalResponseTime": 1.0}}
+                for target, faults in edges
+            ]}
+
+        # orders and payments both fail calling the ledger table; both also call a healthy cache
+        services = [
+            _service(0, "orders", "AWS::Lambda::Function", [(2, 30), (3, 0)]),
+            _service(1, "payments", "AWS::Lambda::Function", [(2, 25), (3, 0)]),
+            _service(2, "ledger", "AWS::DynamoDB::Table"),
+            _service(3, "sessions", "AWS::ElastiCache"),
+            _service(4, "search", "AWS::Lambda::Function", [(3, 0)]),
+        ]
+        alarms = [
+            _alarm("a", f"{ORDERS_ARN} errors"),
+            _alarm("b", f"{PAYMENTS_ARN} errors", timestamp=1010.0),
+            _alarm("c", "arn:aws:lambda:eu-west-1:111111111111:function:search errors", timestamp=1020.0),
+        ]
+        service_graph_tools._snapshot_cache.clear()
+        try:
+            assert len(cluster_alarms([AlarmEvent(a.event_id, a.payload, a.timestamp) for a in alarms])) == 3
+
+            service_graph_tools._snapshot_cache.put(
+                ("111111111111", "eu-west-1", None, "start", "end"), extract_edge_stats(services)
+            )
+            clusters = cluster_alarms(alarms, window_seconds=300)
+        finally:
+            service_graph_tools._snapshot_cache.clear()
+
+        assert [cluster.event_ids for cluster in clusters] == [["a", "b"], ["c"]]
+
+
+class TestLambdaAlarmBatch:
+    """Test that a batch runs one investigation per cluster and fans results out."""
+
+    def test_sqs_batch_runs_one_investigation_per_cluster_without_copying_reports(self):
+        from promptrca import lambda_handler as handler_module
+
+        def _record(message_id, body):
+            return {"messageId": message_id, "eventSource": "aws:sqs", "body": json.dumps(body),
+                    "attributes": {"SentTimestamp": "1700000000000"}}
+
+        alarm = {"investigation": {"input": f"{ORDERS_ARN} 5XX errors"}, "service_config": {}}
+        eventbridge = {"source": "aws.cloudwatch", "time": "2023-11-14T22:13:25Z", "detail": alarm}
+        event = {"Records": [_record("m1", alarm), _record("m2", eventbridge), _record("m3", {"bad": True})]}
+        context = type("Context", (), {
+            "aws_request_id": "req-1", "function_name": "promptrca", "memory_limit_in_mb": 2048,
+            "get_remaining_time_in_millis": lambda self: 60000
+        })()
+        report = {"investigation": {"status": "completed"}}
+
+        with patch.object(handler_module, "handle_investigation", AsyncMock(return_value=report)) as investigate, \
+                patch.object(handler_module, "cached_report", return_value=(None, None)):
+            response = handler_module.lambda_handler(event, context)
+
+        assert investigate.await_count == 1
+        assert [r["record_id"] for r in response["records"]] == ["m1", "m2"]
+        assert {r["cluster_id"] for r in response["records"]} == {"cluster-1"}
+        assert response["clusters"] == [{"cluster_id": "cluster-1", "record_ids": ["m1", "m2"], "status": "completed"}]
+        assert "result" not in json.dumps(response)
+        assert response["batchItemFailures"] == []
+        assert response["rejected"][0]["record_id"] == "m3"
+
+    def test_sns_batch_returns_each_cluster_report_once(self):
+        from promptrca import lambda_handler as handler_module
+
+        alarm = {"investigation": {"input": f"{ORDERS_ARN} 5XX errors"}, "service_config": {}}
+        records = [{"EventSource": "aws:sns", "Sns": {"MessageId": f"s{n}", "Message": json.dumps(alarm),
+                                                      "Timestamp": "2023-11-14T22:13:25Z"}} for n in range(3)]
+        context = type("Context", (), {
+            "aws_request_id": "req-1", "function_name": "promptrca", "memory_limit_in_mb": 2048,
+            "get_remaining_time_in_millis": lambda self: 60000
+        })()
+        report = {"investigation": {"status": "completed"}}
+
+        with patch.object(handler_module, "handle_investigation", AsyncMock(return_value=report)), \
+                patch.object(handler_module, "cached_report", return_value=(None, None)):
+            response = handler_module.lambda_handler({"Records": records}, context)
+
+        assert len(response["clusters"]) == 1
+        assert response["clusters"][0]["result"]["investigation"]["execution_environment"] == "lambda"
+        assert all("result" not in record for record in response["records"])
+        assert "batchItemFailures" not in response
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test suite for per-investigation context propagation into threads.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.context import (
+    get_aws_client, set_aws_client, clear_aws_client, isolated_context, invoke_agent, submit_with_context
+)
+
+
+class FakeAgent:
+    """Agent whose tools look up the AWS client, like the specialist agents' AWS tools."""
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    async def invoke_async(self, prompt, **kwargs):
+        await asyncio.sleep(0.01)
+        from_tool = await asyncio.to_thread(get_aws_client)
+        from_executor = submit_with_context(self.executor, get_aws_client).result()
+        return from_tool, from_executor
+
+
+class TestContextIsolation:
+    """Test that concurrent investigations only ever see their own AWS client."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_investigations_see_their_own_client_in_every_thread(self):
+        # Arrange
+        shared_executor = ThreadPoolExecutor(max_workers=1)
+        agent = FakeAgent(shared_executor)
+
+        async def investigation(client):
+            set_aws_client(client)
+            try:
+                # Specialist tools call their agents synchronously from a tool thread
+                return await asyncio.to_thread(invoke_agent, agent, "investigate")
+            finally:
+                clear_aws_client()
+
+        clients = [f"client-tenant-{n}" for n in range(8)]
+
+        # Act
+        results = await asyncio.gather(*(investigation(client) for client in clients))
+        shared_executor.shutdown()
+
+        # Assert
+        assert results == [(client, client) for client in clients]
+
+    def test_client_set_by_a_tool_does_not_outlive_the_call(self):
+        @isolated_context
+        def tool(client):
+            set_aws_client(client)
+            return get_aws_client()
+
+        with ThreadPoolExecutor(max_workers=1) as worker:
+            assert worker.submit(tool, "client-tenant-a").result() == "client-tenant-a"
+
+            with pytest.raises(RuntimeError):
+                worker.submit(get_aws_client).result()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
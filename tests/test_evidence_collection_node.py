@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test suite for the deterministic evidence pre-collection graph node.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.agents.input_parser_agent import ParsedInputs, ParsedResource
+from promptrca.core.evidence_collection_node import EvidenceCollectionNode, PRECOLLECTED_EVIDENCE_HEADER
+from promptrca.models import Fact
+
+
+def _parsed_inputs():
+    return ParsedInputs(
+        primary_targets=[
+            ParsedResource(type="lambda", name="checkout", region="eu-west-1",
+                           arn="arn:aws:lambda:eu-west-1:123456789012:function:checkout"),
+            ParsedResource(type="sqs", name="orders", region="eu-west-1",
+                           arn="arn:aws:sqs:eu-west-1:123456789012:orders"),
+            ParsedResource(type="dynamodb", name="carts", region="eu-west-1",
+                           arn="arn:aws:dynamodb:eu-west-1:123456789012:table/carts"),
+        ],
+        trace_ids=["1-67890123-abcdef1234567890abcdef12"],
+        error_messages=[],
+        business_context={},
+        time_range=None,
+        confidence=0.85
+    )
+
+
+def _slow_analysis(specialist, resource, context):
+    time.sleep(0.2)
+    return [Fact(source=resource['type'], content=f"{resource['name']} checked", confidence=0.9, metadata={})]
+
+
+class TestEvidenceCollectionNode:
+    """Test parallel specialist runs and the bundle handed to the swarm."""
+
+    @pytest.mark.asyncio
+    async def test_specialists_run_in_parallel_and_bundle_is_forwarded(self):
+        # Arrange
+        node = EvidenceCollectionNode(max_workers=4)
+        invocation_state = {"parsed_inputs": _parsed_inputs(), "region": "eu-west-1"}
+        task = [
+            {"text": "Original Task: Investigate checkout failures"},
+            {"text": "\nInputs from previous nodes:"},
+            {"text": "\nFrom input_parser:"},
+            {"text": "  - input_parser: {\"primary_targets\": [\"checkout\"]}"},
+        ]
+
+        # Act
+        with patch('promptrca.core.evidence_collection_node._run_specialist_analysis', side_effect=_slow_analysis), \
+             patch.object(EvidenceCollectionNode, '_resources_from_trace', return_value=[]), \
+             patch.object(EvidenceCollectionNode, '_analyze_trace', side_effect=lambda trace_id, ctx: _slow_analysis(
+                 None, {'type': 'trace', 'name': trace_id}, ctx)):
+            start = time.monotonic()
+            result = await node.invoke_async(task, invocation_state)
+            elapsed = time.monotonic() - start
+
+        # Assert: lambda, sqs and the trace ran together; dynamodb has no specialist
+        bundle = invocation_state["precollected_facts"]
+        assert sorted(entry["specialist_type"] for entry in bundle) == ["lambda", "sqs", "trace"]
+        assert elapsed < 0.5
+        text = str(result.results["evidence_collector"].result)
+        assert "From input_parser:" in text
+        assert PRECOLLECTED_EVIDENCE_HEADER in text
+        assert "checkout checked" in text
+
+    @pytest.mark.asyncio
+    async def test_failed_specialist_is_reported_not_raised(self):
+        node = EvidenceCollectionNode(max_workers=2, specialist_timeout=0.05)
+        invocation_state = {"parsed_inputs": _parsed_inputs(), "region": "eu-west-1"}
+        invocation_state["parsed_inputs"].trace_ids = []
+
+        with patch('promptrca.core.evidence_collection_node._run_specialist_analysis', side_effect=_slow_analysis):
+            await node.invoke_async("Investigate", invocation_state)
+
+        bundle = invocation_state["precollected_facts"]
+        assert all("timed out" in entry["error"] for entry in bundle)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test suite for exemplar trace selection and trace prefetching.
+Tests signature clustering of trace summaries and trace store reuse.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.context import TraceStore, set_trace_store, clear_trace_store
+from promptrca.core.exemplar_traces import ExemplarTraceSelector, find_incident_time
+from promptrca.tools.xray_tools import fetch_traces
+
+
+def _summary(trace_id, root_service, exception, services, minute, is_partial=False):
+    return {
+        "Id": trace_id,
+        "Duration": 1.2,
+        "IsPartial": is_partial,
+        "StartTime": datetime(2025, 1, 1, 12, minute, tzinfo=timezone.utc),
+        "ServiceIds": [{"Name": name} for name in services],
+        "FaultRootCauses": [{
+            "Services": [{
+                "Name": root_service,
+                "EntityPath": [
+                    {"Name": root_service},
+                    {"Name": "DynamoDB", "Exceptions": [{"Name": exception}]}
+                ]
+            }]
+        }]
+    }
+
+
+class TestExemplarTraceSelector:
+    """Test clustering of faulted trace summaries into exemplars."""
+
+    def test_filter_expression_multiple_services(self):
+        expression = ExemplarTraceSelector.build_filter_expression(["orders", "payments"])
+        assert expression == '(service("orders") OR service("payments")) AND (fault = true OR error = true)'
+
+    def test_one_exemplar_per_signature(self):
+        # Arrange
+        summaries = [
+            _summary("1-a", "orders", "ThrottlingException", ["orders", "DynamoDB"], 1),
+            _summary("1-b", "orders", "ThrottlingException", ["orders", "DynamoDB"], 5),
+            _summary("1-c", "orders", "ThrottlingException", ["orders", "DynamoDB"], 9, is_partial=True),
+            _summary("1-d", "orders", "AccessDeniedException", ["orders", "DynamoDB"], 3),
+        ]
+
+        # Act
+        exemplars = ExemplarTraceSelector(max_exemplars=3).cluster_summaries(summaries)
+
+        # Assert
+        assert len(exemplars) == 2
+        assert exemplars[0].cluster_size == 3
+        assert exemplars[0].exception == "ThrottlingException"
+        # Most recent complete trace wins over a newer partial one
+        assert exemplars[0].trace_id == "1-b"
+        assert exemplars[1].trace_id == "1-d"
+
+    @patch('promptrca.core.exemplar_traces.fetch_traces')
+    @patch('promptrca.core.exemplar_traces.get_aws_client')
+    def test_select_caps_and_prefetches(self, mock_get_client, mock_fetch):
+        xray = mock_get_client.return_value.get_client.return_value
+        xray.get_trace_summaries.return_value = {
+            "TraceSummaries": [
+                _summary(f"1-{i}", "orders", f"Error{i}", ["orders"], i) for i in range(5)
+            ]
+        }
+
+        exemplars = ExemplarTraceSelector(max_exemplars=2).select(["orders"])
+
+        assert len(exemplars) == 2
+        mock_fetch.assert_called_once_with([e.trace_id for e in exemplars])
+
+    @patch('promptrca.core.exemplar_traces.fetch_traces')
+    @patch('promptrca.core.exemplar_traces.get_aws_client')
+    def test_select_anchors_window_on_incident_time(self, mock_get_client, mock_fetch):
+        xray = mock_get_client.return_value.get_client.return_value
+        xray.get_trace_summaries.return_value = {"TraceSummaries": []}
+        incident = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        ExemplarTraceSelector(lookback_minutes=60).select(["orders"], incident_time=incident)
+
+        kwargs = xray.get_trace_summaries.call_args.kwargs
+        assert kwargs["EndTime"] == incident + timedelta(minutes=5)
+        assert kwargs["StartTime"] == incident - timedelta(minutes=55)
+
+    def test_find_incident_time_sources(self):
+        explicit = find_incident_time("at 2025-01-01T09:00:00Z", incident_time="2025-01-01T10:00:00Z")
+        ranged = find_incident_time("", time_range={"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T08:30:00Z"})
+        alarm = find_incident_time("Alarm fired at 2023-11-14T22:13:25.000+0000 on orders")
+
+        assert explicit == datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+        assert ranged == datetime(2025, 1, 1, 8, 30, tzinfo=timezone.utc)
+        assert alarm == datetime(2023, 11, 14, 22, 13, 25, tzinfo=timezone.utc)
+        assert find_incident_time("orders is slow") is None
+
+
+class TestFetchTraces:
+    """Test batched trace fetching through the trace store."""
+
+    def teardown_method(self):
+        clear_trace_store()
+
+    @patch('promptrca.tools.xray_tools.get_aws_client')
+    def test_fetch_uses_store_and_batches(self, mock_get_client):
+        # Arrange
+        store = TraceStore()
+        store.put("1-cached", {"Id": "1-cached", "Segments": []})
+        set_trace_store(store)
+        xray = mock_get_client.return_value.get_client.return_value
+        xray.batch_get_traces.side_effect = lambda TraceIds: {
+            "Traces": [{"Id": trace_id, "Segments": []} for trace_id in TraceIds]
+        }
+        trace_ids = ["1-cached"] + [f"1-{i}" for i in range(7)]
+
+        # Act
+        traces = fetch_traces(trace_ids)
+
+        # Assert
+        assert set(traces) == set(trace_ids)
+        assert xray.batch_get_traces.call_count == 2
+        assert len(store) == 8
+        fetch_traces(trace_ids)
+        assert xray.batch_get_traces.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test suite for fact compaction and token budgeting.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.core.fact_compaction import (
+    FactCompactor, compact_metadata, estimate_tokens, truncate_to_tokens
+)
+from promptrca.core.structured_agent_node import StructuredAgentNode
+from promptrca.models import HypothesesList
+
+
+def _fact(content, confidence=0.5, source="lambda", metadata=None):
+    return {"source": source, "content": content, "confidence": confidence, "metadata": metadata or {}}
+
+
+class TestFactCompaction:
+    """Test dedupe, ranking, metadata trimming and the budget."""
+
+    def test_near_identical_facts_are_merged(self):
+        # Arrange: same finding with different request ids and counts
+        facts = [
+            _fact("Invocation 3f2b1c1e-1111-2222-3333-444455556666 failed after 3001 ms", 0.6),
+            _fact("Invocation 9a8b7c6d-aaaa-bbbb-cccc-ddddeeeeffff failed after 2999 ms", 0.8),
+        ]
+
+        # Act
+        result = FactCompactor().compact(facts, budget=0)
+
+        # Assert
+        assert len(result.facts) == 1
+        assert result.facts[0]["confidence"] == 0.8
+        assert result.facts[0]["occurrences"] == 2
+        assert [d["reason"] for d in result.dropped] == ["duplicate"]
+
+    def test_ranking_prefers_failures_and_targets(self):
+        facts = [
+            _fact("Memory size is 128 MB", 0.7),
+            _fact("checkout raised a KeyError exception", 0.6),
+            _fact("Function checkout has 2 layers", 0.55),
+        ]
+
+        result = FactCompactor(relevance_terms=["checkout"]).compact(facts, budget=0)
+
+        assert [f["content"] for f in result.facts] == [
+            "checkout raised a KeyError exception",
+            "Memory size is 128 MB",
+            "Function checkout has 2 layers",
+        ]
+
+    def test_budget_drops_lowest_ranked_and_records_it(self):
+        facts = [_fact(f"Finding number {chr(65 + i)} " + "x" * 200, 0.9 - i * 0.1) for i in range(5)]
+
+        result = FactCompactor().compact(facts, budget=150)
+
+        assert result.tokens_after <= 150
+        assert 0 < len(result.facts) < 5
+        assert all(d["reason"] == "budget" for d in result.dropped)
+        assert result.facts[0]["content"].startswith("Finding number A")
+        assert "omitted for size" in result.to_prompt_section()
+
+    def test_large_metadata_is_trimmed_and_small_metadata_kept(self):
+        small = {"memory_mb": 512, "runtime": "python3.9"}
+        large = {
+            "function_name": "checkout",
+            "failed_invocations": [{"request_id": str(i), "log": "x" * 500} for i in range(50)],
+            "trace_data": {"segments": [{"document": "y" * 2000}]},
+        }
+
+        assert compact_metadata(small) == small
+        trimmed = compact_metadata(large, max_chars=600)
+        assert len(str(trimmed)) < 1000
+        assert trimmed["function_name"] == "checkout"
+
+    def test_truncate_keeps_head_and_tail(self):
+        text = "START " + "filler " * 2000 + " END"
+
+        truncated = truncate_to_tokens(text, 100)
+
+        assert estimate_tokens(truncated) < 150
+        assert truncated.startswith("START") and truncated.endswith("END")
+        assert "omitted" in truncated
+
+
+class TestStructuredAgentNodeBudget:
+    """Test that synthesis node input is kept within its budget."""
+
+    @pytest.mark.asyncio
+    async def test_node_input_is_compacted_to_budget(self):
+        # Arrange
+        agent = MagicMock()
+        agent.name = "hypothesis_generator"
+        agent.invoke_async = AsyncMock(return_value=MagicMock(structured_output=HypothesesList(hypotheses=[])))
+        node = StructuredAgentNode(agent, HypothesesList, output_key="hypotheses", token_budget=500)
+        invocation_state = {
+            "collected_facts": [_fact(f"Lambda error {chr(65 + i)} " + "z" * 300, 0.8) for i in range(20)],
+        }
+        task = "Original Task: investigate\n" + "transcript " * 1000
+
+        # Act
+        await node.invoke_async(task, invocation_state)
+
+        # Assert
+        sent = agent.invoke_async.call_args.args[0]
+        assert estimate_tokens(sent) <= 550
+        assert "FACTS (" in sent
+        compaction = invocation_state["fact_compaction"]["hypotheses"]
+        assert compaction["input_count"] == 20
+        assert len(compaction["dropped"]) == 20 - compaction["kept"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test suite for cold-start import cost of the package and the Lambda handler.
+"""
+
+import json
+import pytest
+import subprocess
+import sys
+import os
+
+# Add src to path
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC)
+
+HEAVY_MODULES = ["strands", "boto3", "botocore", "opentelemetry", "pydantic"]
+
+PROBE = """
+import json, sys
+import {module}
+print(json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+def _import_in_fresh_interpreter(module):
+    env = {key: value for key, value in os.environ.items() if not key.startswith(("PROMPTRCA_", "OTEL_"))}
+    env["PYTHONPATH"] = SRC
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestImportBudget:
+    """Test that importing entry points defers strands, boto3 and opentelemetry."""
+
+    @pytest.mark.parametrize("module", ["promptrca", "promptrca.tools", "promptrca.lambda_handler"])
+    def test_entry_point_import_stays_light(self, module):
+        # Act
+        loaded = _import_in_fresh_interpreter(module)
+
+        # Assert
+        assert loaded == []
+
+    def test_lazy_exports_still_resolve(self):
+        import promptrca
+        from promptrca import tools
+
+        assert promptrca.PromptRCAInvestigator.__name__ == "PromptRCAInvestigator"
+        assert all(callable(getattr(tools, name)) for name in tools.__all__)
+        assert set(tools.__all__) <= set(dir(tools))
+        assert not hasattr(promptrca, "NotExported")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test suite for request fingerprinting and coalescing of duplicate investigations.
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.core.investigation_events import InvestigationEventStream
+from promptrca.jobs import AdmissionController, InMemoryJobStore, InvestigationJobManager, JobStatus, SingleFlight, investigation_fingerprint
+from promptrca.jobs import manager as job_manager
+
+TRACE_ID = "1-68e904af-484b173354fff9607ee41871"
+
+
+def _payload(text, account="111111111111", region="eu-west-1"):
+    return {
+        "investigation": {"input": text, "region": region},
+        "service_config": {"role_arn": f"arn:aws:iam::{account}:role/PromptRCAReadOnly"}
+    }
+
+
+class TestInvestigationFingerprint:
+    """Test which requests are considered duplicates."""
+
+    def test_same_trace_and_resource_match_regardless_of_wording(self):
+        # Arrange
+        arn = "arn:aws:lambda:eu-west-1:111111111111:function:payment-processor"
+        first = _payload(f"Alarm! {arn} failing, trace {TRACE_ID}")
+        second = _payload(f"Root={TRACE_ID} please look at {arn}")
+
+        # Act / Assert
+        assert investigation_fingerprint(first) == investigation_fingerprint(second)
+        assert investigation_fingerprint(first) != investigation_fingerprint(_payload(f"{arn} {TRACE_ID}", account="222222222222"))
+        assert investigation_fingerprint(first) != investigation_fingerprint(_payload(f"{arn} {TRACE_ID}", region="us-east-1"))
+
+    def test_credentials_are_part_of_the_fingerprint(self):
+        first = _payload(f"trace {TRACE_ID}")
+        other_role = _payload(f"trace {TRACE_ID}")
+        other_role["service_config"]["role_arn"] = "arn:aws:iam::111111111111:role/Other"
+        with_external_id = _payload(f"trace {TRACE_ID}")
+        with_external_id["service_config"]["external_id"] = "secret-a"
+        wrong_external_id = _payload(f"trace {TRACE_ID}")
+        wrong_external_id["service_config"]["external_id"] = "guess"
+
+        fingerprints = {investigation_fingerprint(p) for p in (first, other_role, with_external_id, wrong_external_id)}
+
+        assert len(fingerprints) == 4
+        assert investigation_fingerprint(with_external_id) == investigation_fingerprint(
+            {**with_external_id, "investigation": {"input": f"Root={TRACE_ID}", "region": "eu-west-1"}}
+        )
+
+    def test_input_without_identifiers_uses_normalized_text(self):
+        assert investigation_fingerprint(_payload("Checkout  5XX errors")) == investigation_fingerprint(_payload("checkout 5xx errors"))
+        assert investigation_fingerprint(_payload("checkout 5xx errors")) != investigation_fingerprint(_payload("login 5xx errors"))
+        assert investigation_fingerprint({"investigation": {}}) is None
+
+
+class TestSingleFlight:
+    """Test sharing of results, events and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_run_and_its_events(self):
+        flights = SingleFlight()
+        runs = []
+
+        async def runner(event_stream):
+            runs.append(event_stream)
+            event_stream.emit("phase", {"phase": "started"})
+            await asyncio.sleep(0.05)
+            return {"investigation": {"status": "completed"}}
+
+        late_stream = InvestigationEventStream()
+
+        async def late_request():
+            await asyncio.sleep(0.01)
+            return await flights.do("key", runner, late_stream)
+
+        first, second = await asyncio.gather(flights.do("key", runner), late_request())
+        late_stream.close()
+
+        assert len(runs) == 1
+        assert first == second and first is not second
+        assert [event async for event in late_stream] == [{"event": "phase", "data": {"phase": "started"}}]
+        assert flights.stats()["coalesced"] == 1
+        assert not flights.in_flight("key")
+
+    @pytest.mark.asyncio
+    async def test_run_is_cancelled_only_when_every_caller_left(self):
+        flights = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def runner(event_stream):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        first = asyncio.create_task(flights.do("key", runner))
+        second = asyncio.create_task(flights.do("key", runner))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await asyncio.sleep(0.01)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+class TestCoalescedJobs:
+    """Test that jobs waiting on an in-flight investigation hold no admission slot."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_jobs_give_back_their_admission_slot(self, monkeypatch):
+        monkeypatch.setenv("PROMPTRCA_REPORT_CACHE", "false")
+        runs = []
+        release = asyncio.Event()
+
+        async def runner(payload, event_stream=None):
+            runs.append(payload)
+            await release.wait()
+            return {"investigation": {"status": "completed"}}
+
+        monkeypatch.setattr(job_manager, "_default_runner", runner)
+        admission = AdmissionController(max_concurrent=2, max_per_tenant=1)
+        manager = InvestigationJobManager(store=InMemoryJobStore(), admission=admission)
+
+        # Submitted before the leader starts, so they take tickets they must give back
+        jobs = [manager.submit(_payload(f"trace {TRACE_ID}")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        # Submitted while the leader runs, so they never take one
+        jobs.append(manager.submit(_payload(f"Root={TRACE_ID}")))
+        await asyncio.sleep(0.01)
+
+        assert admission.stats()["running"] == 1
+        assert admission.stats()["queued"] == 0
+        assert all(job.status == JobStatus.RUNNING for job in jobs)
+
+        release.set()
+        await asyncio.gather(*manager._tasks.values())
+
+        assert len(runs) == 1
+        assert all(manager.get(job.job_id).status == JobStatus.SUCCEEDED for job in jobs)
+        assert admission.stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_stays_cancelled_while_its_run_continues(self, monkeypatch):
+        monkeypatch.setenv("PROMPTRCA_REPORT_CACHE", "false")
+        runs = []
+
+        async def runner(payload, event_stream=None):
+            runs.append(payload)
+            return {"investigation": {"status": "completed"}}
+
+        monkeypatch.setattr(job_manager, "_default_runner", runner)
+        admission = AdmissionController(max_concurrent=1)
+        manager = InvestigationJobManager(store=InMemoryJobStore(), admission=admission)
+        async with admission.admit("other"):
+            leader = manager.submit(_payload(f"trace {TRACE_ID}"))
+            await asyncio.sleep(0.01)
+            follower = manager.submit(_payload(f"trace {TRACE_ID}"))
+            await asyncio.sleep(0.01)
+            manager.cancel(leader.job_id)
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*manager._tasks.values())
+
+        assert len(runs) == 1
+        assert manager.get(leader.job_id).status == JobStatus.CANCELLED
+        assert manager.get(follower.job_id).status == JobStatus.SUCCEEDED
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
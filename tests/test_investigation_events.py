@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test suite for streamed investigation progress events.
+"""
+
+import asyncio
+import json
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca import handlers
+from promptrca.core.investigation_events import InvestigationEventStream, publish_facts
+from promptrca.core.swarm_orchestrator import SwarmOrchestrator
+from promptrca.models import Hypothesis, HypothesesList
+
+LAMBDA_RESULTS = {
+    "specialist_type": "lambda",
+    "resource_name": "checkout",
+    "facts": [{"source": "lambda_config", "content": "Timeout is 3s", "confidence": 0.9}],
+}
+
+
+class TestInvestigationEventStream:
+    """Test publishing from threads and stream termination."""
+
+    @pytest.mark.asyncio
+    async def test_events_from_tool_threads_arrive_in_order_until_close(self):
+        # Arrange
+        event_stream = InvestigationEventStream()
+
+        def tool_thread():
+            publish_facts({"event_stream": event_stream}, LAMBDA_RESULTS)
+
+        # Act
+        event_stream.emit("phase", {"phase": "investigation", "status": "started"})
+        thread = threading.Thread(target=tool_thread)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+        event_stream.close()
+        event_stream.emit("phase", {"phase": "ignored"})
+        events = [event async for event in event_stream]
+
+        # Assert
+        assert [e["event"] for e in events] == ["phase", "facts"]
+        assert events[1]["data"]["facts"][0]["content"] == "Timeout is 3s"
+
+    def test_publish_without_listener_is_a_no_op(self):
+        publish_facts({}, LAMBDA_RESULTS)
+        publish_facts(None, LAMBDA_RESULTS)
+
+
+class TestStreamInvestigation:
+    """Test the handler-level stream and the orchestrator's event mapping."""
+
+    @pytest.mark.asyncio
+    async def test_progress_events_precede_the_report(self):
+        # Arrange
+        async def fake_handle(payload, event_stream=None):
+            event_stream.emit("phase", {"phase": "hypothesis_generation", "status": "started"})
+            await asyncio.sleep(0.01)
+            return {"investigation": {"status": "completed"}}
+
+        # Act
+        with patch.object(handlers, 'handle_investigation', side_effect=fake_handle):
+            events = [event async for event in handlers.stream_investigation({"investigation": {"input": "x"}})]
+
+        # Assert
+        assert [e["event"] for e in events] == ["phase", "report"]
+        assert events[-1]["data"]["investigation"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_graph_events_become_phases_and_hypotheses(self):
+        hypotheses = HypothesesList(hypotheses=[
+            Hypothesis(type="timeout", description="Lambda timeout too low", confidence=0.8, evidence=[])
+        ])
+
+        async def fake_stream(prompt, invocation_state=None):
+            yield {"type": "multiagent_node_start", "node_id": "investigation", "node_type": "swarm"}
+            yield {"type": "multiagent_node_stream", "node_id": "investigation",
+                   "event": {"type": "multiagent_node_start", "node_id": "lambda_specialist"}}
+            invocation_state["structured_outputs"] = {"hypotheses": hypotheses}
+            yield {"type": "multiagent_node_stop", "node_id": "hypothesis_generation",
+                   "node_result": SimpleNamespace(status=None)}
+            yield {"type": "multiagent_result", "result": "graph-result"}
+
+        orchestrator = SwarmOrchestrator.__new__(SwarmOrchestrator)
+        orchestrator.graph = MagicMock()
+        orchestrator.graph.stream_async = fake_stream
+        event_stream = InvestigationEventStream()
+
+        result = await orchestrator._stream_graph("Investigate", {}, event_stream)
+        event_stream.close()
+        events = [event async for event in event_stream]
+
+        assert result == "graph-result"
+        assert events[1]["data"] == {"phase": "investigation", "agent": "lambda_specialist", "status": "started"}
+        assert events[2]["data"] == {"phase": "hypothesis_generation", "status": "completed"}
+        assert events[3]["event"] == "hypotheses"
+        assert events[3]["data"]["hypotheses"][0]["type"] == "timeout"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
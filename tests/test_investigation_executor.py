@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test suite for the investigation-scoped executor and concurrent specialists.
+"""
+
+import time
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.context import (
+    InvestigationExecutor, get_aws_client, set_aws_client, clear_aws_client,
+    set_investigation_executor, clear_investigation_executor
+)
+from promptrca.core.fact_collector import FactCollector
+from promptrca.specialists import InvestigationContext, LambdaSpecialist
+
+AWS_CALL_SECONDS = 0.2
+
+
+def _slow_aws_call(result, seen_clients):
+    def call(*args, **kwargs):
+        seen_clients.append(get_aws_client())
+        time.sleep(AWS_CALL_SECONDS)
+        return result
+    return call
+
+
+def _patched_lambda_tools(seen_clients):
+    return (
+        patch("promptrca.tools.lambda_tools.fetch_lambda_config",
+              _slow_aws_call({"timeout": 3, "memory_size": 128}, seen_clients)),
+        patch("promptrca.tools.lambda_tools.fetch_lambda_metrics",
+              _slow_aws_call({"metrics": {}}, seen_clients)),
+        patch("promptrca.tools.lambda_tools.fetch_lambda_failed_invocations",
+              _slow_aws_call({"failed_invocations": []}, seen_clients)),
+    )
+
+
+def _context():
+    return InvestigationContext(trace_ids=[], region="eu-west-1", parsed_inputs=None)
+
+
+class TestInvestigationExecutor:
+    """Test that sub-analyses and specialists overlap on the bounded executor."""
+
+    @pytest.mark.asyncio
+    async def test_specialist_sub_analyses_run_concurrently_with_the_investigation_context(self):
+        # Arrange
+        seen_clients = []
+        executor = InvestigationExecutor(max_workers=4)
+        set_aws_client("client-tenant-a")
+        set_investigation_executor(executor)
+        config, metrics, failures = _patched_lambda_tools(seen_clients)
+
+        # Act
+        try:
+            with config, metrics, failures:
+                started = time.monotonic()
+                facts = await LambdaSpecialist().analyze({"type": "lambda", "name": "orders"}, _context())
+                elapsed = time.monotonic() - started
+        finally:
+            clear_investigation_executor()
+            clear_aws_client()
+            executor.shutdown()
+
+        # Assert
+        assert elapsed < 2 * AWS_CALL_SECONDS
+        assert seen_clients == ["client-tenant-a"] * 3
+        assert [fact.source for fact in facts][:2] == ["lambda_config", "lambda_config"]
+
+    @pytest.mark.asyncio
+    async def test_fact_collector_reports_per_specialist_wall_time_and_overlap(self):
+        seen_clients = []
+        set_aws_client("client-tenant-a")
+        config, metrics, failures = _patched_lambda_tools(seen_clients)
+        resources = [{"type": "lambda", "name": name} for name in ("orders", "payments", "search")]
+        collector = FactCollector()
+
+        try:
+            with config, metrics, failures:
+                await collector.collect_facts(resources, _context())
+        finally:
+            clear_aws_client()
+
+        timings = collector.last_timings
+        assert set(timings["specialists"]) == {"lambda:orders", "lambda:payments", "lambda:search"}
+        assert timings["overlap"] > 1.5
+        assert timings["wall_seconds"] < 3 * AWS_CALL_SECONDS
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test suite for the investigation job queue, worker pool and result stores.
+"""
+
+import asyncio
+import pytest
+import sqlite3
+import subprocess
+import sys
+import os
+from datetime import datetime, timezone
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.jobs import (
+    InMemoryJobStore, InvestigationJob, InvestigationJobManager, JobStatus, SQLiteJobStore
+)
+
+PAYLOAD = {"investigation": {"input": "checkout 5XX errors"}, "service_config": {}}
+
+
+class FakeRunner:
+    """Counts concurrent investigations; each takes `delay` seconds."""
+
+    def __init__(self, delay=0.05, result=None):
+        self.delay = delay
+        self.result = result or {"investigation": {"status": "completed"}}
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, payload):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.result
+        finally:
+            self.running -= 1
+
+
+async def _wait_finished(manager, job_id, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not manager.get(job_id).status.finished:
+        assert asyncio.get_running_loop().time() < deadline, "job did not finish"
+        await asyncio.sleep(0.01)
+    return manager.get(job_id)
+
+
+class TestInvestigationJobManager:
+    """Test bounded execution, results and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency_and_stores_results(self):
+        # Arrange
+        runner = FakeRunner()
+        manager = InvestigationJobManager(store=InMemoryJobStore(), workers=2, runner=runner)
+
+        # Act
+        jobs = [manager.submit(PAYLOAD) for _ in range(5)]
+        finished = [await _wait_finished(manager, job.job_id) for job in jobs]
+        await manager.shutdown()
+
+        # Assert
+        assert runner.peak == 2
+        assert all(job.status == JobStatus.SUCCEEDED for job in finished)
+        assert finished[0].to_dict()["result"] == {"investigation": {"status": "completed"}}
+        assert finished[0].payload == {}
+
+    @pytest.mark.asyncio
+    async def test_queued_and_running_jobs_can_be_cancelled(self):
+        runner = FakeRunner(delay=5)
+        manager = InvestigationJobManager(store=InMemoryJobStore(), workers=1, runner=runner)
+        running = manager.submit(PAYLOAD)
+        queued = manager.submit(PAYLOAD)
+        await asyncio.sleep(0.05)
+
+        manager.cancel(queued.job_id)
+        manager.cancel(running.job_id)
+        await _wait_finished(manager, running.job_id)
+        await manager.shutdown()
+
+        assert manager.get(queued.job_id).status == JobStatus.CANCELLED
+        assert manager.get(running.job_id).status == JobStatus.CANCELLED
+        assert runner.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_unsuccessful_result_marks_job_failed(self):
+        runner = FakeRunner(result={"success": False, "error": "AssumeRole denied"})
+        manager = InvestigationJobManager(store=InMemoryJobStore(), workers=1, runner=runner)
+
+        job = await _wait_finished(manager, manager.submit(PAYLOAD).job_id)
+        await manager.shutdown()
+
+        assert job.status == JobStatus.FAILED
+        assert job.to_dict()["error"] == "AssumeRole denied"
+        assert "result" not in job.to_dict()
+
+
+class TestSQLiteJobStore:
+    """Test that job state survives a new store on the same file."""
+
+    def test_round_trip_without_payload(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+        job = InvestigationJob(job_id="job-1", payload={"service_config": {"external_id": "secret"}},
+                               status=JobStatus.SUCCEEDED, result={"investigation": {"status": "completed"}})
+        SQLiteJobStore(path).save(job)
+
+        loaded = SQLiteJobStore(path).get("job-1")
+
+        assert loaded.to_dict() == job.to_dict()
+        assert loaded.payload == {}
+        assert SQLiteJobStore(path).get("missing") is None
+
+    def test_jobs_of_a_stopped_worker_are_failed_on_open(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+        store = SQLiteJobStore(path)
+        for job_id, status in (("stopped-queued", JobStatus.QUEUED), ("stopped-running", JobStatus.RUNNING),
+                               ("other-worker", JobStatus.RUNNING), ("done", JobStatus.SUCCEEDED)):
+            store.save(InvestigationJob(job_id=job_id, status=status))
+        stopped = subprocess.Popen([sys.executable, "-c", "pass"])
+        stopped.wait()
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE investigation_jobs SET owner_pid = ? WHERE job_id LIKE 'stopped-%'", (stopped.pid,))
+            conn.execute("UPDATE investigation_jobs SET owner_pid = ? WHERE job_id = 'other-worker'", (os.getppid(),))
+
+        reopened = SQLiteJobStore(path)
+
+        assert reopened.get("stopped-queued").status == JobStatus.FAILED
+        assert reopened.get("stopped-running").error == "Worker stopped before the job finished"
+        assert reopened.get("other-worker").status == JobStatus.RUNNING
+        assert reopened.get("done").status == JobStatus.SUCCEEDED
+
+    def test_only_the_newest_finished_jobs_are_kept(self, tmp_path):
+        store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), max_entries=2)
+        store.save(InvestigationJob(job_id="queued"))
+        for n in range(4):
+            store.save(InvestigationJob(job_id=f"job-{n}", status=JobStatus.SUCCEEDED,
+                                        created_at=datetime(2025, 1, 1, n, tzinfo=timezone.utc)))
+
+        assert [store.get(f"job-{n}") is not None for n in range(4)] == [False, False, True, True]
+        assert store.get("queued") is not None
+        assert store.stats()["jobs"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test suite for SQS batch processing in the Lambda handler.
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca import lambda_handler as handler_module
+
+
+class FakeContext:
+    aws_request_id = "req-1"
+    function_name = "promptrca"
+    memory_limit_in_mb = 2048
+
+    def __init__(self, remaining_ms=600000):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+def _sqs_event(*texts):
+    return {"Records": [
+        {"messageId": f"m{n}", "eventSource": "aws:sqs",
+         "body": json.dumps({"investigation": {"input": text}, "service_config": {}})}
+        for n, text in enumerate(texts, 1)
+    ]}
+
+
+class TestSQSBatch:
+    """Test concurrency, partial batch failures and the deadline."""
+
+    def test_batch_runs_concurrently_and_reports_only_failed_items(self):
+        # Arrange
+        running = {"now": 0, "peak": 0}
+
+        async def investigate(payload):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.05)
+            running["now"] -= 1
+            if "broken" in payload["investigation"]["input"]:
+                return {"success": False, "error": "AssumeRole denied"}
+            return {"investigation": {"status": "completed"}}
+
+        event = _sqs_event("orders errors", "payments errors", "broken alarm", "search errors")
+
+        # Act
+        with patch.object(handler_module, "handle_investigation", investigate), \
+                patch.object(handler_module, "cached_report", return_value=(None, None)), \
+                patch.dict(os.environ, {"PROMPTRCA_LAMBDA_BATCH_CONCURRENCY": "2"}):
+            response = handler_module.lambda_handler(event, FakeContext())
+
+        # Assert
+        assert running["peak"] == 2
+        assert response["batchItemFailures"] == [{"itemIdentifier": "m3"}]
+        assert len(response["clusters"]) == 4
+
+    def test_no_investigation_starts_near_the_deadline(self):
+        async def investigate(payload):
+            raise AssertionError("should not start")
+
+        with patch.object(handler_module, "handle_investigation", investigate), \
+                patch.object(handler_module, "cached_report", return_value=(None, None)):
+            response = handler_module.lambda_handler(_sqs_event("orders errors"), FakeContext(remaining_ms=30000))
+
+        assert response["batchItemFailures"] == [{"itemIdentifier": "m1"}]
+        assert response["clusters"][0]["status"] == "not_finished"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
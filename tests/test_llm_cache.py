@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test suite for the LLM response cache.
+"""
+
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from strands.models import BedrockModel
+
+from promptrca.utils import config, llm_cache
+from promptrca.utils.llm_cache import CachedBedrockModel, LLMResponseCache, make_cache_key
+
+MESSAGES = [{"role": "user", "content": [{"text": "Alarm: checkout 5XX errors above threshold"}]}]
+
+RESPONSE_EVENTS = [
+    {"messageStart": {"role": "assistant"}},
+    {"contentBlockDelta": {"delta": {"text": "{\"primary_targets\": []}"}}},
+    {"contentBlockStop": {}},
+    {"messageStop": {"stopReason": "end_turn"}},
+    {"metadata": {"usage": {"inputTokens": 120, "outputTokens": 9, "totalTokens": 129}, "metrics": {"latencyMs": 800}}},
+]
+
+
+def _fake_stream(stop_reason="end_turn"):
+    calls = []
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        calls.append(messages)
+        for event in RESPONSE_EVENTS:
+            if "messageStop" in event:
+                event = {"messageStop": {"stopReason": stop_reason}}
+            yield event
+
+    return stream, calls
+
+
+async def _collect(model):
+    return [event async for event in model.stream(MESSAGES, system_prompt="Parse the alarm")]
+
+
+class TestLLMResponseCache:
+    """Test keys, tiers, TTL and counters."""
+
+    def test_key_covers_model_temperature_system_and_messages(self):
+        base = make_cache_key("model-a", 0.1, "system", MESSAGES)
+
+        assert base == make_cache_key("model-a", 0.1, "system", [dict(m) for m in MESSAGES])
+        assert base != make_cache_key("model-b", 0.1, "system", MESSAGES)
+        assert base != make_cache_key("model-a", 0.2, "system", MESSAGES)
+        assert base != make_cache_key("model-a", 0.1, "other system", MESSAGES)
+        assert base != make_cache_key("model-a", 0.1, "system", MESSAGES, tool_specs=[{"name": "t"}])
+
+    def test_entries_expire_after_ttl(self):
+        # Arrange
+        cache = LLMResponseCache(ttl_seconds=60)
+        with patch('promptrca.utils.llm_cache.time.time', return_value=1000.0):
+            cache.put("k", RESPONSE_EVENTS)
+
+        # Act
+        with patch('promptrca.utils.llm_cache.time.time', return_value=1030.0):
+            fresh = cache.get("k")
+        with patch('promptrca.utils.llm_cache.time.time', return_value=1061.0):
+            expired = cache.get("k")
+
+        # Assert
+        assert fresh == RESPONSE_EVENTS
+        assert expired is None
+        assert cache.stats()["memory_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_disk_tier_serves_a_new_process(self, tmp_path):
+        LLMResponseCache(directory=str(tmp_path)).put("k", RESPONSE_EVENTS)
+
+        cache = LLMResponseCache(directory=str(tmp_path))
+
+        assert cache.get("k") == RESPONSE_EVENTS
+        assert cache.get("k") == RESPONSE_EVENTS
+        stats = cache.stats()
+        assert (stats["disk_hits"], stats["memory_hits"], stats["hit_rate"]) == (1, 1, 1.0)
+
+
+class TestCachedBedrockModel:
+    """Test that repeated requests skip the model call."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_replayed_without_usage(self):
+        # Arrange
+        stream, calls = _fake_stream()
+        model = CachedBedrockModel(cache=LLMResponseCache(), region_name="us-east-1", model_id="m", temperature=0.1)
+
+        # Act
+        with patch.object(BedrockModel, 'stream', stream):
+            first = await _collect(model)
+            second = await _collect(model)
+
+        # Assert
+        assert len(calls) == 1
+        assert first[:-1] == second[:-1]
+        assert second[-1]["metadata"]["usage"]["totalTokens"] == 0
+        assert model.cache.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_responses_are_not_cached(self):
+        stream, calls = _fake_stream(stop_reason="max_tokens")
+        model = CachedBedrockModel(cache=LLMResponseCache(), region_name="us-east-1", model_id="m", temperature=0.1)
+
+        with patch.object(BedrockModel, 'stream', stream):
+            await _collect(model)
+            await _collect(model)
+
+        assert len(calls) == 2
+
+
+class TestModelFactories:
+    """Test which configured models are served through the cache."""
+
+    def test_only_low_temperature_models_are_cached_when_enabled(self):
+        env = {"PROMPTRCA_LLM_CACHE": "true", "AWS_REGION": "us-east-1", "PROMPTRCA_TEMPERATURE": "0.7"}
+        with patch.dict(os.environ, env), patch.object(llm_cache, '_llm_response_cache', None):
+            assert isinstance(config.create_parser_model(), CachedBedrockModel)
+            assert not isinstance(config.create_orchestrator_model(), CachedBedrockModel)
+
+        with patch.dict(os.environ, {"PROMPTRCA_LLM_CACHE": "false", "AWS_REGION": "us-east-1"}):
+            assert not isinstance(config.create_parser_model(), CachedBedrockModel)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test suite for the shared Bedrock model registry.
+"""
+
+import boto3
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.utils import config, model_registry
+from promptrca.utils.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def registry():
+    return ModelRegistry(max_pool_connections=32, boto_session=boto3.Session(region_name="us-east-1"))
+
+
+class TestModelRegistry:
+    """Test sharing of model instances and their clients."""
+
+    def test_same_parameters_share_one_model(self, registry):
+        # Act
+        first = registry.get(model_id="m", temperature=0.2, streaming=False)
+        second = registry.get(model_id="m", temperature=0.2, streaming=False)
+        other = registry.get(model_id="m", temperature=0.7, streaming=False)
+
+        # Assert
+        assert first is second
+        assert other is not first
+        assert first.client.meta.config.max_pool_connections == 32
+        assert registry.stats() == {"models": 2, "created": 2, "reused": 1, "max_pool_connections": 32}
+
+    def test_concurrent_gets_build_a_single_model(self, registry):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            models = list(executor.map(lambda _: registry.get(model_id="m", temperature=0.2), range(16)))
+
+        assert len({id(m) for m in models}) == 1
+        assert registry.created == 1
+
+    def test_specialist_factories_reuse_the_shared_model(self, registry):
+        env = {"AWS_REGION": "us-east-1", "PROMPTRCA_LLM_CACHE": "false"}
+        with patch.dict(os.environ, env), patch.object(model_registry, '_model_registry', registry):
+            lambda_model = config.create_lambda_agent_model()
+            iam_model = config.create_iam_agent_model()
+
+        with patch.dict(os.environ, dict(env, PROMPTRCA_SHARED_MODELS="false")):
+            private_model = config.create_lambda_agent_model()
+
+        assert lambda_model is iam_model
+        assert private_model is not lambda_model
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
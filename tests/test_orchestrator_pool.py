@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test suite for the warm SwarmOrchestrator pool.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.core.orchestrator_pool import OrchestratorPool
+
+
+class TestOrchestratorPool:
+    """Test reuse, reset and sizing of pooled orchestrators."""
+
+    @pytest.mark.asyncio
+    async def test_instances_are_reused_and_reset(self):
+        # Arrange
+        factory = MagicMock(side_effect=lambda: MagicMock())
+        pool = OrchestratorPool(size=2, factory=factory)
+
+        # Act
+        async with pool.acquire("eu-west-1") as first:
+            pass
+        async with pool.acquire("us-east-1") as second:
+            pass
+
+        # Assert
+        assert first is second
+        assert factory.call_count == 1
+        second.reset_for_invocation.assert_called_with("us-east-1")
+        assert pool.stats()["reused"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_get_distinct_instances(self):
+        pool = OrchestratorPool(size=2, factory=lambda: MagicMock())
+        seen = []
+
+        async def investigate():
+            async with pool.acquire() as orchestrator:
+                seen.append(orchestrator)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(investigate() for _ in range(3)))
+
+        assert len({id(o) for o in seen}) == 3
+        # Only `size` instances are kept warm afterwards
+        assert pool.stats()["idle"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_instance_is_discarded(self):
+        pool = OrchestratorPool(size=2, factory=lambda: MagicMock())
+
+        async def investigate():
+            async with pool.acquire():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(investigate())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert pool.stats()["idle"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
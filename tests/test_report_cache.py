@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test suite for the completed investigation report cache.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.jobs import ReportCache, cached_report, remember_report
+
+REPORT = {"investigation": {"id": "run-1", "status": "completed"}, "root_cause": {"summary": "timeout"}}
+PAYLOAD = {
+    "investigation": {"input": "trace 1-68e904af-484b173354fff9607ee41871", "region": "eu-west-1"},
+    "service_config": {}
+}
+
+
+class TestReportCache:
+    """Test hits, expiry and the shared SQLite tier."""
+
+    def test_hit_returns_marked_copy_until_ttl_expires(self):
+        # Arrange
+        cache = ReportCache(ttl_seconds=60)
+        cache.put("key", REPORT)
+
+        # Act
+        first = cache.get("key")
+        first["investigation"]["status"] = "modified"
+        second = cache.get("key")
+
+        # Assert
+        assert second["investigation"]["status"] == "completed"
+        assert second["investigation"]["cached"] is True
+        assert second["root_cause"] == REPORT["root_cause"]
+        assert "cached" not in REPORT["investigation"]
+        with patch("promptrca.jobs.report_cache.time.time", return_value=10 ** 12):
+            assert cache.get("key") is None
+        assert cache.stats()["memory_hits"] == 2
+
+    def test_sqlite_tier_is_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "reports.sqlite3")
+        ReportCache(path=path).put("key", REPORT)
+
+        other_worker = ReportCache(path=path)
+
+        assert other_worker.get("key")["root_cause"] == REPORT["root_cause"]
+        assert other_worker.stats()["sqlite_hits"] == 1
+        assert other_worker.get("missing") is None
+
+
+class TestCachedReport:
+    """Test request-level lookup, force_refresh and what gets cached."""
+
+    def test_force_refresh_skips_lookup_and_failures_are_not_cached(self):
+        cache = ReportCache()
+        with patch("promptrca.jobs.report_cache.get_report_cache", return_value=cache):
+            key, report = cached_report(PAYLOAD)
+            assert key is not None and report is None
+
+            remember_report(key, {"investigation": {"status": "failed"}})
+            assert cached_report(PAYLOAD)[1] is None
+
+            remember_report(key, REPORT)
+            assert cached_report(PAYLOAD)[1]["investigation"]["cached"] is True
+
+            refresh = {**PAYLOAD, "investigation": {**PAYLOAD["investigation"], "force_refresh": True}}
+            assert cached_report(refresh) == (key, None)
+
+    def test_report_is_only_served_to_the_same_credentials(self):
+        cache = ReportCache()
+        owner = {**PAYLOAD, "service_config": {
+            "role_arn": "arn:aws:iam::111111111111:role/PromptRCAReadOnly", "external_id": "tenant-secret"
+        }}
+        guessed_external_id = {**PAYLOAD, "service_config": {**owner["service_config"], "external_id": "guess"}}
+        no_external_id = {**PAYLOAD, "service_config": {"role_arn": owner["service_config"]["role_arn"]}}
+        with patch("promptrca.jobs.report_cache.get_report_cache", return_value=cache):
+            key, _ = cached_report(owner)
+            remember_report(key, REPORT)
+
+            assert cached_report(owner)[1] is not None
+            assert cached_report(guessed_external_id)[1] is None
+            assert cached_report(no_external_id)[1] is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
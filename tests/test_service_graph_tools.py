@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test suite for service graph snapshot caching and baseline/incident diffs.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.tools import service_graph_tools
+from promptrca.tools.service_graph_tools import (
+    extract_edge_stats, diff_service_graphs, get_xray_service_graph_diff
+)
+
+
+def _graph(edges):
+    """Build GetServiceGraph services from {(source, target): (total, faults, response_time)}."""
+    names = sorted({name for edge in edges for name in edge})
+    ref = {name: i for i, name in enumerate(names)}
+    services = []
+    for name in names:
+        services.append({
+            "ReferenceId": ref[name],
+            "Name": name,
+            "Edges": [
+                {
+                    "ReferenceId": ref[target],
+                    "SummaryStatistics": {
+                        "TotalCount": total,
+                        "FaultStatistics": {"TotalCount": faults},
+                        "ErrorStatistics": {"TotalCount": 0},
+                        "TotalResponseTime": response_time
+                    }
+                }
+                for (source, target), (total, faults, response_time) in edges.items() if source == name
+            ]
+        })
+    return services
+
+
+class TestServiceGraphDiff:
+    """Test structural and statistical diffs between service graph windows."""
+
+    def test_new_vanished_and_shifted_edges(self):
+        # Arrange
+        baseline = extract_edge_stats(_graph({
+            ("api", "orders"): (100, 0, 10.0),
+            ("orders", "cache"): (50, 0, 1.0),
+        }))
+        incident = extract_edge_stats(_graph({
+            ("api", "orders"): (100, 20, 40.0),
+            ("orders", "dynamodb"): (80, 0, 4.0),
+        }))
+
+        # Act
+        diff = diff_service_graphs(baseline, incident)
+
+        # Assert
+        assert [e["edge"] for e in diff["new_edges"]] == ["orders -> dynamodb"]
+        assert [e["edge"] for e in diff["vanished_edges"]] == ["orders -> cache"]
+        assert diff["shifted_edges"][0]["edge"] == "api -> orders"
+        assert set(diff["shifted_edges"][0]["shift"]) == {"fault", "latency"}
+
+    @patch('promptrca.tools.service_graph_tools.get_aws_client')
+    def test_snapshots_are_cached_per_bucket(self, mock_get_client):
+        service_graph_tools._snapshot_cache.clear()
+        aws_client = mock_get_client.return_value
+        aws_client.account_id = "123456789012"
+        aws_client.region = "eu-west-1"
+        xray = aws_client.get_client.return_value
+        xray.get_service_graph.return_value = {"Services": _graph({("api", "orders"): (10, 0, 1.0)})}
+
+        first = json.loads(get_xray_service_graph_diff(incident_minutes=30))
+        get_xray_service_graph_diff(incident_minutes=30)
+
+        assert "error" not in first
+        # Baseline and incident windows fetched once, then served from cache
+        assert xray.get_service_graph.call_count == 2
+
+    @patch('promptrca.tools.service_graph_tools.get_aws_client')
+    def test_incident_window_can_end_in_the_past(self, mock_get_client):
+        service_graph_tools._snapshot_cache.clear()
+        aws_client = mock_get_client.return_value
+        aws_client.account_id = "123456789012"
+        aws_client.region = "eu-west-1"
+        xray = aws_client.get_client.return_value
+        xray.get_service_graph.return_value = {"Services": []}
+
+        diff = json.loads(get_xray_service_graph_diff(
+            incident_minutes=30, baseline_offset_minutes=1440, incident_end="2025-03-04T10:07:00Z"
+        ))
+
+        assert diff["incident"] == ["2025-03-04T09:40:00+00:00", "2025-03-04T10:10:00+00:00"]
+        assert diff["baseline"] == ["2025-03-03T09:10:00+00:00", "2025-03-03T09:40:00+00:00"]
+        assert "error" in json.loads(get_xray_service_graph_diff(incident_end="yesterday"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test suite for the parallel specialist fan-out graph topology.
+"""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from strands.multiagent import GraphBuilder
+from strands.multiagent.base import MultiAgentBase
+
+from promptrca.agents.input_parser_agent import ParsedInputs
+from promptrca.core.specialist_fanout import (
+    SPECIALIST_ROUTING_NODE_ID, SPECIALIST_TYPES, SpecialistBranchNode, SpecialistRoutingNode,
+    _text_result, branch_node_id, needs_specialist_swarm, parallel_specialists_complete,
+    plan_specialists, specialist_selected
+)
+
+TRACE_ID = "1-67890123-abcdef1234567890abcdef12"
+
+API_FLOW = [
+    {'type': 'apigateway', 'name': 'checkout-api'},
+    {'type': 'stepfunctions', 'name': 'checkout-flow'},
+    {'type': 'lambda', 'name': 'charge-card'},
+]
+
+
+class FakeSpecialistAgent:
+    """Stands in for a specialist Agent; sleeps instead of calling a model."""
+
+    def __init__(self, name, delay=0.2, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.prompts = []
+        self.messages = []
+        self.state = None
+
+    async def invoke_async(self, prompt, invocation_state=None, **kwargs):
+        self.prompts.append(prompt)
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return FakeAgentResult(f"{self.name} findings")
+
+
+class FakeAgentResult:
+    def __init__(self, text):
+        self.text = text
+        self.metrics = SimpleNamespace(accumulated_usage={"totalTokens": 10, "inputTokens": 8, "outputTokens": 2})
+
+    def __str__(self):
+        return self.text
+
+
+class RecordingNode(MultiAgentBase):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.tasks = []
+
+    async def invoke_async(self, task, invocation_state=None, **kwargs):
+        self.tasks.append(task)
+        return _text_result(self.name, f"{self.name} done")
+
+
+def _build_graph(agents):
+    hypothesis = RecordingNode("hypothesis_generation")
+    swarm = RecordingNode("investigation")
+    builder = GraphBuilder()
+    builder.add_node(SpecialistRoutingNode(), SPECIALIST_ROUTING_NODE_ID)
+    builder.add_node(swarm, "investigation")
+    builder.add_node(hypothesis, "hypothesis_generation")
+    builder.add_edge(SPECIALIST_ROUTING_NODE_ID, "investigation", condition=needs_specialist_swarm)
+    builder.add_edge("investigation", "hypothesis_generation")
+    for specialist_type in SPECIALIST_TYPES:
+        node_id = branch_node_id(specialist_type)
+        builder.add_node(SpecialistBranchNode(agents[specialist_type], specialist_type), node_id)
+        builder.add_edge(SPECIALIST_ROUTING_NODE_ID, node_id, condition=specialist_selected(specialist_type))
+        builder.add_edge(node_id, "hypothesis_generation", condition=parallel_specialists_complete)
+    builder.set_entry_point(SPECIALIST_ROUTING_NODE_ID)
+    return builder.build(), swarm, hypothesis
+
+
+def _state(resources):
+    return {
+        "parsed_inputs": ParsedInputs(primary_targets=[], trace_ids=[TRACE_ID], error_messages=[],
+                                      business_context={}, time_range=None, confidence=0.9),
+        "discovered_resources": resources,
+        "region": "eu-west-1",
+    }
+
+
+class TestPlanSpecialists:
+    """Test which resource sets are fanned out and which go to the swarm."""
+
+    def test_known_services_fan_out_with_trace_first(self):
+        # Arrange / Act
+        plan = plan_specialists(API_FLOW, [TRACE_ID], max_branches=5)
+
+        # Assert
+        assert list(plan) == ["trace", "apigateway", "stepfunctions", "lambda"]
+        assert plan["lambda"] == [API_FLOW[2]]
+
+    def test_ambiguous_cases_use_the_swarm(self):
+        assert plan_specialists([], [TRACE_ID], max_branches=5) is None
+        assert plan_specialists(API_FLOW + [{'type': 'dynamodb', 'name': 'carts'}], [], max_branches=5) is None
+        assert plan_specialists(API_FLOW, [TRACE_ID], max_branches=3) is None
+
+
+class TestParallelSpecialistGraph:
+    """Test the branches run concurrently and join once into hypothesis generation."""
+
+    @pytest.mark.asyncio
+    async def test_branches_run_in_parallel_and_join_once(self):
+        # Arrange
+        agents = {t: FakeSpecialistAgent(f"{t}_specialist") for t in SPECIALIST_TYPES}
+        agents["stepfunctions"].error = RuntimeError("throttled")
+        graph, swarm, hypothesis = _build_graph(agents)
+        invocation_state = _state(API_FLOW)
+
+        # Act
+        start = time.monotonic()
+        await graph.invoke_async("Investigate checkout 5XX errors", invocation_state=invocation_state)
+        elapsed = time.monotonic() - start
+
+        # Assert: four 0.2s branches in one batch, the swarm skipped, the join run once with every branch
+        assert elapsed < 0.6
+        assert swarm.tasks == []
+        assert len(hypothesis.tasks) == 1
+        join_input = "".join(block.get("text", "") for block in hypothesis.tasks[0])
+        assert "lambda_specialist findings" in join_input
+        assert "stepfunctions_specialist failed: throttled" in join_input
+        assert "charge-card" in agents["lambda"].prompts[0]
+        assert agents["sqs"].prompts == []
+        assert set(invocation_state["parallel_specialists"]["timings"]) == {"trace", "apigateway", "stepfunctions", "lambda"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_resources_route_to_swarm(self):
+        agents = {t: FakeSpecialistAgent(f"{t}_specialist") for t in SPECIALIST_TYPES}
+        graph, swarm, hypothesis = _build_graph(agents)
+
+        await graph.invoke_async("Investigate", invocation_state=_state([{'type': 'dynamodb', 'name': 'carts'}]))
+
+        assert len(swarm.tasks) == 1
+        assert len(hypothesis.tasks) == 1
+        assert all(agent.prompts == [] for agent in agents.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -297,8 +297,9 @@ class TestSwarmAgentsIntegration:
         assert agent.system_prompt is not None
         assert "trace analysis specialist" in agent.system_prompt.lower()
         assert "entry point" in agent.system_prompt.lower()
-        assert len(agent.tool_names) == 1
+        assert len(agent.tool_names) == 2
         assert "trace_specialist_tool" in agent.tool_names
+        assert "get_xray_service_graph_diff" in agent.tool_names
     
     def test_create_lambda_agent(self):
         """Test Lambda agent creation and configuration."""
@@ -470,7 +471,7 @@ class TestSwarmOrchestrationIntegration:
         # Check that trace_specialist is the entry point
         trace_agent = next((a for a in agents if a.name == "trace_specialist"), None)
         assert trace_agent is not None
-        assert len(trace_agent.tool_names) == 1
+        assert len(trace_agent.tool_names) == 2
         assert "trace_specialist_tool" in trace_agent.tool_names
     
     @pytest.mark.asyncio
@@ -255,6 +255,41 @@ class TestSwarmOrchestrator:
             assert result.status == "failed"
             assert "Parse error" in result.summary
 
+    @pytest.mark.asyncio
+    async def test_investigate_does_not_block_event_loop(self, orchestrator):
+        """Test that the graph runs on the event loop so investigations interleave."""
+        import asyncio
+        import time
+
+        async def slow_graph(prompt, invocation_state=None):
+            await asyncio.sleep(0.3)
+            return Mock(results={})
+
+        with patch.object(orchestrator, '_create_and_validate_aws_client', return_value=Mock(region="us-east-1")), \
+             patch.object(orchestrator, '_select_exemplar_traces', return_value=[]), \
+             patch.object(orchestrator.graph, 'invoke_async', side_effect=slow_graph) as mock_invoke:
+
+            start = time.monotonic()
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while time.monotonic() - start < 0.3:
+                    ticks += 1
+                    await asyncio.sleep(0.05)
+
+            await asyncio.gather(
+                orchestrator.investigate({"free_text_input": "first"}),
+                orchestrator.investigate({"free_text_input": "second"}),
+                heartbeat()
+            )
+            elapsed = time.monotonic() - start
+
+        assert mock_invoke.call_count == 2
+        # Both investigations overlapped and the loop kept serving other tasks
+        assert elapsed < 0.55
+        assert ticks >= 4
+
 
 # Test the tool functions
 class TestSwarmTools:
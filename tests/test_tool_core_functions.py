@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test suite for the core/tool split of AWS tools.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.specialists.lambda_specialist import LambdaSpecialist
+from promptrca.tools.lambda_tools import fetch_lambda_config, get_lambda_config
+
+
+@pytest.fixture
+def mock_aws_client():
+    aws_client = MagicMock()
+    aws_client.get_client.return_value.get_function_configuration.return_value = {
+        "FunctionName": "checkout",
+        "Runtime": "python3.12",
+        "Timeout": 10,
+        "MemorySize": 512
+    }
+    return aws_client
+
+
+class TestToolCoreFunctions:
+    """Test that core functions return native objects and tools serialize them."""
+
+    def test_core_returns_dict_and_tool_returns_its_json(self, mock_aws_client):
+        # Arrange / Act
+        with patch('promptrca.tools.lambda_tools.get_aws_client', return_value=mock_aws_client):
+            config = fetch_lambda_config("checkout")
+            tool_output = get_lambda_config("checkout")
+
+        # Assert
+        assert isinstance(config, dict)
+        assert config["timeout"] == 10
+        assert json.loads(tool_output) == config
+
+    def test_core_returns_error_dict(self):
+        with patch('promptrca.tools.lambda_tools.get_aws_client', side_effect=RuntimeError("no client")):
+            config = fetch_lambda_config("checkout")
+
+        assert config == {"error": "no client", "function_name": "checkout"}
+
+    @pytest.mark.asyncio
+    async def test_specialist_uses_core_function(self):
+        with patch('promptrca.tools.lambda_tools.fetch_lambda_config',
+                   return_value={"timeout": 10, "memory_size": 512}) as mock_fetch:
+            facts = await LambdaSpecialist()._analyze_configuration("checkout")
+
+        mock_fetch.assert_called_once_with("checkout")
+        assert any("short timeout: 10s" in f.content for f in facts)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
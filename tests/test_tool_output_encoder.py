@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test suite for compact tool output encoding.
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.core.tool_output_encoder import (
+    CompactToolOutputHook, compact_value, encode_tool_output, tool_output_hooks
+)
+
+
+class TestEncodeToolOutput:
+    """Test the compact encoding and the size cap."""
+
+    def test_whitespace_and_empty_fields_are_dropped(self):
+        # Arrange
+        raw = json.dumps({"function_name": "checkout", "layers": [], "vpc_config": None, "description": ""}, indent=2)
+
+        # Act
+        encoded, truncated = encode_tool_output(raw, "get_lambda_config")
+
+        # Assert
+        assert encoded == '{"function_name":"checkout"}'
+        assert truncated is False
+
+    def test_lists_of_records_become_rows(self):
+        value = {"events": [
+            {"timestamp": 1, "message": "START"},
+            {"timestamp": 2, "message": "Task timed out", "level": "ERROR"},
+        ]}
+
+        compacted = compact_value(value)
+
+        assert compacted["events"] == {
+            "cols": ["timestamp", "message", "level"],
+            "rows": [[1, "START", None], [2, "Task timed out", "ERROR"]],
+        }
+
+    def test_oversized_output_is_capped_with_omission_marker(self):
+        raw = json.dumps({"function_name": "checkout", "log_lines": [f"line {i} " + "x" * 50 for i in range(500)]})
+
+        with patch.dict(os.environ, {"PROMPTRCA_TOOL_OUTPUT_MAX_CHARS_GET_LAMBDA_LOGS": "2000"}):
+            encoded, truncated = encode_tool_output(raw, "get_lambda_logs")
+
+        assert truncated is True
+        assert len(encoded) <= 2000
+        decoded = json.loads(encoded)
+        assert decoded["function_name"] == "checkout"
+        kept = decoded["log_lines"][:-1]
+        assert decoded["log_lines"][-1] == f"...(+{500 - len(kept)} more)"
+
+    def test_non_json_text_passes_through(self):
+        assert encode_tool_output("Access denied", "get_iam_role_config") == ("Access denied", False)
+
+
+class TestCompactToolOutputHook:
+    """Test that the hook rewrites tool results and records token usage."""
+
+    def test_hook_rewrites_result_and_records_usage(self):
+        # Arrange
+        raw = json.dumps({"queue_name": "orders", "redrive_policy": None, "attributes": {"delay": 0}}, indent=2)
+        event = SimpleNamespace(
+            tool_use={"name": "get_sqs_queue_config", "toolUseId": "t1", "input": {}},
+            result={"toolUseId": "t1", "status": "success", "content": [{"text": raw}]},
+            invocation_state={}
+        )
+
+        # Act
+        CompactToolOutputHook().on_after_tool_call(event)
+
+        # Assert
+        assert event.result["content"] == [{"text": '{"queue_name":"orders","attributes":{"delay":0}}'}]
+        assert event.result["status"] == "success"
+        usage = event.invocation_state["tool_token_usage"]["get_sqs_queue_config"]
+        assert usage["calls"] == 1
+        assert usage["output_tokens"] < usage["raw_tokens"]
+        assert usage["truncated"] == 0
+
+    def test_hook_can_be_disabled(self):
+        with patch.dict(os.environ, {"PROMPTRCA_COMPACT_TOOL_OUTPUT": "false"}):
+            assert tool_output_hooks() == []
+        with patch.dict(os.environ, {"PROMPTRCA_COMPACT_TOOL_OUTPUT": "true"}):
+            assert isinstance(tool_output_hooks()[0], CompactToolOutputHook)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
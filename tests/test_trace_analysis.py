@@ -37,8 +37,8 @@ class TestTraceAnalysis:
     def test_successful_trace_parsing(self, orchestrator, successful_trace_data):
         """Test parsing of successful API Gateway -> Step Functions trace."""
         
-        with patch('promptrca.tools.get_xray_trace') as mock_get_trace:
-            mock_get_trace.return_value = json.dumps(successful_trace_data)
+        with patch('promptrca.tools.fetch_xray_trace') as mock_get_trace:
+            mock_get_trace.return_value = successful_trace_data
             
             # Run trace analysis
             facts = asyncio.run(orchestrator._analyze_xray_trace_deep("1-68f622d0-2cfc080243ee63df62fc57a8"))
@@ -95,8 +95,8 @@ class TestTraceAnalysis:
             ]
         }
         
-        with patch('promptrca.tools.get_xray_trace') as mock_get_trace:
-            mock_get_trace.return_value = json.dumps(error_trace_data)
+        with patch('promptrca.tools.fetch_xray_trace') as mock_get_trace:
+            mock_get_trace.return_value = error_trace_data
             
             facts = asyncio.run(orchestrator._analyze_xray_trace_deep("1-error-trace-123"))
             
@@ -115,8 +115,8 @@ class TestTraceAnalysis:
     def test_trace_service_flow_extraction(self, orchestrator, successful_trace_data):
         """Test that we correctly extract the service flow from traces."""
         
-        with patch('promptrca.tools.get_xray_trace') as mock_get_trace:
-            mock_get_trace.return_value = json.dumps(successful_trace_data)
+        with patch('promptrca.tools.fetch_xray_trace') as mock_get_trace:
+            mock_get_trace.return_value = successful_trace_data
             
             facts = asyncio.run(orchestrator._analyze_xray_trace_deep("1-68f622d0-2cfc080243ee63df62fc57a8"))
             
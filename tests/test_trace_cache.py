@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test suite for the persistent X-Ray trace disk cache.
+"""
+
+import json
+import os
+import pytest
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.utils.trace_cache import TraceDiskCache
+
+
+def _segment(i, in_progress=False, started=1760100000.0):
+    """A segment as BatchGetTraces returns it: the document is a JSON string."""
+    document = {
+        "id": f"{i:016x}",
+        "name": "orders",
+        "trace_id": "1-68e904af-484b173354fff9607ee41871",
+        "start_time": started + i,
+        "annotations": {"payload": os.urandom(64).hex()},
+        "subsegments": [{"id": f"{i + 1000:016x}", "name": "DynamoDB", "start_time": started + 0.1 + i,
+                         "end_time": started + 0.2 + i}]
+    }
+    if in_progress:
+        document["subsegments"][0]["in_progress"] = True
+        del document["subsegments"][0]["end_time"]
+    document["end_time"] = started + 0.5 + i
+    return {"Id": document["id"], "Document": json.dumps(document)}
+
+
+def _trace(trace_id, size=10, in_progress=False, limit_exceeded=False, started=1760100000.0):
+    """A trace shaped like the BatchGetTraces response (Id, Duration, LimitExceeded, Segments)."""
+    segments = [_segment(i, started=started) for i in range(size)]
+    if in_progress:
+        segments[-1] = _segment(size - 1, in_progress=True, started=started)
+    return {"Id": trace_id, "Duration": 0.5, "LimitExceeded": limit_exceeded, "Segments": segments}
+
+
+class TestTraceDiskCache:
+    """Test caching, bypass, integrity and eviction of completed traces."""
+
+    def test_round_trip_is_scoped_by_account(self, tmp_path):
+        cache = TraceDiskCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+        trace = _trace("1-abc")
+
+        assert cache.put("111111111111", "1-abc", trace)
+
+        assert cache.get("111111111111", "1-abc") == trace
+        assert cache.get("222222222222", "1-abc") is None
+        # A fresh instance (e.g. another worker or a restart) sees the entry
+        assert TraceDiskCache(str(tmp_path), 10 * 1024 * 1024).get("111111111111", "1-abc") == trace
+
+    def test_partial_traces_bypass_cache(self, tmp_path):
+        cache = TraceDiskCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+
+        assert not cache.put("111111111111", "1-partial", _trace("1-partial", in_progress=True))
+        assert not cache.put("111111111111", "1-truncated", _trace("1-truncated", limit_exceeded=True))
+        assert cache.get("111111111111", "1-partial") is None
+        assert cache.get("111111111111", "1-truncated") is None
+
+    def test_recent_traces_are_not_cached_until_settled(self, tmp_path, monkeypatch):
+        cache = TraceDiskCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+        # Every visible segment has ended, but downstream ones may not be ingested yet
+        recent = _trace("1-recent", size=2, started=time.time() - 60)
+
+        assert not cache.put("111111111111", "1-recent", recent)
+        monkeypatch.setenv("PROMPTRCA_TRACE_SETTLE_SECONDS", "30")
+        assert cache.put("111111111111", "1-recent", recent)
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        cache = TraceDiskCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+        cache.put("111111111111", "1-abc", _trace("1-abc"))
+        path = cache._path(cache._key("111111111111", "1-abc"))
+        with open(path, "wb") as f:
+            f.write(b"not gzip")
+
+        assert cache.get("111111111111", "1-abc") is None
+        assert not os.path.exists(path)
+
+    def test_eviction_keeps_size_bounded(self, tmp_path):
+        # Arrange: random segment documents do not compress, so each entry is a few KB
+        cache = TraceDiskCache(str(tmp_path), max_bytes=20 * 1024)
+
+        # Act
+        for i in range(20):
+            cache.put("111111111111", f"1-{i}", _trace(f"1-{i}", size=40))
+
+        # Assert
+        assert cache._directory_size() <= 20 * 1024
+        assert cache.get("111111111111", "1-19") is not None
+        assert cache.get("111111111111", "1-0") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
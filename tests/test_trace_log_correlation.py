@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test suite for trace-to-log correlation.
+Tests that log queries are derived from the trace instead of scanning log groups.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from promptrca.tools.trace_log_correlation import build_log_query_targets, correlate_trace_logs
+
+TRACE_ID = "1-68e915e7-7a2c7c6d1427db5e5b97c431"
+
+TRACE = {
+    "Id": TRACE_ID,
+    "Segments": [
+        {
+            "Id": "apigw",
+            "Document": json.dumps({
+                "name": "orders-api/prod",
+                "origin": "AWS::ApiGateway::Stage",
+                "resource_arn": "arn:aws:apigateway:eu-west-1::/restapis/abc123/stages/prod",
+                "start_time": 1700000000.0,
+                "end_time": 1700000001.5,
+                "aws": {"api_gateway": {"request_id": "apigw-req-1"}},
+                "subsegments": [{
+                    "name": "Lambda",
+                    "namespace": "aws",
+                    "start_time": 1700000000.1,
+                    "end_time": 1700000001.4,
+                    "aws": {
+                        "operation": "Invoke",
+                        "function_name": "arn:aws:lambda:eu-west-1:123456789012:function:orders-handler",
+                        "request_id": "lambda-req-1"
+                    }
+                }]
+            })
+        },
+        {
+            "Id": "fn",
+            "Document": json.dumps({
+                "name": "orders-handler",
+                "origin": "AWS::Lambda::Function",
+                "start_time": 1700000000.2,
+                "end_time": 1700000001.3,
+                "aws": {"request_id": "lambda-req-1"}
+            })
+        }
+    ]
+}
+
+EXECUTION_ARN = "arn:aws:states:eu-west-1:123456789012:execution:checkout:run-1"
+
+STEPFUNCTIONS_TRACE = {
+    "Id": TRACE_ID,
+    "Segments": [
+        {
+            "Id": "sfn",
+            "Document": json.dumps({
+                "name": "checkout",
+                "origin": "AWS::StepFunctions::StateMachine",
+                "resource_arn": EXECUTION_ARN,
+                "start_time": 1700000000.0,
+                "end_time": 1700000004.0,
+                "aws": {"execution_arn": EXECUTION_ARN}
+            })
+        }
+    ]
+}
+
+
+class TestTraceLogCorrelation:
+    """Test derivation of narrow log queries from a trace."""
+
+    def test_targets_from_trace(self):
+        targets = {t.log_group: t for t in build_log_query_targets(TRACE)}
+
+        assert set(targets) == {"/aws/lambda/orders-handler", "API-Gateway-Execution-Logs_abc123/prod"}
+        lambda_target = targets["/aws/lambda/orders-handler"]
+        assert lambda_target.request_ids == ["lambda-req-1"]
+        # Window covers only the segment, padded, not 24 hours
+        assert lambda_target.end_time - lambda_target.start_time < 300
+        assert '@requestId in ["lambda-req-1"]' in lambda_target.build_query(TRACE_ID)
+        assert targets["API-Gateway-Execution-Logs_abc123/prod"].request_ids == ["apigw-req-1"]
+
+    @patch('promptrca.tools.trace_log_correlation.time.sleep')
+    @patch('promptrca.tools.trace_log_correlation.get_aws_client')
+    @patch('promptrca.tools.trace_log_correlation._get_trace')
+    def test_correlate_queries_each_group_once(self, mock_get_trace, mock_get_client, _sleep):
+        # Arrange
+        mock_get_trace.return_value = TRACE
+        logs = mock_get_client.return_value.get_client.return_value
+        logs.start_query.side_effect = lambda **kwargs: {"queryId": kwargs["logGroupName"]}
+        logs.get_query_results.side_effect = lambda queryId: {
+            "status": "Complete",
+            "results": [[{"field": "@timestamp", "value": "2023-11-14 22:13:20"},
+                         {"field": "@message", "value": f"log from {queryId}"}]]
+        }
+
+        # Act
+        result = correlate_trace_logs(TRACE_ID)
+
+        # Assert
+        assert logs.start_query.call_count == 2
+        assert logs.describe_log_groups.call_count == 0
+        assert result["match_count"] == 2
+        assert {entry["log_group"] for entry in result["logs"]} == {
+            "/aws/lambda/orders-handler", "API-Gateway-Execution-Logs_abc123/prod"
+        }
+
+    @patch('promptrca.tools.trace_log_correlation.time.sleep')
+    @patch('promptrca.tools.trace_log_correlation.get_aws_client')
+    @patch('promptrca.tools.trace_log_correlation._get_trace')
+    def test_correlate_queries_only_the_requested_groups(self, mock_get_trace, mock_get_client, _sleep):
+        mock_get_trace.return_value = TRACE
+        logs = mock_get_client.return_value.get_client.return_value
+        logs.start_query.side_effect = lambda **kwargs: {"queryId": kwargs["logGroupName"]}
+        logs.get_query_results.return_value = {"status": "Complete", "results": []}
+
+        result = correlate_trace_logs(TRACE_ID, ["API-Gateway-Execution-Logs_abc123/prod"])
+
+        logs.start_query.assert_called_once()
+        query = logs.start_query.call_args.kwargs
+        assert query["logGroupName"] == "API-Gateway-Execution-Logs_abc123/prod"
+        assert query["endTime"] - query["startTime"] < 300
+        assert "error" in correlate_trace_logs(TRACE_ID, ["API-Gateway-Execution-Logs_other/prod"])
+        assert result["match_count"] == 0
+
+    @patch('promptrca.tools.trace_log_correlation.time.sleep')
+    @patch('promptrca.tools.trace_log_correlation.get_aws_client')
+    @patch('promptrca.tools.trace_log_correlation._get_trace')
+    def test_stepfunctions_executions_query_the_state_machine_log_group(self, mock_get_trace, mock_get_client, _sleep):
+        mock_get_trace.return_value = STEPFUNCTIONS_TRACE
+        client = mock_get_client.return_value.get_client.return_value
+        client.describe_state_machine.return_value = {"loggingConfiguration": {"destinations": [{
+            "cloudWatchLogsLogGroup": {
+                "logGroupArn": "arn:aws:logs:eu-west-1:123456789012:log-group:/aws/vendedlogs/states/checkout-Logs:*"
+            }
+        }]}}
+        client.start_query.side_effect = lambda **kwargs: {"queryId": kwargs["logGroupName"]}
+        client.get_query_results.return_value = {"status": "Complete", "results": []}
+
+        assert [t.log_group for t in build_log_query_targets(STEPFUNCTIONS_TRACE)] == ["/aws/stepfunctions/checkout"]
+        result = correlate_trace_logs(TRACE_ID)
+
+        client.describe_state_machine.assert_called_once_with(
+            stateMachineArn="arn:aws:states:eu-west-1:123456789012:stateMachine:checkout"
+        )
+        query = client.start_query.call_args.kwargs
+        assert query["logGroupName"] == "/aws/vendedlogs/states/checkout-Logs"
+        assert EXECUTION_ARN in query["queryString"]
+        assert result["targets"][0]["source"] == "stepfunctions"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -57,9 +57,9 @@ class TestXRayTools:
         """Test deep trace analysis with successful trace (no errors)."""
         orchestrator = DirectInvocationOrchestrator()
         
-        # Mock the get_xray_trace function to return our test data
-        with patch('src.promptrca.tools.xray_tools.get_xray_trace') as mock_get_trace:
-            mock_get_trace.return_value = json.dumps(sample_trace_data)
+        # Mock the fetch_xray_trace function to return our test data
+        with patch('src.promptrca.tools.xray_tools.fetch_xray_trace') as mock_get_trace:
+            mock_get_trace.return_value = sample_trace_data
             
             # Test the deep analysis
             import asyncio
@@ -123,9 +123,9 @@ class TestXRayToolsWithErrorTrace:
         """Test deep trace analysis with error trace."""
         orchestrator = DirectInvocationOrchestrator()
         
-        # Mock the get_xray_trace function to return error data
-        with patch('src.promptrca.tools.xray_tools.get_xray_trace') as mock_get_trace:
-            mock_get_trace.return_value = json.dumps(error_trace_data)
+        # Mock the fetch_xray_trace function to return error data
+        with patch('src.promptrca.tools.xray_tools.fetch_xray_trace') as mock_get_trace:
+            mock_get_trace.return_value = error_trace_data
             
             # Test the deep analysis
             import asyncio